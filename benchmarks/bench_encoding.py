@@ -0,0 +1,77 @@
+"""
+저카디널리티 필드 인코딩 벤치마크
+
+10만 건 수확(harvest) 데이터를 흉내 내어 다음을 비교합니다.
+- 레코드 생성 메모리: XML 파서처럼 매번 새 문자열 vs intern_fields
+- DataFrame 메모리: object 컬럼 vs category 컬럼
+- 출원인별 group-by 집계 시간
+
+    python benchmarks/bench_encoding.py --records 100000
+"""
+
+import argparse
+import random
+import timeit
+import tracemalloc
+
+import pandas as pd
+
+from mcp_kipris.kipris.api.encoding import encode_categoricals, intern_fields
+
+FIELDS = ("Applicant", "RegistrationStatus", "IPCNumber")
+APPLICANTS = [f"주식회사 출원인{i:03d}" for i in range(300)]
+STATUSES = ["등록", "공개", "거절", "취하", "소멸"]
+IPCS = [f"H01M {i}/{j:02d}" for i in range(1, 20) for j in range(0, 50, 5)]
+
+
+def make_records(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    # "".join으로 매번 새 문자열 객체를 만들어 XML 파서 출력과 같은 상태를 재현
+    return [
+        {
+            "ApplicationNumber": f"1020{i:09d}",
+            "Applicant": "".join(rng.choice(APPLICANTS)),
+            "RegistrationStatus": "".join(rng.choice(STATUSES)),
+            "IPCNumber": "".join(rng.choice(IPCS)),
+        }
+        for i in range(n)
+    ]
+
+
+def retained_mb(fn) -> float:
+    """fn()이 반환한 객체가 살아 있는 동안 유지되는 메모리"""
+    tracemalloc.start()
+    result = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+    n = args.records
+
+    plain_mb = retained_mb(lambda: make_records(n))
+    interned_mb = retained_mb(lambda: intern_fields(make_records(n), FIELDS))
+    print(f"records, fresh strings      {plain_mb:8.1f} MiB")
+    print(f"records, interned           {interned_mb:8.1f} MiB")
+
+    plain_df = pd.DataFrame(make_records(n))
+    encoded_df = encode_categoricals(pd.DataFrame(intern_fields(make_records(n), FIELDS)), FIELDS)
+    print(f"DataFrame, object columns   {plain_df.memory_usage(deep=True).sum() / 1024 / 1024:8.1f} MiB")
+    print(f"DataFrame, category columns {encoded_df.memory_usage(deep=True).sum() / 1024 / 1024:8.1f} MiB")
+
+    for name, df in (("object", plain_df), ("category", encoded_df)):
+        seconds = min(
+            timeit.repeat(
+                lambda: df.groupby(["Applicant", "RegistrationStatus"], observed=True).size(), number=5, repeat=3
+            )
+        )
+        print(f"group-by Applicant x Status ({name:<8}) {seconds / 5 * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+로컬 특허 전문 색인(BM25) 벤치마크
+
+합성 레코드 N건을 색인하는 시간과 검색어별 질의 지연 시간을 측정합니다.
+local_patent_search 는 이 질의 하나로 응답합니다. 합성 레코드는 모두 같은 초록을 쓰므로 초록 단어로 찾는
+질의는 모든 문서가 후보가 되는 최악의 경우입니다.
+
+    python benchmarks/bench_local_index.py --documents 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from kipris_fixtures import korean_item  # noqa: E402
+
+from mcp_kipris.kipris.local_index import LocalPatentIndex  # noqa: E402
+
+TOPICS = ["리튬 이차전지", "반도체 패키지", "자율주행 센서", "수소 연료전지", "유기 발광 소자", "신경망 가속기"]
+QUERIES = ["양극 활물질", "이차전지 수명", "반도체 패키지 열 방출", "삼성전자", "자율주행"]
+
+
+def make_record(i: int) -> dict:
+    record = korean_item(i)
+    record["applicationNumber"] = f"1020{i:09d}"
+    record["inventionTitle"] = f"{TOPICS[i % len(TOPICS)]} {record['inventionTitle']}"
+    return record
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    records = [make_record(i) for i in range(args.documents)]
+    index = LocalPatentIndex(max_documents=args.documents)
+    started = time.perf_counter()
+    for record in records:
+        index.add(record)
+    elapsed = time.perf_counter() - started
+    print(f"index {args.documents} records  {elapsed:.2f} s ({elapsed / args.documents * 1e6:.1f} us/record)")
+    print(f"terms {index.stats()['terms']}")
+
+    for query in QUERIES:
+        seconds = min(timeit.repeat(lambda: index.search(query, limit=10), number=args.repeat, repeat=3)) / args.repeat
+        print(f"search {query!r:<28} {seconds * 1e3:7.2f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+로깅 오버헤드 벤치마크
+
+도구 호출 한 번에 남는 요청 단위 로그(요청 파라미터, KIPRIS 요청 URL, HTTP 시작/완료 등 약 6줄)를
+기존 방식(동기 StreamHandler + f-string)과 큐 기반 파이프라인(LogPipeline, 지연 포맷)으로 기록할 때
+호출 스레드가 쓰는 시간을 비교합니다. 파이프라인은 리스너 스레드가 나중에 처리하는 비용도 따로 표시하며,
+출력은 /dev/null 로 보냅니다.
+
+    python benchmarks/bench_logging.py --repeat 20000
+"""
+
+import argparse
+import logging
+import os
+import time
+import timeit
+
+from mcp_kipris.kipris.logging_utils import (
+    JsonFormatter,
+    LogPipeline,
+    RedactingFormatter,
+    RequestSamplingFilter,
+    request_log_sampling,
+)
+
+URL = (
+    "http://plus.kipris.or.kr/kipo-api/kipi/patUtiModInfoSearchSevice/getAdvancedSearch?word=battery&ServiceKey=secret"
+)
+PARAMS = {"word": "battery", "pageNo": 1, "numOfRows": 20}
+
+
+def log_tool_call_eager(logger: logging.Logger) -> None:
+    logger.info(f"Processing tool call: patent_search with args: {PARAMS}")
+    logger.info(f"parameters: {PARAMS}")
+    logger.info(f"[async] KIPRIS 요청 URL: {URL}")
+    logger.info(f"[async] HTTP 요청 시작: {URL}")
+    logger.info(f"[async] HTTP 요청 완료: {0.42:.2f}초 소요")
+    logger.debug(f"get_tool_description: {PARAMS}")
+
+
+def log_tool_call_lazy(logger: logging.Logger) -> None:
+    logger.info("Processing tool call: %s with args: %s", "patent_search", PARAMS)
+    logger.info("parameters: %s", PARAMS)
+    logger.info("[async] KIPRIS 요청 URL: %s", URL)
+    logger.info("[async] HTTP 요청 시작: %s", URL)
+    logger.info("[async] HTTP 요청 완료: %.2f초 소요", 0.42)
+    logger.debug("get_tool_description: %s", PARAMS)
+
+
+def make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    return logger
+
+
+def measure(fn, logger: logging.Logger, repeat: int, sample_rate: float = 1.0) -> float:
+    def call() -> None:
+        with request_log_sampling(sample_rate):
+            fn(logger)
+
+    return timeit.timeit(call, number=repeat) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20_000)
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w", encoding="utf-8")
+    sync_handler = logging.StreamHandler(devnull)
+    sync_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    sync_logger = make_logger("bench.sync", sync_handler)
+
+    text_handler = logging.StreamHandler(devnull)
+    text_handler.setFormatter(RedactingFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    json_handler = logging.StreamHandler(devnull)
+    json_handler.setFormatter(JsonFormatter())
+    pipelines = {}
+    for name, handler in (("text", text_handler), ("json", json_handler)):
+        pipeline = LogPipeline(handler, max_queue=args.repeat * 10)
+        pipeline.addFilter(RequestSamplingFilter())
+        pipelines[name] = (pipeline, make_logger(f"bench.{name}", pipeline))
+
+    results = [("sync handler, f-strings", measure(log_tool_call_eager, sync_logger, args.repeat))]
+    # configure_logging()과 같은 설정: 호출 위치와 multiprocessing/asyncio 정보 수집 생략
+    logging._srcfile = None
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+    for name, (pipeline, logger) in pipelines.items():
+        # 호출 스레드 비용(큐에 넣기까지)과 리스너 스레드의 포맷/마스킹/쓰기 비용을 따로 측정
+        pipeline.listener.stop()
+        results.append((f"pipeline ({name}), caller", measure(log_tool_call_lazy, logger, args.repeat)))
+        started = time.perf_counter()
+        pipeline.listener.start()
+        pipeline.listener.stop()
+        results.append((f"pipeline ({name}), listener", (time.perf_counter() - started) / args.repeat))
+    pipeline, logger = pipelines["json"]
+    results.append(("pipeline (json), 10% sampled", measure(log_tool_call_lazy, logger, args.repeat, 0.1)))
+    for label, seconds in results:
+        print(f"{label:32s} {seconds * 1e6:8.2f} us / call")
+    print(f"dropped records: {sum(p.dropped for p, _ in pipelines.values())}")
+
+
+if __name__ == "__main__":
+    main()
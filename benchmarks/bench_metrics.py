@@ -0,0 +1,56 @@
+"""
+메트릭 수집 오버헤드 벤치마크
+
+도구 호출 한 번에 기록되는 메트릭(도구/HTTP/업스트림 히스토그램과 카운터, 약 8회 기록)의 비용과
+/metrics 렌더링 시간을 측정합니다.
+
+    python benchmarks/bench_metrics.py --repeat 200000
+"""
+
+import argparse
+import timeit
+
+from mcp_kipris.kipris.metrics import (
+    HTTP_DURATION,
+    HTTP_REQUESTS,
+    PARSE_DURATION,
+    TOOL_CALLS,
+    TOOL_DURATION,
+    UPSTREAM_BYTES,
+    UPSTREAM_DURATION,
+    UPSTREAM_RESPONSES,
+    get_metrics_registry,
+)
+
+ENDPOINT = "patUtiModInfoSearchSevice/getAdvancedSearch"
+
+
+def record_tool_call() -> None:
+    UPSTREAM_DURATION.observe(0.42, ENDPOINT)
+    UPSTREAM_RESPONSES.inc(ENDPOINT, "200")
+    UPSTREAM_BYTES.inc(ENDPOINT, amount=18_000)
+    PARSE_DURATION.observe(0.003, ENDPOINT)
+    TOOL_DURATION.observe(0.45, "patent_search")
+    TOOL_CALLS.inc("patent_search", "ok")
+    HTTP_DURATION.observe(0.46, "/tools/call")
+    HTTP_REQUESTS.inc("/tools/call", "200")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200_000)
+    args = parser.parse_args()
+
+    inc = timeit.timeit(lambda: TOOL_CALLS.inc("patent_search", "ok"), number=args.repeat) / args.repeat
+    observe = timeit.timeit(lambda: TOOL_DURATION.observe(0.45, "patent_search"), number=args.repeat) / args.repeat
+    per_call = timeit.timeit(record_tool_call, number=args.repeat) / args.repeat
+    render = timeit.timeit(get_metrics_registry().render, number=1000) / 1000
+
+    print(f"Counter.inc           {inc * 1e9:8.0f} ns")
+    print(f"Histogram.observe     {observe * 1e9:8.0f} ns")
+    print(f"per tool call (8x)    {per_call * 1e6:8.2f} us")
+    print(f"/metrics render       {render * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+근사 중복 탐지 벤치마크
+
+컬렉션 크기를 늘려 가며 MinHash 서명 추가(add)와 LSH 버킷 기반 clusters() 시간을 측정합니다.
+문서의 --duplicate-rate 비율은 앞선 문서의 단어 --edits 개만 바꾼 근사 중복(분할/계속 출원 가정)이며,
+심어 둔 중복 쌍 중 같은 클러스터로 묶인 비율(recall)을 함께 출력합니다. 시간이 크기에 비례해
+늘어나면(쌍 수에 비례하지 않으면) 수십만 건 컬렉션에도 쓸 수 있습니다.
+
+    python benchmarks/bench_near_duplicates.py --sizes 10000,20000,40000
+"""
+
+import argparse
+import random
+import time
+
+from mcp_kipris.kipris.near_duplicates import NearDuplicateIndex
+
+VOCABULARY = (
+    "리튬 이차전지 양극 음극 활물질 전해질 분리막 니켈 코발트 망간 코팅 소성 입자 반도체 패키지 기판 방열 "
+    "배선 웨이퍼 식각 증착 센서 라이다 카메라 융합 차량 주행 제어 신경망 학습 추론 가속기 메모리 전력 회로"
+).split()
+
+
+def make_documents(count: int, duplicate_rate: float, edits: int, seed: int = 0) -> tuple:
+    rng = random.Random(seed)
+    documents, planted = [], []
+    for i in range(count):
+        number = f"1020{i:09d}"
+        if documents and rng.random() < duplicate_rate:
+            source_number, source = rng.choice(documents)
+            words = source.split()
+            for position in rng.sample(range(len(words)), edits):
+                words[position] = rng.choice(VOCABULARY)
+            documents.append((number, " ".join(words)))
+            planted.append((source_number, number))
+        else:
+            documents.append((number, " ".join(rng.choices(VOCABULARY, k=60))))
+    return documents, planted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,20000,40000")
+    parser.add_argument("--duplicate-rate", type=float, default=0.1)
+    parser.add_argument("--edits", type=int, default=1, help="근사 중복 문서마다 바꾸는 단어 수")
+    parser.add_argument("--threshold", type=float, default=0.8)
+    args = parser.parse_args()
+
+    for size in (int(value) for value in args.sizes.split(",")):
+        documents, planted = make_documents(size, args.duplicate_rate, args.edits)
+        index = NearDuplicateIndex(threshold=args.threshold, max_documents=size)
+
+        started = time.perf_counter()
+        for number, text in documents:
+            index.add(number, text)
+        add_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        clusters = index.clusters()
+        cluster_seconds = time.perf_counter() - started
+
+        cluster_of = {number: position for position, members in enumerate(clusters) for number in members}
+        found = sum(1 for a, b in planted if a in cluster_of and cluster_of.get(a) == cluster_of.get(b))
+        print(
+            f"{size:7d} docs  add {add_seconds:7.2f} s ({size / add_seconds:7.0f} docs/s)  "
+            f"clusters {cluster_seconds:6.2f} s ({len(clusters)} groups)  "
+            f"recall {found / max(len(planted), 1):.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
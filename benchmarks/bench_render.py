@@ -0,0 +1,55 @@
+"""
+render_table vs DataFrame.to_markdown (tabulate) 벤치마크
+
+30건짜리 해외 특허 검색 결과와 비슷한 레코드를 만들어 렌더링 시간을 비교합니다.
+
+    python benchmarks/bench_render.py --rows 30 --repeat 2000
+"""
+
+import argparse
+import timeit
+
+import pandas as pd
+
+from mcp_kipris.kipris.render import render_table
+
+
+def make_records(rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "applicationNo": f"US{17000000 + i}",
+                "applicationDate": "20240101",
+                "inventionName": "Lithium secondary battery comprising a cathode active material | " * 3 + str(i),
+                "applicant": "LG ENERGY SOLUTION, LTD.",
+            }
+            for i in range(rows)
+        ]
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    df = make_records(args.rows)
+    records = df.to_dict("records")
+    cases = {
+        "tabulate (to_markdown)": lambda: df.to_markdown(index=False),
+        "render_table markdown (DataFrame)": lambda: render_table(df),
+        "render_table markdown (records)": lambda: render_table(records),
+        "render_table tsv": lambda: render_table(df, fmt="tsv"),
+        "render_table csv": lambda: render_table(df, fmt="csv"),
+    }
+
+    baseline = None
+    for name, fn in cases.items():
+        seconds = min(timeit.repeat(fn, number=args.repeat, repeat=3)) / args.repeat
+        baseline = baseline or seconds
+        print(f"{name:<36} {seconds * 1e6:10.1f} us/call  x{baseline / seconds:5.1f}  {len(fn())} chars")
+
+
+if __name__ == "__main__":
+    main()
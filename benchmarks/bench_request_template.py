@@ -0,0 +1,54 @@
+"""
+요청 URL 생성 비용 벤치마크
+
+호출마다 파라미터 이름을 camelcase 변환하고 dict 전체를 urlencode 하던 방식과
+엔드포인트별로 컴파일한 요청 템플릿(값만 인코딩)의 호출당 비용을 비교합니다.
+
+    python benchmarks/bench_request_template.py --repeat 100000
+"""
+
+import argparse
+import timeit
+from urllib.parse import urlencode
+
+from stringcase import camelcase
+
+from mcp_kipris.kipris.api.request_template import get_request_template
+
+API_URL = "http://plus.kipris.or.kr/kipo-api/kipi/patUtiModInfoSearchSevice/getAdvancedSearch"
+PARAMS = {
+    "applicant": "삼성전자",
+    "docs_start": "1",
+    "docs_count": "30",
+    "patent": "True",
+    "utility": "True",
+    "lastvalue": "",
+    "sort_spec": "AD",
+    "desc_sort": "True",
+}
+
+
+def legacy(params: dict) -> tuple:
+    params_dict = {camelcase(k): v for k, v in params.items() if v is not None and v != ""}
+    cache_key = f"{API_URL}?{urlencode(params_dict)}"
+    params_dict["accessKey"] = "benchmark-key"
+    return cache_key, f"{API_URL}?{urlencode(params_dict)}"
+
+
+def templated(params: dict) -> tuple:
+    return get_request_template(API_URL, "accessKey").build(params, "benchmark-key")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=100_000)
+    args = parser.parse_args()
+
+    assert legacy(PARAMS) == templated(PARAMS)
+    for name, fn in (("camelcase + urlencode", legacy), ("compiled template", templated)):
+        seconds = min(timeit.repeat(lambda: fn(PARAMS), number=args.repeat, repeat=5)) / args.repeat
+        print(f"{name:<24} {seconds * 1e6:7.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
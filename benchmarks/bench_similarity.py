@@ -0,0 +1,81 @@
+"""
+TF-IDF 유사도 벤치마크
+
+compare_patents 처럼 두 문서마다 TfidfVectorizer 를 새로 학습하는 방식과, 컬렉션 전체에 한 번 학습한
+TfidfSimilarityEngine 의 블록 단위 희소 행렬 곱(all_nearest, similar_pairs)을 비교합니다.
+쌍별 방식은 --pair-sample 개의 쌍만 측정해 전체 쌍 수로 환산합니다.
+
+    python benchmarks/bench_similarity.py --documents 5000
+"""
+
+import argparse
+import random
+import time
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from mcp_kipris.kipris.similarity import TfidfSimilarityEngine
+
+VOCABULARY = (
+    "리튬 이차전지 양극 음극 활물질 전해질 분리막 니켈 코발트 망간 코팅 소성 입자 반도체 패키지 기판 방열 "
+    "배선 웨이퍼 식각 증착 센서 라이다 카메라 융합 차량 주행 제어 신경망 학습 추론 가속기 메모리 전력 회로"
+).split()
+
+
+def make_documents(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    documents = []
+    for i in range(count):
+        # 주제마다 어휘 일부에 치우친 문서를 만들어 유사/비유사 쌍이 섞이도록 함
+        topic = VOCABULARY[(i % 6) * 6 : (i % 6) * 6 + 8]
+        words = rng.choices(topic, k=30) + rng.choices(VOCABULARY, k=10)
+        documents.append(
+            {
+                "applicationNumber": f"1020{i:09d}",
+                "inventionTitle": " ".join(words[:5]),
+                "abstract": " ".join(words[5:]),
+            }
+        )
+    return documents
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=5000)
+    parser.add_argument("--block-size", type=int, default=1024)
+    parser.add_argument("--pair-sample", type=int, default=500)
+    args = parser.parse_args()
+
+    documents = make_documents(args.documents)
+    pairs_total = args.documents * (args.documents - 1) // 2
+
+    started = time.perf_counter()
+    for i in range(args.pair_sample):
+        a, b = documents[i % args.documents], documents[(i * 7 + 1) % args.documents]
+        vectors = TfidfVectorizer().fit_transform([a["abstract"], b["abstract"]])
+        cosine_similarity(vectors[0], vectors[1])
+    per_pair = (time.perf_counter() - started) / args.pair_sample
+    print(
+        f"pairwise fit          {per_pair * 1e3:8.3f} ms/pair -> all {pairs_total} pairs ~{per_pair * pairs_total:.0f} s"
+    )
+
+    started = time.perf_counter()
+    engine = TfidfSimilarityEngine().fit(documents)
+    print(f"engine fit            {time.perf_counter() - started:8.3f} s ({engine.matrix.shape[1]} terms)")
+
+    started = time.perf_counter()
+    engine.nearest(documents[0]["applicationNumber"], k=10)
+    print(f"engine nearest        {(time.perf_counter() - started) * 1e3:8.3f} ms")
+
+    started = time.perf_counter()
+    engine.all_nearest(k=10, block_size=args.block_size)
+    print(f"engine all_nearest    {time.perf_counter() - started:8.3f} s")
+
+    started = time.perf_counter()
+    count = sum(1 for _ in engine.similar_pairs(threshold=0.8, block_size=args.block_size))
+    print(f"engine similar_pairs  {time.perf_counter() - started:8.3f} s ({count} pairs >= 0.8)")
+
+
+if __name__ == "__main__":
+    main()
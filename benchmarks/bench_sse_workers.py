@@ -0,0 +1,90 @@
+"""
+멀티 워커 HTTP 서버 처리량 벤치마크
+
+워커 수별로 sse_server --http --workers N 을 띄우고 /tools (도구 설명 직렬화, CPU 바운드)에
+동시 요청을 보내 초당 처리량을 측정합니다. 워커들은 KIPRIS_SHARED_STATE 데이터베이스로
+캐시와 rate limit 상태를 공유합니다.
+
+    python benchmarks/bench_sse_workers.py --workers 1 2 4 --concurrency 64 --duration 10
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+
+async def wait_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"server did not become ready: {url}")
+
+
+async def load(url: str, concurrency: int, duration: float) -> int:
+    done = 0
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+
+        async def worker() -> None:
+            nonlocal done
+            while time.monotonic() < deadline:
+                response = await client.get(url)
+                response.raise_for_status()
+                done += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return done
+
+
+def run_case(workers: int, port: int, concurrency: int, duration: float) -> float:
+    env = dict(os.environ)
+    env.setdefault("KIPRIS_API_KEY", "benchmark-key")
+    env["KIPRIS_SHARED_STATE"] = os.path.join(tempfile.gettempdir(), f"mcp-kipris-bench-{port}.db")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "mcp_kipris.sse_server", "--http", "--port", str(port), "--workers", str(workers)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/tools"
+    try:
+        asyncio.run(wait_ready(url))
+        started = time.perf_counter()
+        done = asyncio.run(load(url, concurrency, duration))
+        return done / (time.perf_counter() - started)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=6390)
+    args = parser.parse_args()
+
+    print(f"cores: {os.cpu_count()}, concurrency: {args.concurrency}, duration: {args.duration}s")
+    baseline = None
+    for i, workers in enumerate(args.workers):
+        rps = run_case(workers, args.port + i, args.concurrency, args.duration)
+        baseline = baseline or rps
+        print(f"workers={workers:<3} {rps:10.1f} req/s  x{rps / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
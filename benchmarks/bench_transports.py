@@ -0,0 +1,126 @@
+"""
+SSE vs 스트리머블 HTTP 지연 시간 벤치마크
+
+sse_server --http 를 띄우고 같은 MCP 호출을 SSE(/sse + /messages/)와 스트리머블 HTTP(/mcp)로
+각각 N번 보내 호출당 지연 시간을 비교합니다.
+
+- warm: 세션 하나를 연 뒤 N번 호출 (지속 연결 비용 제외, 호출 경로만 비교)
+- cold: 호출마다 연결 + initialize + 호출 (짧은 단발성 호출 시나리오)
+
+기본 호출은 tools/list 라 KIPRIS API 키 없이도 transport 비용만 측정됩니다.
+실제 도구를 호출하려면 --tool 과 --args 를 지정하세요.
+
+    python benchmarks/bench_transports.py --calls 1000
+    python benchmarks/bench_transports.py --calls 100 --tool patent_search --args '{"word": "배터리"}'
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import typing as t
+
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamablehttp_client
+
+
+async def wait_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"server did not become ready: {url}")
+
+
+def sse_session(base_url: str):
+    return sse_client(f"{base_url}/sse")
+
+
+def streamable_session(base_url: str):
+    return streamablehttp_client(f"{base_url}/mcp")
+
+
+async def call(session: ClientSession, tool: t.Optional[str], args: dict) -> None:
+    if tool:
+        await session.call_tool(tool, args)
+    else:
+        await session.list_tools()
+
+
+async def run_warm(open_transport, base_url: str, calls: int, tool: t.Optional[str], args: dict) -> t.List[float]:
+    latencies = []
+    async with open_transport(base_url) as streams:
+        async with ClientSession(streams[0], streams[1]) as session:
+            await session.initialize()
+            for _ in range(calls):
+                started = time.perf_counter()
+                await call(session, tool, args)
+                latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def run_cold(open_transport, base_url: str, calls: int, tool: t.Optional[str], args: dict) -> t.List[float]:
+    latencies = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        async with open_transport(base_url) as streams:
+            async with ClientSession(streams[0], streams[1]) as session:
+                await session.initialize()
+                await call(session, tool, args)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def summarize(name: str, latencies: t.List[float]) -> None:
+    ms = sorted(latency * 1000 for latency in latencies)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    print(f"{name:<24} mean {statistics.mean(ms):8.2f} ms  p50 {statistics.median(ms):8.2f} ms  p95 {p95:8.2f} ms")
+
+
+async def run(args: argparse.Namespace, base_url: str) -> None:
+    await wait_ready(f"{base_url}/tools")
+    tool_args = json.loads(args.args)
+    runner = run_warm if args.mode == "warm" else run_cold
+    for name, transport in (("sse", sse_session), ("streamable-http", streamable_session)):
+        latencies = await runner(transport, base_url, args.calls, args.tool, tool_args)
+        summarize(f"{name} ({args.mode})", latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--mode", choices=["warm", "cold"], default="warm")
+    parser.add_argument("--tool", help="도구 이름 (기본: tools/list 호출)")
+    parser.add_argument("--args", default="{}", help="도구 인자 JSON")
+    parser.add_argument("--port", type=int, default=6395)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.setdefault("KIPRIS_API_KEY", "benchmark-key")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "mcp_kipris.sse_server", "--http", "--host", "127.0.0.1", "--port", str(args.port)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        print(f"calls: {args.calls}, mode: {args.mode}, call: {args.tool or 'tools/list'}")
+        asyncio.run(run(args, f"http://127.0.0.1:{args.port}"))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+벤치마크용 KIPRIS 응답 픽스처 생성
+
+실제 녹화 픽스처(KIPRIS_REPLAY_MODE=record)가 없을 때 쓰는 합성 응답입니다. API의 KEY_STRING 형태
+(items.item / items.PatentUtilityInfo / body.item / items.searchResult)마다 실제 응답과 비슷한 필드와
+길이의 XML을 만듭니다.
+
+    python benchmarks/kipris_fixtures.py --output fixtures --rows 30
+"""
+
+import argparse
+import typing as t
+from urllib.parse import urlencode
+from xml.sax.saxutils import escape
+
+from mcp_kipris.kipris.api.abs_class import ABSKiprisAPI
+from mcp_kipris.kipris.api.foreign.free_search_api import ForeignPatentFreeSearchAPI
+from mcp_kipris.kipris.api.korean.applicant_search_api import PatentApplicantSearchAPI
+from mcp_kipris.kipris.api.korean.patent_detail_search_api import PatentDetailSearchAPI
+from mcp_kipris.kipris.api.korean.patent_search_api import PatentSearchAPI
+from mcp_kipris.kipris.metrics import endpoint_label
+from mcp_kipris.kipris.replay import FixtureStore
+
+APPLICANTS = ["삼성전자주식회사", "주식회사 엘지에너지솔루션", "에스케이하이닉스 주식회사", "현대자동차주식회사"]
+STATUSES = ["등록", "공개", "거절", "소멸"]
+IPCS = ["H01M 10/052", "H01M 4/525", "G06N 3/08", "B60L 58/12"]
+ABSTRACT = "본 발명은 양극 활물질을 포함하는 리튬 이차전지에 관한 것으로, 수명 특성과 안전성이 향상된 전지를 제공한다. "
+
+
+def _element(tag: str, value: t.Any) -> str:
+    if isinstance(value, dict):
+        return f"<{tag}>{''.join(_element(key, item) for key, item in value.items())}</{tag}>"
+    if isinstance(value, list):
+        return "".join(_element(tag, item) for item in value)
+    return f"<{tag}>{escape(str(value))}</{tag}>"
+
+
+def korean_item(i: int) -> t.Dict[str, t.Any]:
+    return {
+        "indexNo": i + 1,
+        "applicationNumber": f"10202300{45678 + i}",
+        "applicationDate": f"2023{(i % 12) + 1:02d}15",
+        "inventionTitle": f"리튬 이차전지용 양극 활물질 및 이의 제조 방법 {i}",
+        "applicantName": APPLICANTS[i % len(APPLICANTS)],
+        "registerStatus": STATUSES[i % len(STATUSES)],
+        "ipcNumber": IPCS[i % len(IPCS)],
+        "openNumber": f"10202400{12345 + i}",
+        "openDate": "20240415",
+        "registerNumber": f"10{2650000 + i}",
+        "registerDate": "20250102",
+        "astrtCont": ABSTRACT * 3,
+    }
+
+
+def patent_utility_item(i: int) -> t.Dict[str, t.Any]:
+    return {
+        "SerialNumber": i + 1,
+        "ApplicationNumber": f"10202300{45678 + i}",
+        "ApplicationDate": f"2023.{(i % 12) + 1:02d}.15",
+        "InventionName": f"리튬 이차전지용 양극 활물질 및 이의 제조 방법 {i}",
+        "Applicant": APPLICANTS[i % len(APPLICANTS)],
+        "RegistrationStatus": STATUSES[i % len(STATUSES)],
+        "IPCNumber": IPCS[i % len(IPCS)],
+        "Abstract": ABSTRACT * 3,
+    }
+
+
+def detail_item(i: int) -> t.Dict[str, t.Any]:
+    return {
+        "biblioSummaryInfoArray": {"biblioSummaryInfo": korean_item(i)},
+        "inventionTitle": f"리튬 이차전지용 양극 활물질 및 이의 제조 방법 {i}",
+        "applicationNumber": f"10202300{45678 + i}",
+        "applicationDate": "20230115",
+        "registerStatus": "등록",
+        "registerNumber": f"10{2650000 + i}",
+        "registerDate": "20250102",
+        "openNumber": f"10202400{12345 + i}",
+        "openDate": "20240415",
+        "applicantInfoArray": {
+            "applicantInfo": [
+                {"name": name, "country": "KR", "code": f"1199{n:07d}"} for n, name in enumerate(APPLICANTS)
+            ]
+        },
+        "ipcInfoArray": {"ipcInfo": [{"ipcNumber": ipc, "ipcDate": "2023.01.15"} for ipc in IPCS]},
+        "abstractInfoArray": {"abstractInfo": {"astrtCont": ABSTRACT * 8}},
+        "claimInfoArray": {"claimInfo": [{"claim": f"청구항 {n}. " + ABSTRACT * 2} for n in range(1, 11)]},
+    }
+
+
+def foreign_item(i: int) -> t.Dict[str, t.Any]:
+    return {
+        "applicationNo": f"US{17000000 + i}",
+        "applicationDate": "20240101",
+        "inventionName": "Lithium secondary battery comprising a cathode active material " + str(i),
+        "applicant": ["LG ENERGY SOLUTION, LTD.", "SAMSUNG SDI CO., LTD.", "PANASONIC CORP."][i % 3],
+        "ipc": IPCS[i % len(IPCS)],
+        "countryCode": "US",
+        "astrtCont": "A lithium secondary battery includes a cathode, an anode and an electrolyte. " * 4,
+    }
+
+
+# KEY_STRING 형태 -> (API 클래스, 항목 태그, 항목 생성 함수, 요청 파라미터)
+SHAPES: t.Dict[str, t.Tuple[t.Type[ABSKiprisAPI], str, t.Callable[[int], t.Dict], t.Dict[str, t.Any]]] = {
+    "items.item": (PatentSearchAPI, "item", korean_item, {"word": "이차전지"}),
+    "items.PatentUtilityInfo": (
+        PatentApplicantSearchAPI,
+        "PatentUtilityInfo",
+        patent_utility_item,
+        {"applicant": "삼성전자"},
+    ),
+    "body.item": (PatentDetailSearchAPI, "item", detail_item, {"applicationNumber": "1020230045678"}),
+    "items.searchResult": (ForeignPatentFreeSearchAPI, "searchResult", foreign_item, {"word": "battery"}),
+}
+
+
+def make_response_xml(shape: str, rows: int) -> str:
+    """KIPRIS-style XML response with rows items in the given KEY_STRING shape (body.item has one item)."""
+    _, tag, make_item, _ = SHAPES[shape]
+    if shape == "body.item":
+        body = _element("item", make_item(0))
+    else:
+        body = "<items>" + "".join(_element(tag, make_item(i)) for i in range(rows)) + "</items>"
+    header = "<header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>"
+    count = f"<count><totalCount>{rows}</totalCount></count>"
+    return f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><response>{header}<body>{body}{count}</body></response>'
+
+
+def fixture_url(shape: str) -> str:
+    api_class, _, _, params = SHAPES[shape]
+    return f"{api_class(api_key='bench').api_url}?{urlencode(params)}"
+
+
+def write_fixtures(directory: str, rows: int = 30) -> t.Dict[str, str]:
+    """Write one fixture per KEY_STRING shape; returns shape -> fixture path."""
+    store = FixtureStore(directory, mode="record")
+    return {shape: store.save(fixture_url(shape), make_response_xml(shape, rows)) for shape in SHAPES}
+
+
+def tool_apis(handlers: t.Iterable[t.Any]) -> t.List[ABSKiprisAPI]:
+    """KIPRIS API clients of tool handlers; local tools (index, store, similarity) have none."""
+    return [handler.api for handler in handlers if handler.api is not None]
+
+
+def write_endpoint_fixtures(directory: str, apis: t.Iterable[ABSKiprisAPI], rows: int = 30) -> t.Dict[str, str]:
+    """
+    Write one fixture per API endpoint, shaped by the API's KEY_STRING; returns endpoint -> fixture path.
+
+    The stub server answers any query on an endpoint with one of its fixtures, so a single
+    fixture per endpoint is enough to serve every tool under load.
+    """
+    store = FixtureStore(directory, mode="record")
+    paths = {}
+    for api in apis:
+        shape = ".".join(api.KEY_STRING.split(".")[-2:])
+        paths[endpoint_label(api.api_url)] = store.save(
+            f"{api.api_url}?fixture=endpoint", make_response_xml(shape, rows)
+        )
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", default="fixtures")
+    parser.add_argument("--rows", type=int, default=30)
+    args = parser.parse_args()
+
+    for shape, path in write_fixtures(args.output, args.rows).items():
+        print(f"{shape:24s} {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,448 @@
+"""
+SSE 서버 부하 테스트 (용량 산정용)
+
+오프라인 스텁 서버(mcp_kipris.kipris.stub_server)와 그쪽을 바라보는 sse_server --http 를 띄우고,
+동시 MCP 세션 N개가 /sse 로 접속해 실제 사용 비율에 맞춘 도구 호출을 반복합니다.
+구간(--interval)마다 처리량, p50/p95/p99 지연 시간, 오류율, 활성 세션 수와 서버 /metrics 의
+RSS(process_resident_memory_bytes), 이벤트 루프 지연(kipris_event_loop_lag_seconds)을 출력합니다.
+
+- step: --start 세션에서 --step 씩 --max 까지 늘리며 단계마다 --step-duration 초 유지 (한계점 찾기)
+- soak: --sessions 세션을 --duration 초 동안 유지 (메모리 증가, 지연 시간 드리프트 확인)
+
+    python benchmarks/load_sse.py --profile step --start 10 --step 10 --max 100 --step-duration 30
+    python benchmarks/load_sse.py --profile soak --sessions 50 --duration 1800 --stub-latency-ms 300 --stub-jitter-ms 100
+    python benchmarks/load_sse.py --url http://127.0.0.1:6274 --profile soak --sessions 20   # 이미 떠 있는 서버
+
+서버 캐시는 끄고(KIPRIS_CACHE_TTL=0) rate limit은 풀어서 띄웁니다. 환경 변수로 직접 지정하면 그 값을 씁니다.
+세션 한도(KIPRIS_MAX_SESSIONS)를 넘는 세션은 접속 실패로 집계됩니다. --workers 2 이상이면 /metrics 값은
+요청을 받은 워커 하나의 값입니다.
+"""
+
+import os
+
+os.environ.setdefault("KIPRIS_API_KEY", "benchmark-key")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import datetime  # noqa: E402
+import json  # noqa: E402
+import random  # noqa: E402
+import statistics  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+import tempfile  # noqa: E402
+import time  # noqa: E402
+import typing as t  # noqa: E402
+
+import httpx  # noqa: E402
+from mcp import ClientSession  # noqa: E402
+from mcp.client.sse import sse_client  # noqa: E402
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from kipris_fixtures import tool_apis, write_endpoint_fixtures  # noqa: E402
+
+WORDS = ["이차전지", "양극재", "전고체 배터리", "반도체 패키징", "자율주행", "수소 연료전지", "OLED", "인공지능"]
+APPLICANTS = ["삼성전자", "엘지에너지솔루션", "에스케이하이닉스", "현대자동차", "에코프로비엠", "포스코퓨처엠"]
+APPLICATION_NUMBERS = [f"10202300{45678 + i}" for i in range(20)]
+FOREIGN_WORDS = ["battery", "cathode", "semiconductor", "hydrogen", "neural network"]
+
+# 도구 이름 -> (호출 비중, 인자 후보). 검색/상세 조회 위주의 실제 사용 비율을 흉내 냄
+TOOL_MIX: t.Dict[str, t.Tuple[float, t.List[dict]]] = {
+    "patent_free_search": (20, [{"word": word} for word in WORDS]),
+    "patent_applicant_search": (15, [{"applicant": applicant} for applicant in APPLICANTS]),
+    "patent_search": (10, [{"application_number": number} for number in APPLICATION_NUMBERS]),
+    "patent_detail_search": (8, [{"application_number": number} for number in APPLICATION_NUMBERS]),
+    "patent_summary_search": (8, [{"application_number": number} for number in APPLICATION_NUMBERS]),
+    "patent_application_number_search": (5, [{"application_number": number} for number in APPLICATION_NUMBERS]),
+    "patent_righter_search": (5, [{"righter_name": applicant} for applicant in APPLICANTS]),
+    "foreign_patent_free_search": (12, [{"word": word} for word in FOREIGN_WORDS]),
+    "foreign_patent_applicant_search": (6, [{"applicant": "SAMSUNG"}, {"applicant": "LG ENERGY SOLUTION"}]),
+    "foreign_patent_application_number_search": (4, [{"application_number": f"US{17000000 + i}"} for i in range(10)]),
+    "foreign_international_application_number_search": (
+        3,
+        [{"international_application_number": f"PCT/KR2023/{10000 + i}"} for i in range(10)],
+    ),
+    "foreign_international_open_number_search": (
+        3,
+        [{"international_open_number": f"WO2024/{100000 + i}"} for i in range(10)],
+    ),
+    "local_patent_search": (5, [{"query": word} for word in WORDS]),
+}
+
+
+class LoadStats:
+    """Call results collected by all sessions; drained by the reporter every interval."""
+
+    def __init__(self):
+        self.latencies: t.List[float] = []
+        self.errors = 0
+        self.session_failures = 0
+        self.active_sessions = 0
+        self.per_tool: t.Dict[str, t.List[float]] = {}
+        self.tool_errors: t.Dict[str, int] = {}
+        self._window: t.List[float] = []
+        self._window_errors = 0
+
+    def record(self, tool: str, latency: float, ok: bool) -> None:
+        self.latencies.append(latency)
+        self._window.append(latency)
+        self.per_tool.setdefault(tool, []).append(latency)
+        if not ok:
+            self.errors += 1
+            self._window_errors += 1
+            self.tool_errors[tool] = self.tool_errors.get(tool, 0) + 1
+
+    def drain_window(self) -> t.Tuple[t.List[float], int]:
+        window, errors = self._window, self._window_errors
+        self._window, self._window_errors = [], 0
+        return window, errors
+
+
+def percentile(values: t.List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)] if ordered else 0.0
+
+
+def latency_summary(latencies: t.List[float], errors: int, seconds: float) -> t.Dict[str, float]:
+    calls = len(latencies)
+    return {
+        "calls": calls,
+        "errors": errors,
+        "error_rate": errors / calls if calls else 0.0,
+        "throughput_rps": calls / seconds if seconds > 0 else 0.0,
+        "mean_ms": statistics.fmean(latencies) * 1e3 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1e3,
+        "p95_ms": percentile(latencies, 0.95) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+    }
+
+
+def parse_metrics(text: str) -> t.Dict[str, float]:
+    """Prometheus text -> {series: value} (series includes labels, e.g. 'x_bucket{le="0.1"}')."""
+    values = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            series, _, value = line.rpartition(" ")
+            try:
+                values[series] = float(value)
+            except ValueError:
+                pass
+    return values
+
+
+def lag_window(previous: t.Dict[str, float], current: t.Dict[str, float]) -> t.Dict[str, t.Optional[float]]:
+    """Mean event-loop lag and the upper bound of the slowest bucket hit between two scrapes."""
+    name = "kipris_event_loop_lag_seconds"
+    count = current.get(f"{name}_count", 0.0) - previous.get(f"{name}_count", 0.0)
+    if count <= 0:
+        return {"lag_mean_ms": None, "lag_max_ms": None}
+    total = current.get(f"{name}_sum", 0.0) - previous.get(f"{name}_sum", 0.0)
+    buckets = sorted(
+        (float(series.split('le="')[1].rstrip('"}')), series)
+        for series in current
+        if series.startswith(f"{name}_bucket")
+    )
+    # 누적 버킷: 직전 버킷보다 증가분이 커진 마지막 버킷이 이번 구간의 최대 지연이 속한 버킷
+    upper, below = 0.0, 0.0
+    for bound, series in buckets:
+        hits = current[series] - previous.get(series, 0.0)
+        if hits > below:
+            upper = bound
+        below = hits
+    return {"lag_mean_ms": total / count * 1e3, "lag_max_ms": upper * 1e3 if upper != float("inf") else None}
+
+
+async def run_session(
+    base_url: str,
+    stats: LoadStats,
+    stop: asyncio.Event,
+    mix: t.Dict[str, t.Tuple[float, t.List[dict]]],
+    rng: random.Random,
+    think: float,
+    timeout: float,
+) -> None:
+    tools = list(mix)
+    weights = [mix[tool][0] for tool in tools]
+    try:
+        async with sse_client(f"{base_url}/sse", timeout=timeout, sse_read_timeout=timeout * 10) as streams:
+            async with ClientSession(streams[0], streams[1]) as session:
+                await session.initialize()
+                stats.active_sessions += 1
+                try:
+                    while not stop.is_set():
+                        tool = rng.choices(tools, weights)[0]
+                        args = rng.choice(mix[tool][1])
+                        started = time.perf_counter()
+                        try:
+                            result = await session.call_tool(
+                                tool, args, read_timeout_seconds=datetime.timedelta(seconds=timeout)
+                            )
+                            ok = not result.isError
+                        except Exception:
+                            ok = False
+                        stats.record(tool, time.perf_counter() - started, ok)
+                        if think:
+                            await asyncio.sleep(rng.expovariate(1 / think))
+                finally:
+                    stats.active_sessions -= 1
+    except Exception:
+        stats.session_failures += 1
+
+
+async def reporter(
+    base_url: str, stats: LoadStats, interval: float, timeline: t.List[dict], started: float, stop: asyncio.Event
+) -> None:
+    previous: t.Dict[str, float] = {}
+    last = time.perf_counter()
+    async with httpx.AsyncClient(timeout=interval) as client:
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+            now = time.perf_counter()
+            window, errors = stats.drain_window()
+            try:
+                metrics = parse_metrics((await client.get(f"{base_url}/metrics")).text)
+            except httpx.HTTPError:
+                metrics = {}
+            rss = metrics.get("process_resident_memory_bytes")
+            row = {
+                "t": round(now - started, 1),
+                "sessions": stats.active_sessions,
+                **latency_summary(window, errors, now - last),
+                "rss_mb": rss / 2**20 if rss else None,
+                **(lag_window(previous, metrics) if previous else {"lag_mean_ms": None, "lag_max_ms": None}),
+            }
+            previous, last = metrics or previous, now
+            timeline.append(row)
+            print(
+                f"t={row['t']:7.1f}s  sessions {row['sessions']:4d}  {row['throughput_rps']:8.1f} req/s  "
+                f"p50 {row['p50_ms']:8.1f}  p95 {row['p95_ms']:8.1f}  p99 {row['p99_ms']:8.1f} ms  "
+                f"err {row['error_rate'] * 100:5.1f}%  rss {_fmt(row['rss_mb'], 'MB')}  "
+                f"loop lag {_fmt(row['lag_mean_ms'], 'ms')} (max <= {_fmt(row['lag_max_ms'], 'ms')})",
+                flush=True,
+            )
+
+
+def _fmt(value: t.Optional[float], unit: str) -> str:
+    return f"{value:7.1f} {unit}" if value is not None else f"{'-':>7s} {unit}"
+
+
+async def run_load(args: argparse.Namespace, base_url: str, mix: t.Dict[str, t.Tuple[float, t.List[dict]]]) -> dict:
+    stats = LoadStats()
+    stop_sessions = asyncio.Event()
+    stop_reporter = asyncio.Event()
+    timeline: t.List[dict] = []
+    steps: t.List[dict] = []
+    rng = random.Random(args.seed)
+    sessions: t.List[asyncio.Task] = []
+
+    def add_sessions(count: int) -> None:
+        for _ in range(count):
+            session_rng = random.Random(rng.random())
+            sessions.append(
+                asyncio.create_task(
+                    run_session(base_url, stats, stop_sessions, mix, session_rng, args.think_ms / 1000, args.timeout)
+                )
+            )
+
+    started = time.perf_counter()
+    report = asyncio.create_task(reporter(base_url, stats, args.interval, timeline, started, stop_reporter))
+
+    if args.profile == "step":
+        for level in range(args.start, args.max + 1, args.step):
+            add_sessions(level - len(sessions))
+            step_started, calls_before, errors_before = time.perf_counter(), len(stats.latencies), stats.errors
+            await asyncio.sleep(args.step_duration)
+            latencies = stats.latencies[calls_before:]
+            steps.append(
+                {
+                    "sessions": level,
+                    **latency_summary(latencies, stats.errors - errors_before, time.perf_counter() - step_started),
+                }
+            )
+    else:
+        add_sessions(args.sessions)
+        await asyncio.sleep(args.duration)
+
+    stop_sessions.set()
+    await asyncio.gather(*sessions, return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    stop_reporter.set()
+    await report
+
+    return {
+        "summary": {
+            **latency_summary(stats.latencies, stats.errors, elapsed),
+            "session_failures": stats.session_failures,
+            "duration_s": elapsed,
+        },
+        "per_tool": {
+            tool: latency_summary(latencies, stats.tool_errors.get(tool, 0), elapsed)
+            for tool, latencies in sorted(stats.per_tool.items())
+        },
+        "steps": steps,
+        "timeline": timeline,
+    }
+
+
+async def wait_ready(url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"server did not become ready: {url}")
+
+
+def start_servers(args: argparse.Namespace, fixtures_dir: str) -> t.Tuple[t.List[subprocess.Popen], str]:
+    stub_url = f"http://127.0.0.1:{args.stub_port}"
+    stub = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "mcp_kipris.kipris.stub_server",
+            "--fixtures",
+            fixtures_dir,
+            "--port",
+            str(args.stub_port),
+            "--latency-ms",
+            str(args.stub_latency_ms),
+            "--jitter-ms",
+            str(args.stub_jitter_ms),
+            "--error-rate",
+            str(args.stub_error_rate),
+            "--seed",
+            str(args.seed),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    env = dict(os.environ)
+    env["KIPRIS_BASE_URL"] = stub_url
+    env.setdefault("KIPRIS_CACHE_TTL", "0")
+    env.setdefault("KIPRIS_RATE_LIMIT_PER_MINUTE", str(10**9))
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "mcp_kipris.sse_server",
+            "--http",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(args.port),
+            "--workers",
+            str(args.workers),
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return [server, stub], f"http://127.0.0.1:{args.port}"
+
+
+def load_mix(path: t.Optional[str]) -> t.Dict[str, t.Tuple[float, t.List[dict]]]:
+    """TOOL_MIX, with weights overridden by a JSON file of {tool: weight} (weight 0 drops the tool)."""
+    if not path:
+        return dict(TOOL_MIX)
+    with open(path, encoding="utf-8") as f:
+        weights = json.load(f)
+    unknown = set(weights) - set(TOOL_MIX)
+    if unknown:
+        raise SystemExit(f"unknown tools in {path}: {', '.join(sorted(unknown))}")
+    return {
+        tool: (weights.get(tool, weight), calls)
+        for tool, (weight, calls) in TOOL_MIX.items()
+        if weights.get(tool, weight) > 0
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", choices=["step", "soak"], default="step")
+    parser.add_argument("--start", type=int, default=10, help="step: initial sessions")
+    parser.add_argument("--step", type=int, default=10, help="step: sessions added per step")
+    parser.add_argument("--max", type=int, default=100, help="step: final sessions")
+    parser.add_argument("--step-duration", type=float, default=30.0, help="step: seconds per step")
+    parser.add_argument("--sessions", type=int, default=50, help="soak: concurrent sessions")
+    parser.add_argument("--duration", type=float, default=600.0, help="soak: seconds")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Mean pause between calls in a session")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-call timeout in seconds")
+    parser.add_argument("--interval", type=float, default=5.0, help="Report interval in seconds")
+    parser.add_argument("--mix", help="JSON file of {tool: weight} overriding the default tool mix")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--url", help="Load an already running server instead of starting the stub and server")
+    parser.add_argument("--port", type=int, default=6396)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--fixtures", help="Recorded fixture directory (default: synthetic, one per endpoint)")
+    parser.add_argument("--rows", type=int, default=30, help="Rows per synthetic response")
+    parser.add_argument("--stub-port", type=int, default=8089)
+    parser.add_argument("--stub-latency-ms", type=float, default=300.0)
+    parser.add_argument("--stub-jitter-ms", type=float, default=100.0)
+    parser.add_argument("--stub-error-rate", type=float, default=0.0)
+    parser.add_argument("--output", help="Write the summary, per-step results and timeline as JSON")
+    args = parser.parse_args()
+
+    mix = load_mix(args.mix)
+    processes: t.List[subprocess.Popen] = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_url = args.url
+        if not base_url:
+            fixtures_dir = args.fixtures
+            if not fixtures_dir:
+                from mcp_kipris import sse_server
+
+                fixtures_dir = temp_dir
+                write_endpoint_fixtures(fixtures_dir, tool_apis(sse_server.tool_handlers.values()), args.rows)
+            processes, base_url = start_servers(args, fixtures_dir)
+        try:
+            asyncio.run(wait_ready(f"{base_url}/tools"))
+            load = (
+                "step {start}->{max} (+{step} every {step_duration:.0f}s)"
+                if args.profile == "step"
+                else "soak {sessions} sessions for {duration:.0f}s"
+            )
+            print(f"{base_url}: {load.format(**vars(args))}, {len(mix)} tools", flush=True)
+            results = asyncio.run(run_load(args, base_url, mix))
+        finally:
+            for process in processes:
+                process.terminate()
+                process.wait(timeout=30)
+
+    summary = results["summary"]
+    print(
+        f"\ntotal {summary['calls']} calls in {summary['duration_s']:.0f}s: {summary['throughput_rps']:.1f} req/s, "
+        f"p50 {summary['p50_ms']:.1f} ms, p95 {summary['p95_ms']:.1f} ms, p99 {summary['p99_ms']:.1f} ms, "
+        f"errors {summary['error_rate'] * 100:.2f}%, session failures {summary['session_failures']}"
+    )
+    for step in results["steps"]:
+        print(
+            f"  {step['sessions']:4d} sessions  {step['throughput_rps']:8.1f} req/s  p95 {step['p95_ms']:8.1f} ms  "
+            f"p99 {step['p99_ms']:8.1f} ms  errors {step['error_rate'] * 100:5.1f}%"
+        )
+    if args.output:
+        results["meta"] = {
+            "profile": args.profile,
+            "url": args.url,
+            "workers": args.workers,
+            "stub_latency_ms": args.stub_latency_ms,
+            "stub_jitter_ms": args.stub_jitter_ms,
+            "stub_error_rate": args.stub_error_rate,
+            "think_ms": args.think_ms,
+            "mix": {tool: weight for tool, (weight, _) in mix.items()},
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
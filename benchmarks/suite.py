@@ -0,0 +1,307 @@
+"""
+벤치마크 모음 (오프라인, 한 번에 실행)
+
+재생 픽스처와 스텁 서버(mcp_kipris.kipris.stub_server)를 사용해 실제 KIPRIS 없이 다음을 측정하고
+결과를 JSON으로 저장합니다. 커밋별 결과 파일을 --compare 로 비교할 수 있습니다.
+
+- xml_to_records: KEY_STRING 형태별 XML → 레코드(DataFrame) 처리량
+- parse_response: 파싱된 응답 dict → DataFrame 비용
+- render: DataFrame.to_markdown 과 도구 출력 경로(render_records) 렌더링 비용
+- async_call: ABSKiprisAPI.async_call 호출당 오버헤드 (재생 응답 기준, XML 파싱 시간 제외분)
+- call_tool: 스텁 서버를 통한 도구 호출 종단 간 지연 시간 / 처리량 (동시성 1, 10, 100)
+
+    python benchmarks/suite.py                               # benchmarks/results/<commit>.json
+    python benchmarks/suite.py --fixtures fixtures           # 녹화한 실제 응답 사용
+    python benchmarks/suite.py --compare benchmarks/results/abc1234.json
+
+캐시는 끄고 rate limit과 동시 호출 한도는 측정에 영향이 없도록 풀어서 실행합니다.
+"""
+
+import os
+
+# 도구/팩토리 모듈을 import 하기 전에 설정해야 적용됨
+os.environ.setdefault("KIPRIS_API_KEY", "bench")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ["KIPRIS_CACHE_TTL"] = "0"
+os.environ["KIPRIS_ENTITY_CACHE_TTL"] = "0"
+os.environ["KIPRIS_RATE_LIMIT_PER_MINUTE"] = str(10**9)
+os.environ["KIPRIS_MAX_INFLIGHT_CALLS"] = "0"
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import datetime  # noqa: E402
+import json  # noqa: E402
+import platform  # noqa: E402
+import socket  # noqa: E402
+import statistics  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+import tempfile  # noqa: E402
+import threading  # noqa: E402
+import time  # noqa: E402
+import timeit  # noqa: E402
+import typing as t  # noqa: E402
+
+import uvicorn  # noqa: E402
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from kipris_fixtures import SHAPES, fixture_url, tool_apis, write_endpoint_fixtures, write_fixtures  # noqa: E402
+
+from mcp_kipris import sse_server  # noqa: E402
+from mcp_kipris.kipris.api.utils import parse_xml_response  # noqa: E402
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory  # noqa: E402
+from mcp_kipris.kipris.metrics import endpoint_label  # noqa: E402
+from mcp_kipris.kipris.replay import FixtureStore, set_fixture_store  # noqa: E402
+from mcp_kipris.kipris.stub_server import StubConfig, create_stub_app  # noqa: E402
+
+# 종단 간 측정 도구 호출 (도구 이름 -> 인자)
+TOOL_CALLS = {
+    "patent_search": {"application_number": "1020230045678"},
+    "patent_applicant_search": {"applicant": "삼성전자"},
+    "patent_detail_search": {"application_number": "1020230045678"},
+    "foreign_patent_free_search": {"word": "battery"},
+}
+
+
+def best_of(fn: t.Callable[[], t.Any], number: int, repeat: int = 5) -> float:
+    """Best per-call time in seconds over repeat runs of number calls."""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def bench_parsing(store: FixtureStore, number: int) -> t.Dict[str, t.Dict[str, t.Dict[str, float]]]:
+    xml_to_records, parse_response, render = {}, {}, {}
+    for shape, (api_class, _, _, _) in SHAPES.items():
+        url = fixture_url(shape)
+        xml = store.load(url)
+        api = api_class(api_key="bench")
+        endpoint = endpoint_label(url)
+        parsed = parse_xml_response(url, xml, endpoint)
+        records = api.parse_response(parsed)
+        rows = max(len(records), 1)
+
+        seconds = best_of(lambda: api.parse_response(parse_xml_response(url, xml, endpoint)), number)
+        xml_to_records[shape] = {
+            "rows": rows,
+            "xml_bytes": len(xml.encode("utf-8")),
+            "us_per_response": seconds * 1e6,
+            "records_per_second": rows / seconds,
+        }
+        parse_response[shape] = {"us_per_call": best_of(lambda: api.parse_response(parsed), number) * 1e6}
+
+        handler = next(iter(sse_server.tool_handlers.values()))
+        table = records.astype(str)
+        render[shape] = {
+            "to_markdown_us": best_of(lambda: table.to_markdown(index=False), max(number // 5, 1)) * 1e6,
+            "render_records_us": best_of(lambda: handler.render_records(records, {}), number) * 1e6,
+        }
+    return {"xml_to_records": xml_to_records, "parse_response": parse_response, "render": render}
+
+
+def bench_async_call(store: FixtureStore, number: int) -> t.Dict[str, float]:
+    """ABSKiprisAPI.async_call through the shared factory, served from in-process replay."""
+    shape = "items.item"
+    api_class, _, _, params = SHAPES[shape]
+    api = get_api_client_factory().get_client(api_class)
+    url = fixture_url(shape)
+    xml = store.load(url)
+    endpoint = endpoint_label(url)
+
+    async def calls() -> float:
+        started = time.perf_counter()
+        for _ in range(number):
+            await api.async_call(api.api_url, api_key_field="ServiceKey", **params)
+        return (time.perf_counter() - started) / number
+
+    set_fixture_store(store)
+    try:
+        asyncio.run(calls())
+        per_call = min(asyncio.run(calls()) for _ in range(3))
+    finally:
+        set_fixture_store(None)
+    parse = best_of(lambda: parse_xml_response(url, xml, endpoint), number)
+    return {"us_per_call": per_call * 1e6, "xml_parse_us": parse * 1e6, "overhead_us": (per_call - parse) * 1e6}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_stub(config: StubConfig) -> t.Tuple[uvicorn.Server, str]:
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(create_stub_app(config), host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, name="kipris-stub", daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, f"http://127.0.0.1:{port}"
+
+
+def percentile(values: t.List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+async def run_concurrent(tool: str, args: dict, concurrency: int, calls: int) -> t.Dict[str, float]:
+    latencies: t.List[float] = []
+    errors = 0
+    remaining = calls
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                result = await sse_server.call_tool(tool, args)
+                if not result or "오류" in result[0].text:
+                    errors += 1
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "calls": len(latencies),
+        "errors": errors,
+        "throughput_rps": len(latencies) / elapsed,
+        "mean_ms": statistics.fmean(latencies) * 1e3,
+        "p50_ms": percentile(latencies, 0.50) * 1e3,
+        "p95_ms": percentile(latencies, 0.95) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+    }
+
+
+def bench_call_tool(
+    config: StubConfig, tools: t.Sequence[str], levels: t.Sequence[int], calls: int
+) -> t.Dict[str, t.Dict[str, t.Dict[str, float]]]:
+    server, base_url = start_stub(config)
+    os.environ["KIPRIS_BASE_URL"] = base_url
+
+    async def run_all() -> t.Dict[str, t.Dict[str, t.Dict[str, float]]]:
+        results = {}
+        for tool in tools:
+            # 연결 풀 준비
+            await run_concurrent(tool, TOOL_CALLS[tool], 4, 8)
+            results[tool] = {
+                str(level): await run_concurrent(tool, TOOL_CALLS[tool], level, max(calls, level)) for level in levels
+            }
+        return results
+
+    try:
+        return asyncio.run(run_all())
+    finally:
+        del os.environ["KIPRIS_BASE_URL"]
+        server.should_exit = True
+
+
+def git_commit() -> t.Tuple[str, bool]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True
+            ).stdout.strip()
+        )
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def flatten(data: t.Any, prefix: str = "") -> t.Dict[str, float]:
+    if isinstance(data, dict):
+        flat = {}
+        for key, value in data.items():
+            flat.update(flatten(value, f"{prefix}.{key}" if prefix else str(key)))
+        return flat
+    if isinstance(data, (int, float)) and not isinstance(data, bool):
+        return {prefix: float(data)}
+    return {}
+
+
+def compare(baseline_path: str, results: t.Dict[str, t.Any]) -> None:
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    old, new = flatten(baseline["results"]), flatten(results["results"])
+    print(f"\nvs {baseline['meta']['commit']} ({baseline_path})")
+    for key in sorted(old.keys() & new.keys()):
+        if old[key]:
+            print(f"  {key:70s} {old[key]:12.2f} -> {new[key]:12.2f}  {(new[key] / old[key] - 1) * 100:+7.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="Recorded fixture directory (default: generate synthetic fixtures)")
+    parser.add_argument("--rows", type=int, default=30, help="Rows per synthetic response")
+    parser.add_argument("--number", type=int, default=200, help="Calls per micro-benchmark repeat")
+    parser.add_argument("--calls", type=int, default=200, help="Tool calls per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--tools", nargs="+", default=list(TOOL_CALLS), choices=list(TOOL_CALLS))
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0)
+    parser.add_argument("--stub-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", help="Earlier result file to compare against")
+    args = parser.parse_args()
+
+    commit, dirty = git_commit()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        fixtures_dir = args.fixtures or temp_dir
+        if not args.fixtures:
+            write_fixtures(fixtures_dir, args.rows)
+            # 도구가 호출하는 나머지 엔드포인트 (스텁 서버가 쿼리와 무관하게 응답)
+            write_endpoint_fixtures(fixtures_dir, tool_apis(sse_server.tool_handlers.values()), args.rows)
+        store = FixtureStore(fixtures_dir, mode="replay")
+
+        print("parse / render ...", flush=True)
+        results = bench_parsing(store, args.number)
+        print("async_call ...", flush=True)
+        results["async_call"] = bench_async_call(store, args.number)
+        print("call_tool ...", flush=True)
+        stub = StubConfig(fixtures_dir=fixtures_dir, latency_ms=args.stub_latency_ms, jitter_ms=args.stub_jitter_ms)
+        results["call_tool"] = bench_call_tool(stub, args.tools, args.concurrency, args.calls)
+
+    report = {
+        "meta": {
+            "commit": commit,
+            "dirty": dirty,
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "fixtures": args.fixtures or f"synthetic ({args.rows} rows)",
+            "stub_latency_ms": args.stub_latency_ms,
+            "stub_jitter_ms": args.stub_jitter_ms,
+        },
+        "results": results,
+    }
+
+    output = args.output or os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", f"{commit}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for shape, row in results["xml_to_records"].items():
+        print(f"xml_to_records  {shape:24s} {row['records_per_second']:10.0f} records/s")
+    for shape, row in results["render"].items():
+        print(
+            f"render          {shape:24s} {row['to_markdown_us']:10.1f} us to_markdown  {row['render_records_us']:8.1f} us render_records"
+        )
+    print(f"async_call      overhead {results['async_call']['overhead_us']:.1f} us/call")
+    for tool, levels in results["call_tool"].items():
+        for level, row in levels.items():
+            print(
+                f"call_tool       {tool:28s} c={level:>3s} {row['throughput_rps']:8.1f} req/s  "
+                f"p50 {row['p50_ms']:7.2f} ms  p99 {row['p99_ms']:7.2f} ms  errors {row['errors']}"
+            )
+    print(f"\nresults written to {output}")
+    if args.compare:
+        compare(args.compare, report)
+
+
+if __name__ == "__main__":
+    main()
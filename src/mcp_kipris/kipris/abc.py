@@ -1,9 +1,102 @@
+import logging
+import os
 from collections.abc import Sequence
 
+import anyio
+import pandas as pd
 from mcp.types import EmbeddedResource, ImageContent, TextContent, Tool
 
+from mcp_kipris.kipris.prefetch import get_prefetcher
+from mcp_kipris.kipris.render import (
+    BYTES_PER_TOKEN,
+    TABLE_FORMATS,
+    fit_records_to_budget,
+    render_budgeted,
+    render_json,
+    render_table,
+)
+from mcp_kipris.kipris.tracing import span
+
+logger = logging.getLogger("mcp-kipris")
+
+OUTPUT_FORMATS = TABLE_FORMATS + ("json",)
+
+OUTPUT_FORMAT_PROPERTY = {
+    "type": "string",
+    "description": (
+        "결과 출력 형식 (기본값: markdown). json은 "
+        '{"columns": [...], "records": [...], "count": n} 구조의 JSON 텍스트를 반환합니다.'
+    ),
+    "enum": list(OUTPUT_FORMATS),
+}
+
+COLLAPSE_DUPLICATES_PROPERTY = {
+    "type": "boolean",
+    "description": (
+        "근사 중복 특허(패밀리, 분할/계속 출원 등 초록/청구항이 거의 같은 특허)를 한 행으로 묶고 "
+        "나머지 출원번호를 duplicates 열에 표시 (기본값: false)"
+    ),
+}
+# 결과 레코드의 출원번호 열 (응답 형식별)
+APPLICATION_NUMBER_COLUMNS = ("applicationNumber", "ApplicationNumber", "applicationNo")
+# collapse_duplicates 가 백그라운드 색인을 기다리는 최대 시간 (초)
+COLLAPSE_INDEX_TIMEOUT = 10.0
+
+RESULT_BUDGET_PROPERTIES = {
+    "max_tokens": {
+        "type": "integer",
+        "description": "결과 토큰 예산. 초과하는 긴 필드는 잘리거나 생략되고 생략된 필드 이름이 함께 표시됩니다.",
+    },
+    "max_bytes": {"type": "integer", "description": "결과 바이트 예산 (max_tokens 대신 사용)"},
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "표시할 필드 이름 또는 경로 목록 (생략된 필드를 다시 요청할 때 사용)",
+    },
+}
+
+_default_output_format = None
+_default_result_token_budget = None
+
+
+def set_default_output_format(output_format: str) -> None:
+    """Set the server-wide output format used when a call does not pass output_format."""
+    global _default_output_format
+
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"output_format must be one of: {', '.join(OUTPUT_FORMATS)}")
+    _default_output_format = output_format
+
+
+def get_default_output_format() -> str:
+    """Server-wide output format: set_default_output_format() > KIPRIS_OUTPUT_FORMAT > markdown."""
+    if _default_output_format:
+        return _default_output_format
+    output_format = os.getenv("KIPRIS_OUTPUT_FORMAT", "markdown").lower()
+    return output_format if output_format in OUTPUT_FORMATS else "markdown"
+
+
+def set_default_result_token_budget(max_tokens: int | None) -> None:
+    """Set the server-wide token budget for tools that support budgeted rendering (None disables it)."""
+    global _default_result_token_budget
+
+    _default_result_token_budget = max_tokens
+
+
+def get_default_result_token_budget() -> int | None:
+    """Server-wide result token budget: set_default_result_token_budget() > KIPRIS_RESULT_TOKEN_BUDGET > None."""
+    if _default_result_token_budget:
+        return _default_result_token_budget
+    budget = os.getenv("KIPRIS_RESULT_TOKEN_BUDGET", "")
+    return int(budget) if budget.isdigit() and int(budget) > 0 else None
+
 
 class ToolHandler:
+    # 목록형 검색 도구는 True: collapse_duplicates 인자를 노출하고 render_records 에서 근사 중복을 묶음
+    collapsible = False
+    # KIPRIS 를 호출하는 도구는 __init__ 에서 API 클라이언트를 설정 (로컬 도구는 None)
+    api = None
+
     def __init__(self, tool_name: str):
         self.name = tool_name
 
@@ -12,3 +105,99 @@ class ToolHandler:
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         raise NotImplementedError("Subclasses must implement this method")
+
+    def with_output_options(self, tool: Tool) -> Tool:
+        """
+        Add the output_format argument to a tool description.
+
+        JSON results are returned as text, so no outputSchema is declared: mcp>=1.10 rejects calls to
+        tools that declare one without returning structuredContent.
+        """
+        tool.inputSchema.setdefault("properties", {})["output_format"] = OUTPUT_FORMAT_PROPERTY
+        if self.collapsible:
+            tool.inputSchema["properties"]["collapse_duplicates"] = COLLAPSE_DUPLICATES_PROPERTY
+        return tool
+
+    def get_output_format(self, args: dict) -> str:
+        output_format = args.get("output_format") or get_default_output_format()
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"output_format must be one of: {', '.join(OUTPUT_FORMATS)}")
+        return output_format
+
+    def render_records(
+        self, records: pd.DataFrame, args: dict, columns: Sequence[str] | None = None
+    ) -> Sequence[TextContent]:
+        """Render tool results in the output format requested by the call (or the server default)."""
+        output_format = self.get_output_format(args)
+        if self.collapsible and args.get("collapse_duplicates"):
+            records = self.collapse_duplicates(records)
+        with span("render", format=output_format, rows=len(records)):
+            if output_format == "json":
+                return [TextContent(type="text", text=render_json(records, columns))]
+            return [TextContent(type="text", text=render_table(records, columns, fmt=output_format))]
+
+    async def render_records_async(
+        self, records: pd.DataFrame, args: dict, columns: Sequence[str] | None = None
+    ) -> Sequence[TextContent]:
+        """render_records() for run_tool_async: collapsing waits for the background indexer, so it runs in a thread."""
+        if self.collapsible and args.get("collapse_duplicates"):
+            return await anyio.to_thread.run_sync(self.render_records, records, args, columns)
+        return self.render_records(records, args, columns)
+
+    def with_result_budget_options(self, tool: Tool) -> Tool:
+        """Add the max_tokens / max_bytes / fields arguments used by render_budgeted_records."""
+        tool.inputSchema.setdefault("properties", {}).update(RESULT_BUDGET_PROPERTIES)
+        return tool
+
+    def get_result_budget_bytes(self, args: dict) -> int | None:
+        if args.get("max_bytes"):
+            return int(args["max_bytes"])
+        max_tokens = args.get("max_tokens") or get_default_result_token_budget()
+        return int(max_tokens) * BYTES_PER_TOKEN if max_tokens else None
+
+    def render_budgeted_records(
+        self, records: pd.DataFrame, args: dict, priority_fields: Sequence[str] = ()
+    ) -> Sequence[TextContent]:
+        """
+        Render records within the call's result budget, falling back to render_records when no budget
+        or field selection applies. Long fields are truncated or omitted and listed in the output.
+        """
+        budget = self.get_result_budget_bytes(args)
+        fields = args.get("fields") or None
+        if budget is None and fields is None:
+            return self.render_records(records, args)
+
+        output_format = self.get_output_format(args)
+        with span("render", format=output_format, rows=len(records), budget_bytes=budget or 0):
+            budgeted = fit_records_to_budget(
+                records,
+                max_bytes=budget if budget is not None else float("inf"),
+                priority_fields=priority_fields,
+                fields=fields,
+                fmt=output_format,
+            )
+            return [TextContent(type="text", text=render_budgeted(budgeted, fmt=output_format))]
+
+    def prefetch_details(self, records: pd.DataFrame) -> None:
+        """Start background detail fetches for the top hits of a search result (when KIPRIS_PREFETCH_TOP_K is set)."""
+        prefetcher = get_prefetcher()
+        if prefetcher is not None:
+            prefetcher.schedule(self.api, records)
+
+    def collapse_duplicates(self, records: pd.DataFrame) -> pd.DataFrame:
+        """Keep one row per group of near-duplicate patents, using the signatures of the client's factory."""
+        factory = getattr(getattr(self, "api", None), "factory", None)
+        column = next((name for name in APPLICATION_NUMBER_COLUMNS if name in records.columns), None)
+        if factory is None or column is None or not factory.near_duplicates.enabled:
+            return records
+        with span("collapse_duplicates", rows=len(records)):
+            # 방금 받은 응답의 서명은 백그라운드 색인 스레드가 계산하므로 끝날 때까지 기다림
+            if not factory.wait_for_indexing(timeout=COLLAPSE_INDEX_TIMEOUT):
+                logger.warning("근사 중복 색인 대기 시간 초과: 일부 중복이 묶이지 않을 수 있음")
+            return factory.near_duplicates.collapse(records, column)
+
+    def render_empty(self, args: dict, message: str) -> Sequence[TextContent]:
+        """Render an empty result; JSON callers get an empty records payload instead of the message."""
+        if self.get_output_format(args) == "json":
+            return [TextContent(type="text", text=render_json([], []))]
+        return [TextContent(type="text", text=message)]
@@ -0,0 +1,190 @@
+"""
+Admission control for the HTTP server.
+Caps concurrent SSE sessions and in-flight tool calls and rejects work over the caps right away,
+with a retry hint derived from recent call latency and the KIPRIS rate limiter's time until its next
+free slot, instead of queuing it behind the KIPRIS rate limit.
+"""
+
+import asyncio
+import contextlib
+import logging
+import math
+import os
+import threading
+import time
+import typing as t
+
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
+from mcp_kipris.kipris.errors import KiprisBusyError
+from mcp_kipris.kipris.metrics import get_metrics_registry, stats_collector
+
+logger = logging.getLogger("mcp-kipris")
+
+
+class AdmissionController:
+    """Session and in-flight call limits with a Retry-After estimate from latency and the rate limiter."""
+
+    # 최근 호출 지연 시간 지수 이동 평균 가중치
+    LATENCY_SMOOTHING = 0.2
+
+    def __init__(
+        self,
+        max_sessions: int = 100,
+        max_inflight: int = 32,
+        rate_limit_wait: t.Optional[t.Callable[[], float]] = None,
+    ):
+        """
+        Initialize admission controller.
+
+        Args:
+            max_sessions: Concurrent SSE sessions allowed (0 disables the cap)
+            max_inflight: Concurrent tool calls allowed (0 disables the cap)
+            rate_limit_wait: Returns seconds until the KIPRIS rate limiter frees a slot
+        """
+        self.max_sessions = max_sessions
+        self.max_inflight = max_inflight
+        self.rate_limit_wait = rate_limit_wait
+        self.sessions = 0
+        self.inflight = 0
+        self.rejected_sessions = 0
+        self.rejected_calls = 0
+        self.cancelled_calls = 0
+        # 호출 지연 시간에는 rate limit 대기 시간이 포함되므로 현재 대기열 상황을 반영함
+        self.avg_call_seconds = 1.0
+        self._lock = threading.Lock()
+
+    def retry_after(self) -> float:
+        """
+        Seconds until a call is likely to be admitted and sent (at least 1).
+
+        The larger of the time for an in-flight slot to free up (recent latency) and the time until
+        the rate limiter's next free slot, so clients held back by the KIPRIS rate limit are not told
+        to come back before it has room.
+        """
+        with self._lock:
+            if self.max_inflight:
+                slot_wait = self.avg_call_seconds * max(self.inflight, 1) / self.max_inflight
+            else:
+                slot_wait = 1.0
+        limiter_wait = self.rate_limit_wait() if self.rate_limit_wait is not None else 0.0
+        return float(max(1, math.ceil(max(slot_wait, limiter_wait))))
+
+    def check_calls(self) -> None:
+        """
+        Fail fast when no call slot is free, without reserving one.
+
+        Raises:
+            KiprisBusyError: When in-flight calls are at the cap
+        """
+        with self._lock:
+            full = bool(self.max_inflight) and self.inflight >= self.max_inflight
+            if full:
+                self.rejected_calls += 1
+        if full:
+            raise KiprisBusyError("in-flight tool calls", self.max_inflight, retry_after=self.retry_after())
+
+    @contextlib.contextmanager
+    def call(self) -> t.Iterator[None]:
+        """
+        Hold an in-flight call slot for the duration of the block.
+
+        Raises:
+            KiprisBusyError: When in-flight calls are at the cap
+        """
+        with self._lock:
+            full = bool(self.max_inflight) and self.inflight >= self.max_inflight
+            if full:
+                self.rejected_calls += 1
+            else:
+                self.inflight += 1
+        if full:
+            logger.warning("Rejecting tool call: %d in-flight calls", self.max_inflight)
+            raise KiprisBusyError("in-flight tool calls", self.max_inflight, retry_after=self.retry_after())
+
+        started = time.monotonic()
+        cancelled = False
+        try:
+            yield
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            with self._lock:
+                self.inflight -= 1
+                if cancelled:
+                    # 취소된 호출의 짧은 지연 시간은 Retry-After 추정에서 제외
+                    self.cancelled_calls += 1
+                else:
+                    self.avg_call_seconds += self.LATENCY_SMOOTHING * (elapsed - self.avg_call_seconds)
+
+    @contextlib.contextmanager
+    def session(self) -> t.Iterator[None]:
+        """
+        Hold an SSE session slot for the duration of the block.
+
+        Raises:
+            KiprisBusyError: When sessions are at the cap
+        """
+        with self._lock:
+            full = bool(self.max_sessions) and self.sessions >= self.max_sessions
+            if full:
+                self.rejected_sessions += 1
+            else:
+                self.sessions += 1
+        if full:
+            logger.warning("Rejecting SSE session: %d sessions open", self.max_sessions)
+            raise KiprisBusyError("SSE sessions", self.max_sessions, retry_after=self.retry_after())
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.sessions -= 1
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        """Admission statistics for logging/metrics."""
+        with self._lock:
+            return {
+                "max_sessions": self.max_sessions,
+                "max_inflight": self.max_inflight,
+                "sessions": self.sessions,
+                "inflight": self.inflight,
+                "rejected_sessions": self.rejected_sessions,
+                "rejected_calls": self.rejected_calls,
+                "cancelled_calls": self.cancelled_calls,
+                "avg_call_seconds": round(self.avg_call_seconds, 4),
+            }
+
+
+# Global admission controller instance
+_admission_controller: t.Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """
+    Get or create the admission controller.
+
+    Caps come from KIPRIS_MAX_SESSIONS (default 100) and KIPRIS_MAX_INFLIGHT_CALLS (default 32).
+
+    Returns:
+        AdmissionController instance
+    """
+    global _admission_controller
+
+    if _admission_controller is None:
+        _admission_controller = AdmissionController(
+            max_sessions=int(os.getenv("KIPRIS_MAX_SESSIONS", "100")),
+            max_inflight=int(os.getenv("KIPRIS_MAX_INFLIGHT_CALLS", "32")),
+            rate_limit_wait=lambda: get_api_client_factory().rate_limiter.time_until_slot(),
+        )
+        get_metrics_registry().register_collector(
+            "admission",
+            stats_collector(
+                "kipris_admission",
+                _admission_controller.stats,
+                ("rejected_sessions", "rejected_calls", "cancelled_calls"),
+            ),
+        )
+
+    return _admission_controller
@@ -1,19 +1,15 @@
 import logging
 import os
 import typing as t
-from urllib.parse import urlencode
 
 import pandas as pd
 from dotenv import load_dotenv
-from stringcase import camelcase
 
+from mcp_kipris.kipris.api.encoding import encode_categoricals, intern_fields
+from mcp_kipris.kipris.api.request_template import get_request_template
 from mcp_kipris.kipris.api.utils import get_nested_key_value, get_response, get_response_async
+from mcp_kipris.kipris.tracing import span
 
-logging.basicConfig(
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    level=logging.INFO,  # INFO 레벨을 출력
-    handlers=[logging.StreamHandler()],
-)
 logger = logging.getLogger("mcp-kipris")
 load_dotenv(override=True)
 
@@ -23,8 +19,16 @@ class ABSKiprisAPI:
     def __init__(self, **kwargs):
         self.HEADER_KEY_STRING = "response.body.items.item"
         self.KEY_STRING = ""
-        if "api_key" in kwargs:
+        # 반복 빈도가 높은 필드(출원인, 등록상태, IPC 등). 서브클래스에서 지정하면 문자열 intern + category 인코딩
+        self.CATEGORICAL_FIELDS: t.Tuple[str, ...] = ()
+        # 특허 저장소에 미러링할 응답인지 (국내 특허 상세/요약/출원인/자유검색만 True)
+        self.STORE_RECORDS = False
+        # ApiClientFactory가 넘겨주면 공유 transport / cache / rate limiter / credential pool 사용
+        self.factory = kwargs.get("factory")
+        if kwargs.get("api_key"):
             self.api_key = kwargs["api_key"]
+        elif self.factory is not None:
+            self.api_key = self.factory.config.api_key
         else:
             if os.getenv("KIPRIS_API_KEY"):
                 self.api_key = os.getenv("KIPRIS_API_KEY")
@@ -47,13 +51,17 @@ class ABSKiprisAPI:
         """
 
         try:
-            params_dict = {camelcase(k): v for k, v in params.items() if v is not None and v != ""}
-            params_dict[api_key_field] = self.api_key
-            full_url = f"{api_url}?{urlencode(params_dict)}"
-            logger.info(f"KIPRIS 요청 URL: {full_url}")
-            return get_response(full_url)
+            # 엔드포인트별로 한 번 컴파일한 템플릿: 호출마다 값만 인코딩
+            template = get_request_template(api_url, api_key_field)
+            api_key = self.factory.credentials.next_key() if self.factory else self.api_key
+            cache_key, full_url = template.build(params, api_key)
+            logger.info("KIPRIS 요청 URL: %s", cache_key)
+            with span("kipris.call", endpoint=template.endpoint):
+                if self.factory is not None:
+                    return self.factory.fetch(full_url, cache_key, api_key)
+                return get_response(full_url)
         except Exception as e:
-            logger.error(f"KIPRIS 요청 실패: {e}")
+            logger.error("KIPRIS 요청 실패: %s", e)
             raise
 
     async def async_call(self, api_url: str, api_key_field="accessKey", **params) -> t.Dict:
@@ -69,14 +77,17 @@ class ABSKiprisAPI:
             dict: 응답 데이터
         """
         try:
-            params_dict = {camelcase(k): v for k, v in params.items() if v is not None and v != ""}
-            params_dict[api_key_field] = self.api_key
-            full_url = f"{api_url}?{urlencode(params_dict)}"
-            print(full_url)
-            logger.info(f"[async] KIPRIS 요청 URL: {full_url}")
-            return await get_response_async(full_url)
+            # 엔드포인트별로 한 번 컴파일한 템플릿: 호출마다 값만 인코딩
+            template = get_request_template(api_url, api_key_field)
+            api_key = self.factory.credentials.next_key() if self.factory else self.api_key
+            cache_key, full_url = template.build(params, api_key)
+            logger.info("[async] KIPRIS 요청 URL: %s", cache_key)
+            with span("kipris.call", endpoint=template.endpoint):
+                if self.factory is not None:
+                    return await self.factory.fetch_async(full_url, cache_key, api_key)
+                return await get_response_async(full_url)
         except Exception as e:
-            logger.error(f"[async] KIPRIS 요청 실패: {e}")
+            logger.error("[async] KIPRIS 요청 실패: %s", e)
             raise
 
     def check_api_error(self, response: dict) -> t.Optional[str]:
@@ -98,15 +109,25 @@ class ABSKiprisAPI:
                 "31": "DEADLINE_EXPIRED",
             }
             code_desc = error_map.get(str(result_code), f"CODE_{result_code}")
-            logger.warning(f"KIPRIS API 에러: [{result_code}] {result_msg} ({code_desc})")
+            logger.warning("KIPRIS API 에러: [%s] %s (%s)", result_code, result_msg, code_desc)
             return f"[{result_code}] {result_msg}"
         return None
 
     def parse_response(self, response: dict) -> pd.DataFrame:
+        """Build the records DataFrame from a parsed KIPRIS response (empty on API errors / no results)."""
+        with span("records.parse", api=type(self).__name__) as parse_span:
+            records = self._build_records(response)
+            parse_span.set_attribute("rows", len(records))
+        if self.factory is not None:
+            # 받은 레코드를 로컬 색인/특허 저장소에 반영 (같은 주제를 API 호출 없이 다시 검색, 백그라운드 처리)
+            self.factory.index_records(records, store=self.STORE_RECORDS)
+        return records
+
+    def _build_records(self, response: dict) -> pd.DataFrame:
         # Check for API-level errors first
         api_error = self.check_api_error(response)
         if api_error:
-            logger.warning(f"KIPRIS API 에러로 인해 빈 결과 반환: {api_error}")
+            logger.warning("KIPRIS API 에러로 인해 빈 결과 반환: %s", api_error)
             return pd.DataFrame()
 
         res_dict = get_nested_key_value(response, self.KEY_STRING)
@@ -114,8 +135,11 @@ class ABSKiprisAPI:
             logger.info("patents is None")
             message = get_nested_key_value(response, self.HEADER_KEY_STRING)
             if message:
-                logger.warning(f"KIPRIS API 응답 메시지: {message}")
+                logger.warning("KIPRIS API 응답 메시지: %s", message)
             return pd.DataFrame()
         if isinstance(res_dict, t.Dict):
             res_dict = [res_dict]
+        if self.CATEGORICAL_FIELDS:
+            intern_fields(res_dict, self.CATEGORICAL_FIELDS)
+            return encode_categoricals(pd.DataFrame(res_dict), self.CATEGORICAL_FIELDS)
         return pd.DataFrame(res_dict)
@@ -16,7 +16,7 @@ def _select_columns(df: pd.DataFrame, expected_cols: list[str]) -> pd.DataFrame:
         return df
     available = [c for c in expected_cols if c in df.columns]
     if not available:
-        logger.warning(f"Unexpected columns in response: {list(df.columns)}")
+        logger.warning("Unexpected columns in response: %s", list(df.columns))
         return df
     return df[available]
 
@@ -29,6 +29,7 @@ class ForeignPatentApplicantSearchAPI(ABSKiprisAPI):
         super().__init__(**kwargs)
         self.api_url = "http://plus.kipris.or.kr/openapi/rest/ForeignPatentAdvencedSearchService/applicantSearch"
         self.KEY_STRING = "response.body.items.searchResult"
+        self.CATEGORICAL_FIELDS = ("applicant", "ipc", "countryCode")
 
     async def async_search(
         self,
@@ -53,7 +54,7 @@ class ForeignPatentApplicantSearchAPI(ABSKiprisAPI):
         Returns:
             pd.DataFrame: 검색 결과
         """
-        logger.info(f"applicant: {applicant}")
+        logger.info("applicant: %s", applicant)
 
         response = await self.async_call(
             api_url=self.api_url,
@@ -90,7 +91,7 @@ class ForeignPatentApplicantSearchAPI(ABSKiprisAPI):
         Returns:
             pd.DataFrame: 검색 결과
         """
-        logger.info(f"applicant: {applicant}")
+        logger.info("applicant: %s", applicant)
 
         response = self.sync_call(
             api_url=self.api_url,
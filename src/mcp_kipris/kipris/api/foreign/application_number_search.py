@@ -16,6 +16,7 @@ class ForeignPatentApplicationNumberSearchAPI(ABSKiprisAPI):
             "http://plus.kipris.or.kr/openapi/rest/ForeignPatentAdvencedSearchService/applicationNumberSearch"
         )
         self.KEY_STRING = "response.body.items.searchResult"
+        self.CATEGORICAL_FIELDS = ("applicant", "ipc", "countryCode")
 
     def sync_search(
         self,
@@ -40,7 +41,7 @@ class ForeignPatentApplicationNumberSearchAPI(ABSKiprisAPI):
         Returns:
             pd.DataFrame: _description_
         """
-        logger.info(f"application_number: {application_number}")
+        logger.info("application_number: %s", application_number)
         response = self.sync_call(
             api_url=self.api_url,
             api_key_field="accessKey",
@@ -75,7 +76,7 @@ class ForeignPatentApplicationNumberSearchAPI(ABSKiprisAPI):
         Returns:
             pd.DataFrame: _description_
         """
-        logger.info(f"application_number: {application_number}")
+        logger.info("application_number: %s", application_number)
         response = await self.async_call(
             api_url=self.api_url,
             api_key_field="accessKey",
@@ -15,6 +15,7 @@ class ForeignPatentFreeSearchAPI(ABSKiprisAPI):
         super().__init__(**kwargs)
         self.api_url = "http://plus.kipris.or.kr/openapi/rest/ForeignPatentAdvencedSearchService/freeSearch"
         self.KEY_STRING = "response.body.items.searchResult"
+        self.CATEGORICAL_FIELDS = ("applicant", "ipc", "countryCode")
 
     async def async_search(
         self,
@@ -39,7 +40,7 @@ class ForeignPatentFreeSearchAPI(ABSKiprisAPI):
         Returns:
             pd.DataFrame: 검색 결과
         """
-        logger.info(f"async search word: {word}")
+        logger.info("async search word: %s", word)
 
         response = await self.async_call(
             api_url=self.api_url,
@@ -75,7 +76,7 @@ class ForeignPatentFreeSearchAPI(ABSKiprisAPI):
         Returns:
             pd.DataFrame: 검색 결과
         """
-        logger.info(f"sync search word: {word}")
+        logger.info("sync search word: %s", word)
 
         response = self.sync_call(
             api_url=self.api_url,
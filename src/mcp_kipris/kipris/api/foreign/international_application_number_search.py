@@ -14,6 +14,7 @@ class ForeignPatentInternationalApplicationNumberSearchAPI(ABSKiprisAPI):
         super().__init__(**kwargs)
         self.api_url = "http://plus.kipris.or.kr/openapi/rest/ForeignPatentAdvencedSearchService/internationalApplicationNumberSearch"
         self.KEY_STRING = "response.body.items.searchResult"
+        self.CATEGORICAL_FIELDS = ("applicant", "ipc", "countryCode")
 
     async def async_search(
         self,
@@ -39,7 +40,7 @@ class ForeignPatentInternationalApplicationNumberSearchAPI(ABSKiprisAPI):
             pd.DataFrame: _description_
         """
 
-        logger.info(f"international_application_number: {international_application_number}")
+        logger.info("international_application_number: %s", international_application_number)
         response = await self.async_call(
             api_url=self.api_url,
             api_key_field="accessKey",
@@ -75,7 +76,7 @@ class ForeignPatentInternationalApplicationNumberSearchAPI(ABSKiprisAPI):
             pd.DataFrame: _description_
         """
 
-        logger.info(f"international_application_number: {international_application_number}")
+        logger.info("international_application_number: %s", international_application_number)
         response = self.sync_call(
             api_url=self.api_url,
             api_key_field="accessKey",
@@ -16,6 +16,7 @@ class ForeignPatentInternationalOpenNumberSearchAPI(ABSKiprisAPI):
             "http://plus.kipris.or.kr/openapi/rest/ForeignPatentAdvencedSearchService/internationalOpenNumberSearch"
         )
         self.KEY_STRING = "response.body.items.searchResult"
+        self.CATEGORICAL_FIELDS = ("applicant", "ipc", "countryCode")
 
     def sync_search(
         self,
@@ -40,7 +41,7 @@ class ForeignPatentInternationalOpenNumberSearchAPI(ABSKiprisAPI):
         Returns:
             pd.DataFrame: _description_
         """
-        logger.info(f"international_open_number: {international_open_number}")
+        logger.info("international_open_number: %s", international_open_number)
         response = self.sync_call(
             api_url=self.api_url,
             api_key_field="accessKey",
@@ -75,7 +76,7 @@ class ForeignPatentInternationalOpenNumberSearchAPI(ABSKiprisAPI):
         Returns:
             pd.DataFrame: _description_
         """
-        logger.info(f"international_open_number: {international_open_number}")
+        logger.info("international_open_number: %s", international_open_number)
         response = await self.async_call(
             api_url=self.api_url,
             api_key_field="accessKey",
@@ -17,6 +17,7 @@ class ForeignPatentInternationalOpenNumberSearchAPI(ABSKiprisAPI):
             "http://plus.kipris.or.kr/openapi/rest/ForeignPatentAdvencedSearchService/internationalOpenNumberSearch"
         )
         self.KEY_STRING = "response.body.items.searchResult"
+        self.CATEGORICAL_FIELDS = ("applicant", "ipc", "countryCode")
 
     async def async_search(
         self,
@@ -41,7 +42,7 @@ class ForeignPatentInternationalOpenNumberSearchAPI(ABSKiprisAPI):
         Returns:
             pd.DataFrame: 검색 결과
         """
-        logger.info(f"async search open_number: {open_number}")
+        logger.info("async search open_number: %s", open_number)
 
         response = await self.async_call(
             api_url=self.api_url,
@@ -77,7 +78,7 @@ class ForeignPatentInternationalOpenNumberSearchAPI(ABSKiprisAPI):
         Returns:
             pd.DataFrame: 검색 결과
         """
-        logger.info(f"sync search open_number: {open_number}")
+        logger.info("sync search open_number: %s", open_number)
 
         response = self.sync_call(
             api_url=self.api_url,
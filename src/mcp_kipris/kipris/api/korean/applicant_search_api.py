@@ -15,6 +15,8 @@ class PatentApplicantSearchAPI(ABSKiprisAPI):
         super().__init__(**kwargs)
         self.api_url = "http://plus.kipris.or.kr/openapi/rest/patUtiModInfoSearchSevice/applicantNameSearchInfo"
         self.KEY_STRING = "response.body.items.PatentUtilityInfo"
+        self.CATEGORICAL_FIELDS = ("Applicant", "RegistrationStatus", "IPCNumber")
+        self.STORE_RECORDS = True
 
     async def async_search(
         self,
@@ -27,7 +29,7 @@ class PatentApplicantSearchAPI(ABSKiprisAPI):
         sort_spec: str = "AD",
         desc_sort: bool = False,
     ) -> pd.DataFrame:
-        logger.info(f"applicant: {applicant}")
+        logger.info("applicant: %s", applicant)
 
         response = await self.async_call(
             api_url=self.api_url,
@@ -53,7 +55,7 @@ class PatentApplicantSearchAPI(ABSKiprisAPI):
         sort_spec: str = "AD",
         desc_sort: bool = False,
     ) -> pd.DataFrame:
-        logger.info(f"applicant: {applicant}")
+        logger.info("applicant: %s", applicant)
 
         response = self.sync_call(
             api_url=self.api_url,
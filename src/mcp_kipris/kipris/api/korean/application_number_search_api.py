@@ -14,6 +14,7 @@ class PatentApplicationNumberSearchAPI(ABSKiprisAPI):
         super().__init__(**kwargs)
         self.api_url = "http://plus.kipris.or.kr/openapi/rest/patUtiModInfoSearchSevice/applicationNumberSearchInfo"
         self.KEY_STRING = "response.body.items.PatentUtilityInfo"
+        self.CATEGORICAL_FIELDS = ("Applicant", "RegistrationStatus", "IPCNumber")
 
     def sync_search(
         self,
@@ -34,7 +35,7 @@ class PatentApplicationNumberSearchAPI(ABSKiprisAPI):
             docs_start (int): 검색 시작 위치
             docs_count (int): 검색 결과 수
         """
-        logger.info(f"application_number: {application_number}")
+        logger.info("application_number: %s", application_number)
         response = self.sync_call(
             api_url=self.api_url,
             application_number=application_number,
@@ -67,7 +68,7 @@ class PatentApplicationNumberSearchAPI(ABSKiprisAPI):
             docs_start (int): 검색 시작 위치
             docs_count (int): 검색 결과 수
         """
-        logger.info(f"application_number: {application_number}")
+        logger.info("application_number: %s", application_number)
         response = await self.async_call(
             api_url=self.api_url,
             application_number=application_number,
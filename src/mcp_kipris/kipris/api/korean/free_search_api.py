@@ -15,6 +15,8 @@ class PatentFreeSearchAPI(ABSKiprisAPI):
         super().__init__(**kwargs)
         self.api_url = "http://plus.kipris.or.kr/openapi/rest/patUtiModInfoSearchSevice/freeSearchInfo"
         self.KEY_STRING = "response.body.items.PatentUtilityInfo"
+        self.CATEGORICAL_FIELDS = ("Applicant", "RegistrationStatus", "IPCNumber")
+        self.STORE_RECORDS = True
 
     async def async_search(
         self,
@@ -66,7 +68,7 @@ class PatentFreeSearchAPI(ABSKiprisAPI):
         """
         # api url https://plus.kipris.or.kr/portal/data/service/DBII_000000000000001/view.do?menuNo=200100&kppBCode=&kppMCode=&kppSCode=&subTab=SC001&entYn=N&clasKeyword=#soap_ADI_0000000000002944
 
-        logger.info(f"word: {word}")
+        logger.info("word: %s", word)
         response = await self.async_call(
             api_url=self.api_url,
             api_key_field="accessKey",
@@ -132,7 +134,7 @@ class PatentFreeSearchAPI(ABSKiprisAPI):
         """
         # api url https://plus.kipris.or.kr/portal/data/service/DBII_000000000000001/view.do?menuNo=200100&kppBCode=&kppMCode=&kppSCode=&subTab=SC001&entYn=N&clasKeyword=#soap_ADI_0000000000002944
 
-        logger.info(f"word: {word}")
+        logger.info("word: %s", word)
         response = self.sync_call(
             api_url=self.api_url,
             api_key_field="accessKey",
@@ -15,6 +15,7 @@ class IpcSearchAPI(ABSKiprisAPI):
         super().__init__(**kwargs)
         self.api_url = "http://plus.kipris.or.kr/kipo-api/kipi/patUtiModInfoSearchSevice/getAdvancedSearch"
         self.KEY_STRING = "response.body.items.item"
+        self.CATEGORICAL_FIELDS = ("applicantName", "registerStatus", "ipcNumber")
 
     def sync_search(
         self,
@@ -66,8 +67,8 @@ class IpcSearchAPI(ABSKiprisAPI):
         # url encoding 제거. urlencode를 sync_call, async_call에서 처리함.
         parameters = {**kwargs}
 
-        logger.info(f"ipc_number: {ipc_number}")
-        logger.info(f"parameters: {parameters}")
+        logger.info("ipc_number: %s", ipc_number)
+        logger.info("parameters: %s", parameters)
 
         response = self.sync_call(
             api_url=self.api_url,
@@ -134,8 +135,8 @@ class IpcSearchAPI(ABSKiprisAPI):
         # url encoding 제거. urlencode를 sync_call, async_call에서 처리함.
         parameters = {**kwargs}
 
-        logger.info(f"ipc_number: {ipc_number}")
-        logger.info(f"parameters: {parameters}")
+        logger.info("ipc_number: %s", ipc_number)
+        logger.info("parameters: %s", parameters)
 
         response = await self.async_call(
             api_url=self.api_url,
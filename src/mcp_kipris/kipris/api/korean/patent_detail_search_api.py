@@ -17,6 +17,7 @@ class PatentDetailSearchAPI(ABSKiprisAPI):
             "http://plus.kipris.or.kr/kipo-api/kipi/patUtiModInfoSearchSevice/getBibliographyDetailInfoSearch"
         )
         self.KEY_STRING = "response.body.item"
+        self.STORE_RECORDS = True
 
     def sync_search(self, application_number: str, **kwargs) -> pd.DataFrame:
         """_summary_
@@ -28,7 +29,7 @@ class PatentDetailSearchAPI(ABSKiprisAPI):
         """
         # url encoding 제거. urlencode를 sync_call, async_call에서 처리함.
         parameters = {**kwargs}
-        logger.info(f"application_number: {application_number}")
+        logger.info("application_number: %s", application_number)
 
         response = self.sync_call(
             api_url=self.api_url, api_key_field="ServiceKey", application_number=application_number
@@ -45,7 +46,7 @@ class PatentDetailSearchAPI(ABSKiprisAPI):
         """
         # url encoding 제거. urlencode를 sync_call, async_call에서 처리함.
         parameters = {**kwargs}
-        logger.info(f"application_number: {application_number}")
+        logger.info("application_number: %s", application_number)
 
         response = await self.async_call(
             api_url=self.api_url, api_key_field="ServiceKey", application_number=application_number
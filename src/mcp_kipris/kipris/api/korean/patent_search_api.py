@@ -15,6 +15,7 @@ class PatentSearchAPI(ABSKiprisAPI):
         super().__init__(**kwargs)
         self.api_url = "http://plus.kipris.or.kr/kipo-api/kipi/patUtiModInfoSearchSevice/getAdvancedSearch"
         self.KEY_STRING = "response.body.items.item"
+        self.CATEGORICAL_FIELDS = ("applicantName", "registerStatus", "ipcNumber")
 
     def sync_search(
         self,
@@ -67,8 +68,8 @@ class PatentSearchAPI(ABSKiprisAPI):
         # url encoding 제거. urlencode를 sync_call, async_call에서 처리함.
         parameters = {**kwargs}
 
-        logger.info(f"word: {word}")
-        logger.info(f"parameters: {parameters}")
+        logger.info("word: %s", word)
+        logger.info("parameters: %s", parameters)
 
         response = self.sync_call(
             api_url=self.api_url,
@@ -136,8 +137,8 @@ class PatentSearchAPI(ABSKiprisAPI):
         # url encoding 제거. urlencode를 sync_call, async_call에서 처리함.
         parameters = {**kwargs}
 
-        logger.info(f"word: {word}")
-        logger.info(f"parameters: {parameters}")
+        logger.info("word: %s", word)
+        logger.info("parameters: %s", parameters)
 
         response = await self.async_call(
             api_url=self.api_url,
@@ -15,6 +15,8 @@ class PatentSummarySearchAPI(ABSKiprisAPI):
         super().__init__(**kwargs)
         self.api_url = "http://plus.kipris.or.kr/kipo-api/kipi/patUtiModInfoSearchSevice/getBibliographySumryInfoSearch"
         self.KEY_STRING = "response.body.items.item"
+        self.CATEGORICAL_FIELDS = ("applicantName", "registerStatus", "ipcNumber")
+        self.STORE_RECORDS = True
 
     def sync_search(self, application_number: str) -> pd.DataFrame:
         """_summary_
@@ -27,7 +29,7 @@ class PatentSummarySearchAPI(ABSKiprisAPI):
         if not application_number:
             raise ValueError("application_number is required")
 
-        logger.info(f"application_number: {application_number}")
+        logger.info("application_number: %s", application_number)
 
         response = self.sync_call(
             api_url=self.api_url, api_key_field="ServiceKey", application_number=application_number
@@ -45,7 +47,7 @@ class PatentSummarySearchAPI(ABSKiprisAPI):
         if not application_number:
             raise ValueError("application_number is required")
 
-        logger.info(f"application_number: {application_number}")
+        logger.info("application_number: %s", application_number)
 
         response = await self.async_call(
             api_url=self.api_url, api_key_field="ServiceKey", application_number=application_number
@@ -15,6 +15,7 @@ class PatentRighterSearchAPI(ABSKiprisAPI):
         super().__init__(**kwargs)
         self.api_url = "http://plus.kipris.or.kr/openapi/rest/patUtiModInfoSearchSevice/rightHolerSearchInfo"
         self.KEY_STRING = "response.body.items.PatentUtilityInfo"
+        self.CATEGORICAL_FIELDS = ("Applicant", "RegistrationStatus", "IPCNumber")
 
     async def async_search(
         self,
@@ -27,7 +28,7 @@ class PatentRighterSearchAPI(ABSKiprisAPI):
         sort_spec: str = "AD",
         desc_sort: bool = False,
     ) -> pd.DataFrame:
-        logger.info(f"rightHoler: {rightHoler}")
+        logger.info("rightHoler: %s", rightHoler)
 
         response = await self.async_call(
             api_url=self.api_url,
@@ -53,7 +54,7 @@ class PatentRighterSearchAPI(ABSKiprisAPI):
         sort_spec: str = "AD",
         desc_sort: bool = False,
     ) -> pd.DataFrame:
-        logger.info(f"rightHoler: {rightHoler}")
+        logger.info("rightHoler: %s", rightHoler)
 
         response = self.sync_call(
             api_url=self.api_url,
@@ -15,6 +15,7 @@ class TrademarkSearchAPI(ABSKiprisAPI):
         super().__init__(**kwargs)
         self.api_url = "http://plus.kipris.or.kr/kipo-api/kipi/trademarkInfoSearchService/getWordSearch"
         self.KEY_STRING = "response.body.items.item"
+        self.CATEGORICAL_FIELDS = ("applicantName", "applicationStatus", "classificationCode")
 
     def sync_search(
         self,
@@ -40,8 +41,8 @@ class TrademarkSearchAPI(ABSKiprisAPI):
         # url encoding 제거. urlencode를 sync_call, async_call에서 처리함.
         parameters = {**kwargs}
 
-        logger.info(f"word: {word}")
-        logger.info(f"parameters: {parameters}")
+        logger.info("word: %s", word)
+        logger.info("parameters: %s", parameters)
 
         response = self.sync_call(
             api_url=self.api_url,
@@ -79,8 +80,8 @@ class TrademarkSearchAPI(ABSKiprisAPI):
         # url encoding 제거. urlencode를 sync_call, async_call에서 처리함.
         parameters = {**kwargs}
 
-        logger.info(f"word: {word}")
-        logger.info(f"parameters: {parameters}")
+        logger.info("word: %s", word)
+        logger.info("parameters: %s", parameters)
 
         response = await self.async_call(
             api_url=self.api_url,
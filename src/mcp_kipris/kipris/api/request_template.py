@@ -0,0 +1,62 @@
+"""
+Compiled request templates for KIPRIS endpoints.
+
+Every endpoint is called with the same small set of snake_case parameter names. A template is
+built once per (endpoint URL, API key field): it holds the base URL with its ``?``, the encoded
+API key parameter prefix and a memo of ``snake_case -> encoded camelCase=`` name prefixes, so a
+call only encodes its parameter values. URLs are byte-identical to
+``f"{api_url}?{urlencode({camelcase(k): v ...})}"``, so cache keys and recorded fixtures stay valid.
+"""
+
+import functools
+import typing as t
+from urllib.parse import quote_plus
+
+from stringcase import camelcase
+
+from mcp_kipris.kipris.metrics import endpoint_label
+
+
+class RequestTemplate:
+    """Precomputed URL parts for one endpoint."""
+
+    __slots__ = ("api_url", "api_key_field", "endpoint", "_prefix", "_key_prefix", "_names")
+
+    def __init__(self, api_url: str, api_key_field: str):
+        self.api_url = api_url
+        self.api_key_field = api_key_field
+        self.endpoint = endpoint_label(api_url)
+        self._prefix = f"{api_url}?"
+        self._key_prefix = f"{quote_plus(api_key_field)}="
+        # snake_case 파라미터 이름 -> "camelCase=" (인코딩 완료). 엔드포인트마다 이름 수가 적고 고정이라 한 번만 변환
+        self._names: t.Dict[str, str] = {}
+
+    def _name(self, name: str) -> str:
+        encoded = self._names.get(name)
+        if encoded is None:
+            encoded = self._names[name] = f"{quote_plus(camelcase(name))}="
+        return encoded
+
+    def cache_key(self, params: t.Dict[str, t.Any]) -> str:
+        """Request URL without the API key (empty and None values dropped); also the response cache key."""
+        return self._prefix + "&".join(
+            self._name(name) + quote_plus(str(value))
+            for name, value in params.items()
+            if value is not None and value != ""
+        )
+
+    def full_url(self, cache_key: str, api_key: str) -> str:
+        """Append the API key parameter to a URL built by cache_key()."""
+        separator = "" if cache_key == self._prefix else "&"
+        return f"{cache_key}{separator}{self._key_prefix}{quote_plus(str(api_key))}"
+
+    def build(self, params: t.Dict[str, t.Any], api_key: str) -> t.Tuple[str, str]:
+        """Return (cache_key, full_url) for a call."""
+        cache_key = self.cache_key(params)
+        return cache_key, self.full_url(cache_key, api_key)
+
+
+@functools.lru_cache(maxsize=256)
+def get_request_template(api_url: str, api_key_field: str = "accessKey") -> RequestTemplate:
+    """Return the shared template for an endpoint, compiling it on first use."""
+    return RequestTemplate(api_url, api_key_field)
@@ -1,6 +1,7 @@
 import datetime
 import json
 import logging
+import time
 import traceback
 import typing as t
 from logging import getLogger
@@ -10,11 +11,18 @@ import httpx
 import requests
 import xmltodict
 
-logging.basicConfig(
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    level=logging.INFO,  # INFO 레벨을 출력
-    handlers=[logging.StreamHandler()],
+from mcp_kipris.kipris.logging_utils import redact_sensitive_data
+from mcp_kipris.kipris.metrics import (
+    PARSE_DURATION,
+    UPSTREAM_BYTES,
+    UPSTREAM_DURATION,
+    UPSTREAM_RESPONSES,
+    UPSTREAM_RESULT_CODES,
+    endpoint_label,
 )
+from mcp_kipris.kipris.replay import FixtureNotFoundError, get_fixture_store, rebase_url
+from mcp_kipris.kipris.tracing import current_span, httpx_trace_extension, span
+
 logger = logging.getLogger("mcp-kipris")
 
 
@@ -36,11 +44,41 @@ def get_nested_key_value(dictionary: t.Dict, nested_key: str, sep: str = ".", de
         return default_value
 
 
-def get_response(url: str) -> t.Dict:
+def parse_xml_response(url: str, response_text: str, endpoint: str) -> t.Dict:
+    """XML 응답을 dict로 변환하고 파싱 시간과 결과 코드를 메트릭에 기록함."""
+    started = time.perf_counter()
+    with span("xml.parse", endpoint=endpoint) as parse_span:
+        try:
+            dict_type = xmltodict.parse(response_text)
+        except ExpatError:
+            # url 에는 accessKey 가 있으므로 엔드포인트만 표시
+            raise Exception(f"response is not xml. check endpoint [{endpoint}] response [{response_text[:100]}]")
+        json_data = json.loads(json.dumps(dict_type))
+        result_code = get_nested_key_value(json_data, "response.header.resultCode")
+        parse_span.set_attribute("kipris.result_code", str(result_code))
+    PARSE_DURATION.observe(time.perf_counter() - started, endpoint)
+    UPSTREAM_RESULT_CODES.inc(endpoint, str(result_code) if result_code is not None else "none")
+    return json_data
+
+
+def record_upstream_response(endpoint: str, started: float, status: str, received_bytes: int = 0) -> None:
+    """KIPRIS 요청 지연 시간 / 상태 / 수신 바이트를 메트릭과 현재 span에 기록함."""
+    UPSTREAM_DURATION.observe(time.perf_counter() - started, endpoint)
+    active = current_span()
+    if active is not None:
+        active.set_attribute("http.status", status)
+        active.set_attribute("http.received_bytes", received_bytes)
+    UPSTREAM_RESPONSES.inc(endpoint, status)
+    if received_bytes:
+        UPSTREAM_BYTES.inc(endpoint, amount=received_bytes)
+
+
+def get_response(url: str, session: t.Optional[requests.Session] = None) -> t.Dict:
     """_summary_
         url을 입력 받아서 해당 url에 대한 get 요청을 보내고, 결과를 json으로 반환함.
     Args:
         url (str): url 주소
+        session (requests.Session, optional): 공유 세션. 없으면 요청마다 새 세션을 사용함.
 
     Returns:
         t.Any: url에 대한 get 요청 결과 json
@@ -51,88 +89,133 @@ def get_response(url: str) -> t.Dict:
 
         # 타임아웃 설정 (연결 시도: 60초, 응답 대기: 600초)
         # 총 타임아웃: 10분 (MCP 서버 타임아웃보다 길게 설정)
-        logger.info(f"HTTP 요청 시작: {url}")
+        # URL 에는 accessKey 가 있으므로 기록하지 않음 (요청은 abs_class 에서 cache key 로 기록)
+        # requests/httpx 예외 메시지에도 URL 이 들어 있으므로 로그에 남길 때는 키를 가림
         start_time = datetime.datetime.now()
 
         response = None  # Initialize to avoid scope issues
         response_text = ""
-        with requests.Session() as sess:
-            response = sess.get(url, timeout=(60, 600))
+        endpoint = endpoint_label(url)
+        fixtures = get_fixture_store()
+        started = time.perf_counter()
+        if fixtures is not None and fixtures.replaying:
+            # 저장된 응답 본문 재생: 네트워크 없이 파싱 이후 경로를 그대로 실행
+            response_text = fixtures.load(url)
+            record_upstream_response(endpoint, started, "replay", len(response_text))
+        else:
+            try:
+                with span("http.request", endpoint=endpoint):
+                    if session is not None:
+                        response = session.get(rebase_url(url), timeout=(60, 600))
+                    else:
+                        with requests.Session() as sess:
+                            response = sess.get(rebase_url(url), timeout=(60, 600))
+                    record_upstream_response(endpoint, started, str(response.status_code), len(response.content))
+            except requests.exceptions.Timeout:
+                record_upstream_response(endpoint, started, "timeout")
+                raise
+            except requests.exceptions.RequestException:
+                record_upstream_response(endpoint, started, "error")
+                raise
             response.raise_for_status()
             response_text = response.text
+            if fixtures is not None:
+                fixtures.save(url, response_text)
 
         end_time = datetime.datetime.now()
         elapsed_time = (end_time - start_time).total_seconds()
-        logger.info(f"HTTP 요청 완료: {elapsed_time:.2f}초 소요")
+        logger.info("HTTP 요청 완료: %.2f초 소요", elapsed_time)
 
-        try:
-            dict_type = xmltodict.parse(response_text)
-        except ExpatError:
-            raise Exception("response is not xml check query url [%s] response [%s]", url, response_text[0:100])
-        json_data = json.loads(json.dumps(dict_type))
+        json_data = parse_xml_response(url, response_text, endpoint)
         result_header = get_nested_key_value(json_data, "response.header", default_value="")
-        logger.info("__kipris__:[%s]:[%s] :result header : [%s]", key_str, url[24:], result_header)
+        logger.info("__kipris__:[%s]:[%s] :result header : [%s]", key_str, endpoint, result_header)
         return json_data
 
+    except FixtureNotFoundError as e:
+        logger.error("재생할 응답 없음: %s", redact_sensitive_data(e))
+        return {}
     except requests.exceptions.Timeout as e:
-        logger.error(f"타임아웃 발생 (60초 연결 시도, 600초 응답 대기): {str(e)}")
+        logger.error("타임아웃 발생 (60초 연결 시도, 600초 응답 대기): %s", redact_sensitive_data(e))
         return {}
     except requests.exceptions.ConnectionError as e:
-        logger.error("connectoin Error:[%s]", e)
+        logger.error("connectoin Error:[%s]", redact_sensitive_data(e))
         return {}
     except requests.exceptions.HTTPError as e:
-        logger.error("http Error:[%s]", e)
+        logger.error("http Error:[%s]", redact_sensitive_data(e))
         return {}
     except requests.exceptions.RequestException as e:
-        logger.error("request Exception Error:[%s]", e)
+        logger.error("request Exception Error:[%s]", redact_sensitive_data(e))
         return {}
     except Exception as e:
-        logger.error("Exception Error:[%s]", e)
-        logger.error("url error [%s]", url)
+        logger.error("Exception Error:[%s]", redact_sensitive_data(e))
+        logger.error("url error [%s]", endpoint_label(url))
         if response is not None:
             logger.error("response error [%s]", response)
-        logger.error(traceback.format_exc())
+        logger.error(redact_sensitive_data(traceback.format_exc()))
         return {}
 
 
-async def get_response_async(url: str) -> t.Dict:
-    """비동기 방식으로 url을 입력 받아 GET 요청을 보내고, 결과를 json으로 반환함."""
+async def get_response_async(url: str, client: t.Optional[httpx.AsyncClient] = None) -> t.Dict:
+    """비동기 방식으로 url을 입력 받아 GET 요청을 보내고, 결과를 json으로 반환함.
+
+    client(httpx.AsyncClient)를 넘기면 해당 커넥션 풀을 재사용하고, 없으면 요청마다 새 클라이언트를 만듦.
+    """
     response_text = ""
     response = None
     try:
         key_str = datetime.datetime.strftime(datetime.datetime.now(), "%H:%M:%S")
-        logger.info(f"[async] HTTP 요청 시작: {url}")
         start_time = datetime.datetime.now()
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(600.0, connect=60.0)) as client:
-            response = await client.get(url)
+        endpoint = endpoint_label(url)
+        fixtures = get_fixture_store()
+        started = time.perf_counter()
+        if fixtures is not None and fixtures.replaying:
+            response_text = fixtures.load(url)
+            record_upstream_response(endpoint, started, "replay", len(response_text))
+        else:
+            try:
+                with span("http.request", endpoint=endpoint):
+                    # 현재 span이 기록 중이면 httpcore 단계(연결/TLS/헤더/본문)를 하위 span으로 기록
+                    extensions = httpx_trace_extension()
+                    if client is not None:
+                        response = await client.get(rebase_url(url), extensions=extensions)
+                    else:
+                        async with httpx.AsyncClient(timeout=httpx.Timeout(600.0, connect=60.0)) as new_client:
+                            response = await new_client.get(rebase_url(url), extensions=extensions)
+                    record_upstream_response(endpoint, started, str(response.status_code), len(response.content))
+            except httpx.TimeoutException:
+                record_upstream_response(endpoint, started, "timeout")
+                raise
+            except httpx.RequestError:
+                record_upstream_response(endpoint, started, "error")
+                raise
             response.raise_for_status()
             response_text = response.text
+            if fixtures is not None:
+                fixtures.save(url, response_text)
 
         end_time = datetime.datetime.now()
         elapsed_time = (end_time - start_time).total_seconds()
-        logger.info(f"[async] HTTP 요청 완료: {elapsed_time:.2f}초 소요")
+        logger.info("[async] HTTP 요청 완료: %.2f초 소요", elapsed_time)
 
-        try:
-            dict_type = xmltodict.parse(response_text)
-        except ExpatError:
-            raise Exception(f"[async] response is not xml. check query url [{url}] response [{response_text[:100]}]")
-
-        json_data = json.loads(json.dumps(dict_type))
+        json_data = parse_xml_response(url, response_text, endpoint)
         result_header = get_nested_key_value(json_data, "response.header", default_value="")
-        logger.info("__kipris__:[async][%s]:[%s] :result header : [%s]", key_str, url[24:], result_header)
+        logger.info("__kipris__:[async][%s]:[%s] :result header : [%s]", key_str, endpoint, result_header)
         return json_data
 
+    except FixtureNotFoundError as e:
+        logger.error("[async] 재생할 응답 없음: %s", redact_sensitive_data(e))
+        return {}
     except httpx.TimeoutException as e:
-        logger.error(f"[async] 타임아웃 발생 (60초 연결 시도, 600초 응답 대기): {str(e)}")
+        logger.error("[async] 타임아웃 발생 (60초 연결 시도, 600초 응답 대기): %s", redact_sensitive_data(e))
         return {}
     except httpx.RequestError as e:
-        logger.error(f"[async] 요청 예외 발생: {e}")
+        logger.error("[async] 요청 예외 발생: %s", redact_sensitive_data(e))
         return {}
     except Exception as e:
-        logger.error(f"[async] Exception Error:[{e}]")
-        logger.error(f"[async] url error [{url}]")
+        logger.error("[async] Exception Error:[%s]", redact_sensitive_data(e))
+        logger.error("[async] url error [%s]", endpoint_label(url))
         if response is not None:
-            logger.error(f"[async] response error [{response}]")
-        logger.error(traceback.format_exc())
+            logger.error("[async] response error [%s]", response)
+        logger.error(redact_sensitive_data(traceback.format_exc()))
         return {}
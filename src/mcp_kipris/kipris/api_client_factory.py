@@ -1,13 +1,30 @@
 """
 Unified API client factory for KIPRIS MCP server.
 Provides centralized API client management with consistent configuration.
+
+The factory is the process-wide registry: every tool gets its API client here, and all
+clients share one transport (connection pools), one response cache, one rate limiter
+and one credential pool.
 """
 
+import asyncio
+import itertools
+import logging
+import os
+import queue
+import threading
 import typing as t
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import httpx
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 
 from mcp_kipris.kipris.api.abs_class import ABSKiprisAPI
+from mcp_kipris.kipris.api.utils import get_nested_key_value, get_response, get_response_async
+from mcp_kipris.kipris.api.korean.abstract_search_api import AbstractSearchAPI
 from mcp_kipris.kipris.api.korean.patent_search_api import PatentSearchAPI
 from mcp_kipris.kipris.api.korean.patent_detail_search_api import PatentDetailSearchAPI
 from mcp_kipris.kipris.api.korean.free_search_api import PatentFreeSearchAPI
@@ -16,7 +33,7 @@ from mcp_kipris.kipris.api.korean.patent_summary_search_api import PatentSummary
 from mcp_kipris.kipris.api.korean.righter_search_api import PatentRighterSearchAPI
 from mcp_kipris.kipris.api.korean.application_number_search_api import PatentApplicationNumberSearchAPI
 from mcp_kipris.kipris.api.korean.ipc_search_api import IpcSearchAPI
-from mcp_kipris.kipris.api.korean.patent_agent_search_api import PatentAgentSearchAPI
+from mcp_kipris.kipris.api.korean.agent_search_api import AgentSearchAPI
 from mcp_kipris.kipris.api.korean.trademark_search_api import TrademarkSearchAPI
 from mcp_kipris.kipris.api.foreign.free_search_api import ForeignPatentFreeSearchAPI
 from mcp_kipris.kipris.api.foreign.application_number_search import ForeignPatentApplicationNumberSearchAPI
@@ -25,6 +42,22 @@ from mcp_kipris.kipris.api.foreign.international_application_number_search impor
     ForeignPatentInternationalApplicationNumberSearchAPI,
 )
 from mcp_kipris.kipris.api.foreign.international_open_number_search import ForeignPatentInternationalOpenNumberSearchAPI
+from mcp_kipris.kipris.cache import ResponseCache
+from mcp_kipris.kipris.entity_cache import PatentEntityCache
+from mcp_kipris.kipris.local_index import LocalPatentIndex
+from mcp_kipris.kipris.metrics import RATE_LIMIT_WAIT, get_metrics_registry, stats_collector
+from mcp_kipris.kipris.near_duplicates import NearDuplicateIndex
+from mcp_kipris.kipris.patent_store import PatentStore
+from mcp_kipris.kipris.rate_limiter import RateLimiter
+from mcp_kipris.kipris.shared_state import SharedRateLimiter, SharedResponseCache, SharedStateStore
+from mcp_kipris.kipris.tracing import current_span, span
+
+logger = logging.getLogger("mcp-kipris")
+
+ApiT = t.TypeVar("ApiT", bound=ABSKiprisAPI)
+
+# 인증키가 등록되지 않았거나 기한이 만료된 경우 해당 키를 풀에서 제외
+DISABLING_RESULT_CODES = {"30", "31"}
 
 
 @dataclass
@@ -32,11 +65,146 @@ class ApiClientConfig:
     """Configuration for API clients."""
 
     api_key: str
+    extra_api_keys: t.List[str] = field(default_factory=list)
     max_retries: int = 3
     base_delay: float = 1.0
-    rate_limit_per_minute: int = 60
+    # .env.example 안내(초당 10회 이하)에 맞춘 기본값
+    rate_limit_per_minute: int = 600
     timeout_connect: int = 60
     timeout_read: int = 600
+    max_connections: int = 20
+    cache_ttl: float = 300.0
+    cache_max_entries: int = 1024
+    # 출원번호별 특허 엔티티 캐시 (patent_search / patent_summary_search / patent_detail_search 공유)
+    entity_cache_ttl: float = 300.0
+    entity_cache_max_entries: int = 4096
+    # 받은 특허 레코드의 로컬 전문 색인 (local_patent_search), 0이면 비활성화
+    local_index_max_documents: int = 20000
+    # 초록/청구항 MinHash 근사 중복(패밀리, 분할/계속 출원) 탐지 기준 유사도, 0이면 비활성화
+    near_duplicate_threshold: float = 0.8
+    near_duplicate_max_documents: int = 200000
+    # 설정 시 받은 특허 레코드를 SQLite FTS5 데이터베이스에 영구 저장 (stored_patent_search)
+    patent_store_path: t.Optional[str] = None
+    # 설정 시 캐시와 rate limit 상태를 프로세스 간 공유 (멀티 워커 배포)
+    shared_state_path: t.Optional[str] = None
+
+    @classmethod
+    def from_env(cls, api_key: t.Optional[str] = None) -> "ApiClientConfig":
+        """
+        Build configuration from environment variables.
+
+        KIPRIS_API_KEY is the primary key; KIPRIS_API_KEYS may list additional comma-separated keys.
+        KIPRIS_RATE_LIMIT_PER_MINUTE, KIPRIS_CACHE_TTL and KIPRIS_CACHE_MAX_ENTRIES override defaults;
+        KIPRIS_ENTITY_CACHE_TTL and KIPRIS_ENTITY_CACHE_MAX_ENTRIES size the patent entity cache;
+        KIPRIS_LOCAL_INDEX_MAX_DOCUMENTS sizes the local full-text index and KIPRIS_PATENT_STORE
+        enables the durable SQLite full-text mirror of fetched patents;
+        KIPRIS_NEAR_DUPLICATE_THRESHOLD and KIPRIS_NEAR_DUPLICATE_MAX_DOCUMENTS tune near-duplicate detection.
+        KIPRIS_SHARED_STATE points the cache and rate limiter at a database shared by worker processes.
+
+        Args:
+            api_key: Primary KIPRIS API key (default: KIPRIS_API_KEY)
+
+        Returns:
+            ApiClientConfig instance
+        """
+        api_key = api_key or os.getenv("KIPRIS_API_KEY")
+        if not api_key:
+            raise ValueError("KIPRIS_API_KEY environment variable required.")
+        extra_keys = [key.strip() for key in os.getenv("KIPRIS_API_KEYS", "").split(",") if key.strip()]
+        return cls(
+            api_key=api_key,
+            extra_api_keys=[key for key in extra_keys if key != api_key],
+            rate_limit_per_minute=int(os.getenv("KIPRIS_RATE_LIMIT_PER_MINUTE", cls.rate_limit_per_minute)),
+            cache_ttl=float(os.getenv("KIPRIS_CACHE_TTL", cls.cache_ttl)),
+            cache_max_entries=int(os.getenv("KIPRIS_CACHE_MAX_ENTRIES", cls.cache_max_entries)),
+            entity_cache_ttl=float(os.getenv("KIPRIS_ENTITY_CACHE_TTL", cls.entity_cache_ttl)),
+            entity_cache_max_entries=int(os.getenv("KIPRIS_ENTITY_CACHE_MAX_ENTRIES", cls.entity_cache_max_entries)),
+            local_index_max_documents=int(os.getenv("KIPRIS_LOCAL_INDEX_MAX_DOCUMENTS", cls.local_index_max_documents)),
+            near_duplicate_threshold=float(os.getenv("KIPRIS_NEAR_DUPLICATE_THRESHOLD", cls.near_duplicate_threshold)),
+            near_duplicate_max_documents=int(
+                os.getenv("KIPRIS_NEAR_DUPLICATE_MAX_DOCUMENTS", cls.near_duplicate_max_documents)
+            ),
+            patent_store_path=os.getenv("KIPRIS_PATENT_STORE") or None,
+            shared_state_path=os.getenv("KIPRIS_SHARED_STATE") or None,
+        )
+
+
+class CredentialPool:
+    """Round-robin pool of KIPRIS API keys shared by all clients."""
+
+    def __init__(self, api_keys: t.Sequence[str]):
+        if not api_keys:
+            raise ValueError("CredentialPool requires at least one API key")
+        self._keys = list(dict.fromkeys(api_keys))
+        self._disabled: t.Set[str] = set()
+        self._cycle = itertools.cycle(self._keys)
+        self._lock = threading.Lock()
+
+    def next_key(self) -> str:
+        """Return the next usable key; falls back to the primary key when every key is disabled."""
+        with self._lock:
+            for _ in range(len(self._keys)):
+                key = next(self._cycle)
+                if key not in self._disabled:
+                    return key
+            return self._keys[0]
+
+    def disable(self, api_key: str) -> None:
+        """Stop handing out a key (e.g. unregistered or expired)."""
+        with self._lock:
+            if api_key in self._keys and api_key not in self._disabled:
+                self._disabled.add(api_key)
+                logger.warning(
+                    "KIPRIS API key disabled in credential pool (%d/%d left)", self.available, len(self._keys)
+                )
+
+    @property
+    def available(self) -> int:
+        return len(self._keys) - len(self._disabled)
+
+
+class KiprisTransport:
+    """Shared HTTP connection pools for sync (requests) and async (httpx) calls."""
+
+    def __init__(self, config: ApiClientConfig):
+        self.config = config
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=config.max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._async_client: t.Optional[httpx.AsyncClient] = None
+        self._async_client_loop: t.Optional[asyncio.AbstractEventLoop] = None
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared AsyncClient for the running event loop.
+
+        httpx clients are bound to the loop they first ran on, so a new client is created
+        when called from a different loop (e.g. asyncio.run in scripts).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(float(self.config.timeout_read), connect=float(self.config.timeout_connect)),
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_connections,
+                ),
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def get(self, url: str) -> t.Dict:
+        return get_response(url, session=self.session)
+
+    async def get_async(self, url: str) -> t.Dict:
+        return await get_response_async(url, client=self.get_async_client())
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.session.close()
 
 
 class ApiClientFactory:
@@ -45,113 +213,284 @@ class ApiClientFactory:
     def __init__(self, config: ApiClientConfig):
         self.config = config
         self._clients = {}
+        self._clients_lock = threading.Lock()
+        self.transport = KiprisTransport(config)
+        if config.shared_state_path:
+            store = SharedStateStore(config.shared_state_path)
+            self.cache = SharedResponseCache(store, ttl_seconds=config.cache_ttl, max_entries=config.cache_max_entries)
+            self.rate_limiter = SharedRateLimiter(store, max_requests_per_minute=config.rate_limit_per_minute)
+            logger.info("Using shared cache/rate-limit state at %s", config.shared_state_path)
+        else:
+            self.cache = ResponseCache(ttl_seconds=config.cache_ttl, max_entries=config.cache_max_entries)
+            self.rate_limiter = RateLimiter(max_requests_per_minute=config.rate_limit_per_minute)
+        self.entities = PatentEntityCache(
+            ttl_seconds=config.entity_cache_ttl, max_entries=config.entity_cache_max_entries
+        )
+        self.local_index = LocalPatentIndex(max_documents=config.local_index_max_documents)
+        self.near_duplicates = NearDuplicateIndex(
+            threshold=config.near_duplicate_threshold, max_documents=config.near_duplicate_max_documents
+        )
+        self.patent_store = PatentStore(config.patent_store_path) if config.patent_store_path else None
+        self.credentials = CredentialPool([config.api_key, *config.extra_api_keys])
+        # 취소로 절약한 업스트림 작업: 요청 전(rate limit 대기 중) 취소 / 전송 중 취소(소켓 즉시 반환)
+        self.cancellations = {"before_request": 0, "in_flight": 0}
+        # 응답 레코드 색인(BM25 토큰화, MinHash)은 CPU 작업이라 백그라운드 스레드에서 처리
+        self.index_dropped = 0
+        self._index_queue: "queue.Queue[t.Tuple[pd.DataFrame, bool]]" = queue.Queue(maxsize=256)
+        self._indexer: t.Optional[threading.Thread] = None
+        # 큐에 넣은 응답 수 / 색인을 마친 응답 수 (wait_for_indexing 은 호출 시점까지 넣은 응답만 기다림)
+        self._index_queued = 0
+        self._index_done = 0
+        self._index_condition = threading.Condition()
+        self._register_metrics()
+
+    def _register_metrics(self) -> None:
+        registry = get_metrics_registry()
+        registry.register_collector("cache", stats_collector("kipris_cache", self.cache.stats, ("hits", "misses")))
+        registry.register_collector(
+            "entities",
+            stats_collector(
+                "kipris_entity_cache",
+                self.entities.stats,
+                ("local_hits", *(f"fetches_{source}" for source in self.entities.fetches)),
+            ),
+        )
+        registry.register_collector(
+            "local_index", stats_collector("kipris_local_index", self.local_index.stats, ("indexed", "queries"))
+        )
+        registry.register_collector(
+            "near_duplicates",
+            stats_collector("kipris_near_duplicates", self.near_duplicates.stats, ("indexed",)),
+        )
+        registry.register_collector("indexing", stats_collector("kipris_indexing", self.indexing_stats, ("dropped",)))
+        if self.patent_store is not None:
+            registry.register_collector(
+                "patent_store",
+                stats_collector("kipris_patent_store", self.patent_store.stats, ("upserts", "queries", "dropped")),
+            )
+        registry.register_collector(
+            "cancellations",
+            stats_collector("kipris_cancelled_requests", lambda: self.cancellations, self.cancellations),
+        )
+        registry.register_collector(
+            "credentials", stats_collector("kipris_api_keys", lambda: {"available": self.credentials.available})
+        )
+
+    def index_records(self, records: pd.DataFrame, store: bool = False) -> None:
+        """
+        Queue parsed response records for the background indexer (never blocks, never raises).
+
+        The indexer adds them to the local full-text index and the near-duplicate signatures, and
+        passes them on to the patent store's writer.
+
+        Args:
+            records: Parsed response rows
+            store: Also queue the rows for the patent store (if enabled)
+        """
+        if records is None or records.empty:
+            return
+        self._start_indexer()
+        with self._index_condition:
+            try:
+                # 호출자가 받은 DataFrame 을 바꿔도 색인 내용이 달라지지 않도록 복사본을 넘김
+                self._index_queue.put_nowait((records.copy(), store))
+            except queue.Full:
+                self.index_dropped += 1
+                return
+            self._index_queued += 1
+
+    def _start_indexer(self) -> None:
+        if self._indexer is not None:
+            return
+        with self._clients_lock:
+            if self._indexer is None:
+                self._indexer = threading.Thread(target=self._run_indexer, name="kipris-indexer", daemon=True)
+                self._indexer.start()
+
+    def _run_indexer(self) -> None:
+        while True:
+            records, store = self._index_queue.get()
+            try:
+                self.local_index.add_records(records)
+                self.near_duplicates.add_records(records)
+                if store and self.patent_store is not None:
+                    self.patent_store.enqueue_records(records)
+            except Exception:
+                logger.exception("로컬 색인 갱신 실패")
+            finally:
+                with self._index_condition:
+                    self._index_done += 1
+                    self._index_condition.notify_all()
+
+    def wait_for_indexing(self, timeout: t.Optional[float] = None) -> bool:
+        """
+        Block until every response queued before this call has been indexed.
+
+        Returns:
+            False when timeout passed first
+        """
+        with self._index_condition:
+            target = self._index_queued
+            return self._index_condition.wait_for(lambda: self._index_done >= target, timeout)
+
+    def flush_indexing(self) -> None:
+        """Wait until every queued response is indexed and written to the patent store."""
+        self.wait_for_indexing()
+        if self.patent_store is not None:
+            self.patent_store.flush()
+
+    def indexing_stats(self) -> t.Dict[str, t.Any]:
+        return {"pending": self._index_queue.qsize(), "dropped": self.index_dropped}
+
+    def get_client(self, api_class: t.Type[ApiT]) -> ApiT:
+        """
+        Get the shared client instance for an API class.
+
+        Args:
+            api_class: ABSKiprisAPI subclass
+
+        Returns:
+            Client bound to this factory's transport, cache, rate limiter and credentials
+        """
+        with self._clients_lock:
+            if api_class not in self._clients:
+                self._clients[api_class] = api_class(api_key=self.config.api_key, factory=self)
+            return self._clients[api_class]
+
+    def _check_credentials(self, api_key: str, response: t.Dict) -> None:
+        result_code = get_nested_key_value(response, "response.header.resultCode")
+        if result_code and str(result_code) in DISABLING_RESULT_CODES:
+            self.credentials.disable(api_key)
+
+    @staticmethod
+    def _is_cacheable(response: t.Dict) -> bool:
+        result_code = get_nested_key_value(response, "response.header.resultCode")
+        return bool(response) and result_code in (None, "00")
+
+    @staticmethod
+    def _trace_cache_lookup(cached: t.Optional[t.Dict]) -> None:
+        active = current_span()
+        if active is not None:
+            active.set_attribute("cache.hit", cached is not None)
+
+    def fetch(self, url: str, cache_key: str, api_key: str) -> t.Dict:
+        """
+        Fetch a KIPRIS response through the shared cache, rate limiter and connection pool.
+
+        Args:
+            url: Full request URL including the access key
+            cache_key: Request URL without the access key
+            api_key: Key used in url (disabled in the pool if KIPRIS rejects it)
+
+        Returns:
+            Parsed response dict ({} on transport errors)
+        """
+        cached = self.cache.get(cache_key)
+        self._trace_cache_lookup(cached)
+        if cached is not None:
+            return cached
+        with span("rate_limit.wait"):
+            RATE_LIMIT_WAIT.observe(self.rate_limiter.acquire_blocking())
+        response = self.transport.get(url)
+        self._check_credentials(api_key, response)
+        if self._is_cacheable(response):
+            self.cache.set(cache_key, response)
+        return response
+
+    async def fetch_async(self, url: str, cache_key: str, api_key: str) -> t.Dict:
+        """
+        Async variant of fetch().
+
+        Cancelling the calling task (client disconnect, MCP cancel notification) aborts the rate-limit
+        wait or the in-flight httpx request; both cases are counted in ``cancellations``.
+        """
+        cached = await self.cache.get_async(cache_key)
+        self._trace_cache_lookup(cached)
+        if cached is not None:
+            return cached
+        try:
+            with span("rate_limit.wait"):
+                RATE_LIMIT_WAIT.observe(await self.rate_limiter.acquire())
+        except asyncio.CancelledError:
+            self.cancellations["before_request"] += 1
+            logger.info("KIPRIS request cancelled before it was sent")
+            raise
+        try:
+            response = await self.transport.get_async(url)
+        except asyncio.CancelledError:
+            self.cancellations["in_flight"] += 1
+            logger.info("In-flight KIPRIS request cancelled")
+            raise
+        self._check_credentials(api_key, response)
+        if self._is_cacheable(response):
+            await self.cache.set_async(cache_key, response)
+        return response
 
     def get_korean_patent_search_client(self) -> PatentSearchAPI:
         """Get Korean patent search API client."""
-        key = "korean_patent_search"
-        if key not in self._clients:
-            self._clients[key] = PatentSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(PatentSearchAPI)
 
     def get_korean_patent_detail_client(self) -> PatentDetailSearchAPI:
         """Get Korean patent detail API client."""
-        key = "korean_patent_detail"
-        if key not in self._clients:
-            self._clients[key] = PatentDetailSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(PatentDetailSearchAPI)
 
     def get_korean_free_search_client(self) -> PatentFreeSearchAPI:
         """Get Korean free search API client."""
-        key = "korean_free_search"
-        if key not in self._clients:
-            self._clients[key] = PatentFreeSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(PatentFreeSearchAPI)
 
     def get_korean_applicant_search_client(self) -> PatentApplicantSearchAPI:
         """Get Korean applicant search API client."""
-        key = "korean_applicant_search"
-        if key not in self._clients:
-            self._clients[key] = PatentApplicantSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(PatentApplicantSearchAPI)
 
     def get_korean_patent_summary_client(self) -> PatentSummarySearchAPI:
         """Get Korean patent summary API client."""
-        key = "korean_patent_summary"
-        if key not in self._clients:
-            self._clients[key] = PatentSummarySearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(PatentSummarySearchAPI)
 
     def get_korean_righter_search_client(self) -> PatentRighterSearchAPI:
         """Get Korean righter search API client."""
-        key = "korean_righter_search"
-        if key not in self._clients:
-            self._clients[key] = PatentRighterSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(PatentRighterSearchAPI)
 
     def get_korean_application_number_search_client(self) -> PatentApplicationNumberSearchAPI:
         """Get Korean application number search API client."""
-        key = "korean_application_number_search"
-        if key not in self._clients:
-            self._clients[key] = PatentApplicationNumberSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(PatentApplicationNumberSearchAPI)
 
     def get_korean_ipc_search_client(self) -> IpcSearchAPI:
         """Get Korean IPC search API client."""
-        key = "korean_ipc_search"
-        if key not in self._clients:
-            self._clients[key] = IpcSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(IpcSearchAPI)
 
-    def get_korean_patent_agent_search_client(self) -> PatentAgentSearchAPI:
+    def get_korean_patent_agent_search_client(self) -> AgentSearchAPI:
         """Get Korean patent agent search API client."""
-        key = "korean_patent_agent_search"
-        if key not in self._clients:
-            self._clients[key] = PatentAgentSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(AgentSearchAPI)
+
+    def get_korean_abstract_search_client(self) -> AbstractSearchAPI:
+        """Get Korean abstract search API client."""
+        return self.get_client(AbstractSearchAPI)
 
     def get_korean_trademark_search_client(self) -> TrademarkSearchAPI:
         """Get Korean trademark search API client."""
-        key = "korean_trademark_search"
-        if key not in self._clients:
-            self._clients[key] = TrademarkSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(TrademarkSearchAPI)
 
     def get_foreign_free_search_client(self) -> ForeignPatentFreeSearchAPI:
         """Get foreign free search API client."""
-        key = "foreign_free_search"
-        if key not in self._clients:
-            self._clients[key] = ForeignPatentFreeSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(ForeignPatentFreeSearchAPI)
 
     def get_foreign_application_number_search_client(self) -> ForeignPatentApplicationNumberSearchAPI:
         """Get foreign application number search API client."""
-        key = "foreign_application_number_search"
-        if key not in self._clients:
-            self._clients[key] = ForeignPatentApplicationNumberSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(ForeignPatentApplicationNumberSearchAPI)
 
     def get_foreign_applicant_search_client(self) -> ForeignPatentApplicantSearchAPI:
         """Get foreign applicant search API client."""
-        key = "foreign_applicant_search"
-        if key not in self._clients:
-            self._clients[key] = ForeignPatentApplicantSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(ForeignPatentApplicantSearchAPI)
 
     def get_foreign_international_application_number_search_client(
         self,
     ) -> ForeignPatentInternationalApplicationNumberSearchAPI:
         """Get foreign international application number search API client."""
-        key = "foreign_international_application_number_search"
-        if key not in self._clients:
-            self._clients[key] = ForeignPatentInternationalApplicationNumberSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(ForeignPatentInternationalApplicationNumberSearchAPI)
 
     def get_foreign_international_open_number_search_client(self) -> ForeignPatentInternationalOpenNumberSearchAPI:
         """Get foreign international open number search API client."""
-        key = "foreign_international_open_number_search"
-        if key not in self._clients:
-            self._clients[key] = ForeignPatentInternationalOpenNumberSearchAPI(api_key=self.config.api_key)
-        return self._clients[key]
+        return self.get_client(ForeignPatentInternationalOpenNumberSearchAPI)
 
     def get_all_korean_clients(self) -> t.Dict[str, ABSKiprisAPI]:
         """Get all Korean API clients."""
@@ -163,6 +502,7 @@ class ApiClientFactory:
             "patent_summary": self.get_korean_patent_summary_client(),
             "righter_search": self.get_korean_righter_search_client(),
             "application_number_search": self.get_korean_application_number_search_client(),
+            "abstract_search": self.get_korean_abstract_search_client(),
             "ipc_search": self.get_korean_ipc_search_client(),
             "patent_agent_search": self.get_korean_patent_agent_search_client(),
             "trademark_search": self.get_korean_trademark_search_client(),
@@ -190,21 +530,24 @@ class ApiClientFactory:
 _factory: t.Optional[ApiClientFactory] = None
 
 
-def get_api_client_factory(api_key: str) -> ApiClientFactory:
+_factory_lock = threading.Lock()
+
+
+def get_api_client_factory(api_key: t.Optional[str] = None) -> ApiClientFactory:
     """
     Get or create the global API client factory.
 
     Args:
-        api_key: KIPRIS API key
+        api_key: KIPRIS API key (default: KIPRIS_API_KEY environment variable)
 
     Returns:
         ApiClientFactory instance
     """
     global _factory
 
-    if _factory is None:
-        config = ApiClientConfig(api_key=api_key)
-        _factory = ApiClientFactory(config)
+    with _factory_lock:
+        if _factory is None:
+            _factory = ApiClientFactory(ApiClientConfig.from_env(api_key))
 
     return _factory
 
@@ -0,0 +1,96 @@
+"""
+Response caching utilities for KIPRIS API requests.
+Implements a thread-safe TTL + LRU cache keyed by request URL (without the access key).
+"""
+
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """TTL + LRU cache for parsed KIPRIS responses."""
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 1024):
+        """
+        Initialize response cache.
+
+        Args:
+            ttl_seconds: Seconds an entry stays valid (0 disables caching)
+            max_entries: Maximum number of entries before the least recently used is evicted
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, t.Tuple[float, t.Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: str) -> t.Optional[t.Dict]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key (request URL without the access key)
+
+        Returns:
+            Cached response, or None on miss/expiry
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: t.Dict) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key (request URL without the access key)
+            value: Parsed response
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get_async(self, key: str) -> t.Optional[t.Dict]:
+        """Async variant of get() (same interface as the shared SQLite cache)."""
+        return self.get(key)
+
+    async def set_async(self, key: str, value: t.Dict) -> None:
+        """Async variant of set()."""
+        self.set(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        """Cache statistics for logging/metrics."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,332 @@
+"""
+Cross-tool patent entity cache.
+
+patent_search (getAdvancedSearch), patent_summary_search (getBibliographySumryInfoSearch) and
+patent_detail_search (getBibliographyDetailInfoSearch) all look up one Korean patent by application
+number, and their fields overlap heavily. Instead of caching each endpoint's response separately,
+fields from whichever endpoint fetched a patent are merged into one entity keyed by application
+number. A tool call is answered locally when the entity already has the fields the tool renders;
+otherwise only the cheapest endpoint that supplies the missing fields is called.
+"""
+
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from mcp_kipris.kipris.api.abs_class import ABSKiprisAPI
+from mcp_kipris.kipris.api.korean.patent_detail_search_api import PatentDetailSearchAPI
+from mcp_kipris.kipris.api.korean.patent_search_api import PatentSearchAPI
+from mcp_kipris.kipris.api.korean.patent_summary_search_api import PatentSummarySearchAPI
+
+SOURCE_APIS: t.Dict[str, t.Type[ABSKiprisAPI]] = {
+    "summary": PatentSummarySearchAPI,
+    "search": PatentSearchAPI,
+    "detail": PatentDetailSearchAPI,
+}
+# 엔드포인트별 상대 비용 (응답 크기 기준): 요약 1건 < 고급검색 1건(초록, 도면 URL 포함) < 상세(청구항, 패밀리 등 전체 서지)
+SOURCE_COSTS = {"summary": 1, "search": 2, "detail": 3}
+
+# 고급검색과 요약은 같은 items.item 레코드 형식
+_ITEM_FIELDS = frozenset(
+    {
+        "applicationNumber",
+        "applicationDate",
+        "inventionTitle",
+        "applicantName",
+        "registerStatus",
+        "ipcNumber",
+        "openNumber",
+        "openDate",
+        "registerNumber",
+        "registerDate",
+        "publicationNumber",
+        "publicationDate",
+        "astrtCont",
+    }
+)
+# 상세 응답의 배열 필드 (patent_detail_search 가 그대로 렌더링)
+DETAIL_FIELDS = (
+    "biblioSummaryInfoArray",
+    "applicantInfoArray",
+    "inventorInfoArray",
+    "agentInfoArray",
+    "ipcInfoArray",
+    "abstractInfoArray",
+    "claimInfoArray",
+    "priorityInfoArray",
+    "familyInfoArray",
+    "legalStatusInfoArray",
+)
+
+# 소스 -> 그 엔드포인트가 채우는 엔티티 필드 (상세는 서지 요약/출원인/IPC/초록을 평탄화해서 함께 채움)
+SOURCE_FIELDS: t.Dict[str, t.FrozenSet[str]] = {
+    "summary": _ITEM_FIELDS,
+    "search": _ITEM_FIELDS | {"indexNo", "drawing", "bigDrawing"},
+    "detail": (_ITEM_FIELDS - {"publicationNumber", "publicationDate"}) | frozenset(DETAIL_FIELDS),
+}
+
+
+def normalize_application_number(application_number: str) -> str:
+    return str(application_number).replace("-", "").strip()
+
+
+def _as_list(value: t.Any) -> t.List[t.Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _nested(record: t.Dict[str, t.Any], array: str, item: str) -> t.List[t.Dict[str, t.Any]]:
+    container = record.get(array)
+    if not isinstance(container, dict):
+        return []
+    return [entry for entry in _as_list(container.get(item)) if isinstance(entry, dict)]
+
+
+def detail_entity_fields(record: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+    """Flatten a detail record into item-style entity fields (alongside its own array fields)."""
+    fields = {key: record[key] for key in DETAIL_FIELDS if key in record}
+    for summary in _nested(record, "biblioSummaryInfoArray", "biblioSummaryInfo")[:1]:
+        fields.update({key: value for key, value in summary.items() if key in _ITEM_FIELDS})
+    applicants = [entry.get("name") for entry in _nested(record, "applicantInfoArray", "applicantInfo")]
+    if any(applicants):
+        fields["applicantName"] = "|".join(name for name in applicants if name)
+    ipcs = [entry.get("ipcNumber") for entry in _nested(record, "ipcInfoArray", "ipcInfo")]
+    if any(ipcs):
+        fields["ipcNumber"] = "|".join(ipc for ipc in ipcs if ipc)
+    for abstract in _nested(record, "abstractInfoArray", "abstractInfo")[:1]:
+        if abstract.get("astrtCont"):
+            fields["astrtCont"] = abstract["astrtCont"]
+    return fields
+
+
+@dataclass
+class PatentEntity:
+    """Merged fields of one patent from every endpoint that fetched it."""
+
+    application_number: str
+    fields: t.Dict[str, t.Any] = field(default_factory=dict)
+    # 소스 -> 원본 레코드 (patent_detail_search 는 상세 레코드를 그대로 렌더링)
+    records: t.Dict[str, t.Dict[str, t.Any]] = field(default_factory=dict)
+
+    @property
+    def sources(self) -> t.Set[str]:
+        return set(self.records)
+
+    def missing(self, fields: t.Iterable[str]) -> t.Set[str]:
+        """Fields not in the entity that an endpoint not fetched yet could still supply."""
+        fetched = self.sources
+        return {
+            name
+            for name in fields
+            if name not in self.fields
+            and not any(name in SOURCE_FIELDS[source] for source in fetched)
+            and any(name in supplied for supplied in SOURCE_FIELDS.values())
+        }
+
+    def merge(self, source: str, record: t.Dict[str, t.Any]) -> None:
+        self.records[source] = record
+        self.fields.update(detail_entity_fields(record) if source == "detail" else record)
+
+    def project(self, fields: t.Sequence[str]) -> pd.DataFrame:
+        """One-row DataFrame with the given fields (None where no endpoint supplied a value)."""
+        return pd.DataFrame([{name: self.fields.get(name) for name in fields}])
+
+
+def cheapest_source(missing: t.Iterable[str], candidates: t.Iterable[str] = tuple(SOURCE_COSTS)) -> t.Optional[str]:
+    """
+    Pick the endpoint to call for the missing fields.
+
+    The cheapest candidate that supplies every missing field wins; if none does, the candidate
+    covering the most missing fields (cheapest on ties).
+    """
+    missing = set(missing)
+    if not missing:
+        return None
+    ranked = sorted(candidates, key=lambda source: (-len(missing & SOURCE_FIELDS[source]), SOURCE_COSTS[source]))
+    return ranked[0] if ranked and missing & SOURCE_FIELDS[ranked[0]] else None
+
+
+def select_record(records: pd.DataFrame, application_number: str) -> t.Optional[t.Dict[str, t.Any]]:
+    """
+    The response row for application_number, without NaN padding.
+
+    Detail responses have no top-level applicationNumber (it sits in biblioSummaryInfoArray), so
+    their first row is used. Search-shaped rows must match: another patent's row would otherwise
+    be merged into this entity.
+    """
+    if records is None or records.empty:
+        return None
+    rows = records.to_dict("records")
+    if "applicationNumber" not in rows[0]:
+        row = rows[0]
+    else:
+        row = next(
+            (row for row in rows if normalize_application_number(row["applicationNumber"]) == application_number),
+            None,
+        )
+        if row is None:
+            return None
+    return {key: value for key, value in row.items() if not (isinstance(value, float) and pd.isna(value))}
+
+
+class PatentEntityCache:
+    """TTL + LRU cache of PatentEntity objects keyed by normalized application number."""
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 4096):
+        """
+        Initialize entity cache.
+
+        Args:
+            ttl_seconds: Seconds an entity stays valid (0 disables caching; lookups still merge per call)
+            max_entries: Maximum number of entities before the least recently used is evicted
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.local_hits = 0
+        self.fetches = {source: 0 for source in SOURCE_COSTS}
+        self._entries: "OrderedDict[str, t.Tuple[float, PatentEntity]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, application_number: str) -> PatentEntity:
+        """Cached entity for application_number, or a new empty one (not stored until merged)."""
+        key = normalize_application_number(application_number)
+        if self.enabled:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    if entry[0] >= time.monotonic():
+                        self._entries.move_to_end(key)
+                        return entry[1]
+                    del self._entries[key]
+        return PatentEntity(key)
+
+    def merge(self, entity: PatentEntity, source: str, record: t.Dict[str, t.Any]) -> PatentEntity:
+        """Merge a record fetched from source into entity and (re)store it."""
+        with self._lock:
+            entity.merge(source, record)
+            self.fetches[source] += 1
+            if self.enabled:
+                # 만료 시각은 처음 저장할 때 기준: 나중에 병합한 필드 때문에 오래된 필드가 TTL을 넘겨 남지 않도록
+                stored = self._entries.get(entity.application_number)
+                expires = stored[0] if stored and stored[1] is entity else time.monotonic() + self.ttl_seconds
+                self._entries[entity.application_number] = (expires, entity)
+                self._entries.move_to_end(entity.application_number)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entity
+
+    def plan(
+        self, application_number: str, fields: t.Sequence[str], candidates: t.Iterable[str] = tuple(SOURCE_COSTS)
+    ) -> t.Tuple[PatentEntity, t.Optional[str]]:
+        """
+        Look up the entity and decide which endpoint (if any) has to be called for fields.
+
+        Returns:
+            (entity, source): source is None when the entity can be rendered locally
+        """
+        entity = self.get(application_number)
+        source = cheapest_source(entity.missing(fields), candidates)
+        if source is None:
+            with self._lock:
+                self.local_hits += 1
+        return entity, source
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        return {
+            "entities": len(self._entries),
+            "local_hits": self.local_hits,
+            **{f"fetches_{source}": count for source, count in self.fetches.items()},
+        }
+
+
+# 팩토리 없이 만든 API 클라이언트용: 엔티티를 저장하지 않고 호출마다 병합만 수행
+_uncached = PatentEntityCache(ttl_seconds=0)
+
+
+def _lookup_context(
+    api: ABSKiprisAPI,
+) -> t.Tuple[PatentEntityCache, t.Callable[[str], ABSKiprisAPI]]:
+    factory = getattr(api, "factory", None)
+    cache = factory.entities if factory is not None else _uncached
+
+    def client(source: str) -> ABSKiprisAPI:
+        # 도구 자신의 클라이언트를 우선 사용 (테스트에서 교체한 클라이언트 포함)
+        if isinstance(api, SOURCE_APIS[source]):
+            return api
+        if factory is not None:
+            return factory.get_client(SOURCE_APIS[source])
+        return SOURCE_APIS[source](api_key=api.api_key)
+
+    return cache, client
+
+
+def _search_kwargs(source: str, application_number: str) -> t.Dict[str, t.Any]:
+    if source == "search":
+        return {"word": "", "application_number": application_number}
+    return {"application_number": application_number}
+
+
+def lookup_patent(
+    api: ABSKiprisAPI,
+    application_number: str,
+    fields: t.Sequence[str],
+    candidates: t.Iterable[str] = tuple(SOURCE_COSTS),
+) -> PatentEntity:
+    """
+    Return the patent entity with fields, calling only the endpoints needed to fill them.
+
+    Args:
+        api: The calling tool's API client (its factory provides the entity cache and other clients)
+        application_number: Korean application number (hyphens allowed)
+        fields: Entity fields the tool renders
+        candidates: Endpoints the lookup may call
+
+    Returns:
+        PatentEntity (``records`` is empty when no endpoint returned the patent)
+    """
+    cache, client = _lookup_context(api)
+    entity, source = cache.plan(application_number, fields, candidates)
+    while source is not None:
+        record = select_record(
+            client(source).sync_search(**_search_kwargs(source, entity.application_number)), entity.application_number
+        )
+        if record is None:
+            break
+        cache.merge(entity, source, record)
+        source = cheapest_source(entity.missing(fields), candidates)
+    return entity
+
+
+async def lookup_patent_async(
+    api: ABSKiprisAPI,
+    application_number: str,
+    fields: t.Sequence[str],
+    candidates: t.Iterable[str] = tuple(SOURCE_COSTS),
+) -> PatentEntity:
+    """Async variant of lookup_patent()."""
+    cache, client = _lookup_context(api)
+    entity, source = cache.plan(application_number, fields, candidates)
+    while source is not None:
+        records = await client(source).async_search(**_search_kwargs(source, entity.application_number))
+        record = select_record(records, entity.application_number)
+        if record is None:
+            break
+        cache.merge(entity, source, record)
+        source = cheapest_source(entity.missing(fields), candidates)
+    return entity
@@ -16,12 +16,14 @@ class KiprisErrorCode(Enum):
     RATE_LIMITED = "RATE_LIMITED"
     PARSE_ERROR = "PARSE_ERROR"
     API_ERROR = "API_ERROR"
+    BUSY = "BUSY"
 
 
 class KiprisApiError(Exception):
     """Base exception for KIPRIS API errors."""
 
     def __init__(self, code: KiprisErrorCode, message: str, details: t.Dict = None):
+        super().__init__(message)
         self.code = code
         self.message = message
         self.details = details or {}
@@ -84,3 +86,15 @@ class KiprisParseError(KiprisApiError):
             message=f"Failed to parse XML response: {parse_error}",
             details={"parse_error": parse_error, "response_preview": response_text[:200]},
         )
+
+
+class KiprisBusyError(KiprisApiError):
+    """Server-side capacity exhausted (executor queue or admission limits)."""
+
+    def __init__(self, resource: str, limit: int, retry_after: float = 1.0, details: t.Dict = None):
+        super().__init__(
+            code=KiprisErrorCode.BUSY,
+            message=f"Server busy: {resource} limit ({limit}) reached. Retry after {retry_after:.1f} seconds",
+            details={"resource": resource, "limit": limit, "retry_after": retry_after},
+        )
+        self.retry_after = retry_after
@@ -0,0 +1,188 @@
+"""
+Tool execution utilities for the MCP servers.
+Runs tools through run_tool_async, and runs synchronous run_tool fallbacks in a
+dedicated, size-bounded thread pool so they never block the event loop.
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+import time
+import typing as t
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from mcp.types import EmbeddedResource, ImageContent, TextContent
+
+from mcp_kipris.kipris.abc import ToolHandler
+from mcp_kipris.kipris.errors import KiprisBusyError
+from mcp_kipris.kipris.logging_utils import request_log_sampling
+from mcp_kipris.kipris.metrics import TOOL_CALLS, TOOL_DURATION, get_metrics_registry, stats_collector
+from mcp_kipris.kipris.tracing import span
+
+logger = logging.getLogger("mcp-kipris")
+
+
+class BlockingExecutor:
+    """Bounded thread pool for blocking tool calls, with queue-depth statistics."""
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 32):
+        """
+        Initialize blocking executor.
+
+        Args:
+            max_workers: Threads running blocking calls concurrently
+            max_queue: Calls allowed to wait for a free thread; beyond this calls are rejected
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kipris-sync")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.rejected = 0
+        self.cancelled = 0
+        self.max_queue_depth = 0
+        self.total_queue_wait = 0.0
+
+    def _reserve(self) -> None:
+        with self._lock:
+            if self.queued >= self.max_queue and self.active >= self.max_workers:
+                self.rejected += 1
+                raise KiprisBusyError("blocking executor queue", self.max_queue)
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queued)
+
+    def _wrap(self, fn: t.Callable[..., t.Any], enqueued_at: float) -> t.Callable[..., t.Any]:
+        def run(*args: t.Any) -> t.Any:
+            with self._lock:
+                self.queued -= 1
+                self.active += 1
+                self.total_queue_wait += time.monotonic() - enqueued_at
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+
+        return run
+
+    async def run(self, fn: t.Callable[..., t.Any], *args: t.Any) -> t.Any:
+        """
+        Run a blocking callable in the pool and await its result.
+
+        Raises:
+            KiprisBusyError: When the queue is full
+        """
+        self._reserve()
+        future = self._executor.submit(self._wrap(fn, time.monotonic()), *args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # 아직 스레드에서 시작되지 않은 호출은 취소되어 실행되지 않음 (실행 중인 호출은 중단 불가)
+            if future.cancelled():
+                with self._lock:
+                    self.queued -= 1
+                    self.cancelled += 1
+            raise
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        """Executor statistics for logging/metrics."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self.queued,
+                "active": self.active,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "cancelled": self.cancelled,
+                "max_queue_depth": self.max_queue_depth,
+                "avg_queue_wait": round(self.total_queue_wait / self.completed, 4) if self.completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global executor instance
+_blocking_executor: t.Optional[BlockingExecutor] = None
+
+
+def get_blocking_executor() -> BlockingExecutor:
+    """
+    Get or create the blocking executor.
+
+    Pool size and queue bound come from KIPRIS_SYNC_WORKERS (default 4) and KIPRIS_SYNC_QUEUE (default 32).
+
+    Returns:
+        BlockingExecutor instance
+    """
+    global _blocking_executor
+
+    if _blocking_executor is None:
+        _blocking_executor = BlockingExecutor(
+            max_workers=int(os.getenv("KIPRIS_SYNC_WORKERS", "4")),
+            max_queue=int(os.getenv("KIPRIS_SYNC_QUEUE", "32")),
+        )
+        get_metrics_registry().register_collector(
+            "blocking_executor",
+            stats_collector(
+                "kipris_blocking_executor", _blocking_executor.stats, ("completed", "rejected", "cancelled")
+            ),
+        )
+
+    return _blocking_executor
+
+
+async def execute_tool(
+    tool_handler: ToolHandler, args: dict
+) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    """
+    Run a tool, preferring run_tool_async and falling back to run_tool in the blocking executor.
+
+    Args:
+        tool_handler: Tool to run
+        args: Tool arguments
+
+    Returns:
+        Tool result contents
+    """
+    started = time.perf_counter()
+    status = "error"
+    try:
+        with request_log_sampling(), span("tool.call", tool=tool_handler.name) as tool_span:
+            try:
+                # 먼저 비동기 메서드 시도
+                result = await tool_handler.run_tool_async(args)
+            except (AttributeError, NotImplementedError) as e:
+                # 비동기 메서드가 없거나 구현되지 않은 경우 동기 메서드를 이벤트 루프 밖(스레드 풀)에서 실행
+                executor = get_blocking_executor()
+                logger.warning("비동기 메서드 실패, 동기 메서드로 폴백: %s", e)
+                tool_span.set_attribute("sync_fallback", True)
+                # 스레드 풀에서도 span이 이어지도록 현재 context를 복사해서 실행
+                result = await executor.run(contextvars.copy_context().run, tool_handler.run_tool, args)
+                logger.info("blocking executor stats: %s", executor.stats())
+        status = "ok"
+        return result
+    except KiprisBusyError:
+        status = "busy"
+        raise
+    except asyncio.CancelledError:
+        status = "cancelled"
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        TOOL_DURATION.observe(elapsed, tool_handler.name)
+        TOOL_CALLS.inc(tool_handler.name, status)
+        logger.debug(
+            "tool call %s %s in %.1f ms",
+            tool_handler.name,
+            status,
+            elapsed * 1000,
+            extra={"tool": tool_handler.name, "status": status, "duration_ms": round(elapsed * 1000, 1)},
+        )
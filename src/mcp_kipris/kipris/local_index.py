@@ -0,0 +1,237 @@
+"""
+In-process full-text index over patent records that passed through the KIPRIS clients.
+
+Every parsed search, summary and detail response is fed to the index (title, abstract, claims,
+applicant), so topics already fetched can be searched again without an upstream call. Korean text
+has no word boundaries a simple tokenizer can rely on, so Hangul runs are indexed as character
+bigrams; Latin words and numbers are indexed whole. Ranking is BM25 over field-weighted term
+frequencies. Records are upserted by application number: fields from later responses (e.g. claims
+from a detail lookup) are merged into the document and only changed documents are re-indexed.
+"""
+
+import heapq
+import math
+import re
+import threading
+import typing as t
+import unicodedata
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from mcp_kipris.kipris.entity_cache import detail_entity_fields, normalize_application_number
+
+# 색인 필드 -> 응답 형식별 원본 필드 (items.item / PatentUtilityInfo / 해외 searchResult 순)
+SOURCE_FIELDS: t.Dict[str, t.Tuple[str, ...]] = {
+    "applicationNumber": ("applicationNumber", "ApplicationNumber", "applicationNo"),
+    "applicationDate": ("applicationDate", "ApplicationDate"),
+    "inventionTitle": ("inventionTitle", "InventionName", "inventionName"),
+    "applicantName": ("applicantName", "Applicant", "applicant"),
+    "ipcNumber": ("ipcNumber", "IPCNumber", "ipc"),
+    "registerStatus": ("registerStatus", "RegistrationStatus"),
+    "abstract": ("astrtCont", "Abstract"),
+}
+# 검색 대상 필드와 BM25 가중치 (제목/출원인 일치를 초록/청구항 일치보다 우선)
+FIELD_WEIGHTS: t.Dict[str, float] = {"inventionTitle": 3.0, "applicantName": 2.0, "abstract": 1.0, "claims": 1.0}
+
+_TOKEN_PATTERN = re.compile(r"[가-힣]+|[0-9a-z]+")
+
+
+def tokenize(text: t.Optional[str]) -> t.List[str]:
+    """
+    Split text into index terms: Hangul runs as character bigrams, Latin words and numbers whole.
+
+    "리튬이차전지 cathode" -> ["리튬", "튬이", "이차", "차전", "전지", "cathode"]
+    """
+    if not text:
+        return []
+    terms: t.List[str] = []
+    for run in _TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", str(text)).lower()):
+        if "가" <= run[0] <= "힣" and len(run) > 1:
+            terms.extend(run[i : i + 2] for i in range(len(run) - 1))
+        else:
+            terms.append(run)
+    return terms
+
+
+def _text(value: t.Any) -> t.Optional[str]:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _claims(record: t.Dict[str, t.Any]) -> t.Optional[str]:
+    container = record.get("claimInfoArray")
+    if not isinstance(container, dict):
+        return None
+    claims = container.get("claimInfo")
+    claims = claims if isinstance(claims, list) else [claims]
+    return "\n".join(claim["claim"] for claim in claims if isinstance(claim, dict) and claim.get("claim")) or None
+
+
+def document_fields(record: t.Dict[str, t.Any]) -> t.Dict[str, str]:
+    """Map one response record (any supported shape) to index fields; empty fields are left out."""
+    if "biblioSummaryInfoArray" in record:
+        # 상세 응답: 서지 요약/출원인/IPC/초록을 평탄화하고 청구항을 더함
+        record = {**record, **detail_entity_fields(record), "claims": _claims(record)}
+    fields = {}
+    for name, sources in SOURCE_FIELDS.items():
+        value = next((_text(record[source]) for source in sources if _text(record.get(source))), None)
+        if value is not None:
+            fields[name] = value
+    if _text(record.get("claims")):
+        fields["claims"] = _text(record["claims"])
+    return fields
+
+
+@dataclass
+class IndexedPatent:
+    """One indexed document: its display fields and field-weighted term frequencies."""
+
+    fields: t.Dict[str, str]
+    terms: t.Dict[str, float] = field(default_factory=dict)
+    length: float = 0.0
+
+
+class LocalPatentIndex:
+    """Inverted index with BM25 ranking, upserted by application number."""
+
+    def __init__(self, max_documents: int = 20000, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize local index.
+
+        Args:
+            max_documents: Documents kept before the least recently updated is dropped (0 disables indexing)
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.max_documents = max_documents
+        self.k1 = k1
+        self.b = b
+        self.indexed = 0
+        self.queries = 0
+        self._documents: "OrderedDict[str, IndexedPatent]" = OrderedDict()
+        self._postings: t.Dict[str, t.Dict[str, float]] = {}
+        self._lengths: t.Dict[str, float] = {}
+        self._total_length = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_documents > 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, application_number: str) -> bool:
+        return normalize_application_number(application_number) in self._documents
+
+    def get(self, application_number: str) -> t.Optional[t.Dict[str, str]]:
+        document = self._documents.get(normalize_application_number(application_number))
+        return dict(document.fields) if document is not None else None
+
+    def _remove(self, key: str) -> None:
+        document = self._documents.pop(key)
+        del self._lengths[key]
+        for term in document.terms:
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= document.length
+
+    def add(self, record: t.Dict[str, t.Any]) -> bool:
+        """
+        Upsert one response record.
+
+        Returns:
+            True when the document was added or changed (and re-indexed)
+        """
+        fields = document_fields(record)
+        if not self.enabled or "applicationNumber" not in fields or not fields.keys() & FIELD_WEIGHTS.keys():
+            return False
+        key = normalize_application_number(fields["applicationNumber"])
+        with self._lock:
+            current = self._documents.get(key)
+            if current is not None:
+                merged = {**current.fields, **fields}
+                if merged == current.fields:
+                    return False
+                fields = merged
+                self._remove(key)
+
+            terms: t.Dict[str, float] = {}
+            for name, weight in FIELD_WEIGHTS.items():
+                for term, count in Counter(tokenize(fields.get(name))).items():
+                    terms[term] = terms.get(term, 0.0) + weight * count
+            document = IndexedPatent(fields, terms, sum(terms.values()))
+            self._documents[key] = document
+            self._lengths[key] = document.length
+            for term, frequency in terms.items():
+                self._postings.setdefault(term, {})[key] = frequency
+            self._total_length += document.length
+            self.indexed += 1
+            while len(self._documents) > self.max_documents:
+                self._remove(next(iter(self._documents)))
+        return True
+
+    def add_records(self, records: pd.DataFrame) -> int:
+        """Upsert every row of a parsed response; returns how many documents changed."""
+        if not self.enabled or records is None or records.empty:
+            return 0
+        return sum(self.add(record) for record in records.to_dict("records"))
+
+    def search(self, query: str, limit: int = 10, offset: int = 0) -> t.List[t.Tuple[float, t.Dict[str, str]]]:
+        """
+        Rank indexed documents against query with BM25.
+
+        Args:
+            query: Free text (tokenized like the documents)
+            limit: Maximum results
+            offset: Results to skip (pagination)
+
+        Returns:
+            (score, fields) pairs, best first
+        """
+        query_terms = set(tokenize(query))
+        with self._lock:
+            self.queries += 1
+            count = len(self._documents)
+            if not count or not query_terms:
+                return []
+            # BM25 분모의 길이 정규화 k1 * (1 - b + b * len / avg) = base + scale * len
+            base = self.k1 * (1.0 - self.b)
+            scale = self.k1 * self.b / (self._total_length / count or 1.0)
+            lengths = self._lengths
+            scores: t.Dict[str, float] = {}
+            for term in query_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                weight = math.log(1.0 + (count - len(postings) + 0.5) / (len(postings) + 0.5)) * (self.k1 + 1.0)
+                for key, frequency in postings.items():
+                    scores[key] = scores.get(key, 0.0) + weight * frequency / (frequency + base + scale * lengths[key])
+            ranked = heapq.nlargest(offset + limit, scores.items(), key=lambda item: item[1])[offset:]
+            return [(score, dict(self._documents[key].fields)) for key, score in ranked]
+
+    def documents(self) -> t.List[t.Dict[str, str]]:
+        """Snapshot of every indexed document's fields (oldest updated first)."""
+        with self._lock:
+            return [dict(document.fields) for document in self._documents.values()]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+            self._postings.clear()
+            self._lengths.clear()
+            self._total_length = 0.0
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        return {
+            "documents": len(self._documents),
+            "terms": len(self._postings),
+            "indexed": self.indexed,
+            "queries": self.queries,
+        }
@@ -1,14 +1,35 @@
 """
 Secure logging utilities for KIPRIS MCP server.
-Provides redaction functions to prevent sensitive data exposure in logs.
+Provides redaction functions to prevent sensitive data exposure in logs, and the
+queue-based log pipeline used by the servers (see configure_logging).
 """
 
-import os
+import atexit
+import contextlib
+import contextvars
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import random
 import re
-import urllib.parse
-from typing import Any, Dict, Optional
+import sys
+import threading
+import typing as t
+
+
+_REDACT_PATTERNS = [
+    re.compile(pattern, flags=re.IGNORECASE)
+    for pattern in (
+        # API key patterns to redact
+        r"(accessKey|ServiceKey|api_key|apikey)[=:]([^&\s]+)",
+        r"(Bearer\s+)([a-zA-Z0-9._-]+)",
+        r"(Authorization\s*:\s*)([^,\s]+)",
+        # URL patterns with keys
+        r"([?&](accessKey|ServiceKey|api_key|apikey)[=])[^&\s]+",
+    )
+]
 
 
 def redact_sensitive_data(text: str) -> str:
@@ -22,24 +43,11 @@ def redact_sensitive_data(text: str) -> str:
         Text with sensitive patterns redacted
     """
     if not isinstance(text, str):
-        return str(text)
-
-    # API key patterns to redact
-    api_key_patterns = [
-        r"(accessKey|ServiceKey|api_key|apikey)[=:]([^&\s]+)",
-        r"(Bearer\s+)([a-zA-Z0-9._-]+)",
-        r"(Authorization\s*:\s*)([^,\s]+)",
-    ]
-
-    # URL patterns with keys
-    url_key_patterns = [
-        r"([?&](accessKey|ServiceKey|api_key|apikey)[=])[^&\s]+",
-    ]
+        text = str(text)
 
     redacted_text = text
-
-    for pattern in api_key_patterns + url_key_patterns:
-        redacted_text = re.sub(pattern, r"\1***REDACTED***", redacted_text, flags=re.IGNORECASE)
+    for pattern in _REDACT_PATTERNS:
+        redacted_text = pattern.sub(r"\1***REDACTED***", redacted_text)
 
     return redacted_text
 
@@ -104,3 +112,187 @@ def get_log_level_from_env():
     }
 
     return level_mapping.get(log_level, logging.INFO)
+
+
+# 요청 단위 로그(INFO/DEBUG) 샘플링 여부; 요청 밖(시작/종료 로그)에서는 항상 기록
+_request_logs_sampled: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "kipris_request_logs_sampled", default=True
+)
+_request_log_sample_rate = 1.0
+
+# LogRecord 기본 속성; 나머지(extra=...)는 JSON 레코드의 필드로 출력
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+@contextlib.contextmanager
+def request_log_sampling(sample_rate: t.Optional[float] = None) -> t.Iterator[bool]:
+    """
+    Decide once per request whether its INFO/DEBUG lines are logged.
+
+    Warnings and errors are always logged. Yields the sampling decision.
+
+    Args:
+        sample_rate: Fraction of requests whose per-request lines are kept (default: KIPRIS_LOG_SAMPLE_RATE)
+    """
+    rate = _request_log_sample_rate if sample_rate is None else sample_rate
+    sampled = rate >= 1.0 or random.random() < rate
+    token = _request_logs_sampled.set(sampled)
+    try:
+        yield sampled
+    finally:
+        _request_logs_sampled.reset(token)
+
+
+class RequestSamplingFilter(logging.Filter):
+    """Drops INFO/DEBUG records logged inside requests that were not sampled."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or _request_logs_sampled.get()
+
+
+class RedactingFormatter(logging.Formatter):
+    """Text formatter whose output always goes through redact_sensitive_data."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return redact_sensitive_data(super().format(record))
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line: ts, level, logger, pid, msg, trace_id/span_id (inside a span),
+    any ``extra=`` fields and exc. Message and exception text are redacted.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if getattr(record, "_trace_prefixed", False):
+            # trace id는 별도 필드로 출력하므로 TraceContextFilter가 붙인 접두어 제거
+            message = message.split("] ", 1)[-1]
+        entry: t.Dict[str, t.Any] = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "pid": record.process,
+            "msg": redact_sensitive_data(message),
+        }
+        if getattr(record, "trace_id", ""):
+            entry["trace_id"] = record.trace_id
+            entry["span_id"] = record.span_id
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and key not in entry and not key.startswith("_"):
+                entry[key] = (
+                    value if isinstance(value, (int, float, bool, type(None))) else redact_sensitive_data(value)
+                )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = redact_sensitive_data(record.exc_text)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _StderrHandler(logging.StreamHandler):
+    """StreamHandler bound to the current sys.stderr (stdout carries the stdio MCP protocol)."""
+
+    def __init__(self):
+        super().__init__(sys.stderr)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+_EXC_FORMATTER = logging.Formatter()
+
+
+class LogPipeline(logging.handlers.QueueHandler):
+    """
+    Non-blocking root handler: the calling thread only merges the message arguments and
+    enqueues the record; formatting, redaction and I/O run on a listener thread.
+    Records are dropped (and counted) when the queue is full instead of blocking the caller.
+    """
+
+    def __init__(self, handler: logging.Handler, max_queue: int = 10000):
+        super().__init__(queue.Queue(maxsize=max_queue))
+        self.dropped = 0
+        self.listener = logging.handlers.QueueListener(self.queue, handler, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.close)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 인자가 이후에 바뀔 수 있으므로 메시지는 호출 스레드에서 확정하고, 포맷/마스킹은 리스너 스레드에서 수행.
+        # 레코드 복사 비용을 피하려고 그 자리에서 바꾸며, 같은 레코드를 받는 다른 핸들러의 출력은 달라지지 않음
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        if self.listener._thread is not None:
+            self.listener.stop()
+        super().close()
+
+
+# Global log pipeline instance
+_pipeline: t.Optional[LogPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def configure_logging(
+    level: t.Optional[int] = None,
+    log_format: t.Optional[str] = None,
+    sample_rate: t.Optional[float] = None,
+    handler: t.Optional[logging.Handler] = None,
+) -> LogPipeline:
+    """
+    Install the queue-based log pipeline on the root logger (idempotent).
+
+    Caller locations (funcName/lineno) are no longer collected once the pipeline is installed.
+
+    Args:
+        level: Root log level (default: LOG_LEVEL, INFO)
+        log_format: "text" or "json" (default: KIPRIS_LOG_FORMAT, text)
+        sample_rate: Fraction of requests whose INFO/DEBUG lines are kept (default: KIPRIS_LOG_SAMPLE_RATE, 1.0)
+        handler: Output handler run on the listener thread (default: stderr)
+
+    Returns:
+        The installed LogPipeline
+    """
+    global _pipeline, _request_log_sample_rate
+
+    with _pipeline_lock:
+        if _pipeline is not None:
+            return _pipeline
+
+        log_format = (log_format or os.getenv("KIPRIS_LOG_FORMAT", "text")).lower()
+        if sample_rate is None:
+            sample_rate = float(os.getenv("KIPRIS_LOG_SAMPLE_RATE", "1.0"))
+        _request_log_sample_rate = sample_rate
+
+        # 파이프라인 포맷에서 쓰지 않는 호출 위치(funcName/lineno)와 multiprocessing/asyncio 정보 수집 생략
+        logging._srcfile = None
+        logging.logMultiprocessing = False
+        logging.logAsyncioTasks = False
+
+        handler = handler or _StderrHandler()
+        if log_format == "json":
+            handler.setFormatter(JsonFormatter())
+        else:
+            handler.setFormatter(RedactingFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+
+        _pipeline = LogPipeline(handler)
+        _pipeline.addFilter(RequestSamplingFilter())
+        root = logging.getLogger()
+        root.addHandler(_pipeline)
+        root.setLevel(level if level is not None else get_log_level_from_env())
+        return _pipeline
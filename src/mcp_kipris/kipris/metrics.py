@@ -0,0 +1,343 @@
+"""
+Prometheus-style metrics for the MCP servers.
+
+A small in-process registry (counters, histograms and callback collectors) rendered in the
+Prometheus text exposition format. The HTTP server serves it at /metrics; stdio mode can
+write it to a file or serve it on a side port. Recording is a dict lookup and an increment
+under a per-metric lock, cheap enough to leave on in production.
+"""
+
+import asyncio
+import bisect
+import logging
+import math
+import os
+import tempfile
+import threading
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+logger = logging.getLogger("mcp-kipris")
+
+# 초 단위 지연 시간 버킷: KIPRIS 응답은 수십 ms ~ 수십 초까지 분포
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 600.0)
+
+Sample = t.Tuple[str, t.Dict[str, str], float]
+Collector = t.Callable[[], t.Iterable[t.Tuple[str, str, str, t.Iterable[t.Tuple[t.Dict[str, str], float]]]]]
+
+
+def _escape_label_value(value: t.Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: t.Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: t.Sequence[str] = ()):
+        # text format 0.0.4에서는 TYPE 줄과 샘플 이름이 같아야 하므로 _total까지 이름에 포함
+        self.name = name if name.endswith("_total") else name + "_total"
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: t.Dict[t.Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0.0)
+
+    def samples(self) -> t.Iterator[Sample]:
+        with self._lock:
+            items = list(self._values.items())
+        for labelvalues, value in items:
+            yield self.name, dict(zip(self.labelnames, labelvalues)), value
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: t.Sequence[str] = (),
+        buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labelvalues -> [버킷별 개수..., +Inf 개수, 합계]
+        self._values: t.Dict[t.Tuple[str, ...], t.List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(labelvalues)
+            if series is None:
+                series = self._values[labelvalues] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, *labelvalues: str) -> int:
+        series = self._values.get(labelvalues)
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> t.Iterator[Sample]:
+        with self._lock:
+            items = [(labelvalues, list(series)) for labelvalues, series in self._values.items()]
+        for labelvalues, series in items:
+            labels = dict(zip(self.labelnames, labelvalues))
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, math.inf), series[:-1]):
+                cumulative += count
+                yield self.name + "_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield self.name + "_count", labels, cumulative
+            yield self.name + "_sum", labels, series[-1]
+
+
+class MetricsRegistry:
+    """Holds metrics and collectors and renders them in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: t.Dict[str, t.Union[Counter, Histogram]] = {}
+        self._collectors: t.Dict[str, Collector] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: t.Sequence[str] = ()) -> Counter:
+        with self._lock:
+            return self._metrics.setdefault(name, Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: t.Sequence[str] = (),
+        buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        with self._lock:
+            return self._metrics.setdefault(name, Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, key: str, collector: Collector) -> None:
+        """
+        Register a callback evaluated at scrape time (replaces an earlier collector with the same key).
+
+        The callback yields ``(name, type, help, [(labels, value), ...])`` tuples, e.g. gauges built
+        from a component's stats() dict.
+        """
+        with self._lock:
+            self._collectors[key] = collector
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.values())
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        for collector in collectors:
+            try:
+                families = list(collector())
+            except Exception as e:
+                logger.error("metrics collector failed: %s", e)
+                continue
+            for name, metric_type, documentation, samples in families:
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+TOOL_DURATION = REGISTRY.histogram("kipris_tool_duration_seconds", "Tool call latency", ("tool",))
+TOOL_CALLS = REGISTRY.counter("kipris_tool_calls", "Tool calls by outcome", ("tool", "status"))
+HTTP_DURATION = REGISTRY.histogram("kipris_http_request_duration_seconds", "HTTP server request latency", ("path",))
+HTTP_REQUESTS = REGISTRY.counter("kipris_http_requests", "HTTP server requests by status", ("path", "status"))
+UPSTREAM_DURATION = REGISTRY.histogram(
+    "kipris_upstream_duration_seconds", "KIPRIS API request latency per endpoint", ("endpoint",)
+)
+UPSTREAM_RESPONSES = REGISTRY.counter(
+    "kipris_upstream_responses", "KIPRIS API responses by HTTP status (or timeout/error)", ("endpoint", "status")
+)
+UPSTREAM_RESULT_CODES = REGISTRY.counter(
+    "kipris_upstream_result_codes", "KIPRIS API header result codes", ("endpoint", "result_code")
+)
+UPSTREAM_BYTES = REGISTRY.counter("kipris_upstream_received_bytes", "Bytes received from KIPRIS", ("endpoint",))
+PARSE_DURATION = REGISTRY.histogram(
+    "kipris_parse_duration_seconds",
+    "XML response parse time per endpoint",
+    ("endpoint",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+RATE_LIMIT_WAIT = REGISTRY.histogram(
+    "kipris_rate_limit_wait_seconds",
+    "Time spent waiting for a rate-limit slot before a KIPRIS request",
+    buckets=(0.0, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0),
+)
+
+EVENT_LOOP_LAG = REGISTRY.histogram(
+    "kipris_event_loop_lag_seconds",
+    "How late the event loop ran a periodic timer (time other coroutines kept the loop busy)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+
+def process_resident_memory_bytes() -> t.Optional[int]:
+    """Current resident set size of this process (Linux /proc), or None where unavailable."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _process_collector():
+    rss = process_resident_memory_bytes()
+    if rss is not None:
+        yield "process_resident_memory_bytes", "gauge", "Resident memory size in bytes", [({}, rss)]
+
+
+REGISTRY.register_collector("process", _process_collector)
+
+
+async def monitor_event_loop_lag(interval: float = 0.25) -> None:
+    """
+    Record event-loop lag into EVENT_LOOP_LAG until cancelled.
+
+    Sleeps interval seconds in a loop; anything beyond interval before the loop resumes the
+    coroutine is time the loop spent on other callbacks (blocking parsing, rendering, logging).
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(loop.time() - started - interval, 0.0))
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return REGISTRY
+
+
+def endpoint_label(url: str) -> str:
+    """KIPRIS endpoint label from a request URL: ``service/operation`` (query and key stripped)."""
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    return "/".join(segments[-2:]) if segments else "unknown"
+
+
+def stats_collector(
+    prefix: str, stats: t.Callable[[], t.Dict[str, t.Any]], counters: t.Iterable[str] = ()
+) -> Collector:
+    """
+    Build a collector exposing a component's numeric stats() entries as ``<prefix>_<key>`` metrics.
+
+    Args:
+        prefix: Metric name prefix, e.g. ``kipris_cache``
+        stats: Callable returning the component's stats dict
+        counters: Keys that are monotonic counters (exported as ``counter``); the rest are gauges
+    """
+    counters = set(counters)
+
+    def collect():
+        for key, value in stats().items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                if key in counters:
+                    yield f"{prefix}_{key}_total", "counter", f"{prefix} {key}", [({}, value)]
+                else:
+                    yield f"{prefix}_{key}", "gauge", f"{prefix} {key}", [({}, value)]
+
+    return collect
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        body = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: t.Any) -> None:
+        pass
+
+
+def write_metrics_file(path: str) -> None:
+    """Write the current metrics to path atomically (for node_exporter's textfile collector)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile("w", dir=directory, delete=False, encoding="utf-8") as f:
+        f.write(REGISTRY.render())
+    os.replace(f.name, path)
+
+
+def start_metrics_exporter(
+    file_path: t.Optional[str] = None, port: t.Optional[int] = None, interval: float = 15.0
+) -> t.Optional[threading.Thread]:
+    """
+    Export metrics from processes without an HTTP app (stdio mode).
+
+    Args:
+        file_path: Rewrite this file with the metrics every interval seconds
+        port: Serve the metrics at http://127.0.0.1:<port>/metrics
+        interval: File rewrite interval in seconds
+
+    Returns:
+        The exporter thread, or None if neither option is set
+    """
+    thread = None
+    if port:
+        server = ThreadingHTTPServer(("127.0.0.1", port), _MetricsHandler)
+        thread = threading.Thread(target=server.serve_forever, name="kipris-metrics-http", daemon=True)
+        thread.start()
+        logger.info("Serving metrics at http://127.0.0.1:%d/metrics", port)
+    if file_path:
+        stop = threading.Event()
+
+        def write_loop() -> None:
+            while not stop.wait(interval):
+                try:
+                    write_metrics_file(file_path)
+                except OSError as e:
+                    logger.error("metrics file write failed: %s", e)
+
+        write_metrics_file(file_path)
+        thread = threading.Thread(target=write_loop, name="kipris-metrics-file", daemon=True)
+        thread.start()
+        logger.info("Writing metrics to %s every %.0f seconds", file_path, interval)
+    return thread
+
+
+def start_metrics_exporter_from_env() -> t.Optional[threading.Thread]:
+    """start_metrics_exporter() configured by KIPRIS_METRICS_FILE, KIPRIS_METRICS_PORT and KIPRIS_METRICS_INTERVAL."""
+    port = os.getenv("KIPRIS_METRICS_PORT", "")
+    return start_metrics_exporter(
+        file_path=os.getenv("KIPRIS_METRICS_FILE") or None,
+        port=int(port) if port.isdigit() else None,
+        interval=float(os.getenv("KIPRIS_METRICS_INTERVAL", "15")),
+    )
@@ -0,0 +1,293 @@
+"""
+MinHash / LSH near-duplicate detection for fetched patents.
+
+Divisionals, continuations and foreign family members often share almost the same abstract and
+claims. Each patent gets a MinHash signature over character shingles of its abstract and claims
+(character shingles work for Korean and English alike). Signatures are split into LSH bands; two
+patents whose band hashes collide in any band are candidates, and a candidate is a near duplicate
+when the signatures agree on at least ``threshold`` of their positions (estimated Jaccard
+similarity). Adding a patent and looking up its duplicates touch only its own buckets, and
+clustering walks the buckets once, so the cost grows linearly with the collection instead of
+with the number of pairs.
+
+Fields that arrive later (claims from a detail lookup) are merged without keeping the text: the
+MinHash of a union of shingle sets is the element-wise minimum of the two signatures. A CRC of
+each text already merged is kept per patent, so a response seen again (e.g. a cache hit) is
+skipped without computing its signature.
+"""
+
+import re
+import threading
+import typing as t
+import unicodedata
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from mcp_kipris.kipris.entity_cache import normalize_application_number
+from mcp_kipris.kipris.local_index import document_fields
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_WHITESPACE = re.compile(r"\s+")
+# 한 번에 서명을 계산하는 싱글 수 (긴 청구항에서 임시 배열 크기 제한)
+_SHINGLE_CHUNK = 2048
+
+
+def shingle_hashes(text: t.Optional[str], size: int = 5) -> np.ndarray:
+    """CRC32 hashes of the distinct character shingles of text (whitespace removed, NFKC lower-cased)."""
+    if not text:
+        return np.empty(0, dtype=np.uint64)
+    normalized = _WHITESPACE.sub("", unicodedata.normalize("NFKC", str(text)).lower())
+    if len(normalized) < size:
+        shingles = {normalized} if normalized else set()
+    else:
+        shingles = {normalized[i : i + size] for i in range(len(normalized) - size + 1)}
+    return np.fromiter((zlib.crc32(shingle.encode("utf-8")) for shingle in shingles), dtype=np.uint64)
+
+
+def optimal_bands(threshold: float, num_perm: int) -> t.Tuple[int, int]:
+    """
+    LSH (bands, rows per band) for num_perm hashes, minimizing false positives below threshold
+    plus false negatives above it (collision probability 1 - (1 - s^rows)^bands).
+    """
+    similarity = np.linspace(0.0, 1.0, 201)
+    below, above = similarity < threshold, similarity >= threshold
+    best, best_error = (1, num_perm), float("inf")
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        probability = 1.0 - (1.0 - similarity**rows) ** bands
+        error = probability[below].sum() + (1.0 - probability[above]).sum()
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class NearDuplicateIndex:
+    """MinHash signatures with LSH band buckets, keyed by normalized application number."""
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        max_documents: int = 200000,
+        seed: int = 1,
+    ):
+        """
+        Initialize near-duplicate index.
+
+        Args:
+            threshold: Estimated Jaccard similarity at which two patents are near duplicates (0 disables)
+            num_perm: MinHash permutations (signature length)
+            shingle_size: Characters per shingle
+            max_documents: Signatures kept before the least recently updated is dropped
+            seed: Seed of the permutation parameters (signatures are only comparable with the same seed)
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.max_documents = max_documents
+        self.bands, self.rows = optimal_bands(threshold, num_perm) if threshold > 0 else (1, num_perm)
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self.indexed = 0
+        self._signatures: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        # 출원번호별로 이미 서명에 합친 텍스트의 CRC32 (같은 텍스트는 서명을 다시 계산하지 않음)
+        self._seen_texts: t.Dict[str, t.Set[int]] = {}
+        self._buckets: t.List[t.Dict[bytes, t.Set[str]]] = [{} for _ in range(self.bands)]
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0 and self.max_documents > 0
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, application_number: str) -> bool:
+        return normalize_application_number(application_number) in self._signatures
+
+    def signature(self, text: t.Optional[str]) -> t.Optional[np.ndarray]:
+        """MinHash signature of text (None when text has no shingles)."""
+        hashes = shingle_hashes(text, self.shingle_size)
+        if not len(hashes):
+            return None
+        signature = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        for start in range(0, len(hashes), _SHINGLE_CHUNK):
+            chunk = hashes[start : start + _SHINGLE_CHUNK, np.newaxis]
+            # 곱셈은 2^64 에서 순환 (datasketch 와 같은 해시 계열)
+            permuted = ((chunk * self._a + self._b) % _MERSENNE_PRIME) & _MAX_HASH
+            np.minimum(signature, permuted.min(axis=0), out=signature)
+        return signature.astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> t.List[bytes]:
+        return [signature[band * self.rows : (band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def _remove(self, key: str) -> None:
+        signature = self._signatures.pop(key)
+        self._seen_texts.pop(key, None)
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            members = buckets.get(band_key)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del buckets[band_key]
+
+    def add(self, application_number: str, text: t.Optional[str]) -> bool:
+        """
+        Add text (e.g. abstract and claims) to a patent's signature.
+
+        Returns:
+            True when the patent was added or its signature changed
+        """
+        if not self.enabled or not text:
+            return False
+        key = normalize_application_number(application_number)
+        text_hash = zlib.crc32(str(text).encode("utf-8"))
+        if text_hash in self._seen_texts.get(key, ()):
+            return False
+        signature = self.signature(text)
+        if signature is None:
+            return False
+        with self._lock:
+            current = self._signatures.get(key)
+            seen = self._seen_texts.get(key, set())
+            seen.add(text_hash)
+            if current is not None:
+                # 싱글 합집합의 MinHash = 두 서명의 원소별 최솟값
+                signature = np.minimum(current, signature)
+                if np.array_equal(signature, current):
+                    return False
+                self._remove(key)
+            self._signatures[key] = signature
+            self._seen_texts[key] = seen
+            for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+                buckets.setdefault(band_key, set()).add(key)
+            self.indexed += 1
+            while len(self._signatures) > self.max_documents:
+                self._remove(next(iter(self._signatures)))
+        return True
+
+    def add_record(self, record: t.Dict[str, t.Any]) -> bool:
+        """Add one response record's abstract and claims (any shape the local index understands)."""
+        fields = document_fields(record)
+        text = "\n".join(fields[name] for name in ("abstract", "claims") if name in fields)
+        return "applicationNumber" in fields and bool(text) and self.add(fields["applicationNumber"], text)
+
+    def add_records(self, records: pd.DataFrame) -> int:
+        """Add every row of a parsed response; returns how many signatures changed."""
+        if not self.enabled or records is None or records.empty:
+            return 0
+        return sum(self.add_record(record) for record in records.to_dict("records"))
+
+    def similarity(self, first: str, second: str) -> float:
+        """Estimated Jaccard similarity of two indexed patents (0.0 when either is unknown)."""
+        a = self._signatures.get(normalize_application_number(first))
+        b = self._signatures.get(normalize_application_number(second))
+        if a is None or b is None:
+            return 0.0
+        return float(np.mean(a == b))
+
+    def _candidates(self, signature: np.ndarray) -> t.Set[str]:
+        candidates: t.Set[str] = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            candidates |= buckets.get(band_key, set())
+        return candidates
+
+    def duplicates_of(self, application_number: str) -> t.Dict[str, float]:
+        """Near duplicates of an indexed patent: application number -> estimated similarity."""
+        key = normalize_application_number(application_number)
+        with self._lock:
+            signature = self._signatures.get(key)
+            if signature is None:
+                return {}
+            result = {}
+            for candidate in self._candidates(signature) - {key}:
+                score = float(np.mean(self._signatures[candidate] == signature))
+                if score >= self.threshold:
+                    result[candidate] = score
+            return result
+
+    def query(self, text: str) -> t.Dict[str, float]:
+        """Indexed patents that are near duplicates of text: application number -> estimated similarity."""
+        signature = self.signature(text)
+        if signature is None:
+            return {}
+        with self._lock:
+            scores = {
+                candidate: float(np.mean(self._signatures[candidate] == signature))
+                for candidate in self._candidates(signature)
+            }
+        return {candidate: score for candidate, score in scores.items() if score >= self.threshold}
+
+    def clusters(self) -> t.List[t.List[str]]:
+        """
+        Groups of near-duplicate patents (two or more members), largest first.
+
+        Each LSH bucket is walked once and its members are verified against the bucket's first
+        member, then joined with union-find, so the cost is linear in the number of signatures.
+        """
+        with self._lock:
+            parent: t.Dict[str, str] = {}
+
+            def find(key: str) -> str:
+                while parent.get(key, key) != key:
+                    parent[key] = parent.get(parent[key], parent[key])
+                    key = parent[key]
+                return key
+
+            for buckets in self._buckets:
+                for members in buckets.values():
+                    if len(members) < 2:
+                        continue
+                    first, *others = members
+                    for other in others:
+                        if (
+                            find(first) != find(other)
+                            and np.mean(self._signatures[first] == self._signatures[other]) >= self.threshold
+                        ):
+                            parent[find(other)] = find(first)
+
+            groups: t.Dict[str, t.List[str]] = {}
+            for key in parent:
+                groups.setdefault(find(key), []).append(key)
+            for root, members in groups.items():
+                if root not in members:
+                    members.append(root)
+        return sorted((sorted(members) for members in groups.values()), key=len, reverse=True)
+
+    def collapse(self, records: pd.DataFrame, column: str) -> pd.DataFrame:
+        """
+        Keep the first row of each group of near-duplicate rows; the others are listed in a
+        ``duplicates`` column of the row that was kept.
+        """
+        kept_rows: t.List[int] = []
+        duplicates: t.Dict[int, t.List[str]] = {}
+        owner: t.Dict[str, int] = {}
+        for position, value in enumerate(records[column]):
+            number = normalize_application_number(value) if isinstance(value, str) else None
+            if number is not None and number in owner:
+                duplicates[owner[number]].append(str(value))
+                continue
+            kept_rows.append(position)
+            duplicates[position] = []
+            if number is not None:
+                owner.setdefault(number, position)
+                for duplicate in self.duplicates_of(number):
+                    owner.setdefault(duplicate, position)
+        collapsed = records.iloc[kept_rows].copy()
+        collapsed["duplicates"] = ["|".join(duplicates[position]) for position in kept_rows]
+        return collapsed.reset_index(drop=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._signatures.clear()
+            self._seen_texts.clear()
+            self._buckets = [{} for _ in range(self.bands)]
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        return {"documents": len(self._signatures), "indexed": self.indexed, "bands": self.bands}
@@ -0,0 +1,306 @@
+"""
+Durable SQLite FTS5 mirror of patent records that passed through the KIPRIS clients.
+
+Unlike the in-process LocalPatentIndex, the mirror survives restarts and is shared by worker
+processes, so repeat research sessions can be served from it without spending quota. Records are
+upserted by application number into a ``patents`` table (fields from later responses are merged)
+and into an FTS5 table with one column per searchable field, ranked with field-weighted bm25().
+Korean text is stored as the same character bigrams the local index uses, because FTS5's built-in
+tokenizers split on whitespace only; a query word becomes a phrase of its bigrams, i.e. a
+substring match.
+
+Responses are mirrored by a background writer thread: a write takes the database lock (and may
+wait out another worker's transaction), so the event loop only puts the records on a bounded
+queue and never blocks on SQLite.
+"""
+
+import atexit
+import logging
+import queue
+import re
+import sqlite3
+import threading
+import time
+import typing as t
+
+import pandas as pd
+
+from mcp_kipris.kipris.local_index import document_fields, tokenize
+
+logger = logging.getLogger("mcp-kipris")
+
+# 표시 필드 (patents 테이블 컬럼 = 색인 필드 이름)
+STORE_COLUMNS = (
+    "applicationNumber",
+    "applicationDate",
+    "inventionTitle",
+    "applicantName",
+    "ipcNumber",
+    "registerStatus",
+    "abstract",
+    "claims",
+)
+# FTS5 컬럼과 bm25() 가중치 (LocalPatentIndex.FIELD_WEIGHTS 와 같은 비중)
+FTS_WEIGHTS = {"inventionTitle": 3.0, "applicantName": 2.0, "abstract": 1.0, "claims": 1.0}
+RESULT_COLUMNS = [
+    "applicationNumber",
+    "applicationDate",
+    "inventionTitle",
+    "applicantName",
+    "ipcNumber",
+    "registerStatus",
+]
+
+_DIGITS = re.compile(r"\D")
+
+
+def normalize_date(value: t.Optional[str]) -> t.Optional[str]:
+    """'2023.01.15' / '2023-01-15' / '20230115' -> '20230115' (None when not a date)."""
+    digits = _DIGITS.sub("", str(value)) if value else ""
+    return digits[:8] if len(digits) >= 8 else None
+
+
+def _ipc_codes(value: t.Optional[str]) -> t.Optional[str]:
+    # "H01M 10/052|G06N 3/08" -> "|H01M10/052|G06N3/08|" (IPC 접두어 필터를 LIKE '%|H01M%' 로 처리)
+    if not value:
+        return None
+    codes = [code.replace(" ", "").upper() for code in str(value).split("|") if code.strip()]
+    return f"|{'|'.join(codes)}|" if codes else None
+
+
+def _fts_text(value: t.Optional[str]) -> str:
+    return " ".join(tokenize(value))
+
+
+def _fts_query(query: str) -> t.Optional[str]:
+    # 검색어 단어마다 바이그램을 구문으로 묶어 AND: 단어가 부분 문자열로 포함된 문서만 일치
+    phrases = []
+    for word in query.split():
+        terms = tokenize(word)
+        if terms:
+            phrases.append('"' + " ".join(terms) + '"')
+    return " AND ".join(phrases) or None
+
+
+class PatentStore:
+    """SQLite database with a patents table and its FTS5 index; one connection per thread."""
+
+    def __init__(self, path: str, max_pending: int = 256):
+        """
+        Initialize patent store.
+
+        Args:
+            path: SQLite database file (shared by worker processes)
+            max_pending: Responses queued for the background writer before new ones are dropped
+        """
+        self.path = path
+        self.upserts = 0
+        self.queries = 0
+        self.dropped = 0
+        self._local = threading.local()
+        self._queue: "queue.Queue[t.List[t.Dict[str, t.Any]]]" = queue.Queue(maxsize=max_pending)
+        self._writer: t.Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        conn = self.connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS patents ("
+            "applicationNumber TEXT PRIMARY KEY, applicationDate TEXT, inventionTitle TEXT, applicantName TEXT, "
+            "ipcNumber TEXT, registerStatus TEXT, abstract TEXT, claims TEXT, ipcCodes TEXT, updated REAL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS patents_date ON patents (applicationDate)")
+        conn.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS patents_fts USING fts5({', '.join(FTS_WEIGHTS)}, tokenize='unicode61')"
+        )
+
+    def connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _upsert(self, conn: sqlite3.Connection, fields: t.Dict[str, str]) -> bool:
+        row = conn.execute(
+            f"SELECT rowid, {', '.join(STORE_COLUMNS)} FROM patents WHERE applicationNumber = ?",
+            (fields["applicationNumber"],),
+        ).fetchone()
+        current = {name: row[name] for name in STORE_COLUMNS if row[name] is not None} if row else {}
+        merged = {**current, **fields}
+        if row is not None and merged == current:
+            return False
+        values = [merged.get(name) for name in STORE_COLUMNS]
+        conn.execute(
+            f"INSERT OR REPLACE INTO patents ({', '.join(STORE_COLUMNS)}, ipcCodes, updated) "
+            f"VALUES ({', '.join('?' * len(STORE_COLUMNS))}, ?, ?)",
+            (*values, _ipc_codes(merged.get("ipcNumber")), time.time()),
+        )
+        (rowid,) = conn.execute(
+            "SELECT rowid FROM patents WHERE applicationNumber = ?", (fields["applicationNumber"],)
+        ).fetchone()
+        if row is not None:
+            conn.execute("DELETE FROM patents_fts WHERE rowid = ?", (row["rowid"],))
+        conn.execute(
+            f"INSERT INTO patents_fts (rowid, {', '.join(FTS_WEIGHTS)}) VALUES (?, {', '.join('?' * len(FTS_WEIGHTS))})",
+            (rowid, *(_fts_text(merged.get(name)) for name in FTS_WEIGHTS)),
+        )
+        return True
+
+    def upsert(self, record: t.Dict[str, t.Any]) -> bool:
+        """Upsert one response record; returns True when the stored patent changed."""
+        return self.upsert_many([record]) == 1
+
+    def upsert_many(self, records: t.Iterable[t.Dict[str, t.Any]]) -> int:
+        """Upsert response records in one transaction; returns how many stored patents changed."""
+        documents = []
+        for record in records:
+            fields = document_fields(record)
+            if "applicationNumber" in fields and fields.keys() & FTS_WEIGHTS.keys():
+                fields["applicationNumber"] = fields["applicationNumber"].replace("-", "")
+                if "applicationDate" in fields:
+                    fields["applicationDate"] = normalize_date(fields["applicationDate"]) or fields["applicationDate"]
+                documents.append(fields)
+        if not documents:
+            return 0
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            changed = sum(self._upsert(conn, fields) for fields in documents)
+            conn.execute("COMMIT")
+        except Exception:
+            # BEGIN 자체가 실패(busy)했으면 트랜잭션이 없으므로 원래 오류를 그대로 전달
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        self.upserts += changed
+        return changed
+
+    def upsert_records(self, records: pd.DataFrame) -> int:
+        """Upsert every row of a parsed response (errors are logged, never raised to the caller)."""
+        if records is None or records.empty:
+            return 0
+        try:
+            return self.upsert_many(records.to_dict("records"))
+        except sqlite3.Error as e:
+            logger.warning("특허 저장소 갱신 실패: %s", e)
+            return 0
+
+    def enqueue_records(self, records: pd.DataFrame) -> bool:
+        """
+        Queue every row of a parsed response for the background writer (never blocks).
+
+        Returns:
+            False when the queue is full and the response was dropped
+        """
+        if records is None or records.empty:
+            return True
+        self._start_writer()
+        try:
+            self._queue.put_nowait(records.to_dict("records"))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def _start_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="kipris-patent-store", daemon=True)
+                self._writer.start()
+                atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            rows = self._queue.get()
+            try:
+                self.upsert_many(rows)
+            except sqlite3.Error as e:
+                logger.warning("특허 저장소 갱신 실패: %s", e)
+            except Exception:
+                logger.exception("특허 저장소 갱신 실패")
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Wait until every queued response has been written."""
+        if self._writer is not None:
+            self._queue.join()
+
+    def search(
+        self,
+        query: str = "",
+        applicant: t.Optional[str] = None,
+        ipc_prefix: t.Optional[str] = None,
+        date_from: t.Optional[str] = None,
+        date_to: t.Optional[str] = None,
+        docs_start: int = 1,
+        docs_count: int = 10,
+    ) -> t.Tuple[int, pd.DataFrame]:
+        """
+        Full-text search with field filters.
+
+        Args:
+            query: Words matched as substrings of title / applicant / abstract / claims (empty: filters only)
+            applicant: Applicant name substring
+            ipc_prefix: IPC code prefix, e.g. ``H01M`` or ``H01M 10``
+            date_from: Earliest application date (YYYYMMDD or YYYY.MM.DD)
+            date_to: Latest application date
+            docs_start: 1-based position of the first result
+            docs_count: Results per page
+
+        Returns:
+            (total matches, page of RESULT_COLUMNS rows): bm25 order with a query, newest first without
+        """
+        conditions, params = [], []
+        match = _fts_query(query or "")
+        if match:
+            conditions.append("patents_fts MATCH ?")
+            params.append(match)
+        if applicant:
+            conditions.append("p.applicantName LIKE ?")
+            params.append(f"%{applicant}%")
+        if ipc_prefix:
+            conditions.append("p.ipcCodes LIKE ?")
+            params.append(f"%|{ipc_prefix.replace(' ', '').upper()}%")
+        if normalize_date(date_from):
+            conditions.append("p.applicationDate >= ?")
+            params.append(normalize_date(date_from))
+        if normalize_date(date_to):
+            conditions.append("p.applicationDate <= ?")
+            params.append(normalize_date(date_to))
+
+        source = "patents p JOIN patents_fts ON patents_fts.rowid = p.rowid" if match else "patents p"
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        weights = ", ".join(str(weight) for weight in FTS_WEIGHTS.values())
+        order = f"bm25(patents_fts, {weights})" if match else "p.applicationDate DESC"
+        conn = self.connect()
+        self.queries += 1
+        (total,) = conn.execute(f"SELECT COUNT(*) FROM {source}{where}", params).fetchone()
+        rows = conn.execute(
+            f"SELECT {', '.join(f'p.{name}' for name in RESULT_COLUMNS)} FROM {source}{where} "
+            f"ORDER BY {order} LIMIT ? OFFSET ?",
+            (*params, max(docs_count, 1), max(docs_start - 1, 0)),
+        ).fetchall()
+        return total, pd.DataFrame([dict(row) for row in rows], columns=RESULT_COLUMNS)
+
+    def documents(self) -> t.Iterator[t.Dict[str, str]]:
+        """Iterate every stored patent's fields (empty fields left out)."""
+        for row in self.connect().execute(f"SELECT {', '.join(STORE_COLUMNS)} FROM patents ORDER BY rowid"):
+            yield {name: row[name] for name in STORE_COLUMNS if row[name] is not None}
+
+    def __len__(self) -> int:
+        (count,) = self.connect().execute("SELECT COUNT(*) FROM patents").fetchone()
+        return count
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        return {
+            "documents": len(self),
+            "upserts": self.upserts,
+            "queries": self.queries,
+            "pending": self._queue.qsize(),
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,241 @@
+"""
+Speculative prefetch of patent details for top search hits.
+
+After a search tool answers, the next call is often patent_detail_search for one of the first
+results. When enabled (KIPRIS_PREFETCH_TOP_K), the prefetcher fetches the detail records of the
+top-K application numbers in the background and merges them into the patent entity cache, so that
+call is answered locally. Prefetches only run on spare rate-limit capacity: a fetch is skipped
+while fewer than a reserved share of the per-minute slots are free, and pending prefetches are
+cancelled on shutdown. Stats (``kipris_prefetch_*``) show whether prefetched details get used.
+"""
+
+import asyncio
+import contextvars
+import logging
+import math
+import os
+import threading
+import typing as t
+from collections import OrderedDict
+
+import pandas as pd
+
+from mcp_kipris.kipris.api.abs_class import ABSKiprisAPI
+from mcp_kipris.kipris.entity_cache import DETAIL_FIELDS, lookup_patent_async, normalize_application_number
+from mcp_kipris.kipris.metrics import get_metrics_registry, stats_collector
+
+logger = logging.getLogger("mcp-kipris")
+
+# 검색 결과의 출원번호 컬럼 (items.item 형식 / PatentUtilityInfo 형식)
+APPLICATION_NUMBER_COLUMNS = ("applicationNumber", "ApplicationNumber")
+
+_COUNTERS = ("scheduled", "fetched", "used", "skipped_cached", "skipped_capacity", "cancelled", "failed")
+
+
+def top_application_numbers(records: pd.DataFrame, top_k: int) -> t.List[str]:
+    """First top_k distinct application numbers of a search result, in result order."""
+    column = next((name for name in APPLICATION_NUMBER_COLUMNS if name in records.columns), None)
+    if column is None:
+        return []
+    numbers: t.List[str] = []
+    for value in records[column]:
+        if isinstance(value, str) and value.strip():
+            number = normalize_application_number(value)
+            if number not in numbers:
+                numbers.append(number)
+                if len(numbers) >= top_k:
+                    break
+    return numbers
+
+
+class DetailPrefetcher:
+    """Background detail fetches for the top hits of search results, on spare rate-limit capacity."""
+
+    def __init__(self, top_k: int = 3, reserve: float = 0.5, max_pending: int = 8, max_tracked: int = 1024):
+        """
+        Initialize prefetcher.
+
+        Args:
+            top_k: Application numbers prefetched per search result
+            reserve: Share of the per-minute rate limit kept free for tool calls
+            max_pending: Maximum prefetches in flight at once
+            max_tracked: Prefetched numbers remembered for hit accounting
+        """
+        self.top_k = top_k
+        self.reserve = reserve
+        self.max_pending = max_pending
+        self.max_tracked = max_tracked
+        self.counts = {name: 0 for name in _COUNTERS}
+        self._pending: t.Dict[str, asyncio.Task] = {}
+        # 미리 받았지만 아직 상세 조회에 쓰이지 않은 출원번호 (LRU)
+        self._prefetched: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counts[name] += amount
+
+    async def spare_capacity(self, api: ABSKiprisAPI) -> int:
+        """Rate-limit slots free beyond the reserved share of the API's window (read off the event loop)."""
+        factory = getattr(api, "factory", None)
+        limiter = getattr(factory, "rate_limiter", None)
+        if limiter is None:
+            return self.top_k
+        remaining = await limiter.remaining_async()
+        return max(remaining - math.ceil(limiter.max_requests_per_minute * self.reserve), 0)
+
+    def schedule(self, api: ABSKiprisAPI, records: pd.DataFrame) -> int:
+        """
+        Start background detail fetches for the top application numbers of a search result.
+
+        The spare rate-limit capacity is read once per call, in the background; prefetches beyond it
+        are skipped.
+
+        Args:
+            api: The search tool's API client (its factory provides the entity cache and detail client)
+            records: Search result rows
+
+        Returns:
+            Number of prefetches started
+        """
+        factory = getattr(api, "factory", None)
+        # 엔티티 캐시가 없으면 미리 받아도 다음 호출이 재사용할 수 없음
+        if factory is None or not factory.entities.enabled or records is None or records.empty:
+            return 0
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return 0
+
+        numbers = []
+        for number in top_application_numbers(records, self.top_k):
+            if number in self._pending:
+                continue
+            if "detail" in factory.entities.get(number).records:
+                self._count("skipped_cached")
+                continue
+            if len(self._pending) + len(numbers) >= self.max_pending:
+                self._count("skipped_capacity")
+                continue
+            numbers.append(number)
+        if not numbers:
+            return 0
+
+        # 호출 요청의 컨텍스트(트레이스 스팬, 로그 샘플링)를 물려받지 않도록 빈 컨텍스트에서 실행
+        capacity = loop.create_task(self.spare_capacity(api), context=contextvars.Context())
+        for position, number in enumerate(numbers):
+            task = loop.create_task(self._prefetch(api, number, capacity, position), context=contextvars.Context())
+            self._pending[number] = task
+            task.add_done_callback(lambda _, number=number: self._pending.pop(number, None))
+        self._count("scheduled", len(numbers))
+        return len(numbers)
+
+    async def _prefetch(self, api: ABSKiprisAPI, number: str, capacity: "asyncio.Task[int]", position: int) -> None:
+        # 여유 용량은 schedule() 한 번에 한 번만 읽음: 결과 순서대로 여유 슬롯 수만큼만 받음
+        try:
+            if position >= await asyncio.shield(capacity):
+                self._count("skipped_capacity")
+                return
+            entity = await lookup_patent_async(api, number, DETAIL_FIELDS, candidates=("detail",))
+        except asyncio.CancelledError:
+            self._count("cancelled")
+            raise
+        except Exception as e:
+            self._count("failed")
+            logger.debug("상세 정보 미리 받기 실패 (%s): %s", number, e)
+            return
+        if "detail" in entity.records:
+            with self._lock:
+                self.counts["fetched"] += 1
+                self._prefetched[number] = None
+                self._prefetched.move_to_end(number)
+                while len(self._prefetched) > self.max_tracked:
+                    self._prefetched.popitem(last=False)
+
+    async def claim(self, application_number: str) -> bool:
+        """
+        Wait for an in-flight prefetch of application_number and record whether a prefetch served it.
+
+        Called by patent_detail_search before its lookup.
+
+        Returns:
+            True when the detail record was prefetched (the lookup is then answered locally)
+        """
+        number = normalize_application_number(application_number)
+        task = self._pending.get(number)
+        if task is not None:
+            # 상세 조회가 취소돼도 미리 받기 작업은 계속 진행
+            await asyncio.wait([task])
+        with self._lock:
+            if number not in self._prefetched:
+                return False
+            del self._prefetched[number]
+            self.counts["used"] += 1
+        return True
+
+    def cancel_all(self) -> int:
+        """Cancel every pending prefetch; returns how many were cancelled."""
+        tasks = list(self._pending.values())
+        for task in tasks:
+            task.cancel()
+        return len(tasks)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        fetched = self.counts["fetched"]
+        return {
+            **self.counts,
+            "pending": len(self._pending),
+            "hit_rate": self.counts["used"] / fetched if fetched else 0.0,
+        }
+
+
+# Global prefetcher instance (False: 환경 변수를 확인했고 미리 받기가 꺼져 있음)
+_prefetcher: t.Union[DetailPrefetcher, None, bool] = None
+_prefetcher_lock = threading.Lock()
+
+
+def _register_metrics(prefetcher: DetailPrefetcher) -> None:
+    get_metrics_registry().register_collector(
+        "prefetch", stats_collector("kipris_prefetch", prefetcher.stats, _COUNTERS)
+    )
+
+
+def get_prefetcher() -> t.Optional[DetailPrefetcher]:
+    """
+    Get the detail prefetcher configured from KIPRIS_PREFETCH_TOP_K (default 0: off),
+    KIPRIS_PREFETCH_RESERVE (default 0.5) and KIPRIS_PREFETCH_MAX_PENDING (default 8).
+
+    Returns:
+        DetailPrefetcher instance, or None when prefetching is off
+    """
+    global _prefetcher
+
+    if _prefetcher is None:
+        with _prefetcher_lock:
+            if _prefetcher is None:
+                top_k = int(os.getenv("KIPRIS_PREFETCH_TOP_K", "0"))
+                if top_k > 0:
+                    prefetcher = DetailPrefetcher(
+                        top_k=top_k,
+                        reserve=float(os.getenv("KIPRIS_PREFETCH_RESERVE", "0.5")),
+                        max_pending=int(os.getenv("KIPRIS_PREFETCH_MAX_PENDING", "8")),
+                    )
+                    _register_metrics(prefetcher)
+                    logger.info("검색 상위 %d건 상세 정보 미리 받기 사용", top_k)
+                    _prefetcher = prefetcher
+                else:
+                    _prefetcher = False
+    return _prefetcher or None
+
+
+def set_prefetcher(prefetcher: t.Optional[DetailPrefetcher]) -> None:
+    """Install a prefetcher (None switches prefetching off); mainly for tests and benchmarks."""
+    global _prefetcher
+
+    if prefetcher is not None:
+        _register_metrics(prefetcher)
+    _prefetcher = prefetcher if prefetcher is not None else False
@@ -0,0 +1,150 @@
+"""
+On-demand sampling profiler.
+
+Samples the stacks of every thread in the live process (the event loop, the blocking executor
+that runs XML parsing and DataFrame work, and worker threads) for a bounded time and returns
+them in the collapsed-stack format read by flamegraph.pl, speedscope and inferno.
+
+Nothing runs until a profile is requested: the sampler thread only exists for the duration of a
+profile. The HTTP server exposes it at /admin/profile; stdio mode starts one on SIGUSR1.
+"""
+
+import collections
+import logging
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+import typing as t
+
+logger = logging.getLogger("mcp-kipris")
+
+MAX_PROFILE_SECONDS = 120.0
+DEFAULT_INTERVAL = 0.005
+
+# 한 번에 하나의 프로파일만 실행 (샘플링 스레드가 여러 개면 서로의 오버헤드가 측정에 섞임)
+_profile_lock = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    # 경로는 패키지 기준으로 줄여 flamegraph 라벨을 짧게 유지
+    index = filename.rfind("site-packages" + os.sep)
+    if index >= 0:
+        filename = filename[index + len("site-packages" + os.sep) :]
+    elif (index := filename.rfind("mcp_kipris" + os.sep)) >= 0:
+        filename = filename[index:]
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def sample_stacks(seconds: float, interval: float = DEFAULT_INTERVAL) -> t.Counter[t.Tuple[str, ...]]:
+    """
+    Sample every thread's stack (except the calling thread) for the given time.
+
+    Args:
+        seconds: Profile duration (capped at MAX_PROFILE_SECONDS)
+        interval: Seconds between samples
+
+    Returns:
+        Counter of root-first stacks; the first element is the thread name
+
+    Raises:
+        ProfilerBusyError: When another profile is running
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("a profile is already running")
+    try:
+        own_id = threading.get_ident()
+        stacks: t.Counter[t.Tuple[str, ...]] = collections.Counter()
+        labels: t.Dict[t.Any, str] = {}
+        deadline = time.monotonic() + min(seconds, MAX_PROFILE_SECONDS)
+        while time.monotonic() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    label = labels.get(code)
+                    if label is None:
+                        label = labels[code] = _frame_label(frame)
+                    stack.append(label)
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, f"thread-{thread_id}"))
+                stacks[tuple(reversed(stack))] += 1
+            time.sleep(interval)
+        return stacks
+    finally:
+        _profile_lock.release()
+
+
+def collapse_stacks(stacks: t.Counter[t.Tuple[str, ...]]) -> str:
+    """Render stacks as collapsed-stack lines (``frame;frame;frame count``)."""
+    return "".join(f"{';'.join(stack)} {count}\n" for stack, count in stacks.most_common())
+
+
+def profile(seconds: float, interval: float = DEFAULT_INTERVAL) -> str:
+    """Run a blocking sampling profile and return it in collapsed-stack format."""
+    started = time.monotonic()
+    stacks = sample_stacks(seconds, interval)
+    logger.info(
+        "Profiled %.1f seconds: %d samples, %d distinct stacks",
+        time.monotonic() - started,
+        sum(stacks.values()),
+        len(stacks),
+    )
+    return collapse_stacks(stacks)
+
+
+def profile_to_file(seconds: float, output_dir: t.Optional[str] = None, interval: float = DEFAULT_INTERVAL) -> str:
+    """
+    Run a profile and write it to ``<output_dir>/mcp-kipris-<pid>-<timestamp>.collapsed``.
+
+    Returns:
+        Path of the written file
+    """
+    output_dir = output_dir or tempfile.gettempdir()
+    path = os.path.join(output_dir, f"mcp-kipris-{os.getpid()}-{time.strftime('%Y%m%d-%H%M%S')}.collapsed")
+    collapsed = profile(seconds, interval)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(collapsed)
+    logger.info("Profile written to %s", path)
+    return path
+
+
+def install_signal_handler(signum: t.Optional[int] = None) -> bool:
+    """
+    Start a background profile whenever the process receives signum (default SIGUSR1).
+
+    Duration and output directory come from KIPRIS_PROFILE_SECONDS (default 30) and
+    KIPRIS_PROFILE_DIR (default: the temp dir). Only the signal handler is installed up front.
+
+    Returns:
+        False when the platform has no such signal (Windows) or this is not the main thread
+    """
+    signum = signum if signum is not None else getattr(signal, "SIGUSR1", None)
+    if signum is None or threading.current_thread() is not threading.main_thread():
+        return False
+
+    def start_profile(received: int, frame) -> None:
+        # 시그널 핸들러에서는 스레드만 시작 (로깅 등 락을 잡는 작업은 스레드에서 수행)
+        def run() -> None:
+            try:
+                profile_to_file(float(os.getenv("KIPRIS_PROFILE_SECONDS", "30")), os.getenv("KIPRIS_PROFILE_DIR"))
+            except (ProfilerBusyError, OSError) as e:
+                logger.error("Profile failed: %s", e)
+
+        threading.Thread(target=run, name="kipris-profiler", daemon=True).start()
+
+    signal.signal(signum, start_profile)
+    return True
@@ -4,12 +4,15 @@ Implements token bucket algorithm to prevent API throttling.
 """
 
 import asyncio
+import logging
 import time
 import threading
 from typing import Dict, Optional
 from collections import deque
 from datetime import datetime, timedelta
 
+logger = logging.getLogger("mcp-kipris")
+
 
 class TokenBucket:
     """Token bucket for rate limiting."""
@@ -121,11 +124,88 @@ class RateLimiter:
             else:
                 return False
 
+    def remaining(self) -> int:
+        """
+        Number of request slots still free in the current one-minute window.
+
+        Returns:
+            Free slots (0 when the limit is reached)
+        """
+        with self._lock:
+            one_minute_ago = datetime.now() - timedelta(minutes=1)
+            while self.requests and self.requests[0] < one_minute_ago:
+                self.requests.popleft()
+            return max(self.max_requests_per_minute - len(self.requests), 0)
+
+    async def remaining_async(self) -> int:
+        """Async variant of remaining() (same interface as the shared SQLite limiter)."""
+        return self.remaining()
+
+    def time_until_slot(self) -> float:
+        """Seconds until a request slot frees up (0.0 when one is free now); does not reserve it."""
+        with self._lock:
+            one_minute_ago = datetime.now() - timedelta(minutes=1)
+            while self.requests and self.requests[0] < one_minute_ago:
+                self.requests.popleft()
+            if len(self.requests) < self.max_requests_per_minute:
+                return 0.0
+            return max((self.requests[0] - one_minute_ago).total_seconds(), 0.0)
+
     def record_request(self) -> None:
         """Record a successful request."""
         with self._lock:
             self.requests.append(datetime.now())
 
+    def try_acquire(self) -> float:
+        """
+        Reserve a request slot if one is free.
+
+        Returns:
+            0.0 if the slot was reserved, otherwise seconds until the oldest request leaves the window
+        """
+        with self._lock:
+            now = datetime.now()
+            one_minute_ago = now - timedelta(minutes=1)
+            while self.requests and self.requests[0] < one_minute_ago:
+                self.requests.popleft()
+
+            if len(self.requests) < self.max_requests_per_minute:
+                self.requests.append(now)
+                return 0.0
+            return max((self.requests[0] - one_minute_ago).total_seconds(), 0.01)
+
+    async def acquire(self) -> float:
+        """
+        Wait until a request slot is free and reserve it.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait_time = self.try_acquire()
+            if wait_time == 0.0:
+                return waited
+            logger.debug("Rate limit reached. Waiting %.2f seconds before next request.", wait_time)
+            await asyncio.sleep(wait_time)
+            waited += wait_time
+
+    def acquire_blocking(self) -> float:
+        """
+        Blocking variant of acquire() for synchronous callers.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait_time = self.try_acquire()
+            if wait_time == 0.0:
+                return waited
+            logger.debug("Rate limit reached. Waiting %.2f seconds before next request.", wait_time)
+            time.sleep(wait_time)
+            waited += wait_time
+
 
 # Global rate limiter instance
 _rate_limiter: Optional[RateLimiter] = None
@@ -153,9 +233,4 @@ async def wait_if_rate_limited() -> None:
     """
     Wait if rate limited. Should be called before making API requests.
     """
-    rate_limiter = get_rate_limiter()
-
-    while not rate_limiter.can_make_request():
-        wait_time = 60.0  # Wait 1 second before checking again
-        logger.warning(f"Rate limit reached. Waiting {wait_time:.1f} seconds before next request.")
-        await asyncio.sleep(wait_time)
+    await get_rate_limiter().acquire()
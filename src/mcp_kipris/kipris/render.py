@@ -0,0 +1,340 @@
+"""
+Table rendering utilities for KIPRIS tool output.
+Renders search records as compact Markdown, TSV, CSV or a JSON records payload without going through tabulate.
+"""
+
+import csv
+import io
+import json
+import math
+import typing as t
+
+import pandas as pd
+
+TABLE_FORMATS = ("markdown", "tsv", "csv")
+TRUNCATION_MARKER = "…"
+BYTES_PER_TOKEN = 3
+MIN_TRUNCATED_FIELD_BYTES = 120
+
+Records = t.Union[pd.DataFrame, t.Sequence[t.Mapping[str, t.Any]]]
+
+
+def _cell_text(value: t.Any) -> str:
+    """Convert a single cell value to text; missing values become an empty string."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, float) and math.isnan(value):
+        return ""
+    if value is pd.NA or value is pd.NaT:
+        return ""
+    return str(value)
+
+
+def _json_value(value: t.Any) -> t.Any:
+    """Convert a cell value to something json.dumps accepts; missing values become None."""
+    if value is None or isinstance(value, (str, bool, int, dict, list)):
+        return value
+    if isinstance(value, float):
+        return None if math.isnan(value) else value
+    if value is pd.NA or value is pd.NaT:
+        return None
+    return str(value)
+
+
+def _truncate(text: str, max_cell_chars: t.Optional[int]) -> str:
+    if max_cell_chars is None or len(text) <= max_cell_chars:
+        return text
+    return text[: max(max_cell_chars - 1, 0)] + TRUNCATION_MARKER
+
+
+def _escape_markdown(text: str) -> str:
+    if "|" in text:
+        text = text.replace("|", "\\|")
+    if "\n" in text or "\r" in text:
+        text = " ".join(text.split())
+    return text
+
+
+def _escape_tsv(text: str) -> str:
+    if "\t" in text or "\n" in text or "\r" in text:
+        text = " ".join(text.split())
+    return text
+
+
+def _iter_rows(data: Records, columns: t.Sequence[str]) -> t.Iterator[t.Sequence[t.Any]]:
+    """Yield rows as value tuples in column order, without building intermediate frames."""
+    if isinstance(data, pd.DataFrame):
+        yield from zip(*(data[column].tolist() for column in columns))
+        return
+    for record in data:
+        yield tuple(record.get(column) for column in columns)
+
+
+def _resolve_columns(data: Records, columns: t.Optional[t.Sequence[str]]) -> t.List[str]:
+    if columns is not None:
+        return list(columns)
+    if isinstance(data, pd.DataFrame):
+        return [str(column) for column in data.columns]
+    resolved: t.Dict[str, None] = {}
+    for record in data:
+        for key in record:
+            resolved.setdefault(key, None)
+    return list(resolved)
+
+
+def render_table(
+    data: Records,
+    columns: t.Optional[t.Sequence[str]] = None,
+    fmt: str = "markdown",
+    max_cell_chars: t.Optional[int] = None,
+) -> str:
+    """
+    Render records as a text table.
+
+    Args:
+        data: DataFrame or sequence of record dicts
+        columns: Columns to render, in order (default: all columns)
+        fmt: One of "markdown", "tsv", "csv"
+        max_cell_chars: Truncate cells longer than this, appending a marker
+
+    Returns:
+        Rendered table text
+    """
+    if fmt not in TABLE_FORMATS:
+        raise ValueError(f"fmt must be one of: {', '.join(TABLE_FORMATS)}")
+
+    columns = _resolve_columns(data, columns)
+    rows = _iter_rows(data, columns)
+
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow([_truncate(_cell_text(value), max_cell_chars) for value in row])
+        return buffer.getvalue().rstrip("\n")
+
+    if fmt == "tsv":
+        lines = ["\t".join(_escape_tsv(column) for column in columns)]
+        for row in rows:
+            lines.append("\t".join(_escape_tsv(_truncate(_cell_text(value), max_cell_chars)) for value in row))
+        return "\n".join(lines)
+
+    lines = [
+        "| " + " | ".join(_escape_markdown(column) for column in columns) + " |",
+        "|" + "|".join("---" for _ in columns) + "|",
+    ]
+    for row in rows:
+        cells = (_escape_markdown(_truncate(_cell_text(value), max_cell_chars)) for value in row)
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def render_json(data: Records, columns: t.Optional[t.Sequence[str]] = None) -> str:
+    """
+    Render records as a JSON payload of the form {"columns": [...], "records": [...], "count": n}.
+
+    Args:
+        data: DataFrame or sequence of record dicts
+        columns: Columns to include, in order (default: all columns)
+
+    Returns:
+        JSON text
+    """
+    columns = _resolve_columns(data, columns)
+    records = [{column: _json_value(value) for column, value in zip(columns, row)} for row in _iter_rows(data, columns)]
+    return json.dumps({"columns": columns, "records": records, "count": len(records)}, ensure_ascii=False)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token estimate used for result budgets.
+
+    Counts UTF-8 bytes / 3, which is close to one token per Hangul syllable and
+    errs on the generous side for ASCII text.
+    """
+    return math.ceil(len(text.encode("utf-8")) / BYTES_PER_TOKEN)
+
+
+def _list_text(values: t.Sequence[t.Any]) -> str:
+    parts = []
+    for value in values:
+        if isinstance(value, dict):
+            parts.append("; ".join(f"{k}: {_cell_text(v)}" for k, v in value.items() if _cell_text(v)))
+        else:
+            parts.append(_cell_text(value))
+    return "\n".join(part for part in parts if part)
+
+
+def flatten_record(record: t.Mapping[str, t.Any], prefix: str = "") -> t.Dict[str, str]:
+    """
+    Flatten a nested KIPRIS record into dotted field paths with text values.
+
+    Single-key wrapper dicts (e.g. ``claimInfoArray.claimInfo``) are collapsed into their parent
+    path, and lists are joined into one multi-line text field. Empty values are dropped.
+    """
+    fields: t.Dict[str, str] = {}
+    for key, value in record.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        while isinstance(value, dict) and len(value) == 1:
+            value = next(iter(value.values()))
+        if isinstance(value, dict):
+            fields.update(flatten_record(value, path))
+            continue
+        text = _list_text(value) if isinstance(value, list) else _cell_text(value)
+        if text:
+            fields[path] = text
+    return fields
+
+
+def _matches(path: str, names: t.Iterable[str]) -> bool:
+    segments = path.split(".")
+    return any(name == path or name in segments or path.startswith(name + ".") for name in names)
+
+
+class BudgetedRecords(t.NamedTuple):
+    """Records cut down to a result budget, with what was left out."""
+
+    records: t.List[t.Dict[str, str]]
+    omitted_fields: t.List[str]
+    truncated_fields: t.List[str]
+
+
+# render_budgeted 출력에서 필드 한 행의 구분자/따옴표/줄바꿈 바이트와 레코드 하나의 머리글(구분 빈 줄 포함) 바이트
+_FIELD_OVERHEAD = {"markdown": 7, "tsv": 2, "csv": 6, "json": 12}
+_RECORD_OVERHEAD = {"markdown": 29, "tsv": 13, "csv": 13, "json": 4}
+# 추정치로 맞춘 뒤 실제 출력이 예산을 넘으면 예산을 줄여 다시 맞추는 최대 횟수
+_MAX_REFITS = 8
+
+
+def _fit_flat_records(
+    flat_records: t.List[t.Dict[str, str]],
+    max_bytes: float,
+    priority_fields: t.Sequence[str],
+    fmt: str,
+) -> BudgetedRecords:
+    remaining = max_bytes
+    field_overhead = _FIELD_OVERHEAD.get(fmt, 0)
+    fitted: t.List[t.Dict[str, str]] = []
+    omitted: t.Dict[str, None] = {}
+    truncated: t.Dict[str, None] = {}
+
+    for flat in flat_records:
+        ordered = [path for name in priority_fields for path in flat if _matches(path, [name])]
+        ordered = list(dict.fromkeys(ordered + list(flat)))
+        remaining -= _RECORD_OVERHEAD.get(fmt, 0)
+
+        out: t.Dict[str, str] = {}
+        for path in ordered:
+            text = flat[path]
+            # JSON 은 필드 경로가 columns 와 레코드 키에 두 번 나옴
+            path_size = len(path.encode("utf-8")) * (2 if fmt == "json" else 1) + field_overhead
+            size = len(text.encode("utf-8")) + path_size
+            if size <= remaining:
+                out[path] = text
+                remaining -= size
+            elif remaining - path_size >= MIN_TRUNCATED_FIELD_BYTES:
+                excerpt = text.encode("utf-8")[: int(remaining - path_size) - 32].decode("utf-8", errors="ignore")
+                out[path] = f"{excerpt}{TRUNCATION_MARKER}[truncated {len(text) - len(excerpt)} chars]"
+                remaining -= len(out[path].encode("utf-8")) + path_size
+                if path not in truncated:
+                    # 출력 끝의 생략/잘림 목록에도 경로가 한 번 나옴
+                    remaining -= len(path.encode("utf-8")) + 2
+                truncated[path] = None
+            else:
+                if path not in omitted:
+                    remaining -= len(path.encode("utf-8")) + 2
+                omitted[path] = None
+        fitted.append(out)
+
+    return BudgetedRecords(fitted, list(omitted), list(truncated))
+
+
+def fit_records_to_budget(
+    data: Records,
+    max_bytes: float,
+    priority_fields: t.Sequence[str] = (),
+    fields: t.Optional[t.Sequence[str]] = None,
+    fmt: str = "markdown",
+) -> BudgetedRecords:
+    """
+    Fit records into a byte budget for the rendered output, keeping priority fields first.
+
+    Fields are taken in priority order and then in record order. A field that does not fit is
+    truncated with a marker when enough budget is left for a useful excerpt, otherwise it is
+    omitted and reported so the caller can request it explicitly via ``fields``. Each field is
+    charged with its value, its path and the table or JSON markup of ``fmt``; if the output of
+    render_budgeted() (escapes, omission notes) still exceeds the budget, it is refitted with a
+    smaller one.
+
+    Args:
+        data: DataFrame or sequence of (possibly nested) record dicts
+        max_bytes: Budget for the rendered output in UTF-8 bytes, shared by all records
+        priority_fields: Field names or dotted paths to keep first
+        fields: If given, only fields matching these names or paths are rendered
+        fmt: Output format passed to render_budgeted()
+
+    Returns:
+        BudgetedRecords with the fitted records and the omitted/truncated field paths
+    """
+    source = data.to_dict("records") if isinstance(data, pd.DataFrame) else data
+    flat_records = []
+    for record in source:
+        flat = flatten_record(record)
+        if fields:
+            flat = {path: text for path, text in flat.items() if _matches(path, fields)}
+        flat_records.append(flat)
+
+    budget = max_bytes
+    budgeted = _fit_flat_records(flat_records, budget, priority_fields, fmt)
+    if math.isinf(max_bytes):
+        return budgeted
+    for _ in range(_MAX_REFITS):
+        excess = len(render_budgeted(budgeted, fmt).encode("utf-8")) - max_bytes
+        if excess <= 0:
+            break
+        budget -= excess
+        budgeted = _fit_flat_records(flat_records, budget, priority_fields, fmt)
+    else:
+        # 마크업만으로도 예산을 넘으면 필드 없이 생략 목록만 반환
+        budgeted = _fit_flat_records(flat_records, 0, priority_fields, fmt)
+    return budgeted
+
+
+def render_budgeted(budgeted: BudgetedRecords, fmt: str = "markdown") -> str:
+    """
+    Render fitted records as field/value tables (or JSON) followed by an omission note.
+
+    Args:
+        budgeted: Output of fit_records_to_budget
+        fmt: One of "markdown", "tsv", "csv", "json"
+
+    Returns:
+        Rendered text
+    """
+    if fmt == "json":
+        columns = list(dict.fromkeys(path for record in budgeted.records for path in record))
+        return json.dumps(
+            {
+                "columns": columns,
+                "records": budgeted.records,
+                "count": len(budgeted.records),
+                "omitted_fields": budgeted.omitted_fields,
+                "truncated_fields": budgeted.truncated_fields,
+            },
+            ensure_ascii=False,
+        )
+
+    sections = [
+        render_table([{"field": path, "value": text} for path, text in record.items()], ["field", "value"], fmt=fmt)
+        for record in budgeted.records
+    ]
+    if budgeted.truncated_fields:
+        sections.append(f"truncated fields: {', '.join(budgeted.truncated_fields)}")
+    if budgeted.omitted_fields:
+        sections.append(
+            f"omitted fields (over budget, request with fields=[...]): {', '.join(budgeted.omitted_fields)}"
+        )
+    return "\n\n".join(sections)
@@ -0,0 +1,163 @@
+"""
+Record/replay of raw KIPRIS responses.
+
+With KIPRIS_REPLAY_MODE=record, every XML body received by get_response/get_response_async is
+saved under KIPRIS_FIXTURES_DIR. With KIPRIS_REPLAY_MODE=replay, the saved bodies are returned
+without any network access, so parsing, rendering and the rest of the tool path can be measured
+reproducibly (and in CI). Fixtures are keyed by endpoint and query; API key parameters are left
+out of the key and never written to disk.
+
+KIPRIS_BASE_URL points the API clients at another host, e.g. the stub server in
+mcp_kipris.kipris.stub_server, which serves the same fixtures over HTTP.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import typing as t
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+from mcp_kipris.kipris.metrics import endpoint_label
+
+logger = logging.getLogger("mcp-kipris")
+
+# 픽스처 키와 파일에서 제외하는 인증키 파라미터
+KEY_PARAMS = frozenset({"accesskey", "servicekey", "api_key", "apikey"})
+REPLAY_MODES = ("off", "record", "replay")
+
+
+class FixtureNotFoundError(KeyError):
+    """Raised in replay mode when no fixture was recorded for a request."""
+
+
+def fixture_key(url: str) -> str:
+    """Stable key for a request: hash of the query without API key parameters (parameter order ignored)."""
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(urlsplit(url).query, keep_blank_values=True)
+        if name.lower() not in KEY_PARAMS
+    )
+    return hashlib.sha1(repr(query).encode("utf-8")).hexdigest()[:16]
+
+
+def rebase_url(url: str, base_url: t.Optional[str] = None) -> str:
+    """
+    Replace the scheme and host of url with base_url (default: KIPRIS_BASE_URL; unchanged when unset).
+
+    A path prefix in base_url is prepended to the request path.
+    """
+    base_url = base_url if base_url is not None else os.getenv("KIPRIS_BASE_URL")
+    if not base_url:
+        return url
+    base = urlsplit(base_url)
+    parts = urlsplit(url)
+    return urlunsplit((base.scheme, base.netloc, base.path.rstrip("/") + parts.path, parts.query, ""))
+
+
+class FixtureStore:
+    """Raw XML response bodies stored as ``<directory>/<service>/<operation>/<key>.xml``."""
+
+    def __init__(self, directory: str, mode: str = "replay"):
+        """
+        Initialize fixture store.
+
+        Args:
+            directory: Fixture root directory
+            mode: "record" (save responses) or "replay" (serve saved responses)
+        """
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"replay mode must be one of {REPLAY_MODES}, got {mode!r}")
+        self.directory = directory
+        self.mode = mode
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+        self._lock = threading.Lock()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    def path_for(self, url: str) -> str:
+        return os.path.join(self.directory, *endpoint_label(url).split("/"), fixture_key(url) + ".xml")
+
+    def save(self, url: str, body: str) -> str:
+        """Write a response body for url (atomically) and return the fixture path."""
+        path = self.path_for(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(body)
+        os.replace(temp_path, path)
+        with self._lock:
+            self.recorded += 1
+        logger.debug("Recorded fixture %s", path)
+        return path
+
+    def load(self, url: str) -> str:
+        """
+        Return the recorded response body for url.
+
+        Raises:
+            FixtureNotFoundError: When nothing was recorded for url
+        """
+        path = self.path_for(url)
+        try:
+            with open(path, encoding="utf-8") as f:
+                body = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.missing += 1
+            raise FixtureNotFoundError(f"no fixture for {endpoint_label(url)} ({path})") from None
+        with self._lock:
+            self.replayed += 1
+        return body
+
+    def endpoint_fixtures(self, endpoint: str) -> t.List[str]:
+        """Fixture paths recorded for an endpoint label (``service/operation``), sorted."""
+        directory = os.path.join(self.directory, *endpoint.split("/"))
+        if not os.path.isdir(directory):
+            return []
+        return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".xml"))
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        return {"mode": self.mode, "recorded": self.recorded, "replayed": self.replayed, "missing": self.missing}
+
+
+# Global fixture store instance (False: 환경 변수를 확인했고 record/replay가 꺼져 있음)
+_fixture_store: t.Union[FixtureStore, None, bool] = None
+_fixture_store_lock = threading.Lock()
+
+
+def get_fixture_store() -> t.Optional[FixtureStore]:
+    """
+    Get the fixture store configured from KIPRIS_REPLAY_MODE (off/record/replay) and KIPRIS_FIXTURES_DIR.
+
+    Returns:
+        FixtureStore instance, or None when record/replay is off
+    """
+    global _fixture_store
+
+    if _fixture_store is None:
+        with _fixture_store_lock:
+            if _fixture_store is None:
+                mode = os.getenv("KIPRIS_REPLAY_MODE", "off").lower()
+                if mode in ("record", "replay"):
+                    directory = os.getenv("KIPRIS_FIXTURES_DIR", "fixtures")
+                    _fixture_store = FixtureStore(directory, mode)
+                    logger.info("KIPRIS responses: %s mode (fixtures: %s)", mode, directory)
+                else:
+                    _fixture_store = False
+    return _fixture_store or None
+
+
+def set_fixture_store(store: t.Optional[FixtureStore]) -> None:
+    """Install a fixture store (None switches record/replay off); mainly for tests and benchmarks."""
+    global _fixture_store
+
+    _fixture_store = store if store is not None else False
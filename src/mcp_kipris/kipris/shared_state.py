@@ -0,0 +1,241 @@
+"""
+Cross-process shared state for multi-worker deployments.
+
+Workers started with ``sse_server --workers N`` are separate processes, so the in-memory
+RateLimiter and ResponseCache would each see only a fraction of the traffic and together
+overrun the KIPRIS quota. These drop-in replacements keep the same interfaces but store
+their state in one SQLite database (WAL mode). Placing it on tmpfs (/dev/shm) keeps
+every operation in shared memory.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import typing as t
+
+import anyio
+
+logger = logging.getLogger("mcp-kipris")
+
+
+def default_shared_state_path() -> str:
+    """Shared-memory location for the state database (falls back to the temp dir)."""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "mcp-kipris-state.db")
+
+
+class SharedStateStore:
+    """SQLite connection holder; one connection per thread, shared file across processes."""
+
+    def __init__(self, path: str, busy_timeout: float = 10.0):
+        """
+        Open (and create) the state database.
+
+        Args:
+            path: SQLite database file shared by the worker processes
+            busy_timeout: Seconds a write waits for another process's lock before failing
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        with self.connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS rate_limit (ts REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS rate_limit_ts ON rate_limit (ts)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache (key TEXT PRIMARY KEY, expires REAL NOT NULL, value TEXT)"
+            )
+
+    def connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA synchronous=OFF")
+            self._local.conn = conn
+        return conn
+
+
+class SharedRateLimiter:
+    """Sliding-window rate limiter whose window is shared by every process using the same store."""
+
+    def __init__(self, store: SharedStateStore, max_requests_per_minute: int = 60):
+        self.store = store
+        self.max_requests_per_minute = max_requests_per_minute
+        # 마지막으로 창이 가득 찼을 때 다음 슬롯이 비는 시각 (time.monotonic 기준, DB 조회 없이 재시도 안내에 사용)
+        self._next_free_at = 0.0
+
+    def try_acquire(self) -> float:
+        """
+        Reserve a request slot if one is free.
+
+        Returns:
+            0.0 if the slot was reserved, otherwise seconds until the oldest request leaves the window
+        """
+        conn = self.store.connect()
+        now = time.time()
+        window_start = now - 60.0
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM rate_limit WHERE ts < ?", (window_start,))
+            count, oldest = conn.execute("SELECT COUNT(*), MIN(ts) FROM rate_limit").fetchone()
+            if count < self.max_requests_per_minute:
+                conn.execute("INSERT INTO rate_limit (ts) VALUES (?)", (now,))
+                wait_time = 0.0
+            else:
+                wait_time = max(oldest - window_start, 0.01)
+                self._next_free_at = time.monotonic() + wait_time
+            conn.execute("COMMIT")
+        except Exception:
+            # BEGIN 자체가 실패(잠금 대기 시간 초과)한 경우 ROLLBACK 하면 원래 오류가 가려짐
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        return wait_time
+
+    def can_make_request(self) -> bool:
+        conn = self.store.connect()
+        (count,) = conn.execute("SELECT COUNT(*) FROM rate_limit WHERE ts >= ?", (time.time() - 60.0,)).fetchone()
+        return count < self.max_requests_per_minute
+
+    def remaining(self) -> int:
+        """Number of shared request slots still free in the current one-minute window."""
+        conn = self.store.connect()
+        (count,) = conn.execute("SELECT COUNT(*) FROM rate_limit WHERE ts >= ?", (time.time() - 60.0,)).fetchone()
+        return max(self.max_requests_per_minute - count, 0)
+
+    async def remaining_async(self) -> int:
+        """remaining() in a worker thread (the COUNT(*) waits out other workers' write locks)."""
+        return await anyio.to_thread.run_sync(self.remaining)
+
+    def time_until_slot(self) -> float:
+        """
+        Seconds until a shared slot frees up, as last seen by this process's try_acquire().
+
+        Reads no database, so it is safe to call on the event loop (e.g. for a Retry-After hint).
+        """
+        return max(self._next_free_at - time.monotonic(), 0.0)
+
+    async def acquire(self) -> float:
+        """Wait until a shared request slot is free and reserve it. Returns seconds spent waiting."""
+        waited = 0.0
+        while True:
+            # 다른 워커가 쓰기 잠금을 쥐고 있으면 BEGIN IMMEDIATE 가 busy timeout 동안 블로킹하므로 스레드에서 실행
+            wait_time = await anyio.to_thread.run_sync(self.try_acquire)
+            if wait_time == 0.0:
+                return waited
+            logger.debug("Shared rate limit reached. Waiting %.2f seconds before next request.", wait_time)
+            await asyncio.sleep(wait_time)
+            waited += wait_time
+
+    def acquire_blocking(self) -> float:
+        """Blocking variant of acquire() for synchronous callers."""
+        waited = 0.0
+        while True:
+            wait_time = self.try_acquire()
+            if wait_time == 0.0:
+                return waited
+            time.sleep(wait_time)
+            waited += wait_time
+
+
+class SharedResponseCache:
+    """TTL cache for parsed responses shared by every process using the same store."""
+
+    # set() 호출 N번마다 만료 항목 정리 및 최대 개수 초과분 삭제
+    PRUNE_EVERY = 64
+
+    def __init__(self, store: SharedStateStore, ttl_seconds: float = 300.0, max_entries: int = 1024):
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._sets = 0
+        # 정리 작업은 한 번에 하나만 백그라운드 스레드에서 실행
+        self._prune_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: str) -> t.Optional[t.Dict]:
+        if not self.enabled:
+            return None
+        row = (
+            self.store.connect()
+            .execute("SELECT value FROM response_cache WHERE key = ? AND expires > ?", (key, time.time()))
+            .fetchone()
+        )
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    async def get_async(self, key: str) -> t.Optional[t.Dict]:
+        """get() in a worker thread (the SELECT waits out other workers' write locks)."""
+        if not self.enabled:
+            return None
+        return await anyio.to_thread.run_sync(self.get, key)
+
+    def set(self, key: str, value: t.Dict) -> None:
+        if not self.enabled:
+            return
+        conn = self.store.connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO response_cache (key, expires, value) VALUES (?, ?, ?)",
+            (key, time.time() + self.ttl_seconds, json.dumps(value, ensure_ascii=False)),
+        )
+        self._sets += 1
+        if self._sets % self.PRUNE_EVERY == 0:
+            self._schedule_prune()
+
+    async def set_async(self, key: str, value: t.Dict) -> None:
+        """set() in a worker thread."""
+        if not self.enabled:
+            return
+        await anyio.to_thread.run_sync(self.set, key, value)
+
+    def _schedule_prune(self) -> None:
+        # 이전 정리가 아직 실행 중이면 건너뜀
+        if not self._prune_lock.acquire(blocking=False):
+            return
+        threading.Thread(target=self._run_prune, name="kipris-cache-prune", daemon=True).start()
+
+    def _run_prune(self) -> None:
+        try:
+            self.prune()
+        except sqlite3.Error as e:
+            logger.warning("공유 캐시 정리 실패: %s", e)
+        finally:
+            self._prune_lock.release()
+
+    def prune(self) -> None:
+        conn = self.store.connect()
+        conn.execute("DELETE FROM response_cache WHERE expires <= ?", (time.time(),))
+        conn.execute(
+            "DELETE FROM response_cache WHERE key NOT IN "
+            "(SELECT key FROM response_cache ORDER BY expires DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+
+    def clear(self) -> None:
+        self.store.connect().execute("DELETE FROM response_cache")
+
+    def __len__(self) -> int:
+        (count,) = self.store.connect().execute("SELECT COUNT(*) FROM response_cache").fetchone()
+        return count
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,174 @@
+"""
+Corpus-level TF-IDF similarity over harvested patents.
+
+``patent_sim.compare_patents`` fits a vectorizer on the two abstracts it compares, so every term
+gets the same IDF and the score is mostly word overlap. This engine fits once over a whole
+collection (the local index and the patent store by default), keeps the L2-normalized sparse
+TF-IDF matrix, and answers cosine nearest neighbours for one patent, for free text, or for every
+patent at once. All-pairs queries multiply row blocks of the matrix with its transpose, so memory
+stays bounded by ``block_size`` rows of scores instead of an n x n matrix.
+
+    engine = TfidfSimilarityEngine().fit(documents)
+    engine.nearest("1020230045678", k=5)
+    for source, target, score in engine.similar_pairs(threshold=0.6):
+        ...
+"""
+
+import logging
+import typing as t
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from mcp_kipris.kipris.entity_cache import normalize_application_number
+from mcp_kipris.kipris.local_index import document_fields, tokenize
+
+logger = logging.getLogger("mcp-kipris")
+
+# 유사도 계산에 쓰는 텍스트 필드 (출원인/IPC 는 제외: 같은 출원인의 다른 기술이 가깝게 나오지 않도록)
+TEXT_FIELDS = ("inventionTitle", "abstract", "claims")
+
+
+def document_text(fields: t.Dict[str, t.Any]) -> str:
+    return "\n".join(str(fields[name]) for name in TEXT_FIELDS if fields.get(name))
+
+
+def _top_k(indices: np.ndarray, scores: np.ndarray, k: int) -> t.List[t.Tuple[int, float]]:
+    if len(scores) > k:
+        keep = np.argpartition(-scores, k - 1)[:k]
+        indices, scores = indices[keep], scores[keep]
+    order = np.argsort(-scores, kind="stable")
+    return [(int(indices[i]), float(scores[i])) for i in order]
+
+
+class TfidfSimilarityEngine:
+    """TF-IDF matrix over a patent collection with blocked sparse cosine-similarity queries."""
+
+    def __init__(self, min_df: int = 1, max_df: float = 1.0, sublinear_tf: bool = True):
+        """
+        Initialize similarity engine.
+
+        Args:
+            min_df: Ignore terms in fewer documents than this
+            max_df: Ignore terms in more than this share of documents
+            sublinear_tf: Use 1 + log(tf) so long claims do not dominate
+        """
+        # 로컬 색인과 같은 토큰(한글 바이그램, 영문/숫자 단어)
+        self.vectorizer = TfidfVectorizer(
+            analyzer=tokenize, min_df=min_df, max_df=max_df, sublinear_tf=sublinear_tf, dtype=np.float32
+        )
+        self.ids: t.List[str] = []
+        self.fields: t.List[t.Dict[str, t.Any]] = []
+        self.matrix: t.Optional[sparse.csr_matrix] = None
+        self._positions: t.Dict[str, int] = {}
+
+    def fit(self, documents: t.Iterable[t.Dict[str, t.Any]]) -> "TfidfSimilarityEngine":
+        """
+        Fit IDF and build the matrix over index-style documents (``applicationNumber`` plus text fields).
+
+        Later documents with the same application number replace earlier ones; documents without
+        text are skipped.
+        """
+        collection: t.Dict[str, t.Dict[str, t.Any]] = {}
+        for fields in documents:
+            number = fields.get("applicationNumber")
+            if number and document_text(fields):
+                key = normalize_application_number(number)
+                collection[key] = {**collection.get(key, {}), **fields}
+        self.ids = list(collection)
+        self.fields = list(collection.values())
+        self._positions = {number: position for position, number in enumerate(self.ids)}
+        if not self.ids:
+            self.matrix = None
+            return self
+        self.matrix = self.vectorizer.fit_transform([document_text(fields) for fields in self.fields]).tocsr()
+        logger.info("TF-IDF 유사도 행렬: %d건 x %d어휘", *self.matrix.shape)
+        return self
+
+    def fit_records(self, records: t.Iterable[t.Dict[str, t.Any]]) -> "TfidfSimilarityEngine":
+        """Fit over raw KIPRIS response records (any shape the local index understands)."""
+        return self.fit(document_fields(record) for record in records)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, application_number: str) -> bool:
+        return normalize_application_number(application_number) in self._positions
+
+    def _neighbours(self, row: sparse.csr_matrix, k: int, exclude: int = -1) -> t.List[t.Tuple[str, float]]:
+        scores = (row @ self.matrix.T).tocsr()
+        indices, values = scores.indices, scores.data
+        mask = (indices != exclude) & (values > 0)
+        return [(self.ids[i], score) for i, score in _top_k(indices[mask], values[mask], k)]
+
+    def nearest(self, application_number: str, k: int = 10) -> t.List[t.Tuple[str, float]]:
+        """
+        Most similar patents to one patent of the collection.
+
+        Returns:
+            (application number, cosine similarity) pairs, best first
+
+        Raises:
+            KeyError: The patent is not in the collection
+        """
+        position = self._positions[normalize_application_number(application_number)]
+        return self._neighbours(self.matrix[position], k, exclude=position)
+
+    def nearest_to_text(self, text: str, k: int = 10) -> t.List[t.Tuple[str, float]]:
+        """Most similar patents to free text, using the collection's vocabulary and IDF."""
+        if self.matrix is None:
+            return []
+        return self._neighbours(self.vectorizer.transform([text]).tocsr(), k)
+
+    def _blocks(self, block_size: int) -> t.Iterator[t.Tuple[int, sparse.csr_matrix]]:
+        transposed = self.matrix.T.tocsc()
+        for start in range(0, self.matrix.shape[0], block_size):
+            yield start, (self.matrix[start : start + block_size] @ transposed).tocsr()
+
+    def all_nearest(
+        self, k: int = 10, block_size: int = 1024, min_score: float = 0.0
+    ) -> t.Dict[str, t.List[t.Tuple[str, float]]]:
+        """
+        Top-k neighbours of every patent (blocked sparse matrix product).
+
+        Args:
+            k: Neighbours per patent
+            block_size: Rows multiplied at once (bounds memory to block_size x n scores)
+            min_score: Drop neighbours below this similarity
+
+        Returns:
+            application number -> (neighbour, similarity) pairs, best first
+        """
+        result: t.Dict[str, t.List[t.Tuple[str, float]]] = {}
+        if self.matrix is None:
+            return result
+        for start, block in self._blocks(block_size):
+            for offset in range(block.shape[0]):
+                position = start + offset
+                begin, end = block.indptr[offset], block.indptr[offset + 1]
+                indices, values = block.indices[begin:end], block.data[begin:end]
+                mask = (indices != position) & (values > min_score)
+                result[self.ids[position]] = [
+                    (self.ids[i], score) for i, score in _top_k(indices[mask], values[mask], k)
+                ]
+        return result
+
+    def similar_pairs(self, threshold: float = 0.5, block_size: int = 1024) -> t.Iterator[t.Tuple[str, str, float]]:
+        """
+        Every pair of patents with similarity at or above threshold, each pair once.
+
+        Yields:
+            (application number, application number, similarity), block by block
+        """
+        if self.matrix is None:
+            return
+        for start, block in self._blocks(block_size):
+            coo = block.tocoo()
+            rows = coo.row + start
+            mask = (coo.col > rows) & (coo.data >= threshold)
+            for row, col, score in zip(rows[mask], coo.col[mask], coo.data[mask]):
+                yield self.ids[row], self.ids[col], float(score)
+
+    def document(self, application_number: str) -> t.Dict[str, t.Any]:
+        return self.fields[self._positions[normalize_application_number(application_number)]]
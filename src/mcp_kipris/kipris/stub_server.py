@@ -0,0 +1,162 @@
+"""
+Offline KIPRIS stub server.
+
+Serves recorded fixtures (see mcp_kipris.kipris.replay) over HTTP with configurable latency,
+jitter, HTTP error rate and KIPRIS result-code injection, so the whole client path (connection
+pools, rate limiting, retries, caching, parsing) can be benchmarked without the live service.
+
+    python -m mcp_kipris.kipris.stub_server --fixtures fixtures --port 8089 --latency-ms 300 --jitter-ms 100
+    KIPRIS_BASE_URL=http://127.0.0.1:8089 python -m mcp_kipris.sse_server --http
+
+Requests are matched to fixtures by endpoint and query (API keys ignored). A request without
+an exact fixture gets one of the endpoint's other fixtures, picked by its query, so
+benchmarks can vary their queries.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import typing as t
+import zlib
+from dataclasses import dataclass
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from mcp_kipris.kipris.metrics import endpoint_label
+from mcp_kipris.kipris.replay import FixtureStore, fixture_key
+
+logger = logging.getLogger("mcp-kipris")
+
+RESULT_CODE_MESSAGES = {
+    "10": "INVALID_REQUEST_PARAMETER_ERROR",
+    "20": "NO_RESULTS",
+    "30": "ACCESS_KEY_NOT_REGISTERED",
+    "31": "DEADLINE_EXPIRED",
+}
+
+
+@dataclass
+class StubConfig:
+    """Behaviour of the stub server."""
+
+    fixtures_dir: str = "fixtures"
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    # HTTP 5xx 응답 비율
+    error_rate: float = 0.0
+    error_status: int = 503
+    # 정상 HTTP 응답 중 KIPRIS 헤더 결과 코드를 result_code로 바꿔 보내는 비율
+    result_code_rate: float = 0.0
+    result_code: str = "20"
+    seed: t.Optional[int] = None
+
+
+def result_code_body(code: str) -> str:
+    """A KIPRIS XML response carrying only an error result code."""
+    message = RESULT_CODE_MESSAGES.get(code, "STUB_INJECTED_ERROR")
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f"<response><header><resultCode>{code}</resultCode><resultMsg>{message}</resultMsg></header>"
+        "<body><items/></body></response>"
+    )
+
+
+def create_stub_app(config: StubConfig) -> Starlette:
+    """Create the stub server application."""
+    store = FixtureStore(config.fixtures_dir, mode="replay")
+    rng = random.Random(config.seed)
+    stats = {"requests": 0, "exact": 0, "fallback": 0, "not_found": 0, "http_errors": 0, "result_codes": 0}
+    # 엔드포인트별 픽스처 목록과 본문은 처음 요청 시 읽어서 메모리에 보관 (디스크 I/O가 지연 시간에 섞이지 않도록)
+    endpoint_paths: t.Dict[str, t.List[str]] = {}
+    bodies: t.Dict[str, str] = {}
+
+    def read(path: str) -> str:
+        body = bodies.get(path)
+        if body is None:
+            with open(path, encoding="utf-8") as f:
+                body = bodies[path] = f.read()
+        return body
+
+    def find_fixture(url: str) -> t.Optional[str]:
+        path = store.path_for(url)
+        if path in bodies or os.path.isfile(path):
+            stats["exact"] += 1
+            return read(path)
+        endpoint = endpoint_label(url)
+        if endpoint not in endpoint_paths:
+            endpoint_paths[endpoint] = store.endpoint_fixtures(endpoint)
+        candidates = endpoint_paths[endpoint]
+        if not candidates:
+            return None
+        stats["fallback"] += 1
+        return read(candidates[zlib.crc32(fixture_key(url).encode("ascii")) % len(candidates)])
+
+    async def kipris(request: Request) -> Response:
+        stats["requests"] += 1
+        delay = config.latency_ms + rng.uniform(-config.jitter_ms, config.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if config.error_rate and rng.random() < config.error_rate:
+            stats["http_errors"] += 1
+            return Response("stub injected error", status_code=config.error_status)
+        if config.result_code_rate and rng.random() < config.result_code_rate:
+            stats["result_codes"] += 1
+            return Response(result_code_body(config.result_code), media_type="application/xml")
+        body = find_fixture(str(request.url))
+        if body is None:
+            stats["not_found"] += 1
+            return Response(f"no fixture for {endpoint_label(str(request.url))}", status_code=404)
+        return Response(body, media_type="application/xml")
+
+    async def stub_stats(request: Request) -> JSONResponse:
+        return JSONResponse(stats)
+
+    return Starlette(
+        routes=[
+            Route("/__stub__/stats", endpoint=stub_stats),
+            Route("/{path:path}", endpoint=kipris),
+        ]
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve recorded KIPRIS fixtures for offline benchmarks")
+    parser.add_argument("--fixtures", default="fixtures", help="Fixture directory (default: fixtures)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mean response latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter around the latency")
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of requests answered with an HTTP error"
+    )
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument(
+        "--result-code-rate", type=float, default=0.0, help="Fraction of responses with an injected result code"
+    )
+    parser.add_argument("--result-code", default="20", help="KIPRIS result code to inject (default: 20, no results)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible error injection")
+    args = parser.parse_args()
+
+    config = StubConfig(
+        fixtures_dir=args.fixtures,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        result_code_rate=args.result_code_rate,
+        result_code=args.result_code,
+        seed=args.seed,
+    )
+    logging.basicConfig(level=logging.INFO)
+    logger.info("KIPRIS stub serving %s on http://%s:%d", args.fixtures, args.host, args.port)
+    uvicorn.run(create_stub_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
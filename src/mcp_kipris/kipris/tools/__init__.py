@@ -7,6 +7,9 @@ from mcp_kipris.kipris.tools.foreign.international_application_number_search_too
 from mcp_kipris.kipris.tools.foreign.international_open_number_search_tool import (
     ForeignPatentInternationalOpenNumberSearchTool,
 )
+from mcp_kipris.kipris.tools.local.local_patent_search_tool import LocalPatentSearchTool
+from mcp_kipris.kipris.tools.local.patent_similarity_tool import PatentSimilarityTool
+from mcp_kipris.kipris.tools.local.stored_patent_search_tool import StoredPatentSearchTool
 from mcp_kipris.kipris.tools.korean.applicant_search_tool import (
     PatentApplicantSearchTool as KoreanPatentApplicantSearchTool,
 )
@@ -44,4 +47,7 @@ __all__ = [
     "ForeignPatentFreeSearchTool",
     "ForeignPatentInternationalApplicationNumberSearchTool",
     "ForeignPatentInternationalOpenNumberSearchTool",
+    "LocalPatentSearchTool",
+    "StoredPatentSearchTool",
+    "PatentSimilarityTool",
 ]
@@ -11,13 +11,10 @@ from pydantic import BaseModel, Field, ValidationError, field_validator
 
 from mcp_kipris.kipris.abc import ToolHandler
 from mcp_kipris.kipris.api.foreign.applicant_search import ForeignPatentApplicantSearchAPI
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
 from mcp_kipris.kipris.tools.code import country_dict, sort_field_dict
 
 logger = logging.getLogger("mcp-kipris")
-api_key = os.getenv("KIPRIS_API_KEY")
-
-if not api_key:
-    raise ValueError("KIPRIS_API_KEY environment variable required.")
 
 
 class ForeignPatentApplicantSearchArgs(BaseModel):
@@ -46,43 +43,47 @@ class ForeignPatentApplicantSearchArgs(BaseModel):
 
 
 class ForeignPatentApplicantSearchTool(ToolHandler):
+    collapsible = True
+
     def __init__(self):
         super().__init__("foreign_patent_applicant_search")
-        self.api = ForeignPatentApplicantSearchAPI(api_key=api_key)
+        self.api = get_api_client_factory().get_client(ForeignPatentApplicantSearchAPI)
         self.description = "foreign patent search by applicant, this tool is for foreign(US, EP, WO, JP, PJ, CP, CN, TW, RU, CO, SE, ES, IL) patent search"
         self.args_schema = ForeignPatentApplicantSearchArgs
 
     def get_tool_description(self) -> Tool:
-        return Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "applicant": {"type": "string", "description": "출원인명"},
-                    "current_page": {"type": "integer", "description": "현재 페이지 번호 (기본값: 1)"},
-                    "sort_field": {
-                        "type": "string",
-                        "description": "정렬 기준 필드",
-                        "enum": list(sort_field_dict.keys()),
-                        "default": "AD",
-                    },
-                    "sort_state": {"type": "boolean", "description": "정렬 상태 (기본값: true)"},
-                    "collection_values": {
-                        "type": "string",
-                        "description": "검색 대상 국가",
-                        "enum": list(country_dict.keys()),
-                        "default": "US",
+        return self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "applicant": {"type": "string", "description": "출원인명"},
+                        "current_page": {"type": "integer", "description": "현재 페이지 번호 (기본값: 1)"},
+                        "sort_field": {
+                            "type": "string",
+                            "description": "정렬 기준 필드",
+                            "enum": list(sort_field_dict.keys()),
+                            "default": "AD",
+                        },
+                        "sort_state": {"type": "boolean", "description": "정렬 상태 (기본값: true)"},
+                        "collection_values": {
+                            "type": "string",
+                            "description": "검색 대상 국가",
+                            "enum": list(country_dict.keys()),
+                            "default": "US",
+                        },
                     },
+                    "required": ["applicant"],
                 },
-                "required": ["applicant"],
-            },
+            )
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         try:
             validated_args = ForeignPatentApplicantSearchArgs(**args)
-            logger.info(f"applicant: {validated_args.applicant}")
+            logger.info("applicant: %s", validated_args.applicant)
 
             response = self.api.sync_search(
                 applicant=validated_args.applicant,
@@ -93,11 +94,11 @@ class ForeignPatentApplicantSearchTool(ToolHandler):
             )
             # ic(response)
             if response.empty:
-                return [TextContent(type="text", text="검색 결과가 없습니다.")]
+                return self.render_empty(args, "검색 결과가 없습니다.")
 
-            return [TextContent(type="text", text=response.to_markdown(index=False))]
+            return self.render_records(response, args)
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             error_details = e.errors()
             for error in error_details:
                 field = error["loc"][0]
@@ -116,7 +117,7 @@ class ForeignPatentApplicantSearchTool(ToolHandler):
     async def run_tool_async(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         try:
             validated_args = ForeignPatentApplicantSearchArgs(**args)
-            logger.info(f"applicant: {validated_args.applicant}")
+            logger.info("applicant: %s", validated_args.applicant)
 
             response = await self.api.async_search(
                 applicant=validated_args.applicant,
@@ -127,11 +128,11 @@ class ForeignPatentApplicantSearchTool(ToolHandler):
             )
 
             if response.empty:
-                return [TextContent(type="text", text="검색 결과가 없습니다.")]
+                return self.render_empty(args, "검색 결과가 없습니다.")
 
-            return [TextContent(type="text", text=response.to_markdown(index=False))]
+            return await self.render_records_async(response, args)
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             error_details = e.errors()
             for error in error_details:
                 field = error["loc"][0]
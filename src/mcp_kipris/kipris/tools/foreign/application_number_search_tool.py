@@ -10,13 +10,10 @@ from pydantic import BaseModel, Field, ValidationError, field_validator
 
 from mcp_kipris.kipris.abc import ToolHandler
 from mcp_kipris.kipris.api.foreign.application_number_search import ForeignPatentApplicationNumberSearchAPI
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
 from mcp_kipris.kipris.tools.code import country_dict, sort_field_dict
 
 logger = logging.getLogger("mcp-kipris")
-api_key = os.getenv("KIPRIS_API_KEY")
-
-if not api_key:
-    raise ValueError("KIPRIS_API_KEY environment variable required.")
 
 
 class ForeignPatentApplicationNumberSearchArgs(BaseModel):
@@ -47,41 +44,43 @@ class ForeignPatentApplicationNumberSearchArgs(BaseModel):
 class ForeignPatentApplicationNumberSearchTool(ToolHandler):
     def __init__(self):
         super().__init__("foreign_patent_application_number_search")
-        self.api = ForeignPatentApplicationNumberSearchAPI(api_key=api_key)
+        self.api = get_api_client_factory().get_client(ForeignPatentApplicationNumberSearchAPI)
         self.description = "foreign patent search by application number, this tool is for foreign(US, EP, WO, JP, PJ, CP, CN, TW, RU, CO, SE, ES, IL) patent search"
         self.args_schema = ForeignPatentApplicationNumberSearchArgs
 
     def get_tool_description(self) -> Tool:
-        return Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "application_number": {"type": "string", "description": "출원번호"},
-                    "current_page": {"type": "integer", "description": "현재 페이지 번호 (기본값: 1)"},
-                    "sort_field": {
-                        "type": "string",
-                        "description": "정렬 기준 필드",
-                        "enum": list(sort_field_dict.keys()),
-                        "default": "AD",
-                    },
-                    "sort_state": {"type": "boolean", "description": "정렬 상태 (기본값: true)"},
-                    "collection_values": {
-                        "type": "string",
-                        "description": "검색 대상 국가",
-                        "enum": list(country_dict.keys()),
-                        "default": "US",
+        return self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "application_number": {"type": "string", "description": "출원번호"},
+                        "current_page": {"type": "integer", "description": "현재 페이지 번호 (기본값: 1)"},
+                        "sort_field": {
+                            "type": "string",
+                            "description": "정렬 기준 필드",
+                            "enum": list(sort_field_dict.keys()),
+                            "default": "AD",
+                        },
+                        "sort_state": {"type": "boolean", "description": "정렬 상태 (기본값: true)"},
+                        "collection_values": {
+                            "type": "string",
+                            "description": "검색 대상 국가",
+                            "enum": list(country_dict.keys()),
+                            "default": "US",
+                        },
                     },
+                    "required": ["application_number"],
                 },
-                "required": ["application_number"],
-            },
+            )
         )
 
     def run_tool(self, args: dict) -> List[TextContent]:
         try:
             validated_args = ForeignPatentApplicationNumberSearchArgs(**args)
-            logger.info(f"Searching for application number: {validated_args.application_number}")
+            logger.info("Searching for application number: %s", validated_args.application_number)
 
             response = self.api.sync_search(
                 application_number=validated_args.application_number,
@@ -92,22 +91,22 @@ class ForeignPatentApplicationNumberSearchTool(ToolHandler):
             )
 
             if response.empty:
-                return [TextContent(type="text", text="there is no result")]
+                return self.render_empty(args, "there is no result")
 
             summary_df = response[["applicationNo", "applicationDate", "inventionName", "applicant"]].copy()
-            return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+            return self.render_records(summary_df, args)
 
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
 
     async def run_tool_async(self, args: dict) -> List[TextContent]:
         try:
             validated_args = ForeignPatentApplicationNumberSearchArgs(**args)
-            logger.info(f"Searching for application number: {validated_args.application_number}")
+            logger.info("Searching for application number: %s", validated_args.application_number)
 
             response = await self.api.async_search(
                 application_number=validated_args.application_number,
@@ -118,14 +117,14 @@ class ForeignPatentApplicationNumberSearchTool(ToolHandler):
             )
 
             if response.empty:
-                return [TextContent(type="text", text="there is no result")]
+                return self.render_empty(args, "there is no result")
 
             summary_df = response[["applicationNo", "applicationDate", "inventionName", "applicant"]].copy()
-            return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+            return self.render_records(summary_df, args)
 
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
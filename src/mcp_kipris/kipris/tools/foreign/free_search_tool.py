@@ -10,13 +10,10 @@ from pydantic import BaseModel, Field, ValidationError, field_validator
 
 from mcp_kipris.kipris.abc import ToolHandler
 from mcp_kipris.kipris.api.foreign.free_search_api import ForeignPatentFreeSearchAPI
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
 from mcp_kipris.kipris.tools.code import country_dict, sort_field_dict
 
 logger = logging.getLogger("mcp-kipris")
-api_key = os.getenv("KIPRIS_API_KEY")
-
-if not api_key:
-    raise ValueError("KIPRIS_API_KEY environment variable required.")
 
 
 class ForeignPatentFreeSearchArgs(BaseModel):
@@ -45,55 +42,59 @@ class ForeignPatentFreeSearchArgs(BaseModel):
 
 
 class ForeignPatentFreeSearchTool(ToolHandler):
+    collapsible = True
+
     def __init__(self):
         super().__init__("foreign_patent_free_search")
-        self.api = ForeignPatentFreeSearchAPI(api_key=api_key)
+        self.api = get_api_client_factory().get_client(ForeignPatentFreeSearchAPI)
         self.description = "foreign patent search by free text, this tool is for foreign(US, EP, WO, JP, PJ, CP, CN, TW, RU, CO, SE, ES, IL) patent search"
         self.args_schema = ForeignPatentFreeSearchArgs
 
     def get_tool_description(self) -> Tool:
-        return Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "word": {"type": "string", "description": "검색어"},
-                    "current_page": {"type": "integer", "description": "현재 페이지 번호 (기본값: 1)"},
-                    "sort_field": {
-                        "type": "string",
-                        "description": "정렬 기준 필드",
-                        "enum": list(sort_field_dict.keys()),
-                        "default": "AD",
-                    },
-                    "sort_state": {"type": "boolean", "description": "정렬 상태 (기본값: true)"},
-                    "collection_values": {
-                        "type": "string",
-                        "description": "검색 대상 국가",
-                        "enum": list(country_dict.keys()),
-                        "default": "US",
+        return self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "word": {"type": "string", "description": "검색어"},
+                        "current_page": {"type": "integer", "description": "현재 페이지 번호 (기본값: 1)"},
+                        "sort_field": {
+                            "type": "string",
+                            "description": "정렬 기준 필드",
+                            "enum": list(sort_field_dict.keys()),
+                            "default": "AD",
+                        },
+                        "sort_state": {"type": "boolean", "description": "정렬 상태 (기본값: true)"},
+                        "collection_values": {
+                            "type": "string",
+                            "description": "검색 대상 국가",
+                            "enum": list(country_dict.keys()),
+                            "default": "US",
+                        },
                     },
+                    "required": ["word"],
                 },
-                "required": ["word"],
-            },
-            metadata={
-                "usage_hint": "키워드로 외국 특허(미국, 유럽, 일본, 중국 등)를 검색하고 정보를 제공합니다.",
-                "example_user_queries": [
-                    "미국 배터리 특허 검색해줘",
-                    "유럽 반도체 특허 최신 10건 알려줘",
-                    "일본 이차전지 특허 조회",
-                ],
-                "preferred_response_style": (
-                    "출원번호, 출원일자, 발명명칭, 출원인을 포함하여 최근 순으로 표 형태로 정리해주세요. "
-                    "간결하고 이해하기 쉽게 응답해 주세요."
-                ),
-            },
+                metadata={
+                    "usage_hint": "키워드로 외국 특허(미국, 유럽, 일본, 중국 등)를 검색하고 정보를 제공합니다.",
+                    "example_user_queries": [
+                        "미국 배터리 특허 검색해줘",
+                        "유럽 반도체 특허 최신 10건 알려줘",
+                        "일본 이차전지 특허 조회",
+                    ],
+                    "preferred_response_style": (
+                        "출원번호, 출원일자, 발명명칭, 출원인을 포함하여 최근 순으로 표 형태로 정리해주세요. "
+                        "간결하고 이해하기 쉽게 응답해 주세요."
+                    ),
+                },
+            )
         )
 
     def run_tool(self, args: dict) -> List[TextContent]:
         try:
             validated_args = ForeignPatentFreeSearchArgs(**args)
-            logger.info(f"Searching for word: {validated_args.word}")
+            logger.info("Searching for word: %s", validated_args.word)
 
             response = self.api.sync_search(
                 word=validated_args.word,
@@ -104,22 +105,22 @@ class ForeignPatentFreeSearchTool(ToolHandler):
             )
 
             if response.empty:
-                return [TextContent(type="text", text="there is no result")]
+                return self.render_empty(args, "there is no result")
 
             summary_df = response[["applicationNo", "applicationDate", "inventionName", "applicant"]].copy()
-            return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+            return self.render_records(summary_df, args)
 
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
 
     async def run_tool_async(self, args: dict) -> List[TextContent]:
         try:
             validated_args = ForeignPatentFreeSearchArgs(**args)
-            logger.info(f"Searching for word: {validated_args.word}")
+            logger.info("Searching for word: %s", validated_args.word)
 
             response = await self.api.async_search(
                 word=validated_args.word,
@@ -130,14 +131,14 @@ class ForeignPatentFreeSearchTool(ToolHandler):
             )
 
             if response.empty:
-                return [TextContent(type="text", text="there is no result")]
+                return self.render_empty(args, "there is no result")
 
             summary_df = response[["applicationNo", "applicationDate", "inventionName", "applicant"]].copy()
-            return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+            return await self.render_records_async(summary_df, args)
 
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
@@ -11,13 +11,10 @@ from mcp_kipris.kipris.abc import ToolHandler
 from mcp_kipris.kipris.api.foreign.international_application_number_search import (
     ForeignPatentInternationalApplicationNumberSearchAPI,
 )
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
 from mcp_kipris.kipris.tools.code import country_dict, sort_field_dict
 
 logger = logging.getLogger("mcp-kipris")
-api_key = os.getenv("KIPRIS_API_KEY")
-
-if not api_key:
-    raise ValueError("KIPRIS_API_KEY environment variable required.")
 
 
 class ForeignPatentInternationalApplicationNumberSearchArgs(BaseModel):
@@ -50,41 +47,43 @@ class ForeignPatentInternationalApplicationNumberSearchArgs(BaseModel):
 class ForeignPatentInternationalApplicationNumberSearchTool(ToolHandler):
     def __init__(self):
         super().__init__("foreign_international_application_number_search")
-        self.api = ForeignPatentInternationalApplicationNumberSearchAPI(api_key=api_key)
+        self.api = get_api_client_factory().get_client(ForeignPatentInternationalApplicationNumberSearchAPI)
         self.description = "foreign patent search by international application number, this tool is for foreign(US, EP, WO, JP, PJ, CP, CN, TW, RU, CO, SE, ES, IL) patent search"
         self.args_schema = ForeignPatentInternationalApplicationNumberSearchArgs
 
     def get_tool_description(self) -> Tool:
-        return Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "international_application_number": {"type": "string", "description": "국제출원번호"},
-                    "current_page": {"type": "integer", "description": "현재 페이지 번호 (기본값: 1)"},
-                    "sort_field": {
-                        "type": "string",
-                        "description": "정렬 기준 필드",
-                        "enum": list(sort_field_dict.keys()),
-                        "default": "AD",
-                    },
-                    "sort_state": {"type": "boolean", "description": "정렬 상태 (기본값: true)"},
-                    "collection_values": {
-                        "type": "string",
-                        "description": "검색 대상 국가",
-                        "enum": list(country_dict.keys()),
-                        "default": "US",
+        return self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "international_application_number": {"type": "string", "description": "국제출원번호"},
+                        "current_page": {"type": "integer", "description": "현재 페이지 번호 (기본값: 1)"},
+                        "sort_field": {
+                            "type": "string",
+                            "description": "정렬 기준 필드",
+                            "enum": list(sort_field_dict.keys()),
+                            "default": "AD",
+                        },
+                        "sort_state": {"type": "boolean", "description": "정렬 상태 (기본값: true)"},
+                        "collection_values": {
+                            "type": "string",
+                            "description": "검색 대상 국가",
+                            "enum": list(country_dict.keys()),
+                            "default": "US",
+                        },
                     },
+                    "required": ["international_application_number"],
                 },
-                "required": ["international_application_number"],
-            },
+            )
         )
 
     async def run_tool_async(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         try:
             validated_args = ForeignPatentInternationalApplicationNumberSearchArgs(**args)
-            logger.info(f"international_application_number: {validated_args.international_application_number}")
+            logger.info("international_application_number: %s", validated_args.international_application_number)
 
             response = await self.api.async_search(
                 international_application_number=validated_args.international_application_number,
@@ -94,12 +93,12 @@ class ForeignPatentInternationalApplicationNumberSearchTool(ToolHandler):
                 collection_values=validated_args.collection_values,
             )
             if response.empty:
-                return [TextContent(type="text", text="검색 결과가 없습니다.")]
+                return self.render_empty(args, "검색 결과가 없습니다.")
 
             summary_df = response[["applicationNo", "applicationDate", "inventionName", "applicant"]].copy()
-            return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+            return self.render_records(summary_df, args)
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             error_details = e.errors()
             for error in error_details:
                 field = error["loc"][0]
@@ -118,7 +117,7 @@ class ForeignPatentInternationalApplicationNumberSearchTool(ToolHandler):
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         try:
             validated_args = ForeignPatentInternationalApplicationNumberSearchArgs(**args)
-            logger.info(f"international_application_number: {validated_args.international_application_number}")
+            logger.info("international_application_number: %s", validated_args.international_application_number)
 
             response = self.api.sync_search(
                 international_application_number=validated_args.international_application_number,
@@ -128,12 +127,12 @@ class ForeignPatentInternationalApplicationNumberSearchTool(ToolHandler):
                 collection_values=validated_args.collection_values,
             )
             if response.empty:
-                return [TextContent(type="text", text="검색 결과가 없습니다.")]
+                return self.render_empty(args, "검색 결과가 없습니다.")
 
             summary_df = response[["applicationNo", "applicationDate", "inventionName", "applicant"]].copy()
-            return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+            return self.render_records(summary_df, args)
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             error_details = e.errors()
             for error in error_details:
                 field = error["loc"][0]
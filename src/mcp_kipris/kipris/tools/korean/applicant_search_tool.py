@@ -11,12 +11,9 @@ from pydantic import BaseModel, Field, ValidationError
 
 from mcp_kipris.kipris.abc import ToolHandler
 from mcp_kipris.kipris.api.korean.applicant_search_api import PatentApplicantSearchAPI
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
 
 logger = logging.getLogger("mcp-kipris")
-api_key = os.getenv("KIPRIS_API_KEY")
-
-if not api_key:
-    raise ValueError("KIPRIS_API_KEY environment variable required.")
 
 
 class PatentApplicantSearchArgs(BaseModel):
@@ -39,61 +36,65 @@ class PatentApplicantSearchArgs(BaseModel):
 
 
 class PatentApplicantSearchTool(ToolHandler):
+    collapsible = True
+
     def __init__(self):
         super().__init__("patent_applicant_search")
-        self.api = PatentApplicantSearchAPI(api_key=api_key)
+        self.api = get_api_client_factory().get_client(PatentApplicantSearchAPI)
         self.description = "patent search by applicant name, this tool is for korean patent search"
 
     def get_tool_description(self) -> Tool:
         import sys
 
-        logger.info(f"get_tool_description: {self.name}")
-        tool = Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "applicant": {"type": "string", "description": "출원인 이름"},
-                    "docs_start": {"type": "integer", "description": "검색 시작 위치 (기본값: 1)"},
-                    "docs_count": {"type": "integer", "description": "검색 결과 수 (기본값: 10, 범위: 1-30)"},
-                    "patent": {"type": "boolean", "description": "특허 포함 여부 (기본값: true)"},
-                    "utility": {"type": "boolean", "description": "실용신안 포함 여부 (기본값: true)"},
-                    "lastvalue": {
-                        "type": "string",
-                        "description": "특허 등록 상태 (A:공개, C:정정공개, F:공고, G:정정공고, I:무효공고, J:취소공고, R:재공고, 공백:전체)",
-                        "enum": ["A", "C", "F", "G", "I", "J", "R", ""],
-                    },
-                    "sort_spec": {
-                        "type": "string",
-                        "description": "정렬 기준 필드",
-                        "enum": ["PD", "AD", "GD", "OPD", "FD", "FOD", "RD"],
-                        "default": "AD",
+        logger.debug("get_tool_description: %s", self.name)
+        tool = self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "applicant": {"type": "string", "description": "출원인 이름"},
+                        "docs_start": {"type": "integer", "description": "검색 시작 위치 (기본값: 1)"},
+                        "docs_count": {"type": "integer", "description": "검색 결과 수 (기본값: 10, 범위: 1-30)"},
+                        "patent": {"type": "boolean", "description": "특허 포함 여부 (기본값: true)"},
+                        "utility": {"type": "boolean", "description": "실용신안 포함 여부 (기본값: true)"},
+                        "lastvalue": {
+                            "type": "string",
+                            "description": "특허 등록 상태 (A:공개, C:정정공개, F:공고, G:정정공고, I:무효공고, J:취소공고, R:재공고, 공백:전체)",
+                            "enum": ["A", "C", "F", "G", "I", "J", "R", ""],
+                        },
+                        "sort_spec": {
+                            "type": "string",
+                            "description": "정렬 기준 필드",
+                            "enum": ["PD", "AD", "GD", "OPD", "FD", "FOD", "RD"],
+                            "default": "AD",
+                        },
+                        "desc_sort": {"type": "boolean", "description": "내림차순 정렬 여부 (기본값: true)"},
                     },
-                    "desc_sort": {"type": "boolean", "description": "내림차순 정렬 여부 (기본값: true)"},
+                    "required": ["applicant"],
                 },
-                "required": ["applicant"],
-            },
-            metadata={
-                "usage_hint": "출원인(특허를 출원한 사람 또는 회사)의 이름으로 한국 특허를 검색합니다. 권리자(특허권자)와는 다릅니다.",
-                "example_user_queries": [
-                    "삼성전자가 출원한 특허 보여줘",
-                    "LG화학이 최근 출원한 특허 5건 검색해줘",
-                    "네이버가 출원한 특허 목록 알려줘",
-                ],
-                "preferred_response_style": (
-                    "출원인, 출원일자, 발명의 명칭, 출원번호를 포함하여 최근 순으로 표 형태로 정리해주세요. "
-                    "간결하고 이해하기 쉽게 응답해 주세요."
-                ),
-            },
+                metadata={
+                    "usage_hint": "출원인(특허를 출원한 사람 또는 회사)의 이름으로 한국 특허를 검색합니다. 권리자(특허권자)와는 다릅니다.",
+                    "example_user_queries": [
+                        "삼성전자가 출원한 특허 보여줘",
+                        "LG화학이 최근 출원한 특허 5건 검색해줘",
+                        "네이버가 출원한 특허 목록 알려줘",
+                    ],
+                    "preferred_response_style": (
+                        "출원인, 출원일자, 발명의 명칭, 출원번호를 포함하여 최근 순으로 표 형태로 정리해주세요. "
+                        "간결하고 이해하기 쉽게 응답해 주세요."
+                    ),
+                },
+            )
         )
-        logger.info(f"get_tool_description: {tool}")
+        logger.debug("get_tool_description: %s", tool)
         return tool
 
     def run_tool(self, args: dict) -> Sequence[TextContent]:
         try:
             validated_args = PatentApplicantSearchArgs(**args)
-            logger.info(f"Searching for applicant: {validated_args.applicant}")
+            logger.info("Searching for applicant: %s", validated_args.applicant)
 
             response = self.api.sync_search(
                 applicant=validated_args.applicant,
@@ -107,23 +108,23 @@ class PatentApplicantSearchTool(ToolHandler):
             )
 
             if response.empty:
-                return [TextContent(type="text", text="there is no result")]
+                return self.render_empty(args, "there is no result")
 
             summary_df = response[["ApplicationNumber", "ApplicationDate", "InventionName", "Applicant"]].copy()
             del response
-            return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+            return self.render_records(summary_df, args)
 
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
 
     async def run_tool_async(self, args: dict) -> Sequence[TextContent]:
         try:
             validated_args = PatentApplicantSearchArgs(**args)
-            logger.info(f"Searching for applicant: {validated_args.applicant}")
+            logger.info("Searching for applicant: %s", validated_args.applicant)
 
             response = await self.api.async_search(
                 applicant=validated_args.applicant,
@@ -137,15 +138,16 @@ class PatentApplicantSearchTool(ToolHandler):
             )
 
             if response.empty:
-                return [TextContent(type="text", text="there is no result")]
+                return self.render_empty(args, "there is no result")
             # logger.info(f"response: {response.columns}")
             summary_df = response[["ApplicationNumber", "ApplicationDate", "InventionName", "Applicant"]].copy()
             del response
-            return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+            self.prefetch_details(summary_df)
+            return await self.render_records_async(summary_df, args)
 
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
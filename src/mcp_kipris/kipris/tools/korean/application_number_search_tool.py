@@ -11,12 +11,9 @@ from pydantic import BaseModel, Field, ValidationError
 
 from mcp_kipris.kipris.abc import ToolHandler
 from mcp_kipris.kipris.api.korean.application_number_search_api import PatentApplicationNumberSearchAPI
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
 
 logger = logging.getLogger("mcp-kipris")
-api_key = os.getenv("KIPRIS_API_KEY")
-
-if not api_key:
-    raise ValueError("KIPRIS_API_KEY environment variable required.")
 
 
 class PatentApplicationNumberSearchArgs(BaseModel):
@@ -34,43 +31,47 @@ class PatentApplicationNumberSearchArgs(BaseModel):
 
 
 class PatentApplicationNumberSearchTool(ToolHandler):
+    collapsible = True
+
     def __init__(self):
         super().__init__("patent_application_number_search")
-        self.api = PatentApplicationNumberSearchAPI(api_key=api_key)
+        self.api = get_api_client_factory().get_client(PatentApplicationNumberSearchAPI)
         self.description = "Patent search by application number, this tool is for korean patent search"
 
     def get_tool_description(self) -> Tool:
         import sys
 
-        logger.info(f"get_tool_description: {self.name}")
-        tool = Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "application_number": {"type": "string", "description": "출원번호"},
-                    "docs_start": {"type": "integer", "description": "검색 시작 위치 (기본값: 1)"},
-                    "docs_count": {"type": "integer", "description": "검색 결과 수 (기본값: 10)"},
-                    "desc_sort": {"type": "boolean", "description": "내림차순 정렬 여부 (기본값: true)"},
-                    "sort_spec": {
-                        "type": "string",
-                        "description": "정렬 기준 필드",
-                        "enum": ["PD", "AD", "GD", "OPD", "FD", "FOD", "RD"],
-                        "default": "AD",
+        logger.debug("get_tool_description: %s", self.name)
+        tool = self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "application_number": {"type": "string", "description": "출원번호"},
+                        "docs_start": {"type": "integer", "description": "검색 시작 위치 (기본값: 1)"},
+                        "docs_count": {"type": "integer", "description": "검색 결과 수 (기본값: 10)"},
+                        "desc_sort": {"type": "boolean", "description": "내림차순 정렬 여부 (기본값: true)"},
+                        "sort_spec": {
+                            "type": "string",
+                            "description": "정렬 기준 필드",
+                            "enum": ["PD", "AD", "GD", "OPD", "FD", "FOD", "RD"],
+                            "default": "AD",
+                        },
                     },
+                    "required": ["application_number"],
                 },
-                "required": ["application_number"],
-            },
+            )
         )
-        logger.info(f"get_tool_description: {tool}")
+        logger.debug("get_tool_description: %s", tool)
         return tool
 
     def run_tool(self, args: dict) -> Sequence[TextContent]:
         try:
             validated_args = PatentApplicationNumberSearchArgs(**args)
             validated_args.application_number = validated_args.application_number.replace("-", "")
-            logger.info(f"Searching for application number: {validated_args.application_number}")
+            logger.info("Searching for application number: %s", validated_args.application_number)
 
             response = self.api.sync_search(
                 application_number=validated_args.application_number,
@@ -81,22 +82,22 @@ class PatentApplicationNumberSearchTool(ToolHandler):
             )
 
             if response.empty:
-                return [TextContent(type="text", text="there is no result")]
+                return self.render_empty(args, "there is no result")
 
-            return [TextContent(type="text", text=response.to_markdown(index=False))]
+            return self.render_records(response, args)
 
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
 
     async def run_tool_async(self, args: dict) -> Sequence[TextContent]:
         try:
             validated_args = PatentApplicationNumberSearchArgs(**args)
             validated_args.application_number = validated_args.application_number.replace("-", "")
-            logger.info(f"Searching for application number: {validated_args.application_number}")
+            logger.info("Searching for application number: %s", validated_args.application_number)
 
             response = await self.api.async_search(
                 application_number=validated_args.application_number,
@@ -107,13 +108,14 @@ class PatentApplicationNumberSearchTool(ToolHandler):
             )
 
             if response.empty:
-                return [TextContent(type="text", text="there is no result")]
+                return self.render_empty(args, "there is no result")
 
             summary_df = response[["ApplicationNumber", "ApplicationDate", "InventionName", "Applicant"]].copy()
-            return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+            self.prefetch_details(summary_df)
+            return await self.render_records_async(summary_df, args)
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
@@ -11,12 +11,26 @@ from pydantic import BaseModel, Field, ValidationError
 
 from mcp_kipris.kipris.abc import ToolHandler
 from mcp_kipris.kipris.api.korean.patent_detail_search_api import PatentDetailSearchAPI
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
+from mcp_kipris.kipris.entity_cache import DETAIL_FIELDS, lookup_patent, lookup_patent_async
+from mcp_kipris.kipris.prefetch import get_prefetcher
 
 logger = logging.getLogger("mcp-kipris")
-api_key = os.getenv("KIPRIS_API_KEY")
 
-if not api_key:
-    raise ValueError("KIPRIS_API_KEY environment variable required.")
+# 결과 예산(max_tokens)이 있을 때 먼저 채우는 필드. 청구항 등 긴 필드는 뒤로 밀려 잘리거나 생략됨
+DETAIL_PRIORITY_FIELDS = (
+    "inventionTitle",
+    "applicationNumber",
+    "applicationDate",
+    "registerStatus",
+    "registerNumber",
+    "registerDate",
+    "openNumber",
+    "openDate",
+    "applicantInfoArray",
+    "ipcInfoArray",
+    "abstractInfoArray",
+)
 
 
 class PatentDetailSearchArgs(BaseModel):
@@ -26,76 +40,84 @@ class PatentDetailSearchArgs(BaseModel):
 class PatentDetailSearchTool(ToolHandler):
     def __init__(self):
         super().__init__("patent_detail_search")
-        self.api = PatentDetailSearchAPI(api_key=api_key)
+        self.api = get_api_client_factory().get_client(PatentDetailSearchAPI)
         self.description = "patent search by applicant name"
 
     def get_tool_description(self) -> Tool:
         import sys
 
-        logger.info(f"get_tool_description: {self.name}")
-        tool = Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema={
-                "type": "object",
-                "properties": {"application_number": {"type": "string", "description": "출원번호"}},
-                "required": ["application_number"],
-            },
-            metadata={
-                "usage_hint": ("출원번호가 주어졌을 때, 해당 특허의 상세한 법적/기술적 정보를 보여줍니다."),
-                "example_user_queries": [
-                    "출원번호 1020250037551 특허의 상세 정보 알려줘",
-                    "두 번째 특허의 구체적인 내용을 알고 싶어",
-                ],
-                "preferred_response_style": (
-                    "정보가 많기 때문에 Markdown 형식으로 구분된 섹션별로 정리해서 보여주세요. "
-                    "예: 기본정보 / 출원인정보 / 발명자정보 / 대리인정보 / 우선권정보 등"
-                ),
-            },
+        logger.debug("get_tool_description: %s", self.name)
+        tool = self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {"application_number": {"type": "string", "description": "출원번호"}},
+                    "required": ["application_number"],
+                },
+                metadata={
+                    "usage_hint": ("출원번호가 주어졌을 때, 해당 특허의 상세한 법적/기술적 정보를 보여줍니다."),
+                    "example_user_queries": [
+                        "출원번호 1020250037551 특허의 상세 정보 알려줘",
+                        "두 번째 특허의 구체적인 내용을 알고 싶어",
+                    ],
+                    "preferred_response_style": (
+                        "정보가 많기 때문에 Markdown 형식으로 구분된 섹션별로 정리해서 보여주세요. "
+                        "예: 기본정보 / 출원인정보 / 발명자정보 / 대리인정보 / 우선권정보 등"
+                    ),
+                },
+            )
         )
-        logger.info(f"get_tool_description: {tool}")
+        self.with_result_budget_options(tool)
+        logger.debug("get_tool_description: %s", tool)
         return tool
 
     def run_tool(self, args: dict) -> Sequence[TextContent]:
         try:
             validated_args = PatentDetailSearchArgs(**args)
             validated_args.application_number = validated_args.application_number.replace("-", "")
-            logger.info(f"Searching for application number: {validated_args.application_number}")
+            logger.info("Searching for application number: %s", validated_args.application_number)
 
-            response = self.api.sync_search(
-                application_number=validated_args.application_number,
-            )
+            # 상세 레코드는 상세 엔드포인트만 제공. 캐시된 엔티티에 있으면 재호출하지 않음
+            entity = lookup_patent(self.api, validated_args.application_number, DETAIL_FIELDS, candidates=("detail",))
 
-            if response.empty:
-                return [TextContent(type="text", text="there is no result")]
+            if "detail" not in entity.records:
+                return self.render_empty(args, "there is no result")
 
-            return [TextContent(type="text", text=response.to_markdown(index=False))]
+            return self.render_budgeted_records(pd.DataFrame([entity.records["detail"]]), args, DETAIL_PRIORITY_FIELDS)
 
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
 
     async def run_tool_async(self, args: dict) -> Sequence[TextContent]:
         try:
             validated_args = PatentDetailSearchArgs(**args)
             validated_args.application_number = validated_args.application_number.replace("-", "")
-            logger.info(f"Searching for application number: {validated_args.application_number}")
+            logger.info("Searching for application number: %s", validated_args.application_number)
+
+            # 검색 직후 미리 받는 중인 출원번호면 그 결과를 기다려 재사용
+            prefetcher = get_prefetcher()
+            if prefetcher is not None:
+                await prefetcher.claim(validated_args.application_number)
 
-            response = await self.api.async_search(
-                application_number=validated_args.application_number,
+            # 상세 레코드는 상세 엔드포인트만 제공. 캐시된 엔티티에 있으면 재호출하지 않음
+            entity = await lookup_patent_async(
+                self.api, validated_args.application_number, DETAIL_FIELDS, candidates=("detail",)
             )
 
-            if response.empty:
-                return [TextContent(type="text", text="there is no result")]
+            if "detail" not in entity.records:
+                return self.render_empty(args, "there is no result")
 
-            return [TextContent(type="text", text=response.to_markdown(index=False))]
+            return self.render_budgeted_records(pd.DataFrame([entity.records["detail"]]), args, DETAIL_PRIORITY_FIELDS)
 
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
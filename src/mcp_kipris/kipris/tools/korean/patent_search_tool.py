@@ -10,13 +10,12 @@ from pydantic import BaseModel, Field, ValidationError
 
 from mcp_kipris.kipris.abc import ToolHandler
 from mcp_kipris.kipris.api.korean.patent_search_api import PatentSearchAPI
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
+from mcp_kipris.kipris.entity_cache import lookup_patent, lookup_patent_async
 
 logger = logging.getLogger("mcp-kipris")
 
-api_key = os.getenv("KIPRIS_API_KEY")
-
-if not api_key:
-    raise ValueError("KIPRIS_API_KEY environment variable required.")
+PATENT_SEARCH_FIELDS = ("applicationNumber", "applicationDate", "inventionTitle", "applicantName", "registerStatus")
 
 
 class PatentSearchArgs(BaseModel):
@@ -26,55 +25,53 @@ class PatentSearchArgs(BaseModel):
 class PatentSearchTool(ToolHandler):
     def __init__(self):
         super().__init__("patent_search")
-        self.api = PatentSearchAPI(api_key=api_key)
+        self.api = get_api_client_factory().get_client(PatentSearchAPI)
         self.description = "patent search by application number, this tool is for korean patent search"
 
     def get_tool_description(self) -> Tool:
-        return Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema={
-                "type": "object",
-                "properties": {"application_number": {"type": "string", "description": "출원번호"}},
-                "required": ["application_number"],
-            },
-            metadata={
-                "usage_hint": "출원번호로 한국 특허를 검색하고 특허에 대한 기본적인 정보를 제공합니다.",
-                "example_user_queries": ["1020230045678 특허의 기본 정보를 알고 싶어."],
-                "preferred_response_style": (
-                    "출원번호, 출원일자, 발명의 명칭, 출원인을 포함하여 최근 순으로 표 형태로 정리해주세요. "
-                    "간결하고 이해하기 쉽게 응답해 주세요."
-                ),
-            },
+        return self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {"application_number": {"type": "string", "description": "출원번호"}},
+                    "required": ["application_number"],
+                },
+                metadata={
+                    "usage_hint": "출원번호로 한국 특허를 검색하고 특허에 대한 기본적인 정보를 제공합니다.",
+                    "example_user_queries": ["1020230045678 특허의 기본 정보를 알고 싶어."],
+                    "preferred_response_style": (
+                        "출원번호, 출원일자, 발명의 명칭, 출원인을 포함하여 최근 순으로 표 형태로 정리해주세요. "
+                        "간결하고 이해하기 쉽게 응답해 주세요."
+                    ),
+                },
+            )
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         validated_args = PatentSearchArgs(**args)
-        logger.info(f"application_number: {validated_args.application_number}")
+        logger.info("application_number: %s", validated_args.application_number)
 
-        response = self.api.sync_search(word="", application_number=validated_args.application_number)
+        # 출원번호별 엔티티 캐시: 요약/상세 조회로 이미 받은 필드면 API 호출 없이 응답
+        entity = lookup_patent(self.api, validated_args.application_number, PATENT_SEARCH_FIELDS)
 
         # 검색 결과가 없는 경우 처리
-        if response.empty:
-            return [TextContent(type="text", text="검색 결과가 없습니다.")]
+        if not entity.records:
+            return self.render_empty(args, "검색 결과가 없습니다.")
 
-        summary_df = response[
-            ["applicationNumber", "applicationDate", "inventionTitle", "applicantName", "registerStatus"]
-        ].copy()
-        return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+        return self.render_records(entity.project(PATENT_SEARCH_FIELDS), args)
 
     async def run_tool_async(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         """특허 검색 비동기 실행 메서드"""
         validated_args = PatentSearchArgs(**args)
-        logger.info(f"application_number: {validated_args.application_number}")
+        logger.info("application_number: %s", validated_args.application_number)
 
-        response = await self.api.async_search(word="", application_number=validated_args.application_number)
+        # 출원번호별 엔티티 캐시: 요약/상세 조회로 이미 받은 필드면 API 호출 없이 응답
+        entity = await lookup_patent_async(self.api, validated_args.application_number, PATENT_SEARCH_FIELDS)
 
         # 검색 결과가 없는 경우 처리
-        if response.empty:
-            return [TextContent(type="text", text="검색 결과가 없습니다.")]
+        if not entity.records:
+            return self.render_empty(args, "검색 결과가 없습니다.")
 
-        summary_df = response[
-            ["applicationNumber", "applicationDate", "inventionTitle", "applicantName", "registerStatus"]
-        ].copy()
-        return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+        return self.render_records(entity.project(PATENT_SEARCH_FIELDS), args)
@@ -11,12 +11,23 @@ from pydantic import BaseModel, Field, ValidationError
 
 from mcp_kipris.kipris.abc import ToolHandler
 from mcp_kipris.kipris.api.korean.patent_summary_search_api import PatentSummarySearchAPI
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
+from mcp_kipris.kipris.entity_cache import lookup_patent, lookup_patent_async
 
 logger = logging.getLogger("mcp-kipris")
-api_key = os.getenv("KIPRIS_API_KEY")
 
-if not api_key:
-    raise ValueError("KIPRIS_API_KEY environment variable required.")
+# 결과 예산(max_tokens)이 있을 때 먼저 채우는 필드. 청구항 등 긴 필드는 뒤로 밀려 잘리거나 생략됨
+SUMMARY_PRIORITY_FIELDS = (
+    "inventionTitle",
+    "applicationNumber",
+    "applicationDate",
+    "applicantName",
+    "registerStatus",
+    "ipcNumber",
+    "astrtCont",
+)
+# 요약 도구가 렌더링하는 필드. 엔티티 캐시에 이미 있으면(고급검색/상세 조회 결과 포함) API 호출 없이 응답
+SUMMARY_FIELDS = (*SUMMARY_PRIORITY_FIELDS, "openNumber", "openDate", "registerNumber", "registerDate")
 
 
 class PatentSummarySearchArgs(BaseModel):
@@ -26,68 +37,67 @@ class PatentSummarySearchArgs(BaseModel):
 class PatentSummarySearchTool(ToolHandler):
     def __init__(self):
         super().__init__("patent_summary_search")
-        self.api = PatentSummarySearchAPI(api_key=api_key)
+        self.api = get_api_client_factory().get_client(PatentSummarySearchAPI)
         self.description = "patent summary search by application number, this tool is for korean patent search"
 
     def get_tool_description(self) -> Tool:
-        return Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema={
-                "type": "object",
-                "properties": {"application_number": {"type": "string", "description": "출원번호"}},
-                "required": ["application_number"],
-            },
-            metadata={
-                "usage_hint": "출원번호로 한국 특허를 검색하고 요약 정보를 제공합니다.",
-                "example_user_queries": ["1020230045678 특허의 요약 정보를 알고 싶어."],
-                "preferred_response_style": (
-                    "출원번호, 출원일자, 발명의 명칭, 출원인을 포함하여 최근 순으로 표 형태로 정리해주세요. "
-                    "간결하고 이해하기 쉽게 응답해 주세요."
-                ),
-            },
+        tool = self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {"application_number": {"type": "string", "description": "출원번호"}},
+                    "required": ["application_number"],
+                },
+                metadata={
+                    "usage_hint": "출원번호로 한국 특허를 검색하고 요약 정보를 제공합니다.",
+                    "example_user_queries": ["1020230045678 특허의 요약 정보를 알고 싶어."],
+                    "preferred_response_style": (
+                        "출원번호, 출원일자, 발명의 명칭, 출원인을 포함하여 최근 순으로 표 형태로 정리해주세요. "
+                        "간결하고 이해하기 쉽게 응답해 주세요."
+                    ),
+                },
+            )
         )
+        return self.with_result_budget_options(tool)
 
     def run_tool(self, args: dict) -> List[TextContent]:
         try:
             validated_args = PatentSummarySearchArgs(**args)
             validated_args.application_number = validated_args.application_number.replace("-", "")
-            logger.info(f"Searching for application number: {validated_args.application_number}")
+            logger.info("Searching for application number: %s", validated_args.application_number)
 
-            response = self.api.sync_search(
-                application_number=validated_args.application_number,
-            )
+            entity = lookup_patent(self.api, validated_args.application_number, SUMMARY_FIELDS)
 
-            if response.empty:
-                return [TextContent(type="text", text="there is no result")]
+            if not entity.records:
+                return self.render_empty(args, "there is no result")
 
-            return [TextContent(type="text", text=response.to_markdown(index=False))]
+            return self.render_budgeted_records(entity.project(SUMMARY_FIELDS), args, SUMMARY_PRIORITY_FIELDS)
 
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
 
     async def run_tool_async(self, args: dict) -> List[TextContent]:
         try:
             validated_args = PatentSummarySearchArgs(**args)
             validated_args.application_number = validated_args.application_number.replace("-", "")
-            logger.info(f"Searching for application number: {validated_args.application_number}")
+            logger.info("Searching for application number: %s", validated_args.application_number)
 
-            response = await self.api.async_search(
-                application_number=validated_args.application_number,
-            )
+            entity = await lookup_patent_async(self.api, validated_args.application_number, SUMMARY_FIELDS)
 
-            if response.empty:
-                return [TextContent(type="text", text="there is no result")]
+            if not entity.records:
+                return self.render_empty(args, "there is no result")
 
-            return [TextContent(type="text", text=response.to_markdown(index=False))]
+            return self.render_budgeted_records(entity.project(SUMMARY_FIELDS), args, SUMMARY_PRIORITY_FIELDS)
 
         except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
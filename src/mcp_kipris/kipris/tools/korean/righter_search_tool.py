@@ -10,14 +10,10 @@ from pydantic import BaseModel, Field, ValidationError
 
 from mcp_kipris.kipris.abc import ToolHandler
 from mcp_kipris.kipris.api.korean.righter_search_api import PatentRighterSearchAPI
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
 
 logger = logging.getLogger("mcp-kipris")
 
-api_key = os.getenv("KIPRIS_API_KEY")
-
-if not api_key:
-    raise ValueError("KIPRIS_API_KEY environment variable required.")
-
 
 class PatentRighterSearchArgs(BaseModel):
     righter_name: str = Field(..., description="Righter name, it must be filled")
@@ -28,49 +24,53 @@ class PatentRighterSearchArgs(BaseModel):
 
 
 class PatentRighterSearchTool(ToolHandler):
+    collapsible = True
+
     def __init__(self):
         super().__init__("patent_righter_search")
-        self.api = PatentRighterSearchAPI(api_key=api_key)
+        self.api = get_api_client_factory().get_client(PatentRighterSearchAPI)
         self.description = "Search patents by right holder name (권리자), distinct from applicant (출원인)"
 
     def get_tool_description(self) -> Tool:
-        return Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "righter_name": {"type": "string", "description": "권리자 이름"},
-                    "docs_start": {"type": "integer", "description": "검색 시작 위치 (기본값: 1)"},
-                    "docs_count": {"type": "integer", "description": "검색 결과 수 (기본값: 10)"},
-                    "desc_sort": {"type": "boolean", "description": "내림차순 정렬 여부 (기본값: true)"},
-                    "sort_spec": {
-                        "type": "string",
-                        "description": "정렬 기준 필드 (PD-공고일자, AD-출원일자, GD-등록일자, OPD-공개일자)",
-                        "enum": ["PD", "AD", "GD", "OPD"],
-                        "default": "AD",
+        return self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "righter_name": {"type": "string", "description": "권리자 이름"},
+                        "docs_start": {"type": "integer", "description": "검색 시작 위치 (기본값: 1)"},
+                        "docs_count": {"type": "integer", "description": "검색 결과 수 (기본값: 10)"},
+                        "desc_sort": {"type": "boolean", "description": "내림차순 정렬 여부 (기본값: true)"},
+                        "sort_spec": {
+                            "type": "string",
+                            "description": "정렬 기준 필드 (PD-공고일자, AD-출원일자, GD-등록일자, OPD-공개일자)",
+                            "enum": ["PD", "AD", "GD", "OPD"],
+                            "default": "AD",
+                        },
                     },
+                    "required": ["righter_name"],
+                },
+                metadata={
+                    "usage_hint": "권리자(특허권자)의 이름으로 한국 특허를 검색하고 요약 정보를 제공합니다. 출원인과는 다릅니다.",
+                    "example_user_queries": [
+                        "삼성전자가 권리자인 특허 보여줘",
+                        "LG화학이 특허권자인 특허 5건 알려줘",
+                        "현대모비스가 특허권을 보유한 특허를 찾아줘",
+                        "특허권자가 네이버인 특허 목록 알려줘",
+                    ],
+                    "preferred_response_style": (
+                        "권리자, 출원일자, 발명의 명칭, 출원번호를 포함하여 최근 순으로 표 형태로 정리해주세요. "
+                        "간결하고 이해하기 쉽게 응답해 주세요."
+                    ),
                 },
-                "required": ["righter_name"],
-            },
-            metadata={
-                "usage_hint": "권리자(특허권자)의 이름으로 한국 특허를 검색하고 요약 정보를 제공합니다. 출원인과는 다릅니다.",
-                "example_user_queries": [
-                    "삼성전자가 권리자인 특허 보여줘",
-                    "LG화학이 특허권자인 특허 5건 알려줘",
-                    "현대모비스가 특허권을 보유한 특허를 찾아줘",
-                    "특허권자가 네이버인 특허 목록 알려줘",
-                ],
-                "preferred_response_style": (
-                    "권리자, 출원일자, 발명의 명칭, 출원번호를 포함하여 최근 순으로 표 형태로 정리해주세요. "
-                    "간결하고 이해하기 쉽게 응답해 주세요."
-                ),
-            },
+            )
         )
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         validated_args = PatentRighterSearchArgs(**args)
-        logger.info(f"righter_name: {validated_args.righter_name}")
+        logger.info("righter_name: %s", validated_args.righter_name)
 
         response = self.api.sync_search(
             rightHoler=validated_args.righter_name,
@@ -82,15 +82,15 @@ class PatentRighterSearchTool(ToolHandler):
 
         # 검색 결과가 없는 경우 처리
         if response.empty:
-            return [TextContent(type="text", text="검색 결과가 없습니다.")]
+            return self.render_empty(args, "검색 결과가 없습니다.")
 
         summary_df = response[["ApplicationNumber", "ApplicationDate", "InventionName", "RegistrationStatus"]].copy()
-        return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+        return self.render_records(summary_df, args)
 
     async def run_tool_async(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         """권리자 검색 비동기 실행 메서드"""
         validated_args = PatentRighterSearchArgs(**args)
-        logger.info(f"righter_name: {validated_args.righter_name}")
+        logger.info("righter_name: %s", validated_args.righter_name)
 
         # 기존 API 클래스를 asyncio.to_thread로 비동기적으로 호출
         response = await self.api.async_search(
@@ -103,7 +103,8 @@ class PatentRighterSearchTool(ToolHandler):
 
         # 검색 결과가 없는 경우 처리
         if response.empty:
-            return [TextContent(type="text", text="검색 결과가 없습니다.")]
+            return self.render_empty(args, "검색 결과가 없습니다.")
 
         summary_df = response[["ApplicationNumber", "ApplicationDate", "InventionName", "RegistrationStatus"]].copy()
-        return [TextContent(type="text", text=summary_df.to_markdown(index=False))]
+        self.prefetch_details(summary_df)
+        return await self.render_records_async(summary_df, args)
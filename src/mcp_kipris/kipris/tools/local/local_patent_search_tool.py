@@ -0,0 +1,81 @@
+import logging
+from collections.abc import Sequence
+
+import pandas as pd
+from mcp.types import TextContent, Tool
+from pydantic import BaseModel, Field, ValidationError
+
+from mcp_kipris.kipris.abc import ToolHandler
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
+
+logger = logging.getLogger("mcp-kipris")
+
+LOCAL_SEARCH_COLUMNS = ["applicationNumber", "applicationDate", "inventionTitle", "applicantName", "score"]
+
+
+class LocalPatentSearchArgs(BaseModel):
+    query: str = Field(..., description="검색어 (발명의 명칭, 초록, 청구항, 출원인)")
+    docs_start: int = Field(1, description="검색 시작 위치 (기본값: 1)")
+    docs_count: int = Field(10, description="검색 결과 수 (기본값: 10, 범위: 1-100)")
+
+
+class LocalPatentSearchTool(ToolHandler):
+    def __init__(self):
+        super().__init__("local_patent_search")
+        self.index = get_api_client_factory().local_index
+        self.description = (
+            "BM25 full-text search over patents already fetched by the other tools on this server (no KIPRIS API call)"
+        )
+        self.args_schema = LocalPatentSearchArgs
+
+    def get_tool_description(self) -> Tool:
+        return self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {"type": "string", "description": "검색어 (발명의 명칭, 초록, 청구항, 출원인)"},
+                        "docs_start": {"type": "integer", "description": "검색 시작 위치 (기본값: 1)"},
+                        "docs_count": {"type": "integer", "description": "검색 결과 수 (기본값: 10, 범위: 1-100)"},
+                    },
+                    "required": ["query"],
+                },
+                metadata={
+                    "usage_hint": (
+                        "이미 검색/조회한 특허를 KIPRIS 호출 없이 다시 찾습니다. "
+                        "결과가 없으면 키워드 검색 도구로 먼저 수집하세요."
+                    ),
+                    "example_user_queries": ["앞에서 찾은 특허 중 양극 활물질 관련된 것만 다시 보여줘"],
+                    "preferred_response_style": "관련도(score) 순으로 출원번호, 발명의 명칭, 출원인을 표로 정리해주세요.",
+                },
+            )
+        )
+
+    def run_tool(self, args: dict) -> Sequence[TextContent]:
+        try:
+            validated_args = LocalPatentSearchArgs(**args)
+            logger.info("Searching local index: %s", validated_args.query)
+
+            results = self.index.search(
+                validated_args.query,
+                limit=max(min(validated_args.docs_count, 100), 1),
+                offset=max(validated_args.docs_start - 1, 0),
+            )
+            if not results:
+                return self.render_empty(args, f"there is no result (indexed patents: {len(self.index)})")
+
+            records = pd.DataFrame([{**fields, "score": round(score, 4)} for score, fields in results])
+            return self.render_records(records.reindex(columns=LOCAL_SEARCH_COLUMNS), args)
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e)
+            return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
+        except Exception as e:
+            logger.error("Error occurred: %s", e)
+            return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
+
+    async def run_tool_async(self, args: dict) -> Sequence[TextContent]:
+        # 메모리 색인 조회라 이벤트 루프에서 바로 실행
+        return self.run_tool(args)
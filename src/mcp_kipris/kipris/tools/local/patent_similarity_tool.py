@@ -0,0 +1,215 @@
+import contextvars
+import heapq
+import logging
+import threading
+import time
+import typing as t
+from collections.abc import Sequence
+
+import pandas as pd
+from mcp.types import TextContent, Tool
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from mcp_kipris.kipris.abc import ToolHandler
+from mcp_kipris.kipris.api_client_factory import ApiClientFactory, get_api_client_factory
+from mcp_kipris.kipris.executor import get_blocking_executor
+from mcp_kipris.kipris.similarity import TfidfSimilarityEngine
+
+logger = logging.getLogger("mcp-kipris")
+
+
+class PatentSimilarityArgs(BaseModel):
+    application_number: str = Field("", description="기준 특허 출원번호 (text 와 둘 중 하나)")
+    text: str = Field("", description="기준 텍스트 (기술 설명, 초록 등)")
+    mode: t.Literal["nearest", "pairs"] = Field("nearest", description="nearest: 유사 특허, pairs: 유사 특허 쌍 전체")
+    top_k: int = Field(10, description="nearest 결과 수 (기본값: 10, 범위: 1-100)")
+    threshold: float = Field(0.5, description="pairs 최소 유사도 (0-1, 기본값: 0.5)")
+    docs_count: int = Field(50, description="pairs 결과 수 (기본값: 50)")
+
+    @field_validator("threshold")
+    @classmethod
+    def validate_threshold(cls, v: float) -> float:
+        # 0 이하이면 모든 쌍(n^2)이 결과가 됨
+        if not 0 < v <= 1:
+            raise ValueError("threshold must be greater than 0 and at most 1")
+        return v
+
+
+def collection_documents(factory: ApiClientFactory) -> t.Iterator[t.Dict[str, t.Any]]:
+    """Patents gathered so far: the durable store first, then the in-memory index (newer fields win)."""
+    if factory.patent_store is not None:
+        yield from factory.patent_store.documents()
+    yield from factory.local_index.documents()
+
+
+class PatentSimilarityTool(ToolHandler):
+    # 수집된 특허 수가 이 비율보다 많이 늘었거나, 바뀐 채로 REFIT_INTERVAL 초가 지나면 다시 학습
+    REFIT_GROWTH = 0.1
+    REFIT_INTERVAL = 600.0
+
+    def __init__(self):
+        super().__init__("patent_similarity")
+        self.factory = get_api_client_factory()
+        self.description = (
+            "TF-IDF similarity over the patents fetched so far: nearest patents to one patent or text, "
+            "or all similar pairs in the collection (no KIPRIS API call)"
+        )
+        self.args_schema = PatentSimilarityArgs
+        # 색인이 바뀌었는지 (서명: 색인 갱신 횟수/문서 수, 저장소 갱신 횟수/문서 수)와 학습 시점의 규모
+        self._engine: t.Optional[TfidfSimilarityEngine] = None
+        self._signature: t.Optional[t.Tuple[int, ...]] = None
+        self._fitted_size = 0
+        self._fitted_at = 0.0
+        self._engine_lock = threading.Lock()
+
+    def _collection_signature(self) -> t.Tuple[int, ...]:
+        store = self.factory.patent_store
+        return (
+            self.factory.local_index.indexed,
+            len(self.factory.local_index),
+            store.upserts if store is not None else 0,
+            len(store) if store is not None else 0,
+        )
+
+    def _should_refit(self, signature: t.Tuple[int, ...]) -> bool:
+        size = signature[1] + signature[3]
+        return (
+            size > self._fitted_size * (1 + self.REFIT_GROWTH)
+            or time.monotonic() - self._fitted_at >= self.REFIT_INTERVAL
+        )
+
+    def get_engine(self, force: bool = False) -> TfidfSimilarityEngine:
+        """
+        Engine fitted over the collection.
+
+        Searches keep updating the index, so the engine is refitted only when the collection grew by
+        more than REFIT_GROWTH, when it changed more than REFIT_INTERVAL seconds after the last fit,
+        or (force) when the caller needs a patent the engine has not seen.
+        """
+        with self._engine_lock:
+            signature = self._collection_signature()
+            if self._engine is None or (signature != self._signature and (force or self._should_refit(signature))):
+                self._engine = TfidfSimilarityEngine().fit(collection_documents(self.factory))
+                self._signature = signature
+                self._fitted_size = signature[1] + signature[3]
+                self._fitted_at = time.monotonic()
+            return self._engine
+
+    def get_tool_description(self) -> Tool:
+        return self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "application_number": {
+                            "type": "string",
+                            "description": "기준 특허 출원번호 (text 와 둘 중 하나)",
+                        },
+                        "text": {"type": "string", "description": "기준 텍스트 (기술 설명, 초록 등)"},
+                        "mode": {
+                            "type": "string",
+                            "description": "nearest: 유사 특허, pairs: 유사 특허 쌍 전체",
+                            "enum": ["nearest", "pairs"],
+                            "default": "nearest",
+                        },
+                        "top_k": {"type": "integer", "description": "nearest 결과 수 (기본값: 10, 범위: 1-100)"},
+                        "threshold": {
+                            "type": "number",
+                            "description": "pairs 최소 유사도 (0-1, 기본값: 0.5)",
+                            "exclusiveMinimum": 0,
+                            "maximum": 1,
+                        },
+                        "docs_count": {"type": "integer", "description": "pairs 결과 수 (기본값: 50)"},
+                    },
+                },
+                metadata={
+                    "usage_hint": (
+                        "이미 검색/조회한 특허들 사이의 텍스트 유사도(TF-IDF 코사인)를 계산합니다. "
+                        "비교할 특허는 검색 도구나 patent_detail_search 로 먼저 받아 두세요."
+                    ),
+                    "example_user_queries": [
+                        "1020230045678 과 비슷한 특허를 찾아줘",
+                        "지금까지 찾은 특허 중 서로 매우 비슷한 것들을 묶어줘",
+                    ],
+                    "preferred_response_style": "유사도(score) 순으로 출원번호, 발명의 명칭, 출원인을 표로 정리해주세요.",
+                },
+            )
+        )
+
+    def _nearest_records(self, engine: TfidfSimilarityEngine, neighbours: t.List[t.Tuple[str, float]]) -> pd.DataFrame:
+        return pd.DataFrame(
+            [
+                {
+                    "applicationNumber": number,
+                    "inventionTitle": engine.document(number).get("inventionTitle"),
+                    "applicantName": engine.document(number).get("applicantName"),
+                    "score": round(score, 4),
+                }
+                for number, score in neighbours
+            ],
+            columns=["applicationNumber", "inventionTitle", "applicantName", "score"],
+        )
+
+    def run_tool(self, args: dict) -> Sequence[TextContent]:
+        try:
+            validated_args = PatentSimilarityArgs(**args)
+            engine = self.get_engine()
+            logger.info("Patent similarity (%s) over %d patents", validated_args.mode, len(engine))
+
+            if validated_args.mode == "pairs":
+                # 상위 docs_count 쌍만 힙에 유지 (전체 쌍을 정렬하려고 모으지 않음)
+                pairs = heapq.nlargest(
+                    max(validated_args.docs_count, 1),
+                    engine.similar_pairs(validated_args.threshold),
+                    key=lambda pair: pair[2],
+                )
+                records = pd.DataFrame(
+                    [
+                        {
+                            "source": source,
+                            "target": target,
+                            "score": round(score, 4),
+                            "sourceTitle": engine.document(source).get("inventionTitle"),
+                            "targetTitle": engine.document(target).get("inventionTitle"),
+                        }
+                        for source, target, score in pairs
+                    ]
+                )
+            elif validated_args.application_number:
+                if validated_args.application_number not in engine:
+                    # 학습 이후에 받은 특허일 수 있으므로 수집 내용이 바뀌었으면 다시 학습
+                    engine = self.get_engine(force=True)
+                if validated_args.application_number not in engine:
+                    return [
+                        TextContent(
+                            type="text",
+                            text=(
+                                f"{validated_args.application_number} 특허가 수집된 특허에 없습니다. "
+                                "patent_detail_search 로 먼저 조회하세요."
+                            ),
+                        )
+                    ]
+                top_k = max(min(validated_args.top_k, 100), 1)
+                records = self._nearest_records(engine, engine.nearest(validated_args.application_number, top_k))
+            elif validated_args.text:
+                top_k = max(min(validated_args.top_k, 100), 1)
+                records = self._nearest_records(engine, engine.nearest_to_text(validated_args.text, top_k))
+            else:
+                return [TextContent(type="text", text="application_number 또는 text 를 입력하세요.")]
+
+            if records.empty:
+                return self.render_empty(args, f"there is no result (patents: {len(engine)})")
+            return self.render_records(records, args)
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e)
+            return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
+        except Exception as e:
+            logger.error("Error occurred: %s", e)
+            return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
+
+    async def run_tool_async(self, args: dict) -> Sequence[TextContent]:
+        # 학습과 행렬 곱은 CPU 작업이라 이벤트 루프 밖(blocking executor)에서 실행
+        return await get_blocking_executor().run(contextvars.copy_context().run, self.run_tool, args)
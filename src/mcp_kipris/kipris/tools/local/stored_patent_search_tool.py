@@ -0,0 +1,99 @@
+import contextvars
+import logging
+from collections.abc import Sequence
+
+from mcp.types import TextContent, Tool
+from pydantic import BaseModel, Field, ValidationError
+
+from mcp_kipris.kipris.abc import ToolHandler
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
+from mcp_kipris.kipris.executor import get_blocking_executor
+
+logger = logging.getLogger("mcp-kipris")
+
+
+class StoredPatentSearchArgs(BaseModel):
+    query: str = Field("", description="검색어 (발명의 명칭, 출원인, 초록, 청구항). 비우면 필터만 적용")
+    applicant: str = Field("", description="출원인 이름 (부분 일치)")
+    ipc_prefix: str = Field("", description="IPC 코드 접두어 (예: H01M, H01M 10)")
+    date_from: str = Field("", description="출원일자 시작 (YYYYMMDD)")
+    date_to: str = Field("", description="출원일자 끝 (YYYYMMDD)")
+    docs_start: int = Field(1, description="검색 시작 위치 (기본값: 1)")
+    docs_count: int = Field(10, description="검색 결과 수 (기본값: 10, 범위: 1-100)")
+
+
+class StoredPatentSearchTool(ToolHandler):
+    def __init__(self):
+        super().__init__("stored_patent_search")
+        self.store = get_api_client_factory().patent_store
+        self.description = (
+            "full-text search with applicant / IPC / date filters over the local patent store "
+            "(patents fetched earlier, kept across restarts; no KIPRIS API call)"
+        )
+        self.args_schema = StoredPatentSearchArgs
+
+    def get_tool_description(self) -> Tool:
+        return self.with_output_options(
+            Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "검색어 (발명의 명칭, 출원인, 초록, 청구항). 비우면 필터만 적용",
+                        },
+                        "applicant": {"type": "string", "description": "출원인 이름 (부분 일치)"},
+                        "ipc_prefix": {"type": "string", "description": "IPC 코드 접두어 (예: H01M, H01M 10)"},
+                        "date_from": {"type": "string", "description": "출원일자 시작 (YYYYMMDD)"},
+                        "date_to": {"type": "string", "description": "출원일자 끝 (YYYYMMDD)"},
+                        "docs_start": {"type": "integer", "description": "검색 시작 위치 (기본값: 1)"},
+                        "docs_count": {"type": "integer", "description": "검색 결과 수 (기본값: 10, 범위: 1-100)"},
+                    },
+                },
+                metadata={
+                    "usage_hint": (
+                        "이전 세션까지 포함해 이미 받은 특허를 KIPRIS 호출 없이 검색합니다. "
+                        "출원인, IPC, 출원일자 범위로 좁힐 수 있습니다."
+                    ),
+                    "example_user_queries": [
+                        "저장된 특허 중 H01M 분류의 2023년 출원 건을 보여줘",
+                        "지난번에 찾은 삼성전자 반도체 패키지 특허 다시 보여줘",
+                    ],
+                    "preferred_response_style": "출원번호, 출원일자, 발명의 명칭, 출원인, IPC를 표로 정리해주세요.",
+                },
+            )
+        )
+
+    def run_tool(self, args: dict) -> Sequence[TextContent]:
+        try:
+            validated_args = StoredPatentSearchArgs(**args)
+            if self.store is None:
+                return [TextContent(type="text", text="특허 저장소가 꺼져 있습니다 (KIPRIS_PATENT_STORE 설정 필요).")]
+            logger.info("Searching patent store: %s", validated_args.query)
+
+            total, records = self.store.search(
+                validated_args.query,
+                applicant=validated_args.applicant or None,
+                ipc_prefix=validated_args.ipc_prefix or None,
+                date_from=validated_args.date_from or None,
+                date_to=validated_args.date_to or None,
+                docs_start=validated_args.docs_start,
+                docs_count=max(min(validated_args.docs_count, 100), 1),
+            )
+            logger.debug("patent store matches: %d", total)
+            if records.empty:
+                return self.render_empty(args, "there is no result")
+            return self.render_records(records, args)
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e)
+            return [TextContent(type="text", text=f"입력값 검증 오류: {str(e)}")]
+        except Exception as e:
+            logger.error("Error occurred: %s", e)
+            return [TextContent(type="text", text=f"오류가 발생했습니다: {str(e)}")]
+
+    async def run_tool_async(self, args: dict) -> Sequence[TextContent]:
+        # COUNT(*) 와 FTS/LIKE 조회는 다른 워커와 저장 스레드가 함께 쓰는 DB 를 읽으므로 blocking executor 에서 실행
+        return await get_blocking_executor().run(contextvars.copy_context().run, self.run_tool, args)
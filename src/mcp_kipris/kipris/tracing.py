@@ -0,0 +1,306 @@
+"""
+Lightweight tracing for tool calls.
+
+Spans cover the stages of a call (tool, rate-limit wait, HTTP connect/send/receive, XML parse,
+record construction, rendering) and are exported as OTLP/JSON, either appended to a local file
+(one ExportTraceServiceRequest per line) or POSTed to an OTLP/HTTP collector (/v1/traces).
+The active trace and span ids are added to log records from the "mcp-kipris" logger.
+
+Tracing is off unless KIPRIS_TRACE_FILE or KIPRIS_TRACE_ENDPOINT is set; span() is then a no-op.
+"""
+
+import atexit
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+import typing as t
+
+import httpx
+
+logger = logging.getLogger("mcp-kipris")
+
+SERVICE_NAME = "mcp-kipris"
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "start_ns", "end_ns", "attributes", "status", "_tracer")
+
+    def __init__(self, tracer: "Tracer", name: str, trace_id: str, parent_id: t.Optional[str], attributes: t.Dict):
+        self._tracer = tracer
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.end_ns: t.Optional[int] = None
+        self.attributes = attributes
+        self.status = STATUS_OK
+
+    def set_attribute(self, key: str, value: t.Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, error: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.attributes["error.type"] = type(error).__name__
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self._tracer.export(self)
+
+    def to_otlp(self) -> t.Dict[str, t.Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": self.status},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class _NoopSpan:
+    """Stand-in when tracing is off or the trace is not sampled."""
+
+    trace_id = span_id = None
+
+    def set_attribute(self, key: str, value: t.Any) -> None:
+        pass
+
+    def set_error(self, error: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+_current_span: contextvars.ContextVar[t.Union[Span, _NoopSpan, None]] = contextvars.ContextVar(
+    "kipris_current_span", default=None
+)
+
+
+def _otlp_attribute(key: str, value: t.Any) -> t.Dict[str, t.Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class Tracer:
+    """Creates spans and exports finished ones in batches from a background thread."""
+
+    def __init__(
+        self,
+        file_path: t.Optional[str] = None,
+        endpoint: t.Optional[str] = None,
+        sample_rate: float = 1.0,
+        flush_interval: float = 5.0,
+        max_batch: int = 512,
+    ):
+        """
+        Initialize tracer.
+
+        Args:
+            file_path: Append OTLP/JSON export requests to this file
+            endpoint: OTLP/HTTP collector base URL (spans are POSTed to <endpoint>/v1/traces)
+            sample_rate: Fraction of root spans (tool calls) that are recorded
+            flush_interval: Seconds between exports
+            max_batch: Spans per export request
+        """
+        self.file_path = file_path
+        self.endpoint = endpoint.rstrip("/") + "/v1/traces" if endpoint else None
+        self.sample_rate = sample_rate
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.exported = 0
+        self.dropped = 0
+        self._queue: "queue.Queue[Span]" = queue.Queue(maxsize=max_batch * 20)
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="kipris-trace-export", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def start_span(self, name: str, parent: t.Union[Span, _NoopSpan, None] = None, **attributes: t.Any):
+        """Start a span under parent (a new sampled-or-not trace when parent is None)."""
+        if parent is NOOP_SPAN:
+            return NOOP_SPAN
+        if parent is None:
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                return NOOP_SPAN
+            return Span(self, name, f"{random.getrandbits(128):032x}", None, attributes)
+        return Span(self, name, parent.trace_id, parent.span_id, attributes)
+
+    def export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """Export every queued span."""
+        with self._flush_lock:
+            while True:
+                batch = []
+                while len(batch) < self.max_batch:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if not batch:
+                    return
+                self._write(batch)
+
+    def _write(self, batch: t.List[Span]) -> None:
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", SERVICE_NAME)]},
+                    "scopeSpans": [{"scope": {"name": "mcp_kipris"}, "spans": [span.to_otlp() for span in batch]}],
+                }
+            ]
+        }
+        try:
+            if self.file_path:
+                with open(self.file_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            if self.endpoint:
+                httpx.post(self.endpoint, json=payload, timeout=5.0).raise_for_status()
+            self.exported += len(batch)
+        except (OSError, httpx.HTTPError) as e:
+            self.dropped += len(batch)
+            logger.error("trace export failed: %s", e)
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        self.flush()
+
+
+# Global tracer instance (False: 환경 변수를 확인했고 tracing이 꺼져 있음)
+_tracer: t.Union[Tracer, None, bool] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> t.Optional[Tracer]:
+    """
+    Get the tracer configured from KIPRIS_TRACE_FILE, KIPRIS_TRACE_ENDPOINT and KIPRIS_TRACE_SAMPLE_RATE.
+
+    Returns:
+        Tracer instance, or None when tracing is off
+    """
+    global _tracer
+
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                file_path = os.getenv("KIPRIS_TRACE_FILE") or None
+                endpoint = os.getenv("KIPRIS_TRACE_ENDPOINT") or None
+                if file_path or endpoint:
+                    _tracer = Tracer(
+                        file_path=file_path,
+                        endpoint=endpoint,
+                        sample_rate=float(os.getenv("KIPRIS_TRACE_SAMPLE_RATE", "1.0")),
+                    )
+                    logger.info("Tracing enabled (file=%s, endpoint=%s)", file_path, endpoint)
+                else:
+                    _tracer = False
+    return _tracer or None
+
+
+def set_tracer(tracer: t.Optional[Tracer]) -> None:
+    """Install a tracer (None switches tracing off); mainly for tests."""
+    global _tracer
+
+    _tracer = tracer if tracer is not None else False
+
+
+def current_span() -> t.Union[Span, _NoopSpan, None]:
+    return _current_span.get()
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: t.Any) -> t.Iterator[t.Union[Span, _NoopSpan]]:
+    """
+    Record the enclosed block as a child of the current span (or as a new trace).
+
+    Yields a span whose set_attribute() can add details; exceptions mark the span as failed.
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        yield NOOP_SPAN
+        return
+    new_span = tracer.start_span(name, current_span(), **attributes)
+    token = _current_span.set(new_span)
+    try:
+        yield new_span
+    except BaseException as e:
+        new_span.set_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        new_span.end()
+
+
+def httpx_trace_extension() -> t.Optional[t.Dict[str, t.Any]]:
+    """
+    httpx request extension that records httpcore connection stages as child spans of the current span.
+
+    Stages: connect_tcp (DNS resolution + TCP connect), start_tls, send_request_headers/body,
+    receive_response_headers/body. Returns None when no span is recording.
+    """
+    parent = current_span()
+    tracer = get_tracer()
+    if tracer is None or parent is None or parent is NOOP_SPAN:
+        return None
+    open_spans: t.Dict[str, t.Union[Span, _NoopSpan]] = {}
+
+    async def trace(event_name: str, info: t.Dict[str, t.Any]) -> None:
+        stage, _, phase = event_name.rpartition(".")
+        if phase == "started":
+            open_spans[stage] = tracer.start_span(stage.split(".", 1)[-1], parent)
+        elif phase in ("complete", "failed") and stage in open_spans:
+            stage_span = open_spans.pop(stage)
+            if phase == "failed":
+                stage_span.set_error(info.get("exception") or RuntimeError(event_name))
+            stage_span.end()
+
+    return {"trace": trace}
+
+
+class TraceContextFilter(logging.Filter):
+    """Adds trace_id/span_id attributes to log records and prefixes messages logged inside a span."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        active = _current_span.get()
+        record.trace_id = getattr(active, "trace_id", None) or ""
+        record.span_id = getattr(active, "span_id", None) or ""
+        if record.trace_id and not getattr(record, "_trace_prefixed", False):
+            record.msg = f"[trace={record.trace_id} span={record.span_id}] {record.msg}"
+            record._trace_prefixed = True
+        return True
+
+
+logger.addFilter(TraceContextFilter())
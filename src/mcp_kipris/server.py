@@ -11,6 +11,11 @@ from mcp.server.stdio import stdio_server
 from mcp.types import EmbeddedResource, ImageContent, TextContent, Tool
 
 from mcp_kipris.kipris.abc import ToolHandler
+from mcp_kipris.kipris.executor import execute_tool
+from mcp_kipris.kipris.logging_utils import configure_logging
+from mcp_kipris.kipris.metrics import start_metrics_exporter_from_env
+from mcp_kipris.kipris.prefetch import get_prefetcher
+from mcp_kipris.kipris.profiler import install_signal_handler
 from mcp_kipris.kipris.tools import (
     ForeignPatentApplicantSearchTool,
     ForeignPatentApplicationNumberSearchTool,
@@ -28,11 +33,15 @@ from mcp_kipris.kipris.tools import (
     KoreanIpcSearchTool,
     KoreanAgentSearchTool,
     KoreanTrademarkSearchTool,
+    LocalPatentSearchTool,
+    PatentSimilarityTool,
+    StoredPatentSearchTool,
 )
 
 load_dotenv(override=True)
 
-logging.basicConfig(level=logging.DEBUG)
+# 큐 기반 로그 파이프라인: LOG_LEVEL, KIPRIS_LOG_FORMAT(text|json), KIPRIS_LOG_SAMPLE_RATE
+configure_logging()
 logger = logging.getLogger("mcp-kipris")
 
 api_key = os.getenv("KIPRIS_API_KEY")
@@ -49,14 +58,14 @@ def add_tool_handler(tool_class: ToolHandler):
     global tool_handlers
 
     tool_handlers[tool_class.name] = tool_class
-    logger.info(f"Tool handler added: {tool_class.name}")
+    logger.info("Tool handler added: %s", tool_class.name)
 
 
 def get_tool_handler(name: str) -> ToolHandler | None:
-    logger.info(f"Tool handler find: {name}")
+    logger.debug("Tool handler find: %s", name)
     if name not in tool_handlers:
         return None
-    logger.info(f"Tool handler found: {name}")
+    logger.debug("Tool handler found: %s", name)
     return tool_handlers[name]
 
 
@@ -76,11 +85,14 @@ add_tool_handler(ForeignPatentApplicationNumberSearchTool())
 add_tool_handler(ForeignPatentFreeSearchTool())
 add_tool_handler(ForeignPatentInternationalApplicationNumberSearchTool())
 add_tool_handler(ForeignPatentInternationalOpenNumberSearchTool())
+add_tool_handler(LocalPatentSearchTool())
+add_tool_handler(StoredPatentSearchTool())
+add_tool_handler(PatentSimilarityTool())
 
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
-    logger.info(f"Tool handler list: {tool_handlers.values()}")
+    logger.debug("Tool handler list: %s", tool_handlers.values())
     return [tool.get_tool_description() for tool in tool_handlers.values()]
 
 
@@ -96,39 +108,43 @@ async def call_tool(tool_name: str, args: dict) -> Sequence[TextContent | ImageC
 
     try:
         # 비동기 메서드(run_tool_async)를 사용하여 타임아웃 및 응답 시간 개선
-        logger.info(f"비동기 실행 시작: {tool_name}")
+        logger.info("비동기 실행 시작: %s", tool_name)
         start_time = datetime.datetime.now()
 
-        try:
-            # 먼저 비동기 메서드 시도
-            result = await tool_handler.run_tool_async(args)
-        except (AttributeError, NotImplementedError) as e:
-            # 비동기 메서드가 없거나 구현되지 않은 경우 동기 메서드로 폴백
-            logger.warning(f"비동기 메서드 실패, 동기 메서드로 폴백: {str(e)}")
-            result = tool_handler.run_tool(args)
+        # run_tool_async 우선, 동기 run_tool 폴백은 제한된 스레드 풀에서 실행
+        result = await execute_tool(tool_handler, args)
 
         end_time = datetime.datetime.now()
         elapsed_time = (end_time - start_time).total_seconds()
-        logger.info(f"도구 실행 완료: {tool_name}, 소요시간: {elapsed_time:.2f}초")
+        logger.info("도구 실행 완료: %s, 소요시간: %.2f초", tool_name, elapsed_time)
 
         return result
     except Exception as e:
-        logger.error(f"도구 실행 중 오류 발생: {str(e)}")
+        logger.error("도구 실행 중 오류 발생: %s", e)
         raise RuntimeError(f"Caught Exception. Error: {str(e)}")
 
 
 async def main():
     logger.info("Starting MCP KIPRIS server...")
+    # stdio 모드에는 HTTP 앱이 없으므로 KIPRIS_METRICS_FILE / KIPRIS_METRICS_PORT로 메트릭 내보내기
+    start_metrics_exporter_from_env()
+    # kill -USR1 <pid> 로 KIPRIS_PROFILE_SECONDS 동안 샘플링 프로파일을 KIPRIS_PROFILE_DIR에 기록
+    install_signal_handler()
     try:
         async with stdio_server() as (read_stream, write_stream):
             logger.info("stdio_server initialized")
             init_options = app.create_initialization_options()
-            logger.info(f"Initialization options created: {init_options}")
+            logger.info("Initialization options created: %s", init_options)
             await app.run(read_stream, write_stream, init_options)
             # app.run(read_stream, write_stream, init_options)
     except Exception as e:
-        logger.error(f"Error occurred: {str(e)}")
+        logger.error("Error occurred: %s", e)
         raise RuntimeError(f"Caught Exception. Error: {str(e)}")
+    finally:
+        # 클라이언트가 연결을 끊으면 남은 상세 정보 미리 받기도 취소
+        prefetcher = get_prefetcher()
+        if prefetcher is not None:
+            prefetcher.cancel_all()
 
 
 if __name__ == "__main__":
@@ -1,24 +1,56 @@
 import argparse
+import asyncio
+import contextlib
 import datetime
+import hmac
 import json
 import logging
+import math
 import os
 import sys
-from collections.abc import Sequence
-from typing import List
+import time
+from collections.abc import AsyncIterator, Sequence
+import typing as t
+from typing import Awaitable, List, TypeVar
+
+import anyio
 
 import uvicorn
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from dotenv import find_dotenv, load_dotenv
 from mcp.server import Server
 from mcp.server.sse import SseServerTransport
 from mcp.server.stdio import stdio_server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.shared.message import SessionMessage
 from mcp.types import EmbeddedResource, ImageContent, TextContent, Tool
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 from starlette.routing import Mount, Route
-
-from mcp_kipris.kipris.abc import ToolHandler
+from starlette.middleware import Middleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mcp_kipris.kipris.abc import (
+    OUTPUT_FORMATS,
+    ToolHandler,
+    set_default_output_format,
+    set_default_result_token_budget,
+)
+from mcp_kipris.kipris.admission import get_admission_controller
+from mcp_kipris.kipris.errors import KiprisBusyError
+from mcp_kipris.kipris.executor import execute_tool
+from mcp_kipris.kipris.logging_utils import configure_logging
+from mcp_kipris.kipris.metrics import (
+    HTTP_DURATION,
+    HTTP_REQUESTS,
+    get_metrics_registry,
+    monitor_event_loop_lag,
+    start_metrics_exporter_from_env,
+)
+from mcp_kipris.kipris.prefetch import get_prefetcher
+from mcp_kipris.kipris.profiler import MAX_PROFILE_SECONDS, ProfilerBusyError, install_signal_handler, profile
+from mcp_kipris.kipris.shared_state import default_shared_state_path
 from mcp_kipris.kipris.tools import (
     ForeignPatentApplicantSearchTool,
     ForeignPatentApplicationNumberSearchTool,
@@ -32,11 +64,15 @@ from mcp_kipris.kipris.tools import (
     KoreanPatentRighterSearchTool,
     KoreanPatentSearchTool,
     KoreanPatentSummarySearchTool,
+    LocalPatentSearchTool,
+    PatentSimilarityTool,
+    StoredPatentSearchTool,
 )
 
 _ = load_dotenv(find_dotenv(".env"))
 
-logging.basicConfig(level=logging.DEBUG)
+# 큐 기반 로그 파이프라인: LOG_LEVEL, KIPRIS_LOG_FORMAT(text|json), KIPRIS_LOG_SAMPLE_RATE
+configure_logging()
 logger = logging.getLogger("mcp-kipris")
 
 api_key = os.getenv("KIPRIS_API_KEY")
@@ -53,14 +89,14 @@ def add_tool_handler(tool_class: ToolHandler):
     global tool_handlers
 
     tool_handlers[tool_class.name] = tool_class
-    logger.info(f"Tool handler added: {tool_class.name}")
+    logger.info("Tool handler added: %s", tool_class.name)
 
 
 def get_tool_handler(name: str) -> ToolHandler | None:
-    logger.info(f"Tool handler find: {name}")
+    logger.debug("Tool handler find: %s", name)
     if name not in tool_handlers:
         return None
-    logger.info(f"Tool handler found: {name}")
+    logger.debug("Tool handler found: %s", name)
     return tool_handlers[name]
 
 
@@ -76,11 +112,14 @@ add_tool_handler(ForeignPatentApplicationNumberSearchTool())
 add_tool_handler(ForeignPatentFreeSearchTool())
 add_tool_handler(ForeignPatentInternationalApplicationNumberSearchTool())
 add_tool_handler(ForeignPatentInternationalOpenNumberSearchTool())
+add_tool_handler(LocalPatentSearchTool())
+add_tool_handler(StoredPatentSearchTool())
+add_tool_handler(PatentSimilarityTool())
 
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
-    logger.info(f"Tool handler list: {tool_handlers.values()}")
+    logger.debug("Tool handler list: %s", tool_handlers.values())
     return [tool.get_tool_description() for tool in tool_handlers.values()]
 
 
@@ -94,27 +133,26 @@ async def call_tool(tool_name: str, args: dict) -> Sequence[TextContent | ImageC
     if not tool_handler:
         raise ValueError(f"Unknown tool: {tool_name}")
 
-    try:
-        # 비동기 메서드(run_tool_async)를 사용하여 타임아웃 및 응답 시간 개선
-        logger.info(f"비동기 실행 시작: {tool_name}")
-        start_time = datetime.datetime.now()
-
+    # 동시 실행 한도를 넘으면 대기열에 쌓지 않고 바로 KiprisBusyError
+    with get_admission_controller().call():
         try:
-            # 먼저 비동기 메서드 시도
-            result = await tool_handler.run_tool_async(args)
-        except (AttributeError, NotImplementedError) as e:
-            # 비동기 메서드가 없거나 구현되지 않은 경우 동기 메서드로 폴백
-            logger.warning(f"비동기 메서드 실패, 동기 메서드로 폴백: {str(e)}")
-            result = tool_handler.run_tool(args)
+            # 비동기 메서드(run_tool_async)를 사용하여 타임아웃 및 응답 시간 개선
+            logger.info("비동기 실행 시작: %s", tool_name)
+            start_time = datetime.datetime.now()
+
+            # run_tool_async 우선, 동기 run_tool 폴백은 제한된 스레드 풀에서 실행
+            result = await execute_tool(tool_handler, args)
 
-        end_time = datetime.datetime.now()
-        elapsed_time = (end_time - start_time).total_seconds()
-        logger.info(f"도구 실행 완료: {tool_name}, 소요시간: {elapsed_time:.2f}초")
+            end_time = datetime.datetime.now()
+            elapsed_time = (end_time - start_time).total_seconds()
+            logger.info("도구 실행 완료: %s, 소요시간: %.2f초", tool_name, elapsed_time)
 
-        return result
-    except Exception as e:
-        logger.error(f"도구 실행 중 오류 발생: {str(e)}")
-        raise RuntimeError(f"Caught Exception. Error: {str(e)}")
+            return result
+        except KiprisBusyError:
+            raise
+        except Exception as e:
+            logger.error("도구 실행 중 오류 발생: %s", e)
+            raise RuntimeError(f"Caught Exception. Error: {str(e)}")
 
 
 def tool_to_dict(tool: Tool) -> dict:
@@ -152,19 +190,276 @@ def content_to_dict(content: TextContent | ImageContent | EmbeddedResource) -> d
         raise ValueError(f"Unknown content type: {type(content)}")
 
 
+# /tools/batch 요청당 최대 호출 수와 동시 실행 수
+BATCH_MAX_CALLS = int(os.getenv("KIPRIS_BATCH_MAX_CALLS", "100"))
+BATCH_CONCURRENCY = int(os.getenv("KIPRIS_BATCH_CONCURRENCY", "8"))
+
+
+def parse_tool_message(body: object, *, require_type: bool = True) -> tuple[str, dict]:
+    """
+    Validate a ``{"type": "tool", "name": ..., "args": {...}}`` message.
+
+    Args:
+        body: Decoded JSON message
+        require_type: Whether ``"type": "tool"`` must be present (batch items may omit it)
+
+    Returns:
+        (tool name, arguments)
+
+    Raises:
+        ValueError: If the message is malformed
+    """
+    if not isinstance(body, dict):
+        raise ValueError("Message must be a dictionary")
+    message_type = body.get("type")
+    if message_type != "tool" and (require_type or message_type is not None):
+        raise ValueError("Invalid message type")
+    tool_name = body.get("name")
+    if not tool_name:
+        raise ValueError("Tool name is required")
+    args = body.get("args", {})
+    if not isinstance(args, dict):
+        raise ValueError("Arguments must be a dictionary")
+    return tool_name, args
+
+
+async def iter_batch_results(calls: Sequence[dict], concurrency: int = BATCH_CONCURRENCY) -> AsyncIterator[dict]:
+    """
+    Run tool calls concurrently and yield each result as soon as it completes.
+
+    Calls go through call_tool, so they share the API client factory's rate limiter, cache and
+    the blocking executor with every other request. Pending calls are cancelled if the consumer
+    stops early (e.g. the HTTP client disconnects).
+
+    Args:
+        calls: Validated batch items (``name``, ``args`` and an optional client ``id``)
+        concurrency: Maximum calls running at once
+
+    Yields:
+        ``{"index", "id", "name", "ok", "content" | "error", "elapsed"}`` in completion order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(index: int, call: dict) -> dict:
+        async with semaphore:
+            started = time.perf_counter()
+            result = {"index": index, "id": call.get("id"), "name": call["name"]}
+            try:
+                contents = await call_tool(call["name"], call.get("args", {}))
+                result.update(ok=True, content=[content_to_dict(content) for content in contents])
+            except Exception as e:
+                result.update(ok=False, error=str(e))
+            result["elapsed"] = round(time.perf_counter() - started, 4)
+            return result
+
+    tasks = [asyncio.create_task(run_one(index, call)) for index, call in enumerate(calls)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+T = TypeVar("T")
+
+
+async def run_until_disconnect(
+    mcp_server: Server,
+    read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
+    write_stream: MemoryObjectSendStream[SessionMessage],
+) -> None:
+    """
+    Run an MCP session and cancel its in-flight requests as soon as the client goes away.
+
+    Server.run waits for running request handlers after the incoming stream closes, so without
+    this a disconnected client's tool calls keep their upstream requests and rate-limit slots
+    until they finish. Messages are forwarded through a proxy stream; when the client stream
+    ends the whole session scope is cancelled, which propagates into run_tool_async and the
+    in-flight httpx requests.
+    """
+    proxy_writer, proxy_reader = anyio.create_memory_object_stream[SessionMessage | Exception](0)
+    async with anyio.create_task_group() as tg:
+
+        async def forward() -> None:
+            async with proxy_writer:
+                async for message in read_stream:
+                    await proxy_writer.send(message)
+            logger.info("🔌 [SSE] Client disconnected, cancelling in-flight tool calls")
+            tg.cancel_scope.cancel()
+
+        tg.start_soon(forward)
+        await mcp_server.run(proxy_reader, write_stream, mcp_server.create_initialization_options())
+        tg.cancel_scope.cancel()
+
+
+class ClientDisconnected(Exception):
+    """The HTTP client went away before its tool call finished."""
+
+
+async def cancel_on_disconnect(request: Request, awaitable: Awaitable[T]) -> T:
+    """
+    Await a plain HTTP handler's work, cancelling it if the client disconnects first.
+
+    Must be called after the request body has been read; the next ASGI message is then the disconnect.
+
+    Raises:
+        ClientDisconnected: If the work was cancelled because the client disconnected
+    """
+    task = asyncio.ensure_future(awaitable)
+    disconnected = False
+
+    async def watch() -> None:
+        nonlocal disconnected
+        while (await request.receive())["type"] != "http.disconnect":
+            pass
+        if not task.done():
+            logger.info("HTTP client disconnected, cancelling tool call")
+            disconnected = True
+            task.cancel()
+
+    watcher = asyncio.create_task(watch())
+    try:
+        return await task
+    except asyncio.CancelledError:
+        if disconnected and not asyncio.current_task().cancelling():
+            raise ClientDisconnected()
+        task.cancel()
+        raise
+    finally:
+        watcher.cancel()
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency and status per route (unknown paths grouped as "other")."""
+
+    def __init__(self, app: ASGIApp, paths: t.Iterable[str]):
+        self.app = app
+        self.paths = set(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"].rstrip("/") or "/"
+        path = path if path in self.paths else "/messages" if path.startswith("/messages") else "other"
+        status = "500"
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_DURATION.observe(time.perf_counter() - started, path)
+            HTTP_REQUESTS.inc(path, status)
+
+
+def busy_response(error: KiprisBusyError, status_code: int) -> Response:
+    """429/503 response for work rejected by admission control, with a Retry-After hint."""
+    return JSONResponse(
+        error.to_dict(),
+        status_code=status_code,
+        headers={"Retry-After": str(math.ceil(error.retry_after))},
+    )
+
+
+async def read_body(receive: Receive) -> bytes:
+    """Read the whole HTTP request body from an ASGI receive channel."""
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def replay_body(body: bytes, receive: Receive) -> Receive:
+    """Receive channel that yields an already-read body once, then defers to the original channel."""
+    sent = False
+
+    async def replay() -> dict:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+def is_tool_call(body: bytes) -> bool:
+    """True when a JSON-RPC message (or any message of a batch) is a tools/call request."""
+    try:
+        message = json.loads(body)
+    except ValueError:
+        return False
+    messages = message if isinstance(message, list) else [message]
+    return any(isinstance(item, dict) and item.get("method") == "tools/call" for item in messages)
+
+
+class StreamableHTTPEndpoint:
+    """ASGI endpoint for the streamable HTTP transport (routed at /mcp without a trailing-slash redirect)."""
+
+    def __init__(self, session_manager: StreamableHTTPSessionManager):
+        self.session_manager = session_manager
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["method"] == "POST":
+            body = await read_body(receive)
+            # initialize, tools/list, 알림은 바쁠 때도 통과시켜야 클라이언트가 연결할 수 있음
+            if is_tool_call(body):
+                try:
+                    get_admission_controller().check_calls()
+                except KiprisBusyError as e:
+                    await busy_response(e, 429)(scope, receive, send)
+                    return
+            receive = replay_body(body, receive)
+        await self.session_manager.handle_request(scope, receive, send)
+
+
 def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlette:
-    """Create a Starlette application that can serve the provided mcp server with SSE."""
+    """
+    Create a Starlette application that serves the provided mcp server over SSE and streamable HTTP.
+
+    The streamable HTTP transport at /mcp is stateless and answers with plain JSON, so each tool
+    call is a single request/response and any worker or replica can serve it (no sticky sessions).
+    """
     sse = SseServerTransport("/messages/")
+    # 요청마다 새 transport를 만들고 세션 상태를 남기지 않음 → 로드 밸런싱 시 sticky session 불필요
+    session_manager = StreamableHTTPSessionManager(app=mcp_server, stateless=True, json_response=True)
+    streamable_http = StreamableHTTPEndpoint(session_manager)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette):
+        # 이벤트 루프 지연 측정 (/metrics 의 kipris_event_loop_lag_seconds)
+        lag_monitor = asyncio.create_task(monitor_event_loop_lag())
+        try:
+            async with session_manager.run():
+                yield
+        finally:
+            lag_monitor.cancel()
+            prefetcher = get_prefetcher()
+            if prefetcher is not None:
+                prefetcher.cancel_all()
 
     async def well_known_mcp(request):
         body = json.dumps(
             {
                 "mcpVersion": "2024-01-01",
-                "capabilities": ["sse"],
+                "capabilities": ["sse", "streamable-http"],
                 "sse": {
                     "url": "https://psm.greennuri.info/sse",
                     "message_url": "https://psm.greennuri.info/messages",
                 },
+                "streamable_http": {"url": "https://psm.greennuri.info/mcp"},
             }
         )
         # content-length 직접 지정 + charset 지정 + no chunk
@@ -212,23 +507,59 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
             headers={"Content-Length": str(len(body.encode("utf-8")))},
         )
 
-    async def handle_sse(request: Request) -> Response:
+    async def serve_sse(request: Request) -> Response:
         try:
             logger.info("🔗 [SSE] New connection request received")
             async with sse.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
                 logger.info("✅ [SSE] Connected, running MCP server...")
-                await mcp_server.run(
-                    read_stream,
-                    write_stream,
-                    mcp_server.create_initialization_options(),
-                )
+                await run_until_disconnect(mcp_server, read_stream, write_stream)
                 logger.info("🔥 MCP server run() completed")
             logger.info("🔌 [SSE] Disconnected cleanly")
             return Response(status_code=204)
         except Exception as e:
-            logger.error(f"❌ [SSE] Connection error: {str(e)}")
+            logger.error("❌ [SSE] Connection error: %s", e)
             return Response(status_code=500)
 
+    async def handle_sse(request: Request) -> Response:
+        try:
+            with get_admission_controller().session():
+                return await serve_sse(request)
+        except KiprisBusyError as e:
+            return busy_response(e, 503)
+
+    async def metrics(request: Request) -> Response:
+        """Prometheus 텍스트 형식의 메트릭 엔드포인트"""
+        return PlainTextResponse(get_metrics_registry().render(), media_type="text/plain; version=0.0.4")
+
+    async def admin_profile(request: Request) -> Response:
+        """
+        실행 중인 프로세스를 샘플링 프로파일링하고 collapsed-stack 형식(flamegraph.pl, speedscope)으로 반환하는 관리자 엔드포인트.
+
+        KIPRIS_ADMIN_TOKEN이 설정된 경우에만 열리며 ``Authorization: Bearer <token>`` 이 필요합니다.
+        쿼리: seconds(기본 10, 최대 120), interval_ms(기본 5)
+        """
+        token = os.getenv("KIPRIS_ADMIN_TOKEN")
+        if not token:
+            return Response(status_code=404)
+        supplied = request.headers.get("authorization", "").removeprefix("Bearer ")
+        if not hmac.compare_digest(supplied.encode("utf-8"), token.encode("utf-8")):
+            return Response(status_code=401, headers={"WWW-Authenticate": "Bearer"})
+        try:
+            seconds = float(request.query_params.get("seconds", "10"))
+            interval = float(request.query_params.get("interval_ms", "5")) / 1000
+        except ValueError:
+            return Response(status_code=400, content="seconds and interval_ms must be numbers")
+        if not 0 < seconds <= MAX_PROFILE_SECONDS or not 0 < interval <= 1:
+            return Response(
+                status_code=400, content=f"seconds must be in (0, {MAX_PROFILE_SECONDS:.0f}], interval_ms in (0, 1000]"
+            )
+        try:
+            # 샘플링은 별도 스레드에서 실행되므로 이벤트 루프는 프로파일 중에도 요청을 계속 처리
+            collapsed = await anyio.to_thread.run_sync(profile, seconds, interval)
+        except ProfilerBusyError as e:
+            return Response(status_code=409, content=str(e))
+        return PlainTextResponse(collapsed)
+
     async def list_tools(request: Request) -> JSONResponse:
         """도구 목록을 JSON 형식으로 반환하는 엔드포인트"""
         tools = [tool.get_tool_description() for tool in tool_handlers.values()]
@@ -239,45 +570,111 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
         """메시지를 처리하는 엔드포인트"""
         try:
             body = await request.json()
-            logger.debug(f"Received message: {body}")
-
-            if not isinstance(body, dict):
-                logger.error(f"Message is not a dictionary: {body}")
-                return Response(status_code=400, content="Message must be a dictionary")
-
-            message_type = body.get("type")
-            if message_type != "tool":
-                logger.error(f"Invalid message type: {message_type}")
-                return Response(status_code=400, content="Invalid message type")
-
-            tool_name = body.get("name")
-            if not tool_name:
-                logger.error("Tool name is missing")
-                return Response(status_code=400, content="Tool name is required")
+            logger.debug("Received message: %s", body)
 
-            args = body.get("args", {})
-            if not isinstance(args, dict):
-                logger.error(f"Arguments must be a dictionary: {args}")
-                return Response(status_code=400, content="Arguments must be a dictionary")
+            try:
+                tool_name, args = parse_tool_message(body)
+            except ValueError as e:
+                logger.error("Invalid message: %s", e)
+                return Response(status_code=400, content=str(e))
 
-            logger.info(f"Processing tool call: {tool_name} with args: {args}")
-            result = await call_tool(tool_name, args)
+            logger.info("Processing tool call: %s with args: %s", tool_name, args)
+            result = await cancel_on_disconnect(request, call_tool(tool_name, args))
             result_dicts = [content_to_dict(content) for content in result]
             return JSONResponse(result_dicts)
+        except KiprisBusyError as e:
+            return busy_response(e, 429)
+        except ClientDisconnected:
+            return Response(status_code=499)
         except Exception as e:
-            logger.error(f"Error processing message: {str(e)}")
+            logger.error("Error processing message: %s", e)
             return Response(status_code=500, content=f"Error: {str(e)}")
 
+    async def handle_batch(request: Request) -> Response:
+        """여러 도구 호출을 동시에 실행하고 완료되는 순서대로 NDJSON으로 스트리밍하는 엔드포인트"""
+        try:
+            body = await request.json()
+        except ValueError:
+            return Response(status_code=400, content="Body must be JSON")
+        if not isinstance(body, list) or not body:
+            return Response(status_code=400, content="Body must be a non-empty array of tool calls")
+        if len(body) > BATCH_MAX_CALLS:
+            return Response(status_code=413, content=f"Batch is limited to {BATCH_MAX_CALLS} calls")
+
+        calls = []
+        for index, item in enumerate(body):
+            try:
+                tool_name, args = parse_tool_message(item, require_type=False)
+            except ValueError as e:
+                return Response(status_code=400, content=f"calls[{index}]: {str(e)}")
+            calls.append({"id": item.get("id"), "name": tool_name, "args": args})
+
+        try:
+            get_admission_controller().check_calls()
+        except KiprisBusyError as e:
+            return busy_response(e, 429)
+
+        logger.info("Processing batch of %s tool calls", len(calls))
+
+        async def ndjson() -> AsyncIterator[str]:
+            async for result in iter_batch_results(calls):
+                yield json.dumps(result, ensure_ascii=False) + "\n"
+
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+    routes = [
+        Route("/mcp", endpoint=streamable_http, methods=["GET", "POST", "DELETE"]),
+        Route("/mcp/", endpoint=streamable_http, methods=["GET", "POST", "DELETE"]),
+        Route("/.well-known/mcp", endpoint=well_known_mcp),
+        Route("/.well-known/mcp/server-card.json", endpoint=well_known_mcp_server_card),
+        Route("/sse", endpoint=handle_sse),
+        Route("/sse/", endpoint=handle_sse),
+        Route("/tools", endpoint=list_tools),
+        Route("/tools/call", endpoint=handle_post_message, methods=["POST"]),
+        Route("/tools/batch", endpoint=handle_batch, methods=["POST"]),
+        Mount("/messages/", app=sse.handle_post_message),
+        Route("/metrics", endpoint=metrics),
+        Route("/admin/profile", endpoint=admin_profile),
+    ]
+    paths = {route.path.rstrip("/") for route in routes if isinstance(route, Route)}
     return Starlette(
         debug=debug,
-        routes=[
-            Route("/.well-known/mcp", endpoint=well_known_mcp),
-            Route("/.well-known/mcp/server-card.json", endpoint=well_known_mcp_server_card),
-            Route("/sse", endpoint=handle_sse),
-            Route("/sse/", endpoint=handle_sse),
-            Route("/tools", endpoint=list_tools),
-            Mount("/messages/", app=sse.handle_post_message),
-        ],
+        lifespan=lifespan,
+        routes=routes,
+        middleware=[Middleware(MetricsMiddleware, paths=paths)],
+    )
+
+
+def create_app() -> Starlette:
+    """Application factory used by uvicorn worker processes (``--workers`` > 1)."""
+    return create_starlette_app(app, debug=True)
+
+
+def run_workers(args: argparse.Namespace) -> None:
+    """
+    Run the HTTP server in several worker processes.
+
+    Workers share the response cache and the KIPRIS rate-limit window through KIPRIS_SHARED_STATE
+    (default: a database on /dev/shm). SSE sessions live in the worker that opened them, so a
+    load balancer in front of the workers needs sticky sessions for /sse and /messages/;
+    the stateless streamable HTTP endpoint (/mcp) does not.
+    """
+    # 워커 프로세스는 모듈을 새로 import하므로 CLI 설정은 환경 변수로 전달
+    os.environ.setdefault("KIPRIS_SHARED_STATE", default_shared_state_path())
+    if args.output_format:
+        os.environ["KIPRIS_OUTPUT_FORMAT"] = args.output_format
+    if args.result_token_budget:
+        os.environ["KIPRIS_RESULT_TOKEN_BUDGET"] = str(args.result_token_budget)
+
+    logger.info(
+        "🌐 Starting %d MCP KIPRIS HTTP workers (shared state: %s)", args.workers, os.environ["KIPRIS_SHARED_STATE"]
+    )
+    uvicorn.run(
+        "mcp_kipris.sse_server:create_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
     )
 
 
@@ -286,12 +683,51 @@ async def main():
     parser.add_argument("--http", action="store_true", help="Run in HTTP mode")
     parser.add_argument("--port", type=int, default=6274, help="Port to listen on (default: 6274)")
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to (default: 0.0.0.0)")
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        help="Default tool output format when a call does not pass output_format (default: KIPRIS_OUTPUT_FORMAT or markdown)",
+    )
+    parser.add_argument(
+        "--result-token-budget",
+        type=int,
+        help="Default token budget for detail/summary results (default: KIPRIS_RESULT_TOKEN_BUDGET or unlimited)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of HTTP worker processes sharing cache/rate-limit state (default: 1)",
+    )
+    parser.add_argument(
+        "--max-sessions",
+        type=int,
+        help="Concurrent SSE sessions per worker; more get 503 (default: KIPRIS_MAX_SESSIONS or 100, 0 = unlimited)",
+    )
+    parser.add_argument(
+        "--max-inflight",
+        type=int,
+        help="Concurrent tool calls per worker; more get 429 (default: KIPRIS_MAX_INFLIGHT_CALLS or 32, 0 = unlimited)",
+    )
     args = parser.parse_args()
 
-    logger.info(f"🚀 argparse received: {args}")
+    # 워커 프로세스에도 적용되도록 환경 변수로 전달
+    if args.max_sessions is not None:
+        os.environ["KIPRIS_MAX_SESSIONS"] = str(args.max_sessions)
+    if args.max_inflight is not None:
+        os.environ["KIPRIS_MAX_INFLIGHT_CALLS"] = str(args.max_inflight)
+
+    if args.output_format:
+        set_default_output_format(args.output_format)
+    if args.result_token_budget:
+        set_default_result_token_budget(args.result_token_budget)
 
-    if args.http:
-        logger.info(f"Starting MCP KIPRIS HTTP server on {args.host}:{args.port}...")
+    logger.info("🚀 argparse received: %s", args)
+
+    if args.http and args.workers > 1:
+        run_workers(args)
+    elif args.http:
+        logger.info("Starting MCP KIPRIS HTTP server on %s:%s...", args.host, args.port)
         try:
             logger.info("🌐 Starting MCP KIPRIS SSE server...")
             starlette_app = create_starlette_app(app, debug=True)
@@ -300,22 +736,23 @@ async def main():
             await server.serve()
 
         except Exception as e:
-            logger.error(f"SSE server error occurred: {str(e)}")
+            logger.error("SSE server error occurred: %s", e)
             raise RuntimeError(f"SSE Server Error: {str(e)}")
     else:
         logger.info("Starting MCP KIPRIS stdio server...")
+        start_metrics_exporter_from_env()
+        # kill -USR1 <pid> 로 KIPRIS_PROFILE_SECONDS 동안 샘플링 프로파일을 KIPRIS_PROFILE_DIR에 기록
+        install_signal_handler()
         try:
             async with stdio_server() as (read_stream, write_stream):
                 logger.info("stdio_server initialized")
                 init_options = app.create_initialization_options()
-                logger.info(f"Initialization options created: {init_options}")
+                logger.info("Initialization options created: %s", init_options)
                 await app.run(read_stream, write_stream, init_options)
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            logger.error("Error occurred: %s", e)
             raise RuntimeError(f"Caught Exception. Error: {str(e)}")
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
@@ -7,9 +7,9 @@ from langchain_core.prompts import ChatPromptTemplate
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
-from mcp_kipris.kipris.api.korean.patent_detail_search_api import PatentDetailSearchAPI
+from mcp_kipris.kipris.api_client_factory import get_api_client_factory
 
-patent_detail_search_api = PatentDetailSearchAPI()
+patent_detail_search_api = get_api_client_factory().get_korean_patent_detail_client()
 
 
 async def get_patent_data(application_number: str) -> Dict[str, Any]:
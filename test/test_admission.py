@@ -0,0 +1,87 @@
+import os
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import pytest  # noqa: E402
+from starlette.testclient import TestClient  # noqa: E402
+
+from mcp_kipris import sse_server  # noqa: E402
+from mcp_kipris.kipris import admission  # noqa: E402
+from mcp_kipris.kipris.admission import AdmissionController  # noqa: E402
+from mcp_kipris.kipris.errors import KiprisBusyError  # noqa: E402
+from mcp_kipris.kipris.rate_limiter import RateLimiter  # noqa: E402
+
+
+def test_call_slots_are_capped_and_released():
+    controller = AdmissionController(max_inflight=1)
+    with controller.call():
+        with pytest.raises(KiprisBusyError):
+            with controller.call():
+                pass
+    with controller.call():
+        pass
+    assert controller.stats()["rejected_calls"] == 1
+    assert controller.stats()["inflight"] == 0
+
+
+def test_retry_after_follows_call_latency():
+    controller = AdmissionController(max_inflight=2)
+    controller.avg_call_seconds = 7.2
+    controller.inflight = 2
+    assert controller.retry_after() == 8.0
+
+
+def test_retry_after_waits_for_the_rate_limiter():
+    limiter = RateLimiter(max_requests_per_minute=2)
+    assert limiter.time_until_slot() == 0.0
+    limiter.acquire_blocking()
+    limiter.acquire_blocking()
+    assert 55 < limiter.time_until_slot() <= 60
+
+    controller = AdmissionController(max_inflight=2, rate_limit_wait=limiter.time_until_slot)
+    controller.avg_call_seconds = 0.5
+    controller.inflight = 2
+    assert controller.retry_after() == 60.0
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    controller = AdmissionController(max_sessions=1, max_inflight=1)
+    monkeypatch.setattr(admission, "_admission_controller", controller)
+    return controller
+
+
+def test_http_calls_over_the_cap_get_429(controller):
+    controller.avg_call_seconds = 3.0
+    with TestClient(sse_server.create_starlette_app(sse_server.app)) as client, controller.call():
+        response = client.post("/tools/call", json={"type": "tool", "name": "patent_search", "args": {"word": "x"}})
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "3"
+        assert response.json()["error"] == "BUSY"
+
+        assert client.post("/tools/batch", json=[{"name": "patent_search", "args": {}}]).status_code == 429
+        call = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "patent_search"}}
+        assert client.post("/mcp", json=call).status_code == 429
+
+
+def test_streamable_http_handshake_is_not_admission_controlled(controller):
+    headers = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+    initialize = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test", "version": "0"}},
+    }
+    with TestClient(sse_server.create_starlette_app(sse_server.app)) as client, controller.call():
+        # 호출 슬롯이 가득 차도 연결(initialize)과 도구 목록 조회는 가능해야 함
+        assert client.post("/mcp", headers=headers, json=initialize).status_code == 200
+        tools = client.post("/mcp", headers=headers, json={"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        assert tools.status_code == 200 and tools.json()["result"]["tools"]
+        assert controller.stats()["rejected_calls"] == 0
+
+
+def test_sse_sessions_over_the_cap_get_503(controller):
+    with TestClient(sse_server.create_starlette_app(sse_server.app)) as client, controller.session():
+        response = client.get("/sse")
+        assert response.status_code == 503
+        assert "Retry-After" in response.headers
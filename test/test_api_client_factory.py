@@ -0,0 +1,68 @@
+import pytest
+
+from mcp_kipris.kipris.api.korean.patent_summary_search_api import PatentSummarySearchAPI
+from mcp_kipris.kipris.api_client_factory import ApiClientConfig, ApiClientFactory, CredentialPool
+
+OK_RESPONSE = {
+    "response": {
+        "header": {"resultCode": "00"},
+        "body": {"items": {"item": {"applicationNumber": "1020230045678", "inventionTitle": "배터리"}}},
+    }
+}
+EXPIRED_RESPONSE = {"response": {"header": {"resultCode": "31", "resultMsg": "DEADLINE_EXPIRED"}}}
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    factory = ApiClientFactory(ApiClientConfig(api_key="key-a", extra_api_keys=["key-b"]))
+    calls = []
+
+    async def fake_get_async(url):
+        calls.append(url)
+        return EXPIRED_RESPONSE if "key-b" in url else OK_RESPONSE
+
+    monkeypatch.setattr(factory.transport, "get_async", fake_get_async)
+    factory.calls = calls
+    return factory
+
+
+def test_get_client_returns_shared_instance(factory):
+    client = factory.get_client(PatentSummarySearchAPI)
+    assert client is factory.get_korean_patent_summary_client()
+    assert client.factory is factory
+    assert len(factory.get_all_clients()) > 0
+
+
+def test_credential_pool_round_robin_and_disable():
+    pool = CredentialPool(["a", "b"])
+    assert [pool.next_key() for _ in range(4)] == ["a", "b", "a", "b"]
+    pool.disable("b")
+    assert [pool.next_key() for _ in range(3)] == ["a", "a", "a"]
+
+
+async def test_cache_serves_repeat_requests(factory):
+    client = factory.get_korean_patent_summary_client()
+    first = await client.async_search("1020230045678")
+    second = await client.async_search("1020230045678")
+    assert first.equals(second)
+    assert len(factory.calls) == 1
+    assert factory.cache.stats()["hits"] == 1
+
+
+async def test_rejected_key_is_disabled(factory):
+    factory.cache.ttl_seconds = 0
+    client = factory.get_korean_patent_summary_client()
+    await client.async_search("1020230045678")
+    await client.async_search("1020230045678")
+    assert factory.credentials.available == 1
+    await client.async_search("1020230045678")
+    assert "key-a" in factory.calls[-1]
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("KIPRIS_API_KEY", "key-a")
+    monkeypatch.setenv("KIPRIS_API_KEYS", "key-a, key-c")
+    monkeypatch.setenv("KIPRIS_RATE_LIMIT_PER_MINUTE", "120")
+    config = ApiClientConfig.from_env()
+    assert config.extra_api_keys == ["key-c"]
+    assert config.rate_limit_per_minute == 120
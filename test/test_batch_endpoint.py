@@ -0,0 +1,60 @@
+import asyncio
+import json
+import os
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+from mcp.types import TextContent  # noqa: E402
+from starlette.testclient import TestClient  # noqa: E402
+
+from mcp_kipris import sse_server  # noqa: E402
+
+
+def fake_tool(monkeypatch, name: str, delays: dict):
+    async def run_tool_async(args):
+        if args["word"] == "fail":
+            raise ValueError("boom")
+        await asyncio.sleep(delays.get(args["word"], 0))
+        return [TextContent(type="text", text=f"result:{args['word']}")]
+
+    monkeypatch.setattr(sse_server.tool_handlers[name], "run_tool_async", run_tool_async)
+
+
+async def test_batch_results_stream_in_completion_order(monkeypatch):
+    fake_tool(monkeypatch, "patent_search", {"slow": 0.2, "fast": 0.0})
+    calls = [
+        {"id": "a", "name": "patent_search", "args": {"word": "slow"}},
+        {"id": "b", "name": "patent_search", "args": {"word": "fast"}},
+        {"id": "c", "name": "patent_search", "args": {"word": "fail"}},
+    ]
+
+    results = [result async for result in sse_server.iter_batch_results(calls, concurrency=3)]
+
+    assert results[-1]["id"] == "a"
+    by_id = {result["id"]: result for result in results}
+    assert by_id["b"]["ok"] and by_id["b"]["content"][0]["text"] == "result:fast"
+    assert not by_id["c"]["ok"] and "boom" in by_id["c"]["error"]
+
+
+def test_batch_endpoint_returns_ndjson(monkeypatch):
+    fake_tool(monkeypatch, "patent_search", {})
+    body = [{"name": "patent_search", "args": {"word": word}} for word in ("배터리", "반도체")]
+
+    with TestClient(sse_server.create_starlette_app(sse_server.app)) as client:
+        response = client.post("/tools/batch", json=body)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(line["index"] for line in lines) == [0, 1]
+        assert all(line["ok"] for line in lines)
+
+        assert client.post("/tools/batch", json=[{"args": {}}]).status_code == 400
+        assert client.post("/tools/batch", json={"name": "patent_search"}).status_code == 400
+
+
+def test_single_call_endpoint_is_routed(monkeypatch):
+    fake_tool(monkeypatch, "patent_search", {})
+    with TestClient(sse_server.create_starlette_app(sse_server.app)) as client:
+        response = client.post("/tools/call", json={"type": "tool", "name": "patent_search", "args": {"word": "x"}})
+        assert response.status_code == 200
+        assert response.json()[0]["text"] == "result:x"
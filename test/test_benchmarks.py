@@ -0,0 +1,23 @@
+import json
+import os
+import subprocess
+import sys
+
+SUITE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "suite.py")
+
+
+def test_benchmark_suite_runs(tmp_path):
+    # suite.py 는 import 시 환경 변수(캐시/rate limit)를 바꾸므로 별도 프로세스로 실행
+    output = tmp_path / "result.json"
+    completed = subprocess.run(
+        [sys.executable, SUITE, "--number", "1", "--calls", "1", "--concurrency", "1"]
+        + ["--tools", "patent_search", "--rows", "2", "--output", str(output)],
+        env={**os.environ, "KIPRIS_API_KEY": os.environ.get("KIPRIS_API_KEY", "test-key")},
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    results = json.loads(output.read_text())["results"]
+    assert results["call_tool"]["patent_search"]["1"]["errors"] == 0
@@ -0,0 +1,86 @@
+import asyncio
+import os
+import threading
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import anyio  # noqa: E402
+
+from mcp_kipris.kipris.api_client_factory import ApiClientConfig, ApiClientFactory  # noqa: E402
+from mcp_kipris.kipris.executor import BlockingExecutor  # noqa: E402
+from mcp_kipris.sse_server import run_until_disconnect  # noqa: E402
+
+
+async def test_cancelling_a_call_aborts_the_in_flight_request(monkeypatch):
+    factory = ApiClientFactory(ApiClientConfig(api_key="key-a"))
+    started = asyncio.Event()
+
+    async def hanging_get_async(url):
+        started.set()
+        await asyncio.sleep(600)
+
+    monkeypatch.setattr(factory.transport, "get_async", hanging_get_async)
+    client = factory.get_korean_patent_summary_client()
+    task = asyncio.create_task(client.async_search("1020230045678"))
+    await started.wait()
+    task.cancel()
+
+    await asyncio.gather(task, return_exceptions=True)
+    assert task.cancelled()
+    assert factory.cancellations == {"before_request": 0, "in_flight": 1}
+
+
+async def test_cancelled_queued_blocking_call_never_runs():
+    executor = BlockingExecutor(max_workers=1, max_queue=4)
+    release = threading.Event()
+    ran = []
+    running = asyncio.create_task(executor.run(release.wait))
+    queued = asyncio.create_task(executor.run(ran.append, "queued"))
+    await asyncio.sleep(0.05)
+
+    queued.cancel()
+    await asyncio.gather(queued, return_exceptions=True)
+    release.set()
+    await running
+
+    assert ran == []
+    assert executor.stats()["cancelled"] == 1
+    assert executor.stats()["queued"] == 0
+    executor.shutdown()
+
+
+class SlowServer:
+    """Server.run과 같이 들어오는 스트림이 끝나도 실행 중인 핸들러를 기다리는 가짜 서버"""
+
+    def __init__(self):
+        self.handler_cancelled = False
+
+    def create_initialization_options(self):
+        return None
+
+    async def run(self, read_stream, write_stream, options):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(self.slow_handler)
+            async for _ in read_stream:
+                pass
+
+    async def slow_handler(self):
+        try:
+            await anyio.sleep(600)
+        except anyio.get_cancelled_exc_class():
+            self.handler_cancelled = True
+            raise
+
+
+async def test_sse_disconnect_cancels_in_flight_handlers():
+    server = SlowServer()
+    client_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, _ = anyio.create_memory_object_stream(0)
+
+    async def disconnect_soon():
+        await asyncio.sleep(0.05)
+        await client_writer.aclose()
+
+    asyncio.create_task(disconnect_soon())
+    await asyncio.wait_for(run_until_disconnect(server, read_stream, write_stream), timeout=5)
+    assert server.handler_cancelled
@@ -0,0 +1,41 @@
+import os
+
+import pandas as pd
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+from mcp_kipris.kipris.api.encoding import encode_categoricals, intern_fields
+from mcp_kipris.kipris.api.korean.applicant_search_api import PatentApplicantSearchAPI
+
+
+def make_records(n, offset=0):
+    return [
+        {
+            "ApplicationNumber": f"10202300{offset + i:05d}",
+            "Applicant": "".join(["삼성", "전자"]) if i % 2 else "".join(["엘지", "화학"]),
+            "RegistrationStatus": "".join(["등", "록"]),
+        }
+        for i in range(n)
+    ]
+
+
+def test_intern_fields_shares_repeated_strings():
+    records = intern_fields(make_records(4), ["Applicant", "RegistrationStatus"])
+    assert records[1]["Applicant"] is records[3]["Applicant"]
+    assert records[0]["RegistrationStatus"] is records[2]["RegistrationStatus"]
+
+
+def test_encode_categoricals_only_for_large_frames():
+    small = encode_categoricals(pd.DataFrame(make_records(10)), ["Applicant"])
+    assert small["Applicant"].dtype == object
+    large = encode_categoricals(pd.DataFrame(make_records(500)), ["Applicant", "Missing"])
+    assert isinstance(large["Applicant"].dtype, pd.CategoricalDtype)
+    assert large["ApplicationNumber"].dtype == object
+
+
+def test_parse_response_interns_categorical_fields():
+    api = PatentApplicantSearchAPI(api_key="test-key")
+    response = {"response": {"header": {"resultCode": "00"}, "body": {"items": {"PatentUtilityInfo": make_records(3)}}}}
+    df = api.parse_response(response)
+    assert len(df) == 3
+    assert df["Applicant"].iloc[0] is df["Applicant"].iloc[2]
@@ -0,0 +1,112 @@
+import os
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import pandas as pd  # noqa: E402
+import pytest  # noqa: E402
+
+from mcp_kipris.kipris.api.utils import parse_xml_response  # noqa: E402
+from mcp_kipris.kipris.api_client_factory import ApiClientConfig, ApiClientFactory  # noqa: E402
+from mcp_kipris.kipris.entity_cache import cheapest_source, select_record  # noqa: E402
+from mcp_kipris.kipris.metrics import endpoint_label  # noqa: E402
+from mcp_kipris.kipris.tools.korean.patent_detail_search_tool import PatentDetailSearchTool  # noqa: E402
+from mcp_kipris.kipris.tools.korean.patent_search_tool import PatentSearchTool  # noqa: E402
+from mcp_kipris.kipris.tools.korean.patent_summary_search_tool import PatentSummarySearchTool  # noqa: E402
+
+ITEM_XML = (
+    "<response><header><resultCode>00</resultCode></header><body><items><item>"
+    "<applicationNumber>1020230045678</applicationNumber><applicationDate>20230115</applicationDate>"
+    "<inventionTitle>이차전지용 양극 활물질</inventionTitle><applicantName>주식회사 엘지에너지솔루션</applicantName>"
+    "<registerStatus>등록</registerStatus><ipcNumber>H01M 4/525</ipcNumber><astrtCont>요약</astrtCont>"
+    "</item></items></body></response>"
+)
+DETAIL_XML = (
+    "<response><header><resultCode>00</resultCode></header><body><item>"
+    "<biblioSummaryInfoArray><biblioSummaryInfo><applicationNumber>1020230045678</applicationNumber>"
+    "<applicationDate>2023.01.15</applicationDate><inventionTitle>이차전지용 양극 활물질</inventionTitle>"
+    "<registerStatus>등록</registerStatus><openNumber>1020240012345</openNumber><openDate>2024.04.15</openDate>"
+    "<registerNumber>1026500000</registerNumber><registerDate>2025.01.02</registerDate>"
+    "</biblioSummaryInfo></biblioSummaryInfoArray>"
+    "<applicantInfoArray><applicantInfo><name>주식회사 엘지에너지솔루션</name></applicantInfo></applicantInfoArray>"
+    "<ipcInfoArray><ipcInfo><ipcNumber>H01M 4/525</ipcNumber></ipcInfo></ipcInfoArray>"
+    "<abstractInfoArray><abstractInfo><astrtCont>요약</astrtCont></abstractInfo></abstractInfoArray>"
+    "<claimInfoArray><claimInfo><claim>청구항 1</claim></claimInfo></claimInfoArray>"
+    "</item></body></response>"
+)
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    factory = ApiClientFactory(ApiClientConfig(api_key="key-a", cache_ttl=0))
+    factory.calls = []
+
+    async def get_async(url):
+        endpoint = endpoint_label(url)
+        factory.calls.append(endpoint.split("/")[-1])
+        xml = DETAIL_XML if endpoint.endswith("getBibliographyDetailInfoSearch") else ITEM_XML
+        return parse_xml_response(url, xml, endpoint)
+
+    monkeypatch.setattr(factory.transport, "get_async", get_async)
+    return factory
+
+
+def make_tools(factory):
+    tools = PatentSearchTool(), PatentSummarySearchTool(), PatentDetailSearchTool()
+    for tool in tools:
+        tool.api = factory.get_client(type(tool.api))
+    return tools
+
+
+def test_cheapest_endpoint_supplying_missing_fields():
+    assert cheapest_source({"inventionTitle", "applicantName"}) == "summary"
+    assert cheapest_source({"drawing"}) == "search"
+    assert cheapest_source({"inventionTitle", "claimInfoArray"}) == "detail"
+    assert cheapest_source({"inventionTitle"}, candidates=("search", "detail")) == "search"
+    assert cheapest_source(set()) is None
+
+
+def test_select_record_never_falls_back_to_another_patent():
+    search = pd.DataFrame([{"applicationNumber": "1020230099999", "inventionTitle": "다른 특허"}])
+    assert select_record(search, "1020230045678") is None
+    assert select_record(search, "1020230099999")["inventionTitle"] == "다른 특허"
+    # 상세 응답은 최상위에 출원번호가 없으므로 첫 행 사용
+    detail = pd.DataFrame([{"biblioSummaryInfoArray": {"biblioSummaryInfo": {}}}])
+    assert "biblioSummaryInfoArray" in select_record(detail, "1020230045678")
+
+
+async def test_detail_lookup_serves_other_tools_locally(factory):
+    search, summary, detail = make_tools(factory)
+    args = {"application_number": "10-2023-0045678", "output_format": "json"}
+
+    await detail.run_tool_async(args)
+    search_result = await search.run_tool_async(args)
+    summary_result = await summary.run_tool_async(args)
+
+    assert factory.calls == ["getBibliographyDetailInfoSearch"]
+    assert "주식회사 엘지에너지솔루션" in search_result[0].text
+    assert "H01M 4/525" in summary_result[0].text
+    assert factory.entities.stats()["local_hits"] == 2
+
+
+async def test_search_fetches_cheapest_endpoint_and_detail_still_fetches_detail(factory):
+    search, summary, detail = make_tools(factory)
+    args = {"application_number": "1020230045678"}
+
+    await search.run_tool_async(args)
+    await summary.run_tool_async(args)
+    assert factory.calls == ["getBibliographySumryInfoSearch"]
+
+    result = await detail.run_tool_async(args)
+    assert factory.calls[-1] == "getBibliographyDetailInfoSearch"
+    assert "claimInfoArray" in result[0].text
+
+
+async def test_disabled_entity_cache_fetches_every_call(factory):
+    factory.entities.ttl_seconds = 0
+    search, _, _ = make_tools(factory)
+
+    for _ in range(2):
+        await search.run_tool_async({"application_number": "1020230045678"})
+
+    assert factory.calls == ["getBibliographySumryInfoSearch"] * 2
+    assert len(factory.entities) == 0
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from mcp.types import TextContent
+
+from mcp_kipris.kipris.abc import ToolHandler
+from mcp_kipris.kipris.errors import KiprisBusyError
+from mcp_kipris.kipris.executor import BlockingExecutor, execute_tool
+
+
+class SlowSyncTool(ToolHandler):
+    def __init__(self):
+        super().__init__("slow_sync")
+
+    def run_tool(self, args: dict):
+        time.sleep(args.get("seconds", 0.2))
+        return [TextContent(type="text", text=threading.current_thread().name)]
+
+
+async def test_sync_fallback_does_not_block_event_loop():
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    result, _ = await asyncio.gather(execute_tool(SlowSyncTool(), {"seconds": 0.3}), ticker())
+    assert result[0].text.startswith("kipris-sync")
+    assert ticks == 10
+
+
+async def test_executor_rejects_when_queue_is_full():
+    executor = BlockingExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    running = asyncio.ensure_future(executor.run(release.wait))
+    waiting = asyncio.ensure_future(executor.run(release.wait))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(KiprisBusyError):
+        await executor.run(release.wait)
+
+    stats = executor.stats()
+    assert stats["active"] == 1 and stats["queued"] == 1 and stats["rejected"] == 1
+
+    release.set()
+    await asyncio.gather(running, waiting)
+    assert executor.stats()["completed"] == 2
+    executor.shutdown()
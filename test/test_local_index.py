@@ -0,0 +1,111 @@
+import logging
+import os
+import time
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import pytest  # noqa: E402
+
+from mcp_kipris.kipris.api.utils import parse_xml_response  # noqa: E402
+from mcp_kipris.kipris.api_client_factory import ApiClientConfig, ApiClientFactory  # noqa: E402
+from mcp_kipris.kipris.local_index import LocalPatentIndex, tokenize  # noqa: E402
+from mcp_kipris.kipris.metrics import endpoint_label  # noqa: E402
+from mcp_kipris.kipris.tools.korean.patent_detail_search_tool import PatentDetailSearchTool  # noqa: E402
+from mcp_kipris.kipris.tools.korean.patent_free_search_tool import PatentFreeSearchTool  # noqa: E402
+from mcp_kipris.kipris.tools.local.local_patent_search_tool import LocalPatentSearchTool  # noqa: E402
+
+SEARCH_XML = (
+    "<response><header><resultCode>00</resultCode></header><body><items>"
+    "<PatentUtilityInfo><ApplicationNumber>1020230045678</ApplicationNumber><ApplicationDate>2023.01.15</ApplicationDate>"
+    "<InventionName>리튬 이차전지용 양극 활물질</InventionName><Applicant>주식회사 엘지에너지솔루션</Applicant>"
+    "<Abstract>니켈 함량이 높은 양극 활물질</Abstract></PatentUtilityInfo>"
+    "<PatentUtilityInfo><ApplicationNumber>1020230099999</ApplicationNumber><ApplicationDate>2023.05.02</ApplicationDate>"
+    "<InventionName>반도체 패키지 기판</InventionName><Applicant>삼성전자주식회사</Applicant>"
+    "<Abstract>열 방출 구조를 갖는 패키지</Abstract></PatentUtilityInfo>"
+    "</items></body></response>"
+)
+DETAIL_XML = (
+    "<response><header><resultCode>00</resultCode></header><body><item>"
+    "<biblioSummaryInfoArray><biblioSummaryInfo><applicationNumber>1020230045678</applicationNumber>"
+    "<inventionTitle>리튬 이차전지용 양극 활물질</inventionTitle></biblioSummaryInfo></biblioSummaryInfoArray>"
+    "<claimInfoArray><claimInfo><claim>코발트 코팅층을 포함하는 양극</claim></claimInfo></claimInfoArray>"
+    "</item></body></response>"
+)
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    factory = ApiClientFactory(ApiClientConfig(api_key="key-a", cache_ttl=0))
+
+    async def get_async(url):
+        endpoint = endpoint_label(url)
+        xml = DETAIL_XML if endpoint.endswith("getBibliographyDetailInfoSearch") else SEARCH_XML
+        return parse_xml_response(url, xml, endpoint)
+
+    monkeypatch.setattr(factory.transport, "get_async", get_async)
+    return factory
+
+
+def test_tokenize_hangul_bigrams_and_latin_words():
+    assert tokenize("리튬이차전지 Cathode-2") == ["리튬", "튬이", "이차", "차전", "전지", "cathode", "2"]
+    assert tokenize("") == []
+
+
+def test_bm25_ranks_title_matches_and_upserts():
+    index = LocalPatentIndex()
+    index.add({"applicationNumber": "1", "inventionTitle": "양극 활물질", "astrtCont": "전지"})
+    index.add({"applicationNumber": "2", "inventionTitle": "전지 케이스", "astrtCont": "양극 활물질을 쓰지 않는 구조"})
+    index.add({"applicationNumber": "3", "inventionTitle": "반도체", "astrtCont": "기판"})
+
+    assert [fields["applicationNumber"] for _, fields in index.search("양극 활물질")] == ["1", "2"]
+    # 같은 레코드를 다시 받으면 재색인하지 않고, 새 필드는 기존 문서에 병합
+    assert not index.add({"applicationNumber": "1", "inventionTitle": "양극 활물질", "astrtCont": "전지"})
+    assert index.add({"applicationNumber": "3", "applicantName": "삼성전자"})
+    assert index.search("삼성전자")[0][1]["inventionTitle"] == "반도체"
+    assert len(index) == 3
+
+
+def test_index_drops_oldest_documents_over_capacity():
+    index = LocalPatentIndex(max_documents=2)
+    for number in "123":
+        index.add({"applicationNumber": number, "inventionTitle": "이차전지"})
+    assert "1" not in index and len(index) == 2
+    assert len(index.search("이차전지")) == 2
+
+
+async def test_local_search_tool_serves_fetched_records(factory):
+    free_search, detail = PatentFreeSearchTool(), PatentDetailSearchTool()
+    for tool in free_search, detail:
+        tool.api = factory.get_client(type(tool.api))
+    local = LocalPatentSearchTool()
+    local.index = factory.local_index
+
+    await free_search.run_tool_async({"word": "이차전지"})
+    await detail.run_tool_async({"application_number": "1020230045678"})
+    factory.flush_indexing()
+    result = await local.run_tool_async({"query": "코발트 코팅", "output_format": "json"})
+
+    assert "1020230045678" in result[0].text
+    assert "1020230099999" not in result[0].text
+    empty = await local.run_tool_async({"query": "자율주행"})
+    assert "there is no result (indexed patents: 2)" in empty[0].text
+
+
+async def test_indexing_runs_in_the_background_and_never_fails_the_search(factory, monkeypatch, caplog):
+    def slow_add(records):
+        time.sleep(0.5)
+        raise ValueError("broken record")
+
+    monkeypatch.setattr(factory.near_duplicates, "add_records", slow_add)
+    tool = PatentFreeSearchTool()
+    tool.api = factory.get_client(type(tool.api))
+
+    started = time.perf_counter()
+    result = await tool.run_tool_async({"word": "이차전지", "output_format": "json"})
+    assert time.perf_counter() - started < 0.4
+    assert "1020230045678" in result[0].text
+
+    with caplog.at_level(logging.ERROR, logger="mcp-kipris"):
+        factory.flush_indexing()
+    assert "로컬 색인 갱신 실패" in caplog.text
+    assert len(factory.local_index) == 2
@@ -0,0 +1,133 @@
+import json
+import logging
+
+import pytest
+
+from mcp_kipris.kipris import tracing
+from mcp_kipris.kipris.logging_utils import (
+    JsonFormatter,
+    LogPipeline,
+    RedactingFormatter,
+    RequestSamplingFilter,
+    redact_sensitive_data,
+    request_log_sampling,
+)
+
+URL = "http://plus.kipris.or.kr/kipo-api/kipi/patUtiModInfoSearchSevice/getAdvancedSearch?word=battery&ServiceKey=secret123"
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+@pytest.fixture
+def pipeline_logger():
+    """A logger wired to its own pipeline so the test does not touch the root logger."""
+    output = ListHandler()
+    pipeline = LogPipeline(output)
+    pipeline.addFilter(RequestSamplingFilter())
+    test_logger = logging.getLogger("mcp-kipris.test-logging")
+    test_logger.propagate = False
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.addHandler(pipeline)
+    yield test_logger, pipeline, output
+    test_logger.removeHandler(pipeline)
+    pipeline.close()
+
+
+def test_redact_sensitive_data():
+    assert "secret123" not in redact_sensitive_data(URL)
+    assert "word=battery" in redact_sensitive_data(URL)
+    assert redact_sensitive_data(42) == "42"
+
+
+def test_json_records_are_redacted(pipeline_logger):
+    test_logger, pipeline, output = pipeline_logger
+    output.setFormatter(JsonFormatter())
+
+    test_logger.info("request %s", URL, extra={"tool": "patent_search", "duration_ms": 12.5})
+    try:
+        raise ValueError(URL)
+    except ValueError:
+        test_logger.exception("failed")
+    pipeline.listener.stop()
+
+    info, error = (json.loads(line) for line in output.lines)
+    assert info["level"] == "INFO"
+    assert info["tool"] == "patent_search"
+    assert info["duration_ms"] == 12.5
+    assert "secret123" not in info["msg"]
+    assert "secret123" not in error["exc"]
+    assert "ValueError" in error["exc"]
+
+
+def test_text_records_are_redacted(pipeline_logger):
+    test_logger, pipeline, output = pipeline_logger
+    output.setFormatter(RedactingFormatter("%(levelname)s %(message)s"))
+
+    test_logger.info("request %s", URL)
+    pipeline.listener.stop()
+
+    assert output.lines == [redact_sensitive_data(f"INFO request {URL}")]
+
+
+def test_message_arguments_are_captured_when_logged(pipeline_logger):
+    test_logger, pipeline, output = pipeline_logger
+    params = {"word": "battery"}
+
+    test_logger.info("params %s", params)
+    params["word"] = "changed"
+    pipeline.listener.stop()
+
+    assert "battery" in output.lines[0]
+
+
+def test_unsampled_requests_keep_only_warnings(pipeline_logger):
+    test_logger, pipeline, output = pipeline_logger
+
+    with request_log_sampling(0.0) as sampled:
+        test_logger.info("dropped")
+        test_logger.warning("kept")
+    assert not sampled
+    with request_log_sampling(1.0):
+        test_logger.info("sampled")
+    test_logger.info("outside request")
+    pipeline.listener.stop()
+
+    assert output.lines == ["kept", "sampled", "outside request"]
+
+
+def test_full_queue_drops_instead_of_blocking(pipeline_logger):
+    test_logger, pipeline, output = pipeline_logger
+    pipeline.listener.stop()
+    pipeline.queue.maxsize = 1
+
+    test_logger.info("first")
+    test_logger.info("second")
+
+    assert pipeline.dropped == 1
+
+
+def test_json_records_carry_trace_ids(pipeline_logger, tmp_path):
+    test_logger, pipeline, output = pipeline_logger
+    output.setFormatter(JsonFormatter())
+    trace_filter = tracing.TraceContextFilter()
+    test_logger.addFilter(trace_filter)
+    tracing.set_tracer(tracing.Tracer(file_path=str(tmp_path / "traces.jsonl"), flush_interval=3600))
+    try:
+        with tracing.span("tool.call") as active:
+            test_logger.info("inside span")
+    finally:
+        tracing.set_tracer(None)
+        test_logger.removeFilter(trace_filter)
+    pipeline.listener.stop()
+
+    record = json.loads(output.lines[0])
+    assert record["msg"] == "inside span"
+    assert record["trace_id"] == active.trace_id
+    assert record["span_id"] == active.span_id
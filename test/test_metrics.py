@@ -0,0 +1,102 @@
+import asyncio
+import os
+import time
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from mcp.types import TextContent  # noqa: E402
+from starlette.testclient import TestClient  # noqa: E402
+
+from mcp_kipris import sse_server  # noqa: E402
+from mcp_kipris.kipris.api.utils import get_response_async  # noqa: E402
+from mcp_kipris.kipris.metrics import (  # noqa: E402
+    EVENT_LOOP_LAG,
+    UPSTREAM_BYTES,
+    UPSTREAM_DURATION,
+    UPSTREAM_RESULT_CODES,
+    MetricsRegistry,
+    endpoint_label,
+    monitor_event_loop_lag,
+    write_metrics_file,
+)
+
+KIPRIS_URL = "http://plus.kipris.or.kr/kipo-api/kipi/patUtiModInfoSearchSevice/getAdvancedSearch?word=x&accessKey=k"
+XML = "<response><header><resultCode>00</resultCode></header><body><items/></body></response>"
+
+
+@pytest.fixture
+async def httpx_mock_transport():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=XML))
+    async with httpx.AsyncClient(transport=transport) as client:
+        yield client
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    counter = registry.counter("demo_requests", "Demo requests", ("status",))
+    histogram = registry.histogram("demo_seconds", "Demo latency", buckets=(0.1, 1.0))
+    counter.inc("ok")
+    counter.inc("ok", amount=2)
+    histogram.observe(0.05)
+    histogram.observe(5.0)
+    registry.register_collector("demo", lambda: [("demo_entries", "gauge", "Demo entries", [({}, 3)])])
+
+    text = registry.render()
+    assert "# TYPE demo_requests_total counter" in text
+    assert 'demo_requests_total{status="ok"} 3' in text
+    assert 'demo_seconds_bucket{le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{le="+Inf"} 2' in text
+    assert "demo_seconds_sum 5.05" in text
+    assert "demo_entries 3" in text
+
+
+def test_endpoint_label_strips_host_query_and_key():
+    assert endpoint_label(KIPRIS_URL) == "patUtiModInfoSearchSevice/getAdvancedSearch"
+
+
+async def test_upstream_requests_are_measured(httpx_mock_transport):
+    endpoint = endpoint_label(KIPRIS_URL)
+    before = UPSTREAM_DURATION.count(endpoint)
+
+    response = await get_response_async(KIPRIS_URL, client=httpx_mock_transport)
+
+    assert response["response"]["header"]["resultCode"] == "00"
+    assert UPSTREAM_DURATION.count(endpoint) == before + 1
+    assert UPSTREAM_BYTES.value(endpoint) >= len(XML)
+    assert UPSTREAM_RESULT_CODES.value(endpoint, "00") >= 1
+
+
+def test_metrics_endpoint_reports_tool_and_http_metrics(monkeypatch):
+    async def run_tool_async(args):
+        return [TextContent(type="text", text="ok")]
+
+    monkeypatch.setattr(sse_server.tool_handlers["patent_search"], "run_tool_async", run_tool_async)
+    with TestClient(sse_server.create_starlette_app(sse_server.app)) as client:
+        client.post("/tools/call", json={"type": "tool", "name": "patent_search", "args": {}})
+        text = client.get("/metrics").text
+
+    assert 'kipris_tool_calls_total{tool="patent_search",status="ok"}' in text
+    assert 'kipris_http_requests_total{path="/tools/call",status="200"}' in text
+    assert "kipris_admission_inflight" in text
+    assert "# TYPE kipris_event_loop_lag_seconds histogram" in text
+    assert "process_resident_memory_bytes" in text
+
+
+async def test_event_loop_lag_is_measured():
+    before = EVENT_LOOP_LAG.count()
+    monitor = asyncio.create_task(monitor_event_loop_lag(interval=0.01))
+    await asyncio.sleep(0)
+    time.sleep(0.05)  # 이벤트 루프를 막는 동기 작업
+    await asyncio.sleep(0.03)
+    monitor.cancel()
+
+    assert EVENT_LOOP_LAG.count() > before
+    assert any(name.endswith("_sum") and value >= 0.03 for name, _, value in EVENT_LOOP_LAG.samples())
+
+
+def test_metrics_file_is_written(tmp_path):
+    path = tmp_path / "kipris.prom"
+    write_metrics_file(str(path))
+    assert "kipris_tool_duration_seconds" in path.read_text()
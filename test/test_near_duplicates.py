@@ -0,0 +1,102 @@
+import json
+import os
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import pytest  # noqa: E402
+
+from mcp_kipris.kipris.api.utils import parse_xml_response  # noqa: E402
+from mcp_kipris.kipris.api_client_factory import ApiClientConfig, ApiClientFactory  # noqa: E402
+from mcp_kipris.kipris.metrics import endpoint_label  # noqa: E402
+from mcp_kipris.kipris.near_duplicates import NearDuplicateIndex, optimal_bands  # noqa: E402
+from mcp_kipris.kipris.tools.korean.patent_free_search_tool import PatentFreeSearchTool  # noqa: E402
+
+ABSTRACT = (
+    "본 발명은 니켈 함량이 높은 리튬 이차전지용 양극 활물질에 관한 것으로, 코발트 코팅층을 형성하여 "
+    "고온에서의 수명 특성과 열 안정성을 향상시키는 양극 활물질 및 그 제조 방법을 제공한다."
+)
+CONTINUATION = ABSTRACT.replace("열 안정성", "열적 안정성").replace("제공한다.", "제공한다")
+OTHER = "본 발명은 반도체 패키지 기판에 관한 것으로, 열 방출 패드와 방열 구조를 갖는 패키지를 제공한다."
+
+
+def _item(number: str, abstract: str) -> str:
+    return (
+        f"<PatentUtilityInfo><ApplicationNumber>{number}</ApplicationNumber>"
+        f"<ApplicationDate>2023.01.15</ApplicationDate><InventionName>양극 활물질</InventionName>"
+        f"<Applicant>주식회사 엘지에너지솔루션</Applicant><Abstract>{abstract}</Abstract></PatentUtilityInfo>"
+    )
+
+
+SEARCH_XML = (
+    "<response><header><resultCode>00</resultCode></header><body><items>"
+    + _item("1020230045678", ABSTRACT)
+    + _item("1020230099999", OTHER)
+    + _item("1020240011111", CONTINUATION)
+    + "</items></body></response>"
+)
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    factory = ApiClientFactory(ApiClientConfig(api_key="key-a", cache_ttl=0))
+
+    async def get_async(url):
+        return parse_xml_response(url, SEARCH_XML, endpoint_label(url))
+
+    monkeypatch.setattr(factory.transport, "get_async", get_async)
+    return factory
+
+
+def test_signatures_estimate_jaccard_and_lsh_finds_candidates():
+    index = NearDuplicateIndex(threshold=0.7)
+    assert index.bands * index.rows <= index.num_perm
+    assert index.add("1", ABSTRACT) and index.add("2", CONTINUATION) and index.add("3", OTHER)
+    assert not index.add("1", ABSTRACT)
+
+    assert index.similarity("1", "2") >= 0.7 > index.similarity("1", "3")
+    assert set(index.duplicates_of("1")) == {"2"}
+    assert set(index.query(ABSTRACT)) == {"1", "2"}
+    assert index.clusters() == [["1", "2"]]
+
+
+def test_merged_fields_and_eviction_keep_buckets_consistent():
+    index = NearDuplicateIndex(threshold=0.7, max_documents=2)
+    index.add_record({"applicationNumber": "1", "astrtCont": ABSTRACT})
+    # 상세 조회로 청구항이 더해지면 서명은 합집합(원소별 최솟값)으로 갱신
+    before = index.similarity("1", "1")
+    assert index.add("1", "코발트 코팅층을 포함하는 양극") and before == 1.0
+    index.add("2", CONTINUATION)
+    index.add("3", OTHER)
+
+    assert "1" not in index and len(index) == 2
+    assert index.duplicates_of("2") == {} and index.clusters() == []
+    assert optimal_bands(0.5, 128)[0] > optimal_bands(0.9, 128)[0]
+    assert not NearDuplicateIndex(threshold=0).add("1", ABSTRACT)
+
+
+def test_texts_already_merged_are_not_signed_again(monkeypatch):
+    index = NearDuplicateIndex(threshold=0.7)
+    signed = []
+    signature = index.signature
+    monkeypatch.setattr(index, "signature", lambda text: signed.append(text) or signature(text))
+    record = {"applicationNumber": "1020230045678", "astrtCont": ABSTRACT}
+
+    assert index.add_record(record)
+    # 캐시 적중으로 같은 응답이 다시 파싱되어도 MinHash 를 다시 계산하지 않음
+    assert not index.add_record(record) and not index.add_record({**record, "applicationNumber": "10-2023-0045678"})
+    assert index.add("1020230045678", "코발트 코팅층을 포함하는 양극")
+    assert len(signed) == 2
+
+
+async def test_search_tool_collapses_near_duplicates(factory):
+    tool = PatentFreeSearchTool()
+    tool.api = factory.get_client(type(tool.api))
+    assert "collapse_duplicates" in tool.get_tool_description().inputSchema["properties"]
+
+    plain = await tool.run_tool_async({"word": "양극", "output_format": "json"})
+    collapsed = await tool.run_tool_async({"word": "양극", "collapse_duplicates": True, "output_format": "json"})
+
+    assert json.loads(plain[0].text)["count"] == 3
+    records = json.loads(collapsed[0].text)["records"]
+    assert [record["ApplicationNumber"] for record in records] == ["1020230045678", "1020230099999"]
+    assert [record["duplicates"] for record in records] == ["1020240011111", ""]
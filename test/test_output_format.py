@@ -0,0 +1,77 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+from mcp import types
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+from mcp_kipris import server
+from mcp_kipris.kipris.tools.foreign.free_search_tool import ForeignPatentFreeSearchTool
+
+
+@pytest.fixture
+def tool(monkeypatch):
+    tool = ForeignPatentFreeSearchTool()
+
+    async def fake_search(**kwargs):
+        return pd.DataFrame(
+            [
+                {
+                    "applicationNo": "US17000001",
+                    "applicationDate": "20240101",
+                    "inventionName": "Battery",
+                    "applicant": "LG",
+                    "ipc": "H01M",
+                }
+            ]
+        )
+
+    monkeypatch.setattr(tool.api, "async_search", fake_search)
+    return tool
+
+
+def test_tool_description_declares_output_format(tool):
+    description = tool.get_tool_description()
+    assert "output_format" in description.inputSchema["properties"]
+    # JSON 은 텍스트로 반환하므로 outputSchema 를 선언하지 않음 (mcp>=1.10 은 structuredContent 없으면 호출 거부)
+    assert getattr(description, "outputSchema", None) is None
+
+
+async def test_markdown_is_default(tool):
+    result = await tool.run_tool_async({"word": "battery"})
+    assert result[0].text.startswith("| applicationNo | applicationDate | inventionName | applicant |")
+
+
+async def test_json_output_per_call(tool):
+    result = await tool.run_tool_async({"word": "battery", "output_format": "json"})
+    payload = json.loads(result[0].text)
+    assert payload["columns"] == ["applicationNo", "applicationDate", "inventionName", "applicant"]
+    assert payload["records"][0]["applicationNo"] == "US17000001"
+    assert payload["count"] == 1
+
+
+async def test_json_output_server_default(tool, monkeypatch):
+    monkeypatch.setenv("KIPRIS_OUTPUT_FORMAT", "json")
+    result = await tool.run_tool_async({"word": "battery"})
+    assert json.loads(result[0].text)["count"] == 1
+
+
+async def test_json_output_through_server_call_tool(tool, monkeypatch):
+    handler = server.get_tool_handler("foreign_patent_free_search")
+    monkeypatch.setattr(handler.api, "async_search", tool.api.async_search)
+
+    listed = await server.app.request_handlers[types.ListToolsRequest](types.ListToolsRequest(method="tools/list"))
+    assert all(getattr(item, "outputSchema", None) is None for item in listed.root.tools)
+
+    request = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(
+            name="foreign_patent_free_search", arguments={"word": "battery", "output_format": "json"}
+        ),
+    )
+    result = (await server.app.request_handlers[types.CallToolRequest](request)).root
+
+    assert not result.isError
+    assert json.loads(result.content[0].text)["records"][0]["applicationNo"] == "US17000001"
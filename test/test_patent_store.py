@@ -0,0 +1,168 @@
+import os
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import sqlite3  # noqa: E402
+import threading  # noqa: E402
+import time  # noqa: E402
+
+import pytest  # noqa: E402
+
+from mcp_kipris.kipris.api.korean.trademark_search_api import TrademarkSearchAPI  # noqa: E402
+from mcp_kipris.kipris.api.utils import parse_xml_response  # noqa: E402
+from mcp_kipris.kipris.api_client_factory import ApiClientConfig, ApiClientFactory  # noqa: E402
+from mcp_kipris.kipris.metrics import endpoint_label  # noqa: E402
+from mcp_kipris.kipris.patent_store import PatentStore, normalize_date  # noqa: E402
+from mcp_kipris.kipris.tools.korean.applicant_search_tool import PatentApplicantSearchTool  # noqa: E402
+from mcp_kipris.kipris.tools.local.stored_patent_search_tool import StoredPatentSearchTool  # noqa: E402
+
+RECORDS = [
+    {
+        "applicationNumber": "1020230045678",
+        "applicationDate": "20230115",
+        "inventionTitle": "리튬 이차전지용 양극활물질",
+        "applicantName": "주식회사 엘지에너지솔루션",
+        "ipcNumber": "H01M 4/525",
+        "astrtCont": "니켈 함량이 높은 양극 활물질",
+    },
+    {
+        "applicationNumber": "1020220011111",
+        "applicationDate": "20220301",
+        "inventionTitle": "전고체 전지용 양극",
+        "applicantName": "삼성에스디아이 주식회사",
+        "ipcNumber": "H01M 10/0562",
+        "astrtCont": "황화물 고체 전해질",
+    },
+    {
+        "applicationNumber": "1020230099999",
+        "applicationDate": "20230502",
+        "inventionTitle": "반도체 패키지 기판",
+        "applicantName": "삼성전자주식회사",
+        "ipcNumber": "H01L 23/36",
+        "astrtCont": "열 방출 구조",
+    },
+]
+SEARCH_XML = (
+    "<response><header><resultCode>00</resultCode></header><body><items>"
+    "<PatentUtilityInfo><ApplicationNumber>1020230045678</ApplicationNumber><ApplicationDate>2023.01.15</ApplicationDate>"
+    "<InventionName>리튬 이차전지용 양극 활물질</InventionName><Applicant>주식회사 엘지에너지솔루션</Applicant>"
+    "<IPCNumber>H01M 4/525</IPCNumber></PatentUtilityInfo>"
+    "</items></body></response>"
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PatentStore(str(tmp_path / "patents.db"))
+    store.upsert_many(RECORDS)
+    return store
+
+
+def numbers(records):
+    return list(records["applicationNumber"])
+
+
+def test_normalize_date():
+    assert normalize_date("2023.01.15") == normalize_date("2023-01-15") == "20230115"
+    assert normalize_date("2023") is None
+
+
+def test_full_text_search_ranks_and_filters(store):
+    total, records = store.search("양극 활물질")
+    assert total == 1 and numbers(records) == ["1020230045678"]
+
+    total, records = store.search("양극")
+    assert total == 2 and numbers(records)[0] in {"1020230045678", "1020220011111"}
+
+    assert numbers(store.search(applicant="삼성")[1]) == ["1020230099999", "1020220011111"]
+    assert numbers(store.search(ipc_prefix="H01M 10")[1]) == ["1020220011111"]
+    assert numbers(store.search(ipc_prefix="H01", date_from="2023.01.01", date_to="20231231")[1]) == [
+        "1020230099999",
+        "1020230045678",
+    ]
+
+
+def test_pagination_and_upsert_merge(store, tmp_path):
+    total, page = store.search(ipc_prefix="H01", docs_start=2, docs_count=1)
+    assert total == 3 and numbers(page) == ["1020230045678"]
+
+    # 같은 레코드는 변경 없음, 새 필드(청구항)는 병합되어 검색됨
+    assert store.upsert_many(RECORDS) == 0
+    assert store.upsert({"applicationNumber": "1020230099999", "claims": "방열 패드를 포함하는 패키지"})
+    total, records = store.search("방열 패드")
+    assert numbers(records) == ["1020230099999"]
+    assert records.loc[0, "inventionTitle"] == "반도체 패키지 기판"
+
+    # 다른 연결(재시작, 다른 워커)에서도 그대로 조회
+    assert len(PatentStore(str(tmp_path / "patents.db"))) == 3
+
+
+async def test_fetched_records_are_mirrored(tmp_path, monkeypatch):
+    factory = ApiClientFactory(
+        ApiClientConfig(api_key="key-a", cache_ttl=0, patent_store_path=str(tmp_path / "mirror.db"))
+    )
+
+    async def get_async(url):
+        return parse_xml_response(url, SEARCH_XML, endpoint_label(url))
+
+    monkeypatch.setattr(factory.transport, "get_async", get_async)
+    search = PatentApplicantSearchTool()
+    search.api = factory.get_client(type(search.api))
+    stored = StoredPatentSearchTool()
+    stored.store = factory.patent_store
+
+    # 다른 워커가 쓰기 잠금을 잡고 있어도 응답은 기다리지 않고 반환 (저장은 백그라운드 스레드)
+    locker = sqlite3.connect(str(tmp_path / "mirror.db"), isolation_level=None)
+    locker.execute("BEGIN IMMEDIATE")
+    started = time.perf_counter()
+    await search.run_tool_async({"applicant": "엘지에너지솔루션"})
+    assert time.perf_counter() - started < 1.0
+    locker.execute("ROLLBACK")
+    factory.flush_indexing()
+    result = await stored.run_tool_async({"query": "이차전지", "date_from": "20230101", "output_format": "json"})
+
+    assert "1020230045678" in result[0].text
+    assert "20230115" in result[0].text
+
+
+def test_only_patent_responses_are_mirrored(tmp_path):
+    factory = ApiClientFactory(
+        ApiClientConfig(api_key="key-a", cache_ttl=0, patent_store_path=str(tmp_path / "mirror.db"))
+    )
+    item = {"applicationNumber": "4020230001111", "inventionTitle": "이차전지 상표", "applicantName": "상표권자"}
+    response = {"response": {"header": {"resultCode": "00"}, "body": {"items": {"item": item}}}}
+
+    assert len(factory.get_client(TrademarkSearchAPI).parse_response(response)) == 1
+    factory.flush_indexing()
+
+    assert len(factory.patent_store) == 0
+    assert "4020230001111" in factory.local_index
+
+
+def test_failed_begin_keeps_the_busy_error(store, tmp_path):
+    locker = sqlite3.connect(str(tmp_path / "patents.db"), isolation_level=None)
+    locker.execute("BEGIN IMMEDIATE")
+    store.connect().execute("PRAGMA busy_timeout=0")
+
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        store.upsert({"applicationNumber": "1020240000001", "inventionTitle": "양극"})
+    locker.execute("ROLLBACK")
+    assert not store.connect().in_transaction
+
+
+async def test_stored_search_runs_off_the_event_loop(store, monkeypatch):
+    threads = []
+    search = store.search
+
+    def recording_search(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return search(*args, **kwargs)
+
+    monkeypatch.setattr(store, "search", recording_search)
+    tool = StoredPatentSearchTool()
+    tool.store = store
+
+    result = await tool.run_tool_async({"query": "양극 활물질", "output_format": "json"})
+
+    assert "1020230045678" in result[0].text
+    assert threads and threads[0] is not threading.main_thread()
@@ -0,0 +1,167 @@
+import asyncio
+import contextlib
+import os
+import threading
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import pandas as pd  # noqa: E402
+import pytest  # noqa: E402
+
+from mcp_kipris import server  # noqa: E402
+from mcp_kipris.kipris.api.utils import parse_xml_response  # noqa: E402
+from mcp_kipris.kipris.api_client_factory import ApiClientConfig, ApiClientFactory  # noqa: E402
+from mcp_kipris.kipris.metrics import endpoint_label  # noqa: E402
+from mcp_kipris.kipris.prefetch import DetailPrefetcher, set_prefetcher, top_application_numbers  # noqa: E402
+from mcp_kipris.kipris.rate_limiter import RateLimiter  # noqa: E402
+from mcp_kipris.kipris.tools.korean.applicant_search_tool import PatentApplicantSearchTool  # noqa: E402
+from mcp_kipris.kipris.tools.korean.patent_detail_search_tool import PatentDetailSearchTool  # noqa: E402
+
+NUMBERS = ["1020230045678", "1020230045679", "1020230045680", "1020230045681"]
+SEARCH_XML = (
+    "<response><header><resultCode>00</resultCode></header><body><items>"
+    + "".join(
+        f"<PatentUtilityInfo><ApplicationNumber>{number}</ApplicationNumber><ApplicationDate>2023.01.15</ApplicationDate>"
+        f"<InventionName>이차전지 {number}</InventionName><Applicant>삼성전자주식회사</Applicant></PatentUtilityInfo>"
+        for number in NUMBERS
+    )
+    + "</items></body></response>"
+)
+
+
+def detail_xml(number):
+    return (
+        "<response><header><resultCode>00</resultCode></header><body><item>"
+        f"<biblioSummaryInfoArray><biblioSummaryInfo><applicationNumber>{number}</applicationNumber>"
+        "<inventionTitle>이차전지</inventionTitle></biblioSummaryInfo></biblioSummaryInfoArray>"
+        "<claimInfoArray><claimInfo><claim>청구항 1</claim></claimInfo></claimInfoArray>"
+        "</item></body></response>"
+    )
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    factory = ApiClientFactory(ApiClientConfig(api_key="key-a", cache_ttl=0))
+    factory.calls = []
+    factory.release = None
+
+    async def get_async(url):
+        endpoint = endpoint_label(url)
+        if endpoint.endswith("getBibliographyDetailInfoSearch"):
+            number = url.split("applicationNumber=")[1].split("&")[0]
+            factory.calls.append(number)
+            if factory.release is not None:
+                await factory.release.wait()
+            return parse_xml_response(url, detail_xml(number), endpoint)
+        return parse_xml_response(url, SEARCH_XML, endpoint)
+
+    monkeypatch.setattr(factory.transport, "get_async", get_async)
+    return factory
+
+
+@pytest.fixture
+def prefetcher():
+    prefetcher = DetailPrefetcher(top_k=2, reserve=0.5)
+    set_prefetcher(prefetcher)
+    yield prefetcher
+    set_prefetcher(None)
+
+
+def make_tools(factory):
+    tools = PatentApplicantSearchTool(), PatentDetailSearchTool()
+    for tool in tools:
+        tool.api = factory.get_client(type(tool.api))
+    return tools
+
+
+def test_top_application_numbers_dedupes_in_result_order():
+    records = pd.DataFrame({"ApplicationNumber": ["10-2023-0045678", "1020230045678", None, "1020230045679"]})
+    assert top_application_numbers(records, 2) == ["1020230045678", "1020230045679"]
+    assert top_application_numbers(pd.DataFrame({"other": [1]}), 2) == []
+
+
+async def test_search_prefetches_top_hits_for_detail_calls(factory, prefetcher):
+    search, detail = make_tools(factory)
+
+    await search.run_tool_async({"applicant": "삼성전자"})
+    result = await detail.run_tool_async({"application_number": NUMBERS[0], "output_format": "json"})
+    await detail.run_tool_async({"application_number": NUMBERS[3]})
+
+    assert "청구항 1" in result[0].text
+    # 상위 2건만 미리 받고, 미리 받지 않은 번호는 상세 조회 때 호출
+    assert factory.calls == NUMBERS[:2] + [NUMBERS[3]]
+    stats = prefetcher.stats()
+    assert (stats["scheduled"], stats["fetched"], stats["used"]) == (2, 2, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+async def test_prefetch_skipped_without_spare_capacity(factory, prefetcher):
+    factory.rate_limiter = RateLimiter(max_requests_per_minute=4)
+    search, _ = make_tools(factory)
+    factory.rate_limiter.try_acquire()
+
+    # 검색 호출까지 2/4 사용: 남은 2건은 예약분(50%)이라 미리 받지 않음
+    await search.run_tool_async({"applicant": "삼성전자"})
+    await asyncio.sleep(0.01)
+
+    assert factory.calls == []
+    assert prefetcher.stats()["skipped_capacity"] == 2
+
+
+async def test_cancel_all_stops_pending_prefetches(factory, prefetcher):
+    factory.release = asyncio.Event()
+    search, _ = make_tools(factory)
+
+    await search.run_tool_async({"applicant": "삼성전자"})
+    await asyncio.sleep(0.01)
+    assert prefetcher.pending == 2
+
+    assert prefetcher.cancel_all() == 2
+    await asyncio.sleep(0.01)
+    assert prefetcher.pending == 0
+    assert prefetcher.stats()["cancelled"] == 2
+
+
+async def test_shared_capacity_is_read_once_off_the_event_loop(tmp_path, monkeypatch, prefetcher):
+    factory = ApiClientFactory(
+        ApiClientConfig(api_key="key-a", cache_ttl=0, shared_state_path=str(tmp_path / "state.db"))
+    )
+    threads = []
+    remaining = factory.rate_limiter.remaining
+    monkeypatch.setattr(
+        factory.rate_limiter, "remaining", lambda: threads.append(threading.current_thread()) or remaining()
+    )
+    search, _ = make_tools(factory)
+    fetched = []
+
+    async def get_async(url):
+        fetched.append(url)
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(factory.transport, "get_async", get_async)
+
+    assert prefetcher.schedule(search.api, pd.DataFrame({"ApplicationNumber": NUMBERS})) == 2
+    await asyncio.sleep(0.1)
+
+    assert len(threads) == 1 and threads[0] is not threading.main_thread()
+    assert len(fetched) == 2
+    prefetcher.cancel_all()
+
+
+async def test_stdio_server_cancels_pending_prefetches_on_exit(monkeypatch, prefetcher):
+    pending = asyncio.get_running_loop().create_future()
+    prefetcher._pending["1020230045678"] = pending
+
+    @contextlib.asynccontextmanager
+    async def stdio_server():
+        yield None, None
+
+    async def run(read_stream, write_stream, init_options):
+        return None
+
+    monkeypatch.setattr(server, "stdio_server", stdio_server)
+    monkeypatch.setattr(server.app, "run", run)
+    monkeypatch.setattr(server, "install_signal_handler", lambda: None)
+    await server.main()
+
+    assert pending.cancelled()
@@ -0,0 +1,89 @@
+import collections
+import os
+import threading
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import pytest  # noqa: E402
+from starlette.testclient import TestClient  # noqa: E402
+
+from mcp_kipris import sse_server  # noqa: E402
+from mcp_kipris.kipris import profiler  # noqa: E402
+
+
+def parse_xml_busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(i * i for i in range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=parse_xml_busy_loop, args=(stop,), name="busy-worker")
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+def test_samples_other_threads(busy_thread):
+    stacks = profiler.sample_stacks(0.2, interval=0.005)
+
+    busy = [stack for stack in stacks if stack[0] == "busy-worker"]
+    assert busy
+    label = f"parse_xml_busy_loop (test_profiler.py:{parse_xml_busy_loop.__code__.co_firstlineno})"
+    assert any(label in stack for stack in busy)
+    # 샘플링 스레드 자신은 제외
+    assert not any("sample_stacks" in frame for stack in stacks for frame in stack)
+
+
+def test_collapsed_stack_format():
+    stacks = collections.Counter({("MainThread", "main (a.py:1)", "run (b.py:2)"): 3, ("MainThread",): 1})
+
+    assert profiler.collapse_stacks(stacks) == "MainThread;main (a.py:1);run (b.py:2) 3\nMainThread 1\n"
+
+
+def test_one_profile_at_a_time():
+    with profiler._profile_lock:
+        with pytest.raises(profiler.ProfilerBusyError):
+            profiler.sample_stacks(0.01)
+
+
+def test_profile_to_file(tmp_path, busy_thread):
+    path = profiler.profile_to_file(0.05, str(tmp_path), interval=0.005)
+
+    assert os.path.dirname(path) == str(tmp_path)
+    with open(path, encoding="utf-8") as f:
+        assert "busy-worker;" in f.read()
+
+
+@pytest.fixture
+def client():
+    with TestClient(sse_server.create_starlette_app(sse_server.app)) as client:
+        yield client
+
+
+def test_admin_profile_disabled_without_token(client, monkeypatch):
+    monkeypatch.delenv("KIPRIS_ADMIN_TOKEN", raising=False)
+
+    assert client.get("/admin/profile").status_code == 404
+
+
+def test_admin_profile_requires_token(client, monkeypatch):
+    monkeypatch.setenv("KIPRIS_ADMIN_TOKEN", "s3cret")
+
+    assert client.get("/admin/profile").status_code == 401
+    assert client.get("/admin/profile", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+
+def test_admin_profile_returns_collapsed_stacks(client, monkeypatch, busy_thread):
+    monkeypatch.setenv("KIPRIS_ADMIN_TOKEN", "s3cret")
+    headers = {"Authorization": "Bearer s3cret"}
+
+    response = client.get("/admin/profile?seconds=0.1&interval_ms=5", headers=headers)
+
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert any(line.startswith("busy-worker;") for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert client.get("/admin/profile?seconds=600", headers=headers).status_code == 400
@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+
+from mcp_kipris.kipris.render import render_table
+
+
+@pytest.fixture
+def records():
+    return [
+        {"applicationNo": "US1", "inventionName": "Battery | cell", "applicant": "LG"},
+        {"applicationNo": "US2", "inventionName": "Line one\nline two", "applicant": None},
+    ]
+
+
+def test_markdown_escapes_pipes_and_newlines(records):
+    text = render_table(records)
+    lines = text.split("\n")
+    assert lines[0] == "| applicationNo | inventionName | applicant |"
+    assert lines[1] == "|---|---|---|"
+    assert lines[2] == "| US1 | Battery \\| cell | LG |"
+    assert lines[3] == "| US2 | Line one line two |  |"
+
+
+def test_dataframe_and_records_render_the_same(records):
+    df = pd.DataFrame(records)
+    assert render_table(df) == render_table(records)
+    assert render_table(df, columns=["applicant", "applicationNo"]) == render_table(
+        records, columns=["applicant", "applicationNo"]
+    )
+
+
+def test_tsv_and_csv(records):
+    tsv = render_table(records, fmt="tsv").split("\n")
+    assert tsv[0] == "applicationNo\tinventionName\tapplicant"
+    assert tsv[2] == "US2\tLine one line two\t"
+
+    csv_text = render_table(records, fmt="csv")
+    assert csv_text.split("\n")[1] == "US1,Battery | cell,LG"
+    assert '"Line one\nline two"' in csv_text
+
+
+def test_truncation(records):
+    text = render_table(records, columns=["inventionName"], max_cell_chars=5)
+    assert "| Batt… |" in text
+
+
+def test_unknown_format(records):
+    with pytest.raises(ValueError):
+        render_table(records, fmt="html")
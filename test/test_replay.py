@@ -0,0 +1,131 @@
+import os
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from starlette.testclient import TestClient  # noqa: E402
+
+from mcp_kipris.kipris import replay  # noqa: E402
+from mcp_kipris.kipris.api.utils import get_response_async  # noqa: E402
+from mcp_kipris.kipris.stub_server import StubConfig, create_stub_app  # noqa: E402
+
+BASE = "http://plus.kipris.or.kr/kipo-api/kipi/patUtiModInfoSearchSevice/getAdvancedSearch"
+URL = f"{BASE}?word=battery&pageNo=1&ServiceKey=secret"
+XML = (
+    "<response><header><resultCode>00</resultCode></header><body><items><item>"
+    "<applicationNumber>1020230045678</applicationNumber><inventionTitle>배터리</inventionTitle>"
+    "</item></items></body></response>"
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = replay.FixtureStore(str(tmp_path), mode="record")
+    replay.set_fixture_store(store)
+    yield store
+    replay.set_fixture_store(None)
+
+
+def failing_client():
+    def fail(request):
+        raise AssertionError(f"unexpected network request: {request.url}")
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(fail))
+
+
+def test_fixture_key_ignores_api_key_and_parameter_order():
+    assert replay.fixture_key(URL) == replay.fixture_key(f"{BASE}?pageNo=1&accessKey=other&word=battery")
+    assert replay.fixture_key(URL) != replay.fixture_key(f"{BASE}?word=battery&pageNo=2")
+
+
+def test_rebase_url():
+    assert replay.rebase_url(URL, "") == URL
+    assert replay.rebase_url(URL, "http://127.0.0.1:8089/") == (
+        "http://127.0.0.1:8089/kipo-api/kipi/patUtiModInfoSearchSevice/getAdvancedSearch"
+        "?word=battery&pageNo=1&ServiceKey=secret"
+    )
+
+
+async def test_record_then_replay(store):
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, text=XML))
+    ) as client:
+        recorded = await get_response_async(URL, client=client)
+
+    path = store.path_for(URL)
+    assert path.endswith(
+        os.path.join("patUtiModInfoSearchSevice", "getAdvancedSearch", replay.fixture_key(URL) + ".xml")
+    )
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == XML
+
+    store.mode = "replay"
+    async with failing_client() as client:
+        replayed = await get_response_async(URL.replace("secret", "another-key"), client=client)
+    assert replayed == recorded
+    assert store.replayed == 1
+
+
+async def test_missing_fixture_returns_empty_response(store):
+    store.mode = "replay"
+    async with failing_client() as client:
+        assert await get_response_async(URL, client=client) == {}
+    assert store.missing == 1
+
+
+async def test_base_url_redirects_requests(monkeypatch):
+    monkeypatch.setenv("KIPRIS_BASE_URL", "http://stub.local:8089")
+    seen = []
+
+    def handler(request):
+        seen.append(str(request.url))
+        return httpx.Response(200, text=XML)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await get_response_async(URL, client=client)
+    assert seen[0].startswith("http://stub.local:8089/kipo-api/kipi/")
+
+
+@pytest.fixture
+def fixtures_dir(tmp_path):
+    replay.FixtureStore(str(tmp_path), mode="record").save(URL, XML)
+    return str(tmp_path)
+
+
+def test_stub_serves_exact_and_fallback_fixtures(fixtures_dir):
+    client = TestClient(create_stub_app(StubConfig(fixtures_dir=fixtures_dir)))
+    path = "/kipo-api/kipi/patUtiModInfoSearchSevice/getAdvancedSearch"
+
+    assert client.get(f"{path}?word=battery&pageNo=1&ServiceKey=k").text == XML
+    assert client.get(f"{path}?word=solar").text == XML
+    assert client.get("/openapi/rest/Unknown/op?word=x").status_code == 404
+    assert client.get("/__stub__/stats").json() == {
+        "requests": 3,
+        "exact": 1,
+        "fallback": 1,
+        "not_found": 1,
+        "http_errors": 0,
+        "result_codes": 0,
+    }
+
+
+def test_stub_injects_errors_and_result_codes(fixtures_dir):
+    path = "/kipo-api/kipi/patUtiModInfoSearchSevice/getAdvancedSearch?word=battery"
+    errors = TestClient(create_stub_app(StubConfig(fixtures_dir=fixtures_dir, error_rate=1.0, error_status=502)))
+    codes = TestClient(create_stub_app(StubConfig(fixtures_dir=fixtures_dir, result_code_rate=1.0, result_code="30")))
+
+    assert errors.get(path).status_code == 502
+    response = codes.get(path)
+    assert response.status_code == 200
+    assert "<resultCode>30</resultCode>" in response.text
+
+
+async def test_client_against_stub(fixtures_dir, monkeypatch):
+    monkeypatch.setenv("KIPRIS_BASE_URL", "http://stub")
+    transport = httpx.ASGITransport(app=create_stub_app(StubConfig(fixtures_dir=fixtures_dir, latency_ms=5)))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await get_response_async(URL, client=client)
+
+    assert response["response"]["body"]["items"]["item"]["applicationNumber"] == "1020230045678"
@@ -0,0 +1,95 @@
+import os
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import logging  # noqa: E402
+from urllib.parse import urlencode  # noqa: E402
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+import requests  # noqa: E402
+from stringcase import camelcase  # noqa: E402
+
+from mcp_kipris.kipris.api.request_template import get_request_template  # noqa: E402
+from mcp_kipris.kipris.api.utils import get_response, get_response_async  # noqa: E402
+
+API_URL = "http://plus.kipris.or.kr/kipo-api/kipi/patUtiModInfoSearchSevice/getAdvancedSearch"
+
+
+def legacy_urls(api_url, api_key_field, api_key, params):
+    params_dict = {camelcase(k): v for k, v in params.items() if v is not None and v != ""}
+    cache_key = f"{api_url}?{urlencode(params_dict)}"
+    params_dict[api_key_field] = api_key
+    return cache_key, f"{api_url}?{urlencode(params_dict)}"
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"word": "이차전지 양극재", "docs_start": "1", "docs_count": "30", "desc_sort": True},
+        {"applicant": "삼성전자(주)", "sort_spec": "AD", "lastvalue": "", "patent": None},
+        {"application_number": "10-2023-0045678", "fields": "a&b=c/d"},
+        {},
+    ],
+)
+def test_template_urls_match_urlencode(params):
+    template = get_request_template(API_URL, "ServiceKey")
+    assert template.build(params, "k+ey/=") == legacy_urls(API_URL, "ServiceKey", "k+ey/=", params)
+
+
+def test_template_is_compiled_once_per_endpoint():
+    template = get_request_template(API_URL, "accessKey")
+    assert get_request_template(API_URL, "accessKey") is template
+    assert get_request_template(API_URL, "ServiceKey") is not template
+    assert template.endpoint == "patUtiModInfoSearchSevice/getAdvancedSearch"
+
+
+async def test_request_url_with_api_key_is_not_logged(caplog):
+    xml = "<response><header><resultCode>00</resultCode></header><body><items/></body></response>"
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, text=xml)))
+    _, full_url = get_request_template(API_URL, "accessKey").build({"word": "배터리"}, "secret-key")
+
+    with caplog.at_level(logging.INFO, logger="mcp-kipris"):
+        await get_response_async(full_url, client=client)
+    await client.aclose()
+
+    messages = [record.getMessage() for record in caplog.records if record.name == "mcp-kipris"]
+    assert any("patUtiModInfoSearchSevice/getAdvancedSearch" in message for message in messages)
+    assert not any("secret-key" in message for message in messages)
+
+
+def _logged_text(caplog):
+    # 메시지와 traceback 을 포함해 mcp-kipris 로거가 남긴 모든 텍스트
+    return "\n".join(
+        record.getMessage() + (record.exc_text or "") for record in caplog.records if record.name == "mcp-kipris"
+    )
+
+
+@pytest.mark.parametrize("status, body", [(200, "<html>점검 중</html"), (500, "error")])
+async def test_failed_response_does_not_log_api_key(caplog, status, body):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(status, text=body)))
+    _, full_url = get_request_template(API_URL, "accessKey").build({"word": "배터리"}, "secret-key")
+
+    with caplog.at_level(logging.INFO, logger="mcp-kipris"):
+        assert await get_response_async(full_url, client=client) == {}
+    await client.aclose()
+
+    assert "Exception Error" in _logged_text(caplog)
+    assert "secret-key" not in _logged_text(caplog)
+
+
+@pytest.mark.parametrize("status, body", [(200, b"<html>"), (500, b"error")])
+def test_failed_sync_response_does_not_log_api_key(caplog, status, body):
+    _, full_url = get_request_template(API_URL, "ServiceKey").build({"word": "배터리"}, "secret-key")
+
+    class Session:
+        def get(self, url, timeout):
+            response = requests.Response()
+            response.status_code, response.url, response._content = status, url, body
+            return response
+
+    with caplog.at_level(logging.INFO, logger="mcp-kipris"):
+        assert get_response(full_url, session=Session()) == {}
+
+    assert "Error" in _logged_text(caplog)
+    assert "secret-key" not in _logged_text(caplog)
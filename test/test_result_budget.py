@@ -0,0 +1,92 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+from mcp_kipris.kipris.render import fit_records_to_budget, flatten_record, render_budgeted
+from mcp_kipris.kipris.tools.korean.patent_detail_search_tool import PatentDetailSearchTool
+
+DETAIL_ITEM = {
+    "biblioSummaryInfoArray": {
+        "biblioSummaryInfo": {
+            "applicationNumber": "1020230045678",
+            "applicationDate": "2023.04.06",
+            "inventionTitle": "이차전지용 양극 활물질",
+            "registerStatus": "등록",
+        }
+    },
+    "claimInfoArray": {"claimInfo": [{"claim": "청구항 " * 400}, {"claim": "두번째 청구항 " * 400}]},
+    "abstractInfoArray": {"abstractInfo": {"astrtCont": "요약 내용 " * 80}},
+    "inventorInfoArray": {"inventorInfo": [{"name": "홍길동"}, {"name": "김철수"}]},
+}
+
+
+def test_flatten_record_collapses_wrappers():
+    flat = flatten_record(DETAIL_ITEM)
+    assert flat["biblioSummaryInfoArray.inventionTitle"] == "이차전지용 양극 활물질"
+    assert flat["claimInfoArray"].count("\n") == 1
+    assert flat["inventorInfoArray"] == "name: 홍길동\nname: 김철수"
+
+
+def test_budget_keeps_priority_fields_and_reports_omissions():
+    budgeted = fit_records_to_budget(
+        [DETAIL_ITEM], max_bytes=1500, priority_fields=["inventionTitle", "abstractInfoArray"]
+    )
+    record = budgeted.records[0]
+    assert list(record)[0] == "biblioSummaryInfoArray.inventionTitle"
+    assert "abstractInfoArray" in record
+    assert "claimInfoArray" in budgeted.truncated_fields + budgeted.omitted_fields
+    assert sum(len(k) + len(v.encode("utf-8")) for k, v in record.items()) <= 1500
+
+
+@pytest.mark.parametrize("fmt", ["markdown", "tsv", "csv", "json"])
+@pytest.mark.parametrize("max_bytes", [600, 1500, 4000])
+def test_rendered_output_stays_within_budget(fmt, max_bytes):
+    # 표/JSON 마크업, 이스케이프(파이프, 따옴표, 줄바꿈), 생략 목록까지 포함한 출력 크기
+    noisy = {**DETAIL_ITEM, "remark": 'a|b "quoted", line\nbreak ' * 20}
+    budgeted = fit_records_to_budget([noisy, DETAIL_ITEM], max_bytes=max_bytes, fmt=fmt)
+
+    assert len(render_budgeted(budgeted, fmt).encode("utf-8")) <= max_bytes
+    assert budgeted.records[0]
+
+
+def test_fields_selection_returns_only_requested_fields():
+    budgeted = fit_records_to_budget([DETAIL_ITEM], max_bytes=100_000, fields=["claimInfoArray"])
+    assert list(budgeted.records[0]) == ["claimInfoArray"]
+    assert not budgeted.omitted_fields
+
+
+@pytest.fixture
+def tool(monkeypatch):
+    tool = PatentDetailSearchTool()
+
+    async def fake_search(application_number):
+        return pd.DataFrame([DETAIL_ITEM])
+
+    monkeypatch.setattr(tool.api, "async_search", fake_search)
+    return tool
+
+
+async def test_detail_tool_respects_max_tokens(tool):
+    result = await tool.run_tool_async({"application_number": "1020230045678", "max_tokens": 400})
+    text = result[0].text
+    assert "이차전지용 양극 활물질" in text
+    assert "omitted fields" in text or "truncated fields" in text
+    assert len(text.encode("utf-8")) <= 400 * 3
+
+
+async def test_detail_tool_json_budget(tool):
+    result = await tool.run_tool_async(
+        {"application_number": "1020230045678", "max_tokens": 400, "output_format": "json"}
+    )
+    payload = json.loads(result[0].text)
+    assert payload["count"] == 1
+    assert "claimInfoArray" in payload["omitted_fields"] + payload["truncated_fields"]
+
+
+async def test_detail_tool_without_budget_renders_full_record(tool):
+    result = await tool.run_tool_async({"application_number": "1020230045678"})
+    assert result[0].text.startswith("| biblioSummaryInfoArray |")
@@ -0,0 +1,107 @@
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from mcp_kipris.kipris.api_client_factory import ApiClientConfig, ApiClientFactory
+from mcp_kipris.kipris.shared_state import SharedRateLimiter, SharedResponseCache, SharedStateStore
+
+
+def test_rate_limit_window_is_shared_between_stores(tmp_path):
+    path = str(tmp_path / "state.db")
+    # 워커 프로세스마다 자기 store를 여는 상황을 흉내냄
+    worker_a = SharedRateLimiter(SharedStateStore(path), max_requests_per_minute=3)
+    worker_b = SharedRateLimiter(SharedStateStore(path), max_requests_per_minute=3)
+
+    assert worker_a.try_acquire() == 0.0
+    assert worker_b.try_acquire() == 0.0
+    assert worker_a.try_acquire() == 0.0
+    assert worker_b.try_acquire() > 0.0
+    assert not worker_a.can_make_request()
+
+
+def test_time_until_slot_follows_the_last_full_window(tmp_path):
+    limiter = SharedRateLimiter(SharedStateStore(str(tmp_path / "state.db")), max_requests_per_minute=1)
+    assert limiter.time_until_slot() == 0.0
+    assert limiter.try_acquire() == 0.0
+    wait_time = limiter.try_acquire()
+    assert 0 < limiter.time_until_slot() <= wait_time
+
+
+def test_locked_database_error_is_not_masked_by_rollback(tmp_path):
+    path = str(tmp_path / "state.db")
+    limiter = SharedRateLimiter(SharedStateStore(path, busy_timeout=0.05), max_requests_per_minute=3)
+    holder = sqlite3.connect(path, isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            limiter.try_acquire()
+    finally:
+        holder.execute("ROLLBACK")
+    assert limiter.try_acquire() == 0.0
+
+
+async def test_acquire_waits_for_lock_off_the_event_loop(tmp_path):
+    path = str(tmp_path / "state.db")
+    limiter = SharedRateLimiter(SharedStateStore(path, busy_timeout=5.0), max_requests_per_minute=3)
+    # 다른 워커가 쓰기 잠금을 쥐고 있는 동안에도 이벤트 루프는 다른 작업을 계속 처리해야 함
+    holder = sqlite3.connect(path, isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+    acquire = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.1)
+    assert not acquire.done()
+    holder.execute("ROLLBACK")
+
+    assert await acquire == 0.0
+
+
+def test_cache_entries_are_visible_to_other_stores(tmp_path):
+    path = str(tmp_path / "state.db")
+    cache_a = SharedResponseCache(SharedStateStore(path), ttl_seconds=60)
+    cache_b = SharedResponseCache(SharedStateStore(path), ttl_seconds=60)
+
+    cache_a.set("url?q=배터리", {"response": {"header": {"resultCode": "00"}}})
+    assert cache_b.get("url?q=배터리") == {"response": {"header": {"resultCode": "00"}}}
+    assert cache_b.get("url?q=missing") is None
+    assert cache_b.stats() == {"entries": 1, "hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+def test_cache_prune_keeps_max_entries(tmp_path):
+    cache = SharedResponseCache(SharedStateStore(str(tmp_path / "state.db")), ttl_seconds=60, max_entries=2)
+    for i in range(5):
+        cache.set(f"key-{i}", {"i": i})
+    cache.prune()
+    assert len(cache) == 2
+
+
+def test_cache_prune_runs_in_the_background(tmp_path):
+    cache = SharedResponseCache(SharedStateStore(str(tmp_path / "state.db")), ttl_seconds=60, max_entries=1)
+    cache.PRUNE_EVERY = 3
+    for i in range(3):
+        cache.set(f"key-{i}", {"i": i})
+
+    deadline = time.monotonic() + 5.0
+    while len(cache) > 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(cache) == 1
+
+
+async def test_cache_set_waits_for_lock_off_the_event_loop(tmp_path):
+    path = str(tmp_path / "state.db")
+    cache = SharedResponseCache(SharedStateStore(path, busy_timeout=5.0), ttl_seconds=60)
+    holder = sqlite3.connect(path, isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+    store = asyncio.create_task(cache.set_async("url?q=배터리", {"i": 1}))
+    await asyncio.sleep(0.1)
+    assert not store.done()
+    holder.execute("ROLLBACK")
+
+    await store
+    assert await cache.get_async("url?q=배터리") == {"i": 1}
+
+
+def test_factory_uses_shared_state_when_configured(tmp_path):
+    factory = ApiClientFactory(ApiClientConfig(api_key="key-a", shared_state_path=str(tmp_path / "state.db")))
+    assert isinstance(factory.cache, SharedResponseCache)
+    assert isinstance(factory.rate_limiter, SharedRateLimiter)
@@ -0,0 +1,104 @@
+import json
+import os
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+import pytest  # noqa: E402
+
+from mcp_kipris.kipris.api_client_factory import ApiClientConfig, ApiClientFactory  # noqa: E402
+from mcp_kipris.kipris.similarity import TfidfSimilarityEngine  # noqa: E402
+from mcp_kipris.kipris.tools.local.patent_similarity_tool import PatentSimilarityTool  # noqa: E402
+
+DOCUMENTS = [
+    {"applicationNumber": "1", "inventionTitle": "리튬 이차전지용 양극 활물질", "abstract": "니켈 코발트 망간 양극"},
+    {"applicationNumber": "2", "inventionTitle": "이차전지용 양극 활물질의 제조 방법", "abstract": "니켈 양극 소성"},
+    {"applicationNumber": "3", "inventionTitle": "반도체 패키지 기판", "abstract": "열 방출 구조를 갖는 패키지"},
+    {"applicationNumber": "4", "inventionTitle": "반도체 패키지의 방열 구조", "abstract": "패키지 열 방출 패드"},
+    {"applicationNumber": "5", "inventionTitle": "자율주행 차량의 센서 융합", "abstract": "라이다 카메라 융합"},
+]
+
+
+@pytest.fixture
+def engine():
+    return TfidfSimilarityEngine().fit(DOCUMENTS)
+
+
+def test_nearest_uses_corpus_idf(engine):
+    assert engine.nearest("1", k=2)[0][0] == "2"
+    assert engine.nearest("3", k=1)[0][0] == "4"
+    assert engine.nearest_to_text("라이다 센서", k=1)[0][0] == "5"
+    with pytest.raises(KeyError):
+        engine.nearest("9")
+
+
+def test_blocked_all_nearest_and_pairs_match_dense(engine):
+    dense = (engine.matrix @ engine.matrix.T).toarray()
+    np.fill_diagonal(dense, 0)
+    for block_size in (1, 2, 1024):
+        nearest = engine.all_nearest(k=1, block_size=block_size)
+        # 겹치는 단어가 없는 특허(자율주행)는 이웃 없음
+        assert [neighbours[0][0] if neighbours else None for neighbours in nearest.values()] == [
+            engine.ids[i] if dense[row, i] > 0 else None for row, i in enumerate(dense.argmax(axis=1))
+        ]
+        pairs = sorted(engine.similar_pairs(threshold=0.2, block_size=block_size))
+        expected = [
+            (engine.ids[i], engine.ids[j])
+            for i in range(len(engine))
+            for j in range(i + 1, len(engine))
+            if dense[i, j] >= 0.2
+        ]
+        assert [(a, b) for a, b, _ in pairs] == sorted(expected)
+        assert all(abs(score - dense[engine.ids.index(a), engine.ids.index(b)]) < 1e-5 for a, b, score in pairs)
+
+
+async def test_similarity_tool_refits_on_new_patents():
+    factory = ApiClientFactory(ApiClientConfig(api_key="key-a"))
+    tool = PatentSimilarityTool()
+    tool.factory = factory
+    for document in DOCUMENTS[:4]:
+        factory.local_index.add(document)
+
+    result = await tool.run_tool_async({"application_number": "3", "top_k": 1, "output_format": "json"})
+    assert '"applicationNumber":"4"' in result[0].text.replace(" ", "")
+    missing = await tool.run_tool_async({"application_number": "5"})
+    assert "patent_detail_search" in missing[0].text
+
+    factory.local_index.add(DOCUMENTS[4])
+    pairs = await tool.run_tool_async({"mode": "pairs", "threshold": 0.2, "output_format": "json"})
+    assert len(tool.get_engine()) == 5
+    assert '"source":"3"' in pairs[0].text.replace(" ", "")
+    one = await tool.run_tool_async({"mode": "pairs", "threshold": 0.01, "docs_count": 1, "output_format": "json"})
+    scores = [record["score"] for record in json.loads(pairs[0].text)["records"]]
+    assert scores == sorted(scores, reverse=True)
+    assert [record["score"] for record in json.loads(one[0].text)["records"]] == scores[:1]
+    for threshold in (0, 1.5):
+        invalid = await tool.run_tool_async({"mode": "pairs", "threshold": threshold})
+        assert "입력값 검증 오류" in invalid[0].text
+
+
+async def test_similarity_tool_does_not_refit_after_every_search(monkeypatch):
+    factory = ApiClientFactory(ApiClientConfig(api_key="key-a"))
+    tool = PatentSimilarityTool()
+    tool.factory = factory
+    for document in DOCUMENTS:
+        factory.local_index.add(document)
+    fits = []
+    fit = TfidfSimilarityEngine.fit
+    monkeypatch.setattr(
+        TfidfSimilarityEngine, "fit", lambda engine, documents: fits.append(1) or fit(engine, documents)
+    )
+
+    await tool.run_tool_async({"text": "양극 활물질"})
+    # 검색 응답이 이미 받은 특허의 필드를 갱신해도 규모가 그대로면 다시 학습하지 않음
+    factory.index_records(pd.DataFrame([{**DOCUMENTS[0], "claims": "코발트 코팅층을 포함하는 양극"}]))
+    factory.flush_indexing()
+    await tool.run_tool_async({"text": "양극 활물질"})
+    await tool.run_tool_async({"application_number": "3", "top_k": 1})
+    assert len(fits) == 1
+
+    tool.REFIT_INTERVAL = 0.0
+    await tool.run_tool_async({"text": "양극 활물질"})
+    await tool.run_tool_async({"text": "양극 활물질"})
+    assert len(fits) == 2
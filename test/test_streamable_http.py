@@ -0,0 +1,39 @@
+import os
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+from starlette.testclient import TestClient  # noqa: E402
+
+from mcp_kipris.sse_server import app, create_starlette_app  # noqa: E402
+
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+def rpc(client: TestClient, method: str, params: dict, request_id: int = 1) -> dict:
+    response = client.post(
+        "/mcp", headers=HEADERS, json={"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    assert "mcp-session-id" not in response.headers
+    return response.json()
+
+
+def test_streamable_http_is_single_request_and_stateless():
+    with TestClient(create_starlette_app(app)) as client:
+        init = rpc(
+            client,
+            "initialize",
+            {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test", "version": "0"}},
+        )
+        assert init["result"]["serverInfo"]["name"] == "mcp-kipris"
+
+        # 세션 ID 없이 보낸 요청도 처리됨 → 어느 워커/레플리카로 가도 동일하게 응답
+        tools = rpc(client, "tools/list", {}, request_id=2)
+        names = {tool["name"] for tool in tools["result"]["tools"]}
+        assert "patent_search" in names
+
+
+def test_legacy_sse_routes_are_still_mounted():
+    paths = {getattr(route, "path", None) for route in create_starlette_app(app).routes}
+    assert {"/mcp", "/sse", "/messages"} <= paths
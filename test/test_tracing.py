@@ -0,0 +1,97 @@
+import json
+import logging
+import os
+
+os.environ.setdefault("KIPRIS_API_KEY", "test-key")
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+from mcp_kipris.kipris import tracing  # noqa: E402
+from mcp_kipris.kipris.api.utils import get_response_async  # noqa: E402
+from mcp_kipris.kipris.api_client_factory import ApiClientConfig, ApiClientFactory  # noqa: E402
+from mcp_kipris.kipris.executor import execute_tool  # noqa: E402
+from mcp_kipris.kipris.tools.korean.patent_summary_search_tool import PatentSummarySearchTool  # noqa: E402
+
+XML = (
+    "<response><header><resultCode>00</resultCode></header><body><items><item>"
+    "<applicationNumber>1020230045678</applicationNumber><inventionTitle>배터리</inventionTitle>"
+    "</item></items></body></response>"
+)
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    tracer = tracing.Tracer(file_path=str(tmp_path / "traces.jsonl"), flush_interval=3600)
+    tracing.set_tracer(tracer)
+    yield tracer
+    tracing.set_tracer(None)
+
+
+def exported_spans(tracer):
+    tracer.flush()
+    with open(tracer.file_path, encoding="utf-8") as f:
+        requests = [json.loads(line) for line in f]
+    return [
+        span
+        for request in requests
+        for resource in request["resourceSpans"]
+        for scope in resource["scopeSpans"]
+        for span in scope["spans"]
+    ]
+
+
+async def test_tool_call_produces_one_trace_across_stages(tracer, monkeypatch):
+    factory = ApiClientFactory(ApiClientConfig(api_key="key-a"))
+    mock_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, text=XML)))
+
+    async def get_async(url):
+        return await get_response_async(url, client=mock_client)
+
+    monkeypatch.setattr(factory.transport, "get_async", get_async)
+    tool = PatentSummarySearchTool()
+    tool.api = factory.get_korean_patent_summary_client()
+
+    await execute_tool(tool, {"application_number": "1020230045678"})
+    await mock_client.aclose()
+
+    spans = exported_spans(tracer)
+    by_name = {span["name"]: span for span in spans}
+    assert {
+        "tool.call",
+        "kipris.call",
+        "rate_limit.wait",
+        "http.request",
+        "xml.parse",
+        "records.parse",
+        "render",
+    } <= set(by_name)
+    assert len({span["traceId"] for span in spans}) == 1
+    assert "parentSpanId" not in by_name["tool.call"]
+    assert by_name["http.request"]["parentSpanId"] == by_name["kipris.call"]["spanId"]
+    attributes = {attr["key"]: attr["value"] for attr in by_name["http.request"]["attributes"]}
+    assert attributes["http.status"] == {"stringValue": "200"}
+
+
+async def test_httpx_trace_events_become_child_spans(tracer):
+    with tracing.span("http.request") as parent:
+        extension = tracing.httpx_trace_extension()
+        await extension["trace"]("connection.connect_tcp.started", {})
+        await extension["trace"]("connection.connect_tcp.complete", {})
+
+    connect = next(span for span in exported_spans(tracer) if span["name"] == "connect_tcp")
+    assert connect["parentSpanId"] == parent.span_id
+
+
+def test_logs_carry_trace_ids(tracer, caplog):
+    with caplog.at_level(logging.INFO, logger="mcp-kipris"), tracing.span("tool.call") as active:
+        logging.getLogger("mcp-kipris").info("inside span")
+    record = caplog.records[-1]
+    assert record.trace_id == active.trace_id
+    assert active.trace_id in record.getMessage()
+
+
+def test_span_is_noop_when_tracing_is_off():
+    tracing.set_tracer(None)
+    with tracing.span("tool.call") as active:
+        assert active is tracing.NOOP_SPAN